@@ -5,10 +5,18 @@ Provides the main command-line interface using Typer:
 - resume: Resume an incomplete roadmap
 - export: Export roadmap to a PM tool
 - view: View a generated roadmap
+- forecast: Forecast milestone dates with Monte Carlo simulation
+- schedule: Assign tasks to developers and set target dates
+- list: List and search roadmaps in a SQLite workspace
+- history: Show recorded versions of a roadmap
+- diff: Compare two versions of a roadmap
 - config: Manage configuration
 """
 
 import asyncio
+import sqlite3
+from collections.abc import Coroutine
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any
 
@@ -17,19 +25,41 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, TaskProgressColumn, TextColumn
 from rich.prompt import Confirm
+from rich.table import Table
 from rich.tree import Tree
 
 from arcane.core.clients import create_client
 from arcane.core.config import Settings
-from arcane.core.generators import RoadmapOrchestrator
-from arcane.core.items import Roadmap
+from arcane.core.generators import GenerationBudget, RoadmapOrchestrator
+from arcane.core.items import Roadmap, RoadmapView
 from arcane.core.models import SUPPORTED_MODELS, DEFAULT_MODEL, ModelInfo, resolve_model
+from arcane.core.planning import (
+    ScheduleAnalysis,
+    analyze_dependencies,
+    apply_schedule,
+    schedule_team,
+    summarize,
+)
 from arcane.core.project_management import CSVClient
 from arcane.core.questions import QuestionConductor
 from arcane.core.questions.base import QuestionType
 from arcane.core.questions.registry import QuestionRegistry
-from arcane.core.storage import StorageManager
-from arcane.core.utils import estimate_generation_cost, format_cost_estimate
+from arcane.core.storage import (
+    VERSIONS_DIR,
+    SQLiteStorageManager,
+    StorageManager,
+    VersionStore,
+    create_storage,
+    resolve_storage,
+)
+from arcane.core.utils import (
+    CostCalibration,
+    Profiler,
+    estimate_generation_cost,
+    format_cost_estimate,
+    start_tracing,
+    stop_tracing,
+)
 
 app = typer.Typer(
     name="arcane",
@@ -39,6 +69,41 @@ app = typer.Typer(
 console = Console()
 
 
+@app.callback()
+def main(
+    ctx: typer.Context,
+    profile: str = typer.Option(
+        None,
+        "--profile",
+        help=(
+            "Profile the command and write PROFILE.prof, .collapsed (flamegraph stacks) "
+            "and .tracemalloc files"
+        ),
+        metavar="PROFILE",
+    ),
+    profile_top: int = typer.Option(
+        15,
+        "--profile-top",
+        help="Number of Arcane functions listed in the profile summary",
+    ),
+) -> None:
+    """Options that apply to every command."""
+    if profile is None:
+        return
+    profiler = Profiler()
+
+    def finish() -> None:
+        profiler.stop()
+        profiler.print_summary(console, limit=profile_top)
+        paths = profiler.write(Path(profile))
+        console.print(f"[dim]Profile written to {', '.join(str(p) for p in paths)}[/dim]")
+
+    # Typer runs the command after this callback returns and closes the
+    # context afterwards, even when the command exits with an error
+    ctx.call_on_close(finish)
+    profiler.start()
+
+
 def _split_csv(value: str | None) -> list[str] | None:
     """Split a comma-separated string into a list, or return None if input is None."""
     if value is None:
@@ -46,6 +111,38 @@ def _split_csv(value: str | None) -> list[str] | None:
     return [x.strip() for x in value.split(",") if x.strip()]
 
 
+def _build_budget(
+    max_seconds: float | None,
+    max_tokens: int | None,
+    max_cost: float | None,
+    max_items: list[str] | None,
+) -> GenerationBudget | None:
+    """Build a generation budget from CLI flags, or None if none were given.
+
+    Raises:
+        typer.BadParameter: If a --max-items value isn't LEVEL=COUNT.
+    """
+    items: dict[str, int] = {}
+    for value in max_items or []:
+        level, _, count = (part.strip() for part in value.partition("="))
+        if not count.isdigit():
+            raise typer.BadParameter(
+                f"Invalid --max-items '{value}'. Expected LEVEL=COUNT, e.g. tasks=200"
+            )
+        items[level] = int(count)
+    if max_seconds is None and max_tokens is None and max_cost is None and not items:
+        return None
+    try:
+        return GenerationBudget(
+            max_seconds=max_seconds,
+            max_tokens=max_tokens,
+            max_cost_usd=max_cost,
+            max_items=items,
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+
+
 def _build_prefilled(
     *,
     project_name: str | None = None,
@@ -153,6 +250,7 @@ async def _new(
     output: str,
     interactive: bool,
     idea: str | None,
+    budget: GenerationBudget | None = None,
 ) -> None:
     """Internal async implementation of the new command."""
     settings = Settings()
@@ -197,7 +295,11 @@ async def _new(
         api_key=settings.anthropic_api_key,
         model=model_info.model_id,
     )
-    storage = StorageManager(Path(output))
+    try:
+        storage = create_storage(settings.storage_backend, Path(output))
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
 
     # Validate connection
     console.print("\n[dim]Validating API connection...[/dim]")
@@ -206,9 +308,12 @@ async def _new(
         raise typer.Exit(1)
     console.print("[green]✓[/green] Connected to", client.provider_name)
 
+    # Calibrate cost estimates from roadmaps generated earlier in this directory
+    calibration = CostCalibration(await storage.load_usage_history())
+
     # Show cost estimate and confirm (only in interactive mode)
     if interactive:
-        estimate = estimate_generation_cost(model=model_info.model_id)
+        estimate = estimate_generation_cost(model=model_info.model_id, calibration=calibration)
         console.print()
         console.print(format_cost_estimate(estimate))
         console.print()
@@ -223,17 +328,32 @@ async def _new(
         console=console,
         storage=storage,
         interactive=interactive,
+        calibration=calibration,
+        budget=budget,
     )
 
     roadmap = await orchestrator.generate(context)
+    if orchestrator.budget_report is not None and not roadmap.milestones:
+        console.print("[dim]Nothing was generated.[/dim]")
+        raise typer.Exit(1)
 
     # Print output location
     project_slug = storage._slugify(roadmap.project_name)
     output_path = Path(output) / project_slug
+    _version_store(output_path, storage).commit(roadmap, "new")
     console.print(f"\n[bold]📁 Saved to:[/bold] {output_path.absolute()}")
+    if orchestrator.budget_report is not None:
+        console.print(f"[dim]Continue with: arcane resume {output_path}[/dim]")
+    if isinstance(storage, SQLiteStorageManager):
+        console.print(f"[dim]Stored in {storage.db_path.absolute()}[/dim]")
 
 
-async def _resume(path: str, model: str | None = None, interactive: bool = True) -> None:
+async def _resume(
+    path: str,
+    model: str | None = None,
+    interactive: bool = True,
+    budget: GenerationBudget | None = None,
+) -> None:
     """Internal async implementation of the resume command."""
     settings = Settings()
     path_obj = Path(path)
@@ -251,7 +371,7 @@ async def _resume(path: str, model: str | None = None, interactive: bool = True)
         raise typer.Exit(1)
 
     # Load existing roadmap
-    storage = StorageManager(path_obj.parent if path_obj.is_file() else path_obj)
+    storage = resolve_storage(path_obj)
 
     try:
         roadmap = await storage.load_roadmap(path_obj)
@@ -282,7 +402,11 @@ async def _resume(path: str, model: str | None = None, interactive: bool = True)
         raise typer.Exit(1)
     console.print("[green]✓[/green] Connected to", client.provider_name)
 
+    calibration = CostCalibration(await storage.load_usage_history())
     if interactive:
+        estimate = calibration.estimate(model_info.model_id, roadmap=roadmap)
+        console.print()
+        console.print(format_cost_estimate(estimate))
         if not Confirm.ask("\nResume generation?", default=True, console=console):
             console.print("[dim]Resume cancelled.[/dim]")
             raise typer.Exit(0)
@@ -293,14 +417,269 @@ async def _resume(path: str, model: str | None = None, interactive: bool = True)
         console=console,
         storage=storage,
         interactive=interactive,
+        calibration=calibration,
+        budget=budget,
     )
 
+    # Record the pre-resume state so history shows what the resume added
+    versions = _version_store(path_obj, storage)
+    versions.commit(roadmap, "before resume")
+
     roadmap = await orchestrator.resume(roadmap)
+    versions.commit(roadmap, "resume")
 
     # Print output location
-    project_slug = storage._slugify(roadmap.project_name)
     output_dir = path_obj.parent if path_obj.is_file() else path_obj
     console.print(f"\n[bold]📁 Saved to:[/bold] {output_dir.absolute()}")
+    if orchestrator.budget_report is not None:
+        console.print(f"[dim]Continue with: arcane resume {path}[/dim]")
+
+
+def _version_store(path: Path, storage: StorageManager) -> VersionStore:
+    """Return the version store for a roadmap path.
+
+    JSON roadmaps keep history in <project-dir>/.arcane, SQLite workspaces
+    in <workspace>/.arcane next to arcane.db.
+    """
+    if isinstance(storage, SQLiteStorageManager):
+        return VersionStore.at(storage.db_path.parent / VERSIONS_DIR)
+    project_dir = path.parent if path.is_file() else path
+    return VersionStore.at(project_dir / VERSIONS_DIR)
+
+
+async def _load_for_history(path: str) -> tuple[Roadmap, VersionStore]:
+    """Load a roadmap and its version store, exiting on errors."""
+    path_obj = Path(path)
+    storage = resolve_storage(path_obj)
+
+    try:
+        roadmap = await storage.load_roadmap(path_obj)
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] Roadmap not found at {path}")
+        raise typer.Exit(1) from None
+
+    return roadmap, _version_store(path_obj, storage)
+
+
+async def _history(path: str) -> None:
+    """Internal async implementation of the history command."""
+    roadmap, versions = await _load_for_history(path)
+    snapshots = versions.history(roadmap.id)
+
+    if not snapshots:
+        console.print(f"[dim]No versions recorded for {roadmap.project_name}.[/dim]")
+        return
+
+    console.print(f"[bold]{roadmap.project_name}[/bold]\n")
+    for snapshot in reversed(snapshots):
+        counts = snapshot.total_items
+        console.print(
+            f"[cyan]v{snapshot.version}[/cyan] [dim]{snapshot.root[:10]}[/dim] "
+            f"{snapshot.created_at.strftime('%Y-%m-%d %H:%M')} "
+            f"[bold]{snapshot.message}[/bold]\n"
+            f"    {counts.get('tasks', 0)} tasks · {snapshot.total_hours}h"
+        )
+
+
+_CHANGE_STYLE = {
+    "added": "[green]+[/green]",
+    "removed": "[red]-[/red]",
+    "modified": "[yellow]~[/yellow]",
+    "reordered": "[blue]↕[/blue]",
+}
+
+
+async def _diff(path: str, old: str | None, new: str | None) -> None:
+    """Internal async implementation of the diff command."""
+    roadmap, versions = await _load_for_history(path)
+
+    try:
+        old_snapshot = versions.resolve(roadmap.id, old if old is not None else -1)
+        new_snapshot = versions.resolve(roadmap.id, new)
+    except KeyError as e:
+        console.print(f"[red]Error:[/red] {e.args[0]}")
+        raise typer.Exit(1) from e
+
+    changes = versions.diff_roots(old_snapshot.root, new_snapshot.root)
+    console.print(
+        f"[bold]{roadmap.project_name}[/bold]: "
+        f"v{old_snapshot.version} → v{new_snapshot.version}\n"
+    )
+    if not changes:
+        console.print("[dim]No changes.[/dim]")
+        return
+
+    for change in changes:
+        detail = f" [dim]({', '.join(change.fields)})[/dim]" if change.fields else ""
+        console.print(
+            f"{_CHANGE_STYLE[change.kind]} {change.item_type} "
+            f"{change.name} [dim]{change.item_id}[/dim]{detail}"
+        )
+
+
+async def _forecast(
+    path: str,
+    simulations: int,
+    team_size: int | None,
+    start: str | None,
+    hours_per_day: float,
+    seed: int | None,
+) -> None:
+    """Internal async implementation of the forecast command."""
+    try:
+        from arcane.core.planning.forecast import forecast_roadmap
+    except ImportError:
+        console.print(
+            "[red]Error:[/red] Forecasting requires numpy. "
+            "Install it with: pip install 'arcane-roadmap[forecast]'"
+        )
+        raise typer.Exit(1) from None
+
+    try:
+        start_date = date.fromisoformat(start) if start else None
+    except ValueError:
+        console.print(f"[red]Error:[/red] Invalid start date: {start} (use YYYY-MM-DD)")
+        raise typer.Exit(1) from None
+
+    path_obj = Path(path)
+    storage = resolve_storage(path_obj)
+    try:
+        roadmap = await storage.load_roadmap(path_obj)
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] Roadmap not found at {path}")
+        raise typer.Exit(1) from None
+
+    try:
+        forecast = forecast_roadmap(
+            roadmap,
+            team_size=team_size,
+            simulations=simulations,
+            start=start_date,
+            hours_per_day=hours_per_day,
+            seed=seed,
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] Cannot forecast: {e}")
+        raise typer.Exit(1) from e
+
+    percentiles = list(forecast.completion.dates)
+    table = Table(
+        title=(
+            f"{roadmap.project_name} — {forecast.simulations:,} simulations, "
+            f"{forecast.team_size} developer(s) from {forecast.start}"
+        )
+    )
+    table.add_column("Milestone")
+    for p in percentiles:
+        table.add_column(f"P{p}", justify="right")
+    for milestone in forecast.milestones:
+        table.add_row(milestone.name, *(str(milestone.dates[p]) for p in percentiles))
+    table.add_row(
+        f"[bold]{forecast.completion.name}[/bold]",
+        *(f"[bold]{forecast.completion.dates[p]}[/bold]" for p in percentiles),
+    )
+    console.print(table)
+
+    if forecast.deadline is not None:
+        chance = forecast.on_time_probability * 100
+        style = "green" if forecast.fits_timeline() else "red"
+        console.print(
+            f"\n[bold]Timeline:[/bold] {roadmap.context.timeline} "
+            f"(by {forecast.deadline}) — [{style}]{chance:.0f}% chance[/{style}] "
+            f"of finishing on time"
+        )
+
+
+async def _schedule(
+    path: str,
+    team_size: int | None,
+    start: str | None,
+    hours_per_day: float,
+    dry_run: bool,
+) -> None:
+    """Internal async implementation of the schedule command."""
+    try:
+        start_date = date.fromisoformat(start) if start else None
+    except ValueError:
+        console.print(f"[red]Error:[/red] Invalid start date: {start} (use YYYY-MM-DD)")
+        raise typer.Exit(1) from None
+
+    path_obj = Path(path)
+    storage = resolve_storage(path_obj)
+    try:
+        roadmap = await storage.load_roadmap(path_obj)
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] Roadmap not found at {path}")
+        raise typer.Exit(1) from None
+
+    try:
+        schedule = schedule_team(
+            roadmap,
+            team_size=team_size,
+            start=start_date,
+            hours_per_day=hours_per_day,
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] Cannot schedule: {e}")
+        raise typer.Exit(1) from e
+
+    if not dry_run:
+        apply_schedule(roadmap, schedule)
+
+    tasks_per_milestone: dict[str, int] = {}
+    milestone_of = {
+        task.id: milestone.id
+        for milestone in roadmap.milestones
+        for epic in milestone.epics
+        for story in epic.stories
+        for task in story.tasks
+    }
+    for assignment in schedule.assignments:
+        milestone_id = milestone_of.get(assignment.task_id)
+        tasks_per_milestone[milestone_id] = tasks_per_milestone.get(milestone_id, 0) + 1
+
+    table = Table(
+        title=(
+            f"{roadmap.project_name} — {schedule.team_size} developer(s) "
+            f"from {schedule.start}"
+        )
+    )
+    table.add_column("Milestone")
+    table.add_column("Tasks", justify="right")
+    table.add_column("Done After", justify="right")
+    table.add_column("Target Date", justify="right")
+    for milestone in roadmap.milestones:
+        end = schedule.milestone_end.get(milestone.id, 0.0)
+        count = tasks_per_milestone.get(milestone.id, 0)
+        table.add_row(
+            milestone.name,
+            str(count),
+            f"{end:g}h" if count else "-",
+            str(schedule.date_at(end)) if count else "[green]done[/green]",
+        )
+    console.print(table)
+    console.print(
+        f"\n[bold]{len(schedule.assignments)}[/bold] task(s) scheduled, "
+        f"finishing {schedule.end_date} "
+        f"({schedule.utilization() * 100:.0f}% team utilization)"
+    )
+
+    if dry_run:
+        console.print("[dim]Dry run: roadmap not updated.[/dim]")
+        return
+
+    roadmap.updated_at = datetime.now(timezone.utc)
+    if isinstance(storage, SQLiteStorageManager):
+        await storage.save_roadmap(roadmap)
+    else:
+        # Write back to the file that was loaded rather than the
+        # project_name-derived location save_roadmap would pick
+        roadmap_path = path_obj if path_obj.is_file() else path_obj / "roadmap.json"
+        roadmap_path.write_text(roadmap.model_dump_json(indent=2))
+    _version_store(path_obj, storage).commit(roadmap, "schedule")
+    console.print(
+        "[green]✓[/green] Saved assignments, due dates and milestone target dates"
+    )
 
 
 async def _export_with_progress(
@@ -340,17 +719,18 @@ async def _export(path: str, to: str, workspace: str | None) -> None:
     """Internal async implementation of the export command."""
     path_obj = Path(path)
 
-    # Load roadmap
-    storage = StorageManager(path_obj.parent if path_obj.is_file() else path_obj)
+    # Load roadmap; the CSV writer only reads it, so a slotted view will do
+    storage = resolve_storage(path_obj)
+    to_lower = to.lower()
+    load = storage.load_view if to_lower == "csv" else storage.load_roadmap
 
     try:
-        roadmap = await storage.load_roadmap(path_obj)
+        roadmap = await load(path_obj)
     except FileNotFoundError:
         console.print(f"[red]Error:[/red] Roadmap not found at {path}")
         raise typer.Exit(1)
 
     # Select export target
-    to_lower = to.lower()
 
     if to_lower == "csv":
         # Determine output path - put CSV next to roadmap.json
@@ -359,6 +739,7 @@ async def _export(path: str, to: str, workspace: str | None) -> None:
         else:
             output_path = path_obj / "roadmap.csv"
 
+        output_path.parent.mkdir(parents=True, exist_ok=True)
         client = CSVClient()
         total = sum(roadmap.total_items.values())
         result = await _export_with_progress(
@@ -542,16 +923,15 @@ async def _view(path: str, format: str) -> None:
     path_obj = Path(path)
 
     # Load roadmap
-    if path_obj.is_dir():
-        roadmap_file = path_obj / "roadmap.json"
-    else:
-        roadmap_file = path_obj
+    storage = resolve_storage(path_obj)
 
-    if not roadmap_file.exists():
-        console.print(f"[red]Error:[/red] Roadmap not found at {roadmap_file}")
-        raise typer.Exit(1)
-
-    roadmap = Roadmap.model_validate_json(roadmap_file.read_text())
+    # Tree and summary only read the roadmap, so a slotted view will do
+    load = storage.load_roadmap if format == "json" else storage.load_view
+    try:
+        roadmap = await load(path_obj)
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] Roadmap not found at {path}")
+        raise typer.Exit(1) from None
 
     if format == "json":
         console.print(roadmap.model_dump_json(indent=2))
@@ -563,10 +943,17 @@ async def _view(path: str, format: str) -> None:
         _print_tree(roadmap)
 
 
-def _print_summary(roadmap: Roadmap) -> None:
+def _print_summary(roadmap: Roadmap | RoadmapView) -> None:
     """Print a summary of the roadmap."""
-    counts = roadmap.total_items
-
+    summary = summarize(roadmap)
+    counts = summary.item_counts
+    analysis = analyze_dependencies(roadmap)
+
+    by_status = ", ".join(
+        f"{status.replace('_', ' ')} {hours:g}h"
+        for status, hours in summary.hours_by_status.items()
+        if hours
+    )
     console.print(
         Panel(
             f"[bold]{roadmap.project_name}[/bold]\n\n"
@@ -576,15 +963,40 @@ def _print_summary(roadmap: Roadmap) -> None:
             f"[cyan]Epics:[/cyan] {counts['epics']}\n"
             f"[cyan]Stories:[/cyan] {counts['stories']}\n"
             f"[cyan]Tasks:[/cyan] {counts['tasks']}\n\n"
-            f"[bold]Total Hours:[/bold] {roadmap.total_hours}",
+            f"[bold]Total Hours:[/bold] {summary.hours_total:g}"
+            + (f" ({by_status})" if by_status else "")
+            + f"\n[bold]Completed:[/bold] {summary.completion_percent:g}% of hours\n"
+            f"[bold]Critical Path:[/bold] {analysis.length_hours:g}h "
+            f"across {len(analysis.critical_path)} tasks",
             title="📊 Roadmap Summary",
             border_style="blue",
         )
     )
 
+    overdue = [m.name for m in summary.overdue_milestones]
+    if overdue or summary.overdue_tasks:
+        console.print(
+            f"\n[yellow]⚠ Overdue:[/yellow] {len(overdue)} milestone(s), "
+            f"{len(summary.overdue_tasks)} task(s)"
+        )
+        for name in overdue:
+            console.print(f"  {name}")
+    _print_dependency_problems(analysis)
+
+
+def _print_dependency_problems(analysis: ScheduleAnalysis) -> None:
+    """Print prerequisite cycles and dangling IDs, if any."""
+    problems = analysis.problems()
+    if problems:
+        console.print(f"\n[yellow]⚠ {len(problems)} prerequisite problem(s):[/yellow]")
+        for problem in problems:
+            console.print(f"  {problem}")
+
 
-def _print_tree(roadmap: Roadmap) -> None:
-    """Print the roadmap as a tree."""
+def _print_tree(roadmap: Roadmap | RoadmapView) -> None:
+    """Print the roadmap as a tree, highlighting the critical path."""
+    analysis = analyze_dependencies(roadmap)
+    critical = set(analysis.critical_path)
     tree = Tree(f"🔮 [bold]{roadmap.project_name}[/bold]")
 
     for milestone in roadmap.milestones:
@@ -606,12 +1018,44 @@ def _print_tree(roadmap: Roadmap) -> None:
                 )
 
                 for task in story.tasks:
-                    st_branch.add(
-                        f"[dim]• {task.name} ({task.estimated_hours}h)[/dim]"
-                    )
+                    if task.id in critical:
+                        st_branch.add(
+                            f"[yellow]• {task.name} ({task.estimated_hours}h)[/yellow]"
+                        )
+                    else:
+                        st_branch.add(
+                            f"[dim]• {task.name} ({task.estimated_hours}h)[/dim]"
+                        )
 
     console.print(tree)
     console.print(f"\n[bold]Total:[/bold] {roadmap.total_hours} hours")
+    if critical:
+        console.print(
+            f"[bold]Critical path:[/bold] {analysis.length_hours:g} hours "
+            f"across {len(critical)} tasks [dim](highlighted)[/dim]"
+        )
+    _print_dependency_problems(analysis)
+
+
+def _run(coro: Coroutine[Any, Any, None], trace: str | None) -> None:
+    """Run a command's coroutine, tracing it if --trace was given.
+
+    The trace is written even if the command fails, since that is often
+    when it is wanted.
+    """
+    if trace is None:
+        asyncio.run(coro)
+        return
+    tracer = start_tracing()
+    try:
+        asyncio.run(coro)
+    finally:
+        stop_tracing()
+        if trace == "-":
+            tracer.print_summary(console)
+        else:
+            path = tracer.write_chrome_trace(Path(trace))
+            console.print(f"[dim]Trace written to {path} ({len(tracer.spans)} spans)[/dim]")
 
 
 @app.command()
@@ -721,6 +1165,34 @@ def new(
         "-i",
         help="Path to an idea file with additional project context",
     ),
+    max_seconds: float = typer.Option(
+        None,
+        "--max-seconds",
+        min=0,
+        help="Stop before a call that would run past this many seconds",
+    ),
+    max_tokens: int = typer.Option(
+        None,
+        "--max-tokens",
+        min=0,
+        help="Stop before a call that would take the run past this many tokens",
+    ),
+    max_cost: float = typer.Option(
+        None,
+        "--max-cost",
+        min=0,
+        help="Stop before a call that would take the run past this many USD",
+    ),
+    max_items: list[str] = typer.Option(
+        None,
+        "--max-items",
+        help="Cap a level's items, e.g. tasks=200 (repeatable)",
+    ),
+    trace: str = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome trace of the run to this file ('-' prints a summary)",
+    ),
 ) -> None:
     """Create a new roadmap from scratch.
 
@@ -733,7 +1205,11 @@ def new(
 
     All discovery questions can be pre-filled via flags. When all 16 are
     provided with --no-interactive, arcane runs with zero prompts.
+
+    The --max-* flags bound the run. When one is reached, generation stops
+    with everything generated so far saved; finish it with `arcane resume`.
     """
+    budget_limits = _build_budget(max_seconds, max_tokens, max_cost, max_items)
     prefilled = _build_prefilled(
         project_name=name,
         vision=vision,
@@ -766,7 +1242,7 @@ def new(
         else:
             model = DEFAULT_MODEL
 
-    asyncio.run(_new(prefilled, model, output, interactive, idea))
+    _run(_new(prefilled, model, output, interactive, idea, budget_limits), trace)
 
 
 @app.command()
@@ -786,17 +1262,47 @@ def resume(
         "--no-interactive",
         help="Skip review prompts and auto-approve all generated items",
     ),
+    max_seconds: float = typer.Option(
+        None,
+        "--max-seconds",
+        min=0,
+        help="Stop before a call that would run past this many seconds",
+    ),
+    max_tokens: int = typer.Option(
+        None,
+        "--max-tokens",
+        min=0,
+        help="Stop before a call that would take the run past this many tokens",
+    ),
+    max_cost: float = typer.Option(
+        None,
+        "--max-cost",
+        min=0,
+        help="Stop before a call that would take the run past this many USD",
+    ),
+    max_items: list[str] = typer.Option(
+        None,
+        "--max-items",
+        help="Cap a level's items, e.g. tasks=200 (repeatable)",
+    ),
+    trace: str = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome trace of the run to this file ('-' prints a summary)",
+    ),
 ) -> None:
     """Resume generating an incomplete roadmap.
 
-    Detects where generation stopped and continues from that point.
+    Detects where generation stopped and continues from that point. The
+    --max-* flags bound this run the same way as for `arcane new`.
     """
+    budget_limits = _build_budget(max_seconds, max_tokens, max_cost, max_items)
     # Resolve model: CLI flag > settings > default
     if model is None:
         settings = Settings()
         model = settings.model
 
-    asyncio.run(_resume(path, model, not no_interactive))
+    _run(_resume(path, model, not no_interactive, budget_limits), trace)
 
 
 @app.command()
@@ -817,12 +1323,17 @@ def export(
         "-w",
         help="Target workspace or project (for Linear, Jira, Notion)",
     ),
+    trace: str = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome trace of the run to this file ('-' prints a summary)",
+    ),
 ) -> None:
     """Export a roadmap to a project management tool.
 
     Supports CSV (universal import), Linear, Jira, and Notion.
     """
-    asyncio.run(_export(path, to, workspace))
+    _run(_export(path, to, workspace), trace)
 
 
 @app.command()
@@ -837,12 +1348,211 @@ def view(
         "-f",
         help="Display format: tree, summary, json",
     ),
+    trace: str = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome trace of the run to this file ('-' prints a summary)",
+    ),
 ) -> None:
     """View a generated roadmap.
 
     Displays the roadmap in the specified format.
     """
-    asyncio.run(_view(path, format))
+    _run(_view(path, format), trace)
+
+
+@app.command()
+def history(
+    path: str = typer.Argument(
+        ...,
+        help="Path to roadmap.json or project directory",
+    ),
+) -> None:
+    """Show the recorded versions of a roadmap.
+
+    A version is recorded each time new or resume finishes.
+    """
+    asyncio.run(_history(path))
+
+
+@app.command()
+def diff(
+    path: str = typer.Argument(
+        ...,
+        help="Path to roadmap.json or project directory",
+    ),
+    old: str = typer.Argument(
+        None,
+        help="Older version: number or hash prefix (default: previous)",
+    ),
+    new: str = typer.Argument(
+        None,
+        help="Newer version (default: latest)",
+    ),
+) -> None:
+    """Compare two versions of a roadmap.
+
+    Shows added, removed, modified and reordered items.
+    """
+    asyncio.run(_diff(path, old, new))
+
+
+@app.command()
+def forecast(
+    path: str = typer.Argument(
+        ...,
+        help="Path to roadmap.json or project directory",
+    ),
+    simulations: int = typer.Option(
+        10_000,
+        "--simulations",
+        "-n",
+        min=100,
+        help="Number of Monte Carlo simulations",
+    ),
+    team_size: int = typer.Option(
+        None,
+        "--team-size",
+        "-t",
+        min=1,
+        help="Developers working in parallel (default: from the roadmap context)",
+    ),
+    start: str = typer.Option(
+        None,
+        "--start",
+        help="First day of work, YYYY-MM-DD (default: today)",
+    ),
+    hours_per_day: float = typer.Option(
+        6.0,
+        "--hours-per-day",
+        help="Focused hours per developer per working day",
+    ),
+    seed: int = typer.Option(
+        None,
+        "--seed",
+        help="Random seed for reproducible forecasts",
+    ),
+) -> None:
+    """Forecast milestone completion dates.
+
+    Simulates the remaining tasks with uncertain durations, respecting
+    prerequisites and team size, and reports P50/P80/P95 finish dates
+    and the chance of meeting the roadmap's timeline.
+    """
+    asyncio.run(_forecast(path, simulations, team_size, start, hours_per_day, seed))
+
+
+@app.command()
+def schedule(
+    path: str = typer.Argument(
+        ...,
+        help="Path to roadmap.json or project directory",
+    ),
+    team_size: int = typer.Option(
+        None,
+        "--team-size",
+        "-t",
+        min=1,
+        help="Developers working in parallel (default: from the roadmap context)",
+    ),
+    start: str = typer.Option(
+        None,
+        "--start",
+        help="First day of work, YYYY-MM-DD (default: today)",
+    ),
+    hours_per_day: float = typer.Option(
+        6.0,
+        "--hours-per-day",
+        help="Focused hours per developer per working day",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show the schedule without saving it to the roadmap",
+    ),
+) -> None:
+    """Assign remaining tasks to developers and set target dates.
+
+    Developers take the most urgent ready task (milestone order, then
+    priority) whenever they're free. Each task gets a developer slot,
+    start/end offsets and a due date; milestones get a target date.
+    """
+    asyncio.run(_schedule(path, team_size, start, hours_per_day, dry_run))
+
+
+@app.command("list")
+def list_roadmaps(
+    workspace: str = typer.Argument(
+        "./",
+        help="Workspace directory containing arcane.db",
+    ),
+    search: str = typer.Option(
+        None,
+        "--search",
+        "-s",
+        help="Full-text search item names and descriptions",
+    ),
+    limit: int = typer.Option(
+        50,
+        "--limit",
+        help="Maximum number of search results",
+    ),
+) -> None:
+    """List roadmaps stored in a SQLite workspace.
+
+    With --search, shows matching items across all roadmaps instead.
+    """
+    db_path = Path(workspace) / SQLiteStorageManager.DB_FILENAME
+    if not db_path.exists():
+        console.print(f"[red]Error:[/red] No arcane.db found in {workspace}")
+        console.print("[dim]Set ARCANE_STORAGE_BACKEND=sqlite to store roadmaps there.[/dim]")
+        raise typer.Exit(1)
+
+    storage = SQLiteStorageManager(Path(workspace))
+    try:
+        if search:
+            _print_search_results(storage.search(search, limit=limit), search)
+        else:
+            _print_roadmap_list(storage.list_roadmaps())
+    except sqlite3.OperationalError as e:
+        console.print(f"[red]Error:[/red] Could not read {db_path}: {e}")
+        raise typer.Exit(1) from e
+    finally:
+        storage.close()
+
+
+def _print_roadmap_list(roadmaps: list[dict]) -> None:
+    """Print one line per roadmap in a workspace."""
+    if not roadmaps:
+        console.print("[dim]No roadmaps stored yet.[/dim]")
+        return
+
+    for entry in roadmaps:
+        counts = entry["total_items"]
+        console.print(
+            f"[bold]{entry['project_name']}[/bold] [dim]({entry['slug']})[/dim]\n"
+            f"  {counts['milestones']} milestones, {counts['epics']} epics, "
+            f"{counts['stories']} stories, {counts['tasks']} tasks · "
+            f"{entry['total_hours']}h · "
+            f"updated {entry['updated_at'].strftime('%Y-%m-%d %H:%M')}"
+        )
+
+
+def _print_search_results(hits: list[dict], query: str) -> None:
+    """Print full-text search hits grouped under their roadmap."""
+    if not hits:
+        console.print(f"[dim]No items match '{query}'.[/dim]")
+        return
+
+    current = None
+    for hit in hits:
+        if hit["project_name"] != current:
+            current = hit["project_name"]
+            console.print(f"\n[bold]{current}[/bold]")
+        console.print(
+            f"  [cyan]{hit['type']}[/cyan] {hit['name']} "
+            f"[dim]({hit['id']}, {hit['status']})[/dim]"
+        )
 
 
 @app.command()
@@ -871,7 +1581,8 @@ def config(
                 f"[bold]Max Retries:[/bold] {settings.max_retries}\n"
                 f"[bold]Interactive:[/bold] {settings.interactive}\n"
                 f"[bold]Auto Save:[/bold] {settings.auto_save}\n"
-                f"[bold]Output Dir:[/bold] {settings.output_dir}\n\n"
+                f"[bold]Output Dir:[/bold] {settings.output_dir}\n"
+                f"[bold]Storage:[/bold] {settings.storage_backend}\n\n"
                 "[dim]PM Integrations:[/dim]\n"
                 f"  Linear: {'✓ set' if settings.linear_api_key else '✗ not set'}\n"
                 f"  Jira: {'✓ set' if settings.jira_api_token else '✗ not set'}\n"
@@ -886,6 +1597,7 @@ def config(
         console.print("  ARCANE_ANTHROPIC_API_KEY  - Required for generation")
         console.print(f"  ARCANE_MODEL              - Model to use (default: {DEFAULT_MODEL})")
         console.print("  ARCANE_MAX_RETRIES        - Retry count (default: 3)")
+        console.print("  ARCANE_STORAGE_BACKEND    - json or sqlite (default: json)")
         console.print("  ARCANE_LINEAR_API_KEY     - For Linear export")
         console.print("  ARCANE_JIRA_DOMAIN        - For Jira export")
         console.print("  ARCANE_JIRA_EMAIL         - For Jira export")
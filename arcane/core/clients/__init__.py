@@ -6,11 +6,13 @@ concrete implementations for supported providers.
 
 from .base import BaseAIClient, AIClientError, UsageStats
 from .anthropic import AnthropicClient
+from .telemetry import GenerationTelemetry
 
 __all__ = [
     "BaseAIClient",
     "AIClientError",
     "UsageStats",
+    "GenerationTelemetry",
     "AnthropicClient",
     "create_client",
 ]
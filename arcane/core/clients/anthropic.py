@@ -8,7 +8,10 @@ import anthropic
 import instructor
 from pydantic import BaseModel
 
+from arcane.core.utils.tracing import span
+
 from .base import BaseAIClient, AIClientError, UsageStats
+from .telemetry import current_call
 
 
 class AnthropicClient(BaseAIClient):
@@ -30,7 +33,14 @@ class AnthropicClient(BaseAIClient):
         """
         self._api_key = api_key
         self._model = model
-        self._raw_client = anthropic.AsyncAnthropic(api_key=api_key)
+        # The response hook fires when headers arrive, before the body is
+        # read, which gives time-to-first-byte for the call in flight
+        self._raw_client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                event_hooks={"response": [_mark_first_byte]}
+            ),
+        )
         self._client = instructor.from_anthropic(self._raw_client)
         self._usage = UsageStats()
 
@@ -65,24 +75,42 @@ class AnthropicClient(BaseAIClient):
         Raises:
             AIClientError: If the API call fails.
         """
+        attributes = {
+            "gen_ai.system": "anthropic",
+            "gen_ai.request.model": self._model,
+            "arcane.level": level,
+        }
         try:
-            response, completion = await self._call_with_backoff(
-                self._create_message,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                response_model=response_model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-            )
-
-            # Track usage from the completion
-            if hasattr(completion, "usage") and completion.usage:
-                self._usage.add(
-                    input_tokens=completion.usage.input_tokens,
-                    output_tokens=completion.usage.output_tokens,
-                    level=level,
+            with (
+                span("anthropic.generate", **attributes) as current,
+                self.telemetry.track_call(level) as call,
+            ):
+                response, completion = await self._call_with_backoff(
+                    self._create_message,
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    response_model=response_model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
                 )
 
+                # Track usage from the completion
+                if hasattr(completion, "usage") and completion.usage:
+                    self._usage.add(
+                        input_tokens=completion.usage.input_tokens,
+                        output_tokens=completion.usage.output_tokens,
+                        level=level,
+                    )
+                    call.add_tokens(
+                        completion.usage.input_tokens, completion.usage.output_tokens
+                    )
+                    current.set_attribute(
+                        "gen_ai.usage.input_tokens", completion.usage.input_tokens
+                    )
+                    current.set_attribute(
+                        "gen_ai.usage.output_tokens", completion.usage.output_tokens
+                    )
+
             return response
         except Exception as e:
             raise AIClientError(f"Anthropic API call failed: {e}") from e
@@ -139,3 +167,10 @@ class AnthropicClient(BaseAIClient):
     def reset_usage(self) -> None:
         """Reset usage statistics to zero."""
         self._usage.reset()
+
+
+async def _mark_first_byte(_response) -> None:
+    """httpx response hook: record first byte for the call in flight."""
+    call = current_call()
+    if call is not None:
+        call.mark_first_byte()
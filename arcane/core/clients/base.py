@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 
 from pydantic import BaseModel
 
+from .telemetry import GenerationTelemetry, current_call
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,12 +82,24 @@ class BaseAIClient(ABC):
         rate_limit_max_retries: Max retries on rate limit (0 to disable).
         rate_limit_initial_delay: Starting backoff delay in seconds.
         rate_limit_max_delay: Maximum backoff delay in seconds.
+
+    Subclasses should wrap each API call in ``self.telemetry.track_call()``
+    so latency, tokens and rate-limit waits are recorded per level.
     """
 
     rate_limit_max_retries: int = 5
     rate_limit_initial_delay: float = 2.0
     rate_limit_max_delay: float = 60.0
 
+    @property
+    def telemetry(self) -> GenerationTelemetry:
+        """Latency, throughput and retry metrics for this client's calls."""
+        # Created lazily so subclasses don't need to call a base __init__
+        telemetry = self.__dict__.get("_telemetry")
+        if telemetry is None:
+            telemetry = self.__dict__["_telemetry"] = GenerationTelemetry()
+        return telemetry
+
     def _is_rate_limit_error(self, error: Exception) -> bool:
         """Check if an exception is a rate limit error.
 
@@ -109,8 +123,11 @@ class BaseAIClient(ABC):
             the error is not a rate limit.
         """
         delay = self.rate_limit_initial_delay
+        call = current_call()
 
         for attempt in range(self.rate_limit_max_retries + 1):
+            if call is not None:
+                call.start_attempt()
             try:
                 return await coro_func(*args, **kwargs)
             except Exception as e:
@@ -127,6 +144,9 @@ class BaseAIClient(ABC):
                     attempt + 1,
                     self.rate_limit_max_retries,
                 )
+                if call is not None:
+                    call.rate_limits += 1
+                    call.rate_limit_wait += delay
                 await asyncio.sleep(delay)
                 delay = min(delay * 2, self.rate_limit_max_delay)
 
@@ -0,0 +1,362 @@
+"""Generation telemetry: where the wall-clock time of a generation goes.
+
+UsageStats counts calls and tokens. GenerationTelemetry adds, per
+generation level, latency and time-to-first-byte histograms, output
+tokens/sec, rate-limit waits, failed calls, and the retries and
+validation failures seen by the generators.
+
+Clients record into it through BaseAIClient.telemetry: a client wraps
+each API call in ``track_call()``, and ``_call_with_backoff`` and the
+HTTP layer add attempt timings and rate-limit waits to the call in
+flight (found through a context variable, so concurrent calls don't mix).
+Generators record attempts, retries and validation failures.
+
+Reports serialize to JSON (``to_dict``) and to the Prometheus text
+format (``to_prometheus``), and merge across sessions and clients.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds in seconds; model calls take from under a second to
+# several minutes for large structured outputs
+LATENCY_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+
+# Level name for calls made without one
+OTHER_LEVEL = "other"
+
+
+@dataclass
+class Histogram:
+    """Histogram with fixed bucket bounds.
+
+    ``counts[i]`` is the number of observations <= ``bounds[i]`` and
+    above the previous bound; observations above every bound are only
+    in ``count``.
+    """
+
+    bounds: tuple[float, ...] = LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * len(self.bounds)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def cumulative(self) -> list[int]:
+        """Observations <= each bound, as Prometheus reports buckets."""
+        result, running = [], 0
+        for n in self.counts:
+            running += n
+            result.append(running)
+        return result
+
+    def merge(self, other: Histogram) -> None:
+        """Add another histogram with the same bounds into this one."""
+        if other.bounds != self.bounds:
+            raise ValueError("Cannot merge histograms with different buckets")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": round(self.mean, 6),
+            "max": self.max,
+            "buckets": {str(b): n for b, n in zip(self.bounds, self.cumulative(), strict=True)},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Histogram:
+        bounds = tuple(float(b) for b in data["buckets"])
+        cumulative = list(data["buckets"].values())
+        counts = [b - a for a, b in zip([0] + cumulative[:-1], cumulative, strict=True)]
+        return cls(
+            bounds=bounds,
+            counts=counts,
+            count=data["count"],
+            total=data["sum"],
+            max=data["max"],
+        )
+
+
+@dataclass
+class LevelTelemetry:
+    """Counters and histograms for one generation level."""
+
+    calls: int = 0
+    failed_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+    first_byte: Histogram = field(default_factory=Histogram)
+    rate_limits: int = 0
+    rate_limit_wait_seconds: float = 0.0
+    # Recorded by generators
+    generations: int = 0
+    generation_seconds: float = 0.0
+    retries: int = 0
+    validation_failures: int = 0
+
+    _COUNTERS = (
+        "calls",
+        "failed_calls",
+        "input_tokens",
+        "output_tokens",
+        "rate_limits",
+        "rate_limit_wait_seconds",
+        "generations",
+        "generation_seconds",
+        "retries",
+        "validation_failures",
+    )
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Output tokens per second of successful call latency."""
+        return self.output_tokens / self.latency.total if self.latency.total else 0.0
+
+    def merge(self, other: LevelTelemetry) -> None:
+        for name in self._COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.latency.merge(other.latency)
+        self.first_byte.merge(other.first_byte)
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {name: getattr(self, name) for name in self._COUNTERS}
+        data["tokens_per_second"] = round(self.tokens_per_second, 2)
+        data["latency_seconds"] = self.latency.to_dict()
+        data["first_byte_seconds"] = self.first_byte.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LevelTelemetry:
+        level = cls(**{name: data.get(name, 0) for name in cls._COUNTERS})
+        level.latency = Histogram.from_dict(data["latency_seconds"])
+        level.first_byte = Histogram.from_dict(data["first_byte_seconds"])
+        return level
+
+
+@dataclass
+class CallTimer:
+    """Timings of the API call in flight.
+
+    ``attempt_started`` is reset by each rate-limit retry, so latency
+    covers only the attempt that succeeded; waits are counted apart.
+    """
+
+    level: str
+    attempt_started: float = field(default_factory=time.perf_counter)
+    first_byte: float | None = None
+    rate_limits: int = 0
+    rate_limit_wait: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def start_attempt(self) -> None:
+        self.attempt_started = time.perf_counter()
+        self.first_byte = None
+
+    def mark_first_byte(self) -> None:
+        """Note that response headers arrived for the current attempt."""
+        if self.first_byte is None:
+            self.first_byte = time.perf_counter() - self.attempt_started
+
+    def add_tokens(self, input_tokens: int, output_tokens: int) -> None:
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+
+# The call being made in the current task, if any
+_current_call: ContextVar[CallTimer | None] = ContextVar("arcane_current_call", default=None)
+
+
+def current_call() -> CallTimer | None:
+    """Return the timer of the API call in flight in this task, if any."""
+    return _current_call.get()
+
+
+@dataclass
+class GenerationTelemetry:
+    """Per-level generation metrics for one client (or merged clients)."""
+
+    levels: dict[str, LevelTelemetry] = field(default_factory=dict)
+
+    def level(self, name: str | None) -> LevelTelemetry:
+        """Return the metrics for a level, creating them if needed."""
+        name = name or OTHER_LEVEL
+        level = self.levels.get(name)
+        if level is None:
+            level = self.levels[name] = LevelTelemetry()
+        return level
+
+    @contextmanager
+    def track_call(self, level: str | None) -> Iterator[CallTimer]:
+        """Time one API call, including any rate-limit retries inside it.
+
+        The call counts as failed if the block raises.
+        """
+        timer = CallTimer(level or OTHER_LEVEL)
+        token = _current_call.set(timer)
+        try:
+            yield timer
+        except BaseException:
+            self._finish(timer, failed=True)
+            raise
+        else:
+            self._finish(timer, failed=False)
+        finally:
+            _current_call.reset(token)
+
+    def _finish(self, timer: CallTimer, failed: bool) -> None:
+        level = self.level(timer.level)
+        level.rate_limits += timer.rate_limits
+        level.rate_limit_wait_seconds += timer.rate_limit_wait
+        if failed:
+            level.failed_calls += 1
+            return
+        level.calls += 1
+        level.input_tokens += timer.input_tokens
+        level.output_tokens += timer.output_tokens
+        level.latency.observe(time.perf_counter() - timer.attempt_started)
+        if timer.first_byte is not None:
+            level.first_byte.observe(timer.first_byte)
+
+    def record_generation(
+        self,
+        level: str | None,
+        seconds: float,
+        attempts: int,
+        validation_failures: int = 0,
+    ) -> None:
+        """Record one generator run (all of its attempts)."""
+        stats = self.level(level)
+        stats.generations += 1
+        stats.generation_seconds += seconds
+        stats.retries += max(0, attempts - 1)
+        stats.validation_failures += validation_failures
+
+    def reset(self) -> None:
+        self.levels = {}
+
+    def merge(self, other: GenerationTelemetry) -> None:
+        """Add another report into this one."""
+        for name, stats in other.levels.items():
+            self.level(name).merge(stats)
+
+    def merged_with(self, other: GenerationTelemetry) -> GenerationTelemetry:
+        """Return a new report combining this one with other."""
+        merged = GenerationTelemetry()
+        merged.merge(self)
+        merged.merge(other)
+        return merged
+
+    # --- Export ---
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable report, with totals across levels."""
+        total = LevelTelemetry()
+        for stats in self.levels.values():
+            total.merge(stats)
+        return {
+            "levels": {name: stats.to_dict() for name, stats in self.levels.items()},
+            "total": total.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GenerationTelemetry:
+        return cls(
+            levels={
+                name: LevelTelemetry.from_dict(stats)
+                for name, stats in (data.get("levels") or {}).items()
+            }
+        )
+
+    def to_prometheus(self, prefix: str = "arcane_generation") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        levels = sorted(self.levels.items())
+
+        def metric(name: str, kind: str, help_text: str, attr: str) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for level, stats in levels:
+                lines.append(f'{prefix}_{name}{{level="{level}"}} {_number(getattr(stats, attr))}')
+
+        def histogram(name: str, help_text: str, attr: str) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for level, stats in levels:
+                hist = getattr(stats, attr)
+                for bound, n in zip(hist.bounds, hist.cumulative(), strict=True):
+                    lines.append(
+                        f'{prefix}_{name}_bucket{{level="{level}",le="{_number(bound)}"}} {n}'
+                    )
+                lines.append(f'{prefix}_{name}_bucket{{level="{level}",le="+Inf"}} {hist.count}')
+                lines.append(f'{prefix}_{name}_sum{{level="{level}"}} {_number(hist.total)}')
+                lines.append(f'{prefix}_{name}_count{{level="{level}"}} {hist.count}')
+
+        histogram("call_seconds", "Latency of successful AI calls.", "latency")
+        histogram("first_byte_seconds", "Time until AI response headers arrived.", "first_byte")
+        metric("calls_total", "counter", "Successful AI calls.", "calls")
+        metric("failed_calls_total", "counter", "AI calls that raised.", "failed_calls")
+        metric("input_tokens_total", "counter", "Input tokens sent.", "input_tokens")
+        metric("output_tokens_total", "counter", "Output tokens received.", "output_tokens")
+        metric(
+            "output_tokens_per_second",
+            "gauge",
+            "Output tokens per second of call latency.",
+            "tokens_per_second",
+        )
+        metric("rate_limits_total", "counter", "Rate-limited attempts.", "rate_limits")
+        metric(
+            "rate_limit_wait_seconds_total",
+            "counter",
+            "Time spent backing off after rate limits.",
+            "rate_limit_wait_seconds",
+        )
+        metric("generations_total", "counter", "Generator runs.", "generations")
+        metric(
+            "generation_seconds_total",
+            "counter",
+            "Wall-clock time in generator runs, including retries.",
+            "generation_seconds",
+        )
+        metric("retries_total", "counter", "Generator attempts after the first.", "retries")
+        metric(
+            "validation_failures_total",
+            "counter",
+            "Responses rejected by schema or generator validation.",
+            "validation_failures",
+        )
+        return "\n".join(lines) + "\n"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
@@ -37,3 +37,4 @@ class Settings(BaseSettings):
     interactive: bool = True  # Whether to pause for user review between levels
     auto_save: bool = True
     output_dir: str = "./"
+    storage_backend: str = "json"  # "json" (roadmap.json per project) or "sqlite" (arcane.db)
@@ -17,6 +17,8 @@ from .milestone import MilestoneGenerator
 from .epic import EpicGenerator
 from .story import StoryGenerator
 from .task import TaskGenerator, TaskList
+from .budget import BudgetExceeded, BudgetReport, GenerationBudget
+from .eta import EtaSnapshot, EtaTracker
 from .orchestrator import RoadmapOrchestrator
 
 __all__ = [
@@ -33,5 +35,10 @@ __all__ = [
     "StoryGenerator",
     "TaskGenerator",
     "TaskList",
+    "BudgetExceeded",
+    "BudgetReport",
+    "GenerationBudget",
+    "EtaSnapshot",
+    "EtaTracker",
     "RoadmapOrchestrator",
 ]
@@ -5,8 +5,11 @@ All generators inherit from BaseGenerator which handles:
 - AI client calls with structured output
 - Retry logic with error feedback
 - Custom validation hooks
+- Telemetry: time, attempts and validation failures per level
+- Tracing: a span per run, tagged with attempts and validation failures
 """
 
+import time
 from abc import ABC, abstractmethod
 
 from pydantic import BaseModel, ValidationError
@@ -15,6 +18,7 @@ from rich.console import Console
 from arcane.core.clients.base import BaseAIClient, AIClientError
 from arcane.core.items.context import ProjectContext
 from arcane.core.templates.loader import TemplateLoader
+from arcane.core.utils.tracing import current_span, span
 
 
 class GenerationError(Exception):
@@ -61,6 +65,21 @@ class BaseGenerator(ABC):
         additional_guidance: str | None = None,
     ) -> BaseModel:
         """Generate items with retry logic and validation."""
+        with span(f"generate.{self.item_type}", **{"arcane.level": self.item_type}):
+            return await self._generate(
+                project_context, parent_context, sibling_context, additional_guidance
+            )
+
+    async def _generate(
+        self,
+        project_context: ProjectContext,
+        parent_context: dict | None,
+        sibling_context: list[str] | None,
+        additional_guidance: str | None,
+    ) -> BaseModel:
+        started = time.perf_counter()
+        attempts = 0
+        validation_failures = 0
 
         system_prompt = self.templates.render_system(self.item_type)
         user_prompt = self.templates.render_user(
@@ -74,6 +93,7 @@ class BaseGenerator(ABC):
         errors_so_far: list[str] = []
 
         for attempt in range(self.max_retries):
+            attempts += 1
             try:
                 if errors_so_far:
                     user_prompt = self.templates.render_user(
@@ -89,31 +109,51 @@ class BaseGenerator(ABC):
                     level=self.item_type,
                 )
 
-                extra_errors = self._validate(response, project_context, sibling_context)
+                with span("generate.validate"):
+                    extra_errors = self._validate(response, project_context, sibling_context)
                 if extra_errors:
+                    validation_failures += 1
                     errors_so_far.extend(extra_errors)
                     continue
 
+                self._record(started, attempts, validation_failures)
                 return response
 
             except (AIClientError, ValidationError) as e:
+                if isinstance(e, ValidationError):
+                    validation_failures += 1
                 errors_so_far.append(str(e))
                 if attempt < self.max_retries - 1:
                     self.console.print(
                         f"  [yellow]⚠ Attempt {attempt + 1} failed, retrying...[/yellow]"
                     )
                 else:
+                    self._record(started, attempts, validation_failures)
                     raise GenerationError(
                         f"Failed to generate {self.item_type} after {self.max_retries} attempts.\n"
                         f"Errors: {errors_so_far}"
                     )
 
-        # This should not be reached, but just in case
+        # Reached when the last attempt fails custom validation
+        self._record(started, attempts, validation_failures)
         raise GenerationError(
             f"Failed to generate {self.item_type} after {self.max_retries} attempts.\n"
             f"Errors: {errors_so_far}"
         )
 
+    def _record(self, started: float, attempts: int, validation_failures: int) -> None:
+        """Record this run's time, attempts and validation failures."""
+        current = current_span()
+        if current is not None:
+            current.set_attribute("arcane.attempts", attempts)
+            current.set_attribute("arcane.validation_failures", validation_failures)
+        self.client.telemetry.record_generation(
+            self.item_type,
+            time.perf_counter() - started,
+            attempts=attempts,
+            validation_failures=validation_failures,
+        )
+
     def _validate(
         self,
         response: BaseModel,
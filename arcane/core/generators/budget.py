@@ -0,0 +1,170 @@
+"""Time, token, cost and size limits for a generation run.
+
+A GenerationBudget is checked before each generator call is scheduled:
+a call only starts if the run can afford what it is expected to use
+(the rolling latency of its level, and the calibrated tokens per call
+priced for the client's model). Item caps stop scheduling once a level
+has reached its cap; the batch that crosses it is kept whole, since a
+story with half its tasks would look complete to resume.
+
+When a check fails the orchestrator saves the roadmap as it stands and
+returns it with a BudgetReport. Everything not generated yet is still a
+shell (a milestone without epics, an epic without stories, a story
+without tasks), so ``arcane resume`` picks up from there.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from arcane.core.clients.base import BaseAIClient
+from arcane.core.utils.cost_estimator import model_pricing
+
+from .eta import EtaTracker
+
+# Generation level -> the items one call at that level creates
+ITEM_KEYS = {
+    "milestone": "milestones",
+    "epic": "epics",
+    "story": "stories",
+    "task": "tasks",
+}
+
+
+class BudgetExceeded(Exception):
+    """Raised when the next generator call would exceed the budget."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass
+class GenerationBudget:
+    """Limits for one generate or resume run; None means no limit.
+
+    ``max_items`` caps the total items of a level in the roadmap, keyed
+    by "milestones", "epics", "stories" or "tasks". The other limits
+    apply to the run itself, not to earlier sessions of the roadmap.
+    """
+
+    max_seconds: float | None = None
+    max_tokens: int | None = None
+    max_cost_usd: float | None = None
+    max_items: dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        unknown = set(self.max_items) - set(ITEM_KEYS.values())
+        if unknown:
+            raise ValueError(
+                f"Unknown item level(s) {', '.join(sorted(unknown))}; "
+                f"expected {', '.join(ITEM_KEYS.values())}"
+            )
+        limits = [self.max_seconds, self.max_tokens, self.max_cost_usd, *self.max_items.values()]
+        if any(limit is not None and limit < 0 for limit in limits):
+            raise ValueError("Budget limits must not be negative")
+
+
+@dataclass
+class BudgetReport:
+    """Why a run stopped early, what it used and what is left."""
+
+    reason: str
+    elapsed_seconds: float
+    tokens: int
+    cost_usd: float
+    # Items still waiting for their children, by level
+    pending: dict[str, int]
+    remaining_calls: int
+    cost_to_complete_usd: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "reason": self.reason,
+            "elapsed_seconds": round(self.elapsed_seconds, 1),
+            "tokens": self.tokens,
+            "cost_usd": round(self.cost_usd, 4),
+            "pending": dict(self.pending),
+            "remaining_calls": self.remaining_calls,
+            "cost_to_complete_usd": round(self.cost_to_complete_usd, 4),
+        }
+
+
+class BudgetGuard:
+    """Checks a GenerationBudget against one run of a client.
+
+    Create it when the run starts, after the client's usage is reset.
+    """
+
+    def __init__(self, budget: GenerationBudget, client: BaseAIClient, eta: EtaTracker):
+        self.budget = budget
+        self.client = client
+        self.eta = eta
+        self.started = time.monotonic()
+        self._pricing = model_pricing(client.model_name)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def cost_usd(self) -> float:
+        return self.client.usage.calculate_cost(self._pricing["input"], self._pricing["output"])
+
+    def check(self, level: str, roadmap: Any) -> None:
+        """Raise BudgetExceeded if a call at ``level`` can't be afforded."""
+        budget = self.budget
+        key = ITEM_KEYS[level]
+        cap = budget.max_items.get(key)
+        if cap is not None and roadmap.total_items[key] >= cap:
+            raise BudgetExceeded(f"{key}: {roadmap.total_items[key]} of {cap} generated")
+
+        if budget.max_seconds is not None:
+            latency = self.eta.latency(level) or 0.0
+            if self.elapsed + latency > budget.max_seconds:
+                raise BudgetExceeded(
+                    f"time: {self.elapsed:.0f}s of {budget.max_seconds:.0f}s used; "
+                    f"the next {level} call takes ~{latency:.0f}s"
+                )
+
+        input_tokens, output_tokens = self.eta.calibration.tokens_per_call()[level]
+        if budget.max_tokens is not None:
+            used = self.client.usage.total_tokens
+            expected = round(input_tokens + output_tokens)
+            if used + expected > budget.max_tokens:
+                raise BudgetExceeded(
+                    f"tokens: {used:,} of {budget.max_tokens:,} used; "
+                    f"the next {level} call needs ~{expected:,}"
+                )
+
+        if budget.max_cost_usd is not None:
+            expected_cost = (
+                input_tokens * self._pricing["input"] + output_tokens * self._pricing["output"]
+            ) / 1_000_000
+            if self.cost_usd + expected_cost > budget.max_cost_usd:
+                raise BudgetExceeded(
+                    f"cost: ${self.cost_usd:.2f} of ${budget.max_cost_usd:.2f} spent; "
+                    f"the next {level} call costs ~${expected_cost:.2f}"
+                )
+
+    def report(self, reason: str, roadmap: Any) -> BudgetReport:
+        """Summarize the run after it stopped for ``reason``."""
+        snapshot = self.eta.snapshot(roadmap)
+        pending = {"milestones": 0, "epics": 0, "stories": 0}
+        for milestone in roadmap.milestones:
+            pending["milestones"] += not milestone.epics
+            for epic in milestone.epics:
+                pending["epics"] += not epic.stories
+                for story in epic.stories:
+                    pending["stories"] += not story.tasks
+        return BudgetReport(
+            reason=reason,
+            elapsed_seconds=self.elapsed,
+            tokens=self.client.usage.total_tokens,
+            cost_usd=self.cost_usd,
+            pending=pending,
+            remaining_calls=snapshot.remaining_calls,
+            cost_to_complete_usd=snapshot.cost_to_complete_usd,
+        )
@@ -0,0 +1,166 @@
+"""Live ETA and throughput for a generation run.
+
+The orchestrator can't know its total up front: every milestone, epic
+and story it generates adds calls below it. EtaTracker fills the gap
+with the expected fan-out (from a CostCalibration, or the defaults)
+for the items that don't exist yet, and times the remaining calls with
+the rolling per-level latency seen in the client's telemetry.
+
+Rates are per second of generation time rather than wall-clock time,
+so pauses for interactive review don't drag them down.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from arcane.core.clients.telemetry import GenerationTelemetry
+from arcane.core.utils.cost_estimator import LEVELS, CostCalibration
+
+# Per-level observations kept for the rolling latency and rates
+WINDOW = 20
+
+
+@dataclass
+class EtaSnapshot:
+    """Progress of a run at one save."""
+
+    completed_calls: int
+    remaining_calls: int
+    eta_seconds: float | None
+    calls_per_minute: float
+    tokens_per_second: float
+    cost_to_complete_usd: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form, as sent in progress events."""
+        return {
+            "completed_calls": self.completed_calls,
+            "remaining_calls": self.remaining_calls,
+            "eta_seconds": round(self.eta_seconds, 1) if self.eta_seconds is not None else None,
+            "calls_per_minute": round(self.calls_per_minute, 2),
+            "tokens_per_second": round(self.tokens_per_second, 1),
+            "cost_to_complete_usd": round(self.cost_to_complete_usd, 4),
+        }
+
+    def describe(self) -> str:
+        """One-line summary for the progress bar."""
+        eta = format_duration(self.eta_seconds) if self.eta_seconds is not None else "--"
+        return (
+            f"~{self.remaining_calls} remaining · ETA {eta} · "
+            f"{self.calls_per_minute:.1f} calls/min · {self.tokens_per_second:.0f} tok/s · "
+            f"~${self.cost_to_complete_usd:.2f} to go"
+        )
+
+
+@dataclass
+class _Observation:
+    """What one level's counters gained between two snapshots."""
+
+    level: str
+    generations: int
+    seconds: float
+    calls: int
+    output_tokens: int
+
+
+class EtaTracker:
+    """Projects the time and cost left in a run from its telemetry.
+
+    Create it after the client's telemetry is reset for the run; each
+    snapshot() reads what the telemetry gained since the previous one.
+    """
+
+    def __init__(
+        self,
+        telemetry: GenerationTelemetry,
+        calibration: CostCalibration | None = None,
+        model: str = "sonnet",
+        window: int = WINDOW,
+    ) -> None:
+        self.telemetry = telemetry
+        self.calibration = calibration or CostCalibration()
+        self.model = model
+        self._window: deque[_Observation] = deque(maxlen=window)
+        self._seen: dict[str, tuple[int, float, int, int]] = {}
+
+    def observe(self) -> None:
+        """Add the telemetry gained since the last call to the window."""
+        for level, stats in self.telemetry.levels.items():
+            current = (
+                stats.generations,
+                stats.generation_seconds,
+                stats.calls,
+                stats.output_tokens,
+            )
+            generations, seconds, calls, output = self._seen.get(level, (0, 0.0, 0, 0))
+            self._seen[level] = current
+            if current[0] > generations:
+                self._window.append(
+                    _Observation(
+                        level=level,
+                        generations=current[0] - generations,
+                        seconds=current[1] - seconds,
+                        calls=current[2] - calls,
+                        output_tokens=current[3] - output,
+                    )
+                )
+
+    def latency(self, level: str) -> float | None:
+        """Rolling mean seconds per generation at a level.
+
+        Falls back to the mean across levels for a level not seen yet,
+        and to None before anything has been generated.
+        """
+        for matches in (lambda o: o.level == level, lambda _: True):
+            observed = [o for o in self._window if matches(o)]
+            if observed:
+                return sum(o.seconds for o in observed) / sum(o.generations for o in observed)
+        return None
+
+    def snapshot(self, roadmap: Any) -> EtaSnapshot:
+        """Observe the telemetry and project the rest of ``roadmap``."""
+        self.observe()
+        estimate = self.calibration.estimate(self.model, roadmap=roadmap)
+        remaining = {
+            "milestone": estimate.milestone_calls,
+            "epic": estimate.epic_calls,
+            "story": estimate.story_calls,
+            "task": estimate.task_calls,
+        }
+
+        eta: float | None = 0.0
+        for level in LEVELS:
+            if not remaining[level]:
+                continue
+            latency = self.latency(level)
+            if latency is None:
+                eta = None
+                break
+            eta += remaining[level] * latency
+
+        seconds = sum(o.seconds for o in self._window)
+        return EtaSnapshot(
+            completed_calls=sum(s.generations for s in self.telemetry.levels.values()),
+            remaining_calls=sum(remaining.values()),
+            eta_seconds=eta,
+            calls_per_minute=sum(o.calls for o in self._window) * 60 / seconds if seconds else 0.0,
+            tokens_per_second=(
+                sum(o.output_tokens for o in self._window) / seconds if seconds else 0.0
+            ),
+            cost_to_complete_usd=estimate.estimated_cost_usd - estimate.spent_cost_usd,
+        )
+
+
+def format_duration(seconds: float) -> str:
+    """Render seconds as ``45s``, ``3m 05s`` or ``1h 02m``."""
+    seconds = round(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
@@ -4,6 +4,7 @@ Coordinates the full generation process: milestones → epics → stories → ta
 Saves incrementally after each story to prevent data loss on failures.
 """
 
+from collections.abc import Callable
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -14,6 +15,7 @@ from rich.prompt import Prompt
 from rich.table import Table
 
 from arcane.core.clients.base import BaseAIClient
+from arcane.core.clients.telemetry import GenerationTelemetry
 from arcane.core.items import (
     Roadmap,
     StoredUsage,
@@ -24,8 +26,11 @@ from arcane.core.items import (
 )
 from arcane.core.storage import StorageManager
 from arcane.core.templates import TemplateLoader
-from arcane.core.utils import generate_id, format_actual_usage
+from arcane.core.utils import CostCalibration, generate_id, format_actual_usage
+from arcane.core.utils.tracing import traced
 
+from .budget import BudgetExceeded, BudgetGuard, BudgetReport, GenerationBudget
+from .eta import EtaSnapshot, EtaTracker
 from .milestone import MilestoneGenerator
 from .epic import EpicGenerator
 from .story import StoryGenerator
@@ -47,6 +52,9 @@ class RoadmapOrchestrator:
         console: Console,
         storage: StorageManager,
         interactive: bool = True,
+        calibration: CostCalibration | None = None,
+        on_progress: Callable[[EtaSnapshot], None] | None = None,
+        budget: GenerationBudget | None = None,
     ):
         """Initialize the orchestrator.
 
@@ -55,14 +63,28 @@ class RoadmapOrchestrator:
             console: Rich console for output.
             storage: Storage manager for saving roadmaps.
             interactive: Whether to pause for user review between levels.
+            calibration: If given, the cost estimate is refined and shown
+                as each milestone's epics become known. It also sets the
+                fan-out the progress ETA assumes for items not generated yet.
+            on_progress: Called with the ETA and throughput at each save.
+            budget: Limits checked before each generator call. A run that
+                reaches one stops early, leaving a resumable roadmap and
+                setting budget_report.
         """
         self.client = client
         self.console = console
         self.storage = storage
         self.interactive = interactive
+        self.calibration = calibration
+        self.on_progress = on_progress
+        self.budget = budget
+        self.budget_report: BudgetReport | None = None
         self._previous_usage = StoredUsage()
+        self._previous_telemetry = GenerationTelemetry()
         self._progress: Progress | None = None
         self._task_id: int | None = None
+        self._eta: EtaTracker | None = None
+        self._budget: BudgetGuard | None = None
 
         templates = TemplateLoader()
         self.milestone_gen = MilestoneGenerator(client, console, templates)
@@ -70,11 +92,84 @@ class RoadmapOrchestrator:
         self.story_gen = StoryGenerator(client, console, templates)
         self.task_gen = TaskGenerator(client, console, templates)
 
+    @traced("orchestrator.save")
     async def _save(self, roadmap: Roadmap) -> None:
-        """Save roadmap with accumulated usage stats."""
+        """Save roadmap with accumulated usage stats and telemetry."""
         roadmap.usage = self._previous_usage.merged_with(self.client.usage)
         roadmap.updated_at = datetime.now(timezone.utc)
+        self._update_eta(roadmap)
         await self.storage.save_roadmap(roadmap)
+        await self.storage.save_telemetry(roadmap, self.telemetry)
+
+    def _update_eta(self, roadmap: Roadmap) -> None:
+        """Refresh the progress bar's ETA and report it to on_progress."""
+        if self._eta is None:
+            return
+        snapshot = self._eta.snapshot(roadmap)
+        if self.on_progress is not None:
+            self.on_progress(snapshot)
+        if self._progress and self._task_id is not None:
+            # Completed steps plus the expected calls left, so the total
+            # stops jumping as each level's fan-out is discovered
+            task = self._progress.tasks[self._task_id]
+            self._progress.update(
+                self._task_id,
+                total=max(task.completed + snapshot.remaining_calls, 1),
+                stats=snapshot.describe(),
+            )
+
+    def _start_budget(self) -> None:
+        """Start enforcing the budget for a run; call after the usage reset."""
+        self.budget_report = None
+        self._budget = None
+        if self.budget is not None and self._eta is not None:
+            self._budget = BudgetGuard(self.budget, self.client, self._eta)
+
+    def _check_budget(self, level: str, roadmap: Roadmap) -> None:
+        """Raise BudgetExceeded if the next call at a level can't be afforded."""
+        if self._budget is not None:
+            self._budget.check(level, roadmap)
+
+    async def _stop_for_budget(self, roadmap: Roadmap, exceeded: BudgetExceeded) -> Roadmap:
+        """Save what was generated and report why the run stopped."""
+        # Before the first milestone call there is nothing to resume from
+        if roadmap.milestones:
+            await self._save(roadmap)
+        self._finish_progress()
+        self.budget_report = self._budget.report(exceeded.reason, roadmap)
+        self._print_budget_report(self.budget_report)
+        return roadmap
+
+    def _print_budget_report(self, report: BudgetReport) -> None:
+        """Print why the run stopped and what it leaves for resume."""
+        pending = report.pending
+        self.console.print(f"\n[bold yellow]⏸  Budget reached[/bold yellow] — {report.reason}")
+        self.console.print(
+            f"   Used {report.elapsed_seconds:.0f}s, {report.tokens:,} tokens, "
+            f"${report.cost_usd:.2f}"
+        )
+        self.console.print(
+            f"   Left: {pending['milestones']} milestones without epics, "
+            f"{pending['epics']} epics without stories, "
+            f"{pending['stories']} stories without tasks "
+            f"(~{report.remaining_calls} calls, ~${report.cost_to_complete_usd:.2f})"
+        )
+
+    def _print_estimate(self, roadmap: Roadmap) -> None:
+        """Show the total cost estimate given what has been generated so far."""
+        if self.calibration is None:
+            return
+        # Called right after _save(), so roadmap.usage is current
+        estimate = self.calibration.estimate(self.client.model_name, roadmap=roadmap)
+        line = f"  [dim]💰 Estimated total: ~${estimate.estimated_cost_usd:.2f}"
+        if estimate.low_cost_usd is not None:
+            line += f" (${estimate.low_cost_usd:.2f}–${estimate.high_cost_usd:.2f})"
+        self.console.print(line + "[/dim]")
+
+    @property
+    def telemetry(self) -> GenerationTelemetry:
+        """Generation telemetry across this and previous sessions."""
+        return self._previous_telemetry.merged_with(self.client.telemetry)
 
     def _display_milestones(self, milestones: list) -> None:
         """Display generated milestones in a table format."""
@@ -182,12 +277,12 @@ class RoadmapOrchestrator:
             TextColumn("[bold blue]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
-            TextColumn("{task.fields[remaining]} remaining"),
+            TextColumn("{task.fields[stats]}"),
             console=self.console,
         )
         self._progress.start()
         self._task_id = self._progress.add_task(
-            "Starting...", total=max(total, 1), remaining=total
+            "Starting...", total=max(total, 1), stats=f"{total} remaining"
         )
 
     def _update_description(self, description: str) -> None:
@@ -200,14 +295,7 @@ class RoadmapOrchestrator:
         if not self._progress or self._task_id is None:
             return
         task = self._progress.tasks[self._task_id]
-        new_total = task.total + add_total
-        remaining = int(new_total - task.completed - 1)
-        self._progress.update(
-            self._task_id,
-            total=new_total,
-            advance=1,
-            remaining=remaining,
-        )
+        self._progress.update(self._task_id, total=task.total + add_total, advance=1)
 
     def _pause_progress(self) -> None:
         """Temporarily hide the progress bar for interactive prompts."""
@@ -243,6 +331,7 @@ class RoadmapOrchestrator:
                                 total += 1
         return total
 
+    @traced("orchestrator.generate")
     async def generate(self, context: ProjectContext) -> Roadmap:
         """Generate a complete roadmap from project context.
 
@@ -253,7 +342,8 @@ class RoadmapOrchestrator:
             context: The project context from discovery questions.
 
         Returns:
-            The complete generated Roadmap.
+            The complete generated Roadmap, or the partial one saved when
+            the budget was reached (see budget_report).
         """
         roadmap = Roadmap(
             id=generate_id("roadmap"),
@@ -265,14 +355,33 @@ class RoadmapOrchestrator:
 
         # Reset usage tracking for this session (new roadmap, no previous usage)
         self._previous_usage = StoredUsage()
+        self._previous_telemetry = GenerationTelemetry()
         self.client.reset_usage()
+        self.client.telemetry.reset()
+        self._eta = EtaTracker(self.client.telemetry, self.calibration, self.client.model_name)
+        self._start_budget()
+
+        try:
+            await self._generate_levels(context, roadmap)
+        except BudgetExceeded as exceeded:
+            return await self._stop_for_budget(roadmap, exceeded)
+
+        # Final save
+        await self._save(roadmap)
+
+        self._finish_progress()
+        self._print_summary(roadmap)
+        return roadmap
 
+    async def _generate_levels(self, context: ProjectContext, roadmap: Roadmap) -> None:
+        """Generate milestones, then expand each one level by level."""
         # Initialize progress bar (1 step for milestone generation)
         self._init_progress(1)
 
         # Phase 1: Generate milestones
         self._update_description("Generating milestones...")
         self.console.print("\n[bold]📋 Generating milestones...[/bold]")
+        self._check_budget("milestone", roadmap)
         ms_result = await self.milestone_gen.generate(context)
 
         # Interactive review of milestones
@@ -287,6 +396,7 @@ class RoadmapOrchestrator:
                 if action == ReviewAction.APPROVE:
                     break
                 self.console.print("\n[bold]🔄 Regenerating milestones...[/bold]")
+                self._check_budget("milestone", roadmap)
                 ms_result = await self.milestone_gen.generate(context)
             self._resume_progress()
 
@@ -307,6 +417,7 @@ class RoadmapOrchestrator:
 
         # Save milestone shells so resume can find them if generation fails
         await self._save(roadmap)
+        self._print_estimate(roadmap)
 
         # Phase 2-4: Expand each milestone
         for ms_skel, milestone in ms_pairs:
@@ -314,6 +425,7 @@ class RoadmapOrchestrator:
 
             # Generate epics for this milestone
             self._update_description(f"Generating epics for: {ms_skel.name}")
+            self._check_budget("epic", roadmap)
             ep_result = await self.epic_gen.generate(
                 context,
                 parent_context={"milestone": ms_skel.model_dump()},
@@ -333,6 +445,7 @@ class RoadmapOrchestrator:
                     self.console.print(
                         f"\n[bold]🔄 Regenerating epics for {ms_skel.name}...[/bold]"
                     )
+                    self._check_budget("epic", roadmap)
                     ep_result = await self.epic_gen.generate(
                         context,
                         parent_context={"milestone": ms_skel.model_dump()},
@@ -356,6 +469,7 @@ class RoadmapOrchestrator:
 
             # Save epic shells so resume can find them if generation fails
             await self._save(roadmap)
+            self._print_estimate(roadmap)
 
             # Now expand each epic with stories and tasks
             for ep_skel, epic in epic_pairs:
@@ -363,6 +477,7 @@ class RoadmapOrchestrator:
 
                 # Generate stories for this epic
                 self._update_description(f"Generating stories for: {ep_skel.name}")
+                self._check_budget("story", roadmap)
                 st_result = await self.story_gen.generate(
                     context,
                     parent_context={
@@ -386,6 +501,7 @@ class RoadmapOrchestrator:
                         self.console.print(
                             f"\n[bold]🔄 Regenerating stories for {ep_skel.name}...[/bold]"
                         )
+                        self._check_budget("story", roadmap)
                         st_result = await self.story_gen.generate(
                             context,
                             parent_context={
@@ -420,6 +536,7 @@ class RoadmapOrchestrator:
 
                     # Generate tasks for this story
                     self._update_description(f"Generating tasks for: {st_skel.name}")
+                    self._check_budget("task", roadmap)
                     task_result = await self.task_gen.generate(
                         context,
                         parent_context={
@@ -443,6 +560,7 @@ class RoadmapOrchestrator:
                             self.console.print(
                                 f"\n[bold]🔄 Regenerating tasks for {st_skel.name}...[/bold]"
                             )
+                            self._check_budget("task", roadmap)
                             task_result = await self.task_gen.generate(
                                 context,
                                 parent_context={
@@ -460,13 +578,7 @@ class RoadmapOrchestrator:
                     # Save incrementally after each story
                     await self._save(roadmap)
 
-        # Final save
-        await self._save(roadmap)
-
-        self._finish_progress()
-        self._print_summary(roadmap)
-        return roadmap
-
+    @traced("orchestrator.resume")
     async def resume(self, roadmap: Roadmap) -> Roadmap:
         """Resume generation of an incomplete roadmap.
 
@@ -477,14 +589,33 @@ class RoadmapOrchestrator:
             roadmap: A partially-complete roadmap loaded from disk.
 
         Returns:
-            The completed Roadmap.
+            The completed Roadmap, or the partial one saved when the budget
+            was reached (see budget_report).
         """
         context = roadmap.context
 
         # Capture existing usage so we can accumulate across sessions
         self._previous_usage = roadmap.usage.model_copy()
+        self._previous_telemetry = await self.storage.load_telemetry(roadmap)
         self.client.reset_usage()
+        self.client.telemetry.reset()
+        self._eta = EtaTracker(self.client.telemetry, self.calibration, self.client.model_name)
+        self._start_budget()
+
+        try:
+            await self._resume_levels(context, roadmap)
+        except BudgetExceeded as exceeded:
+            return await self._stop_for_budget(roadmap, exceeded)
 
+        # Final save
+        await self._save(roadmap)
+
+        self._finish_progress()
+        self._print_summary(roadmap)
+        return roadmap
+
+    async def _resume_levels(self, context: ProjectContext, roadmap: Roadmap) -> None:
+        """Generate the missing children of each milestone, epic and story."""
         # Initialize progress bar based on remaining work
         resume_total = self._calculate_resume_total(roadmap)
         if resume_total > 0:
@@ -501,6 +632,7 @@ class RoadmapOrchestrator:
                 )
 
                 self._update_description(f"Generating epics for: {milestone.name}")
+                self._check_budget("epic", roadmap)
                 ep_result = await self.epic_gen.generate(
                     context,
                     parent_context={"milestone": ms_ctx},
@@ -519,6 +651,7 @@ class RoadmapOrchestrator:
                         self.console.print(
                             f"\n[bold]🔄 Regenerating epics for {milestone.name}...[/bold]"
                         )
+                        self._check_budget("epic", roadmap)
                         ep_result = await self.epic_gen.generate(
                             context,
                             parent_context={"milestone": ms_ctx},
@@ -539,6 +672,7 @@ class RoadmapOrchestrator:
 
                 # Save epic shells so resume can find them if generation fails
                 await self._save(roadmap)
+                self._print_estimate(roadmap)
 
             # Now expand each epic that needs children
             for epic in milestone.epics:
@@ -551,6 +685,7 @@ class RoadmapOrchestrator:
                     )
 
                     self._update_description(f"Generating stories for: {epic.name}")
+                    self._check_budget("story", roadmap)
                     st_result = await self.story_gen.generate(
                         context,
                         parent_context={"milestone": ms_ctx, "epic": ep_ctx},
@@ -570,6 +705,7 @@ class RoadmapOrchestrator:
                             self.console.print(
                                 f"\n[bold]🔄 Regenerating stories for {epic.name}...[/bold]"
                             )
+                            self._check_budget("story", roadmap)
                             st_result = await self.story_gen.generate(
                                 context,
                                 parent_context={"milestone": ms_ctx, "epic": ep_ctx},
@@ -604,6 +740,7 @@ class RoadmapOrchestrator:
                     )
 
                     self._update_description(f"Generating tasks for: {story.name}")
+                    self._check_budget("task", roadmap)
                     task_result = await self.task_gen.generate(
                         context,
                         parent_context={
@@ -626,6 +763,7 @@ class RoadmapOrchestrator:
                             self.console.print(
                                 f"\n[bold]🔄 Regenerating tasks for {story.name}...[/bold]"
                             )
+                            self._check_budget("task", roadmap)
                             task_result = await self.task_gen.generate(
                                 context,
                                 parent_context={
@@ -643,13 +781,6 @@ class RoadmapOrchestrator:
                     # Save incrementally after each story
                     await self._save(roadmap)
 
-        # Final save
-        await self._save(roadmap)
-
-        self._finish_progress()
-        self._print_summary(roadmap)
-        return roadmap
-
     @staticmethod
     def _item_context(item: Milestone | Epic | Story) -> dict:
         """Extract compact context dict from a saved item for parent_context.
@@ -676,6 +807,20 @@ class RoadmapOrchestrator:
         )
         self.console.print(f"   Estimated: {roadmap.total_hours} hours")
 
+        # Where this session's time went (full report in telemetry.json)
+        levels = self.client.telemetry.levels
+        if levels:
+            timing = ", ".join(
+                f"{name} {stats.generation_seconds:.1f}s" for name, stats in levels.items()
+            )
+            self.console.print(f"   Time by level: {timing}")
+            retries = sum(stats.retries for stats in levels.values())
+            waited = sum(stats.rate_limit_wait_seconds for stats in levels.values())
+            if retries or waited:
+                self.console.print(
+                    f"   [yellow]{retries} retries, {waited:.0f}s waiting on rate limits[/yellow]"
+                )
+
         # Print session usage
         self.console.print()
         self.console.print(format_actual_usage(
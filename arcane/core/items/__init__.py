@@ -5,6 +5,8 @@ This module exports all Pydantic models for roadmap entities:
 - Base: BaseItem
 - Items: Task, Story, Epic, Milestone, Roadmap
 - Context: ProjectContext
+- Index: RoadmapIndex (ID lookups, parent chains, per-type columns)
+- Views: RoadmapView and slotted read-only item views
 """
 
 from .base import Priority, Status, BaseItem
@@ -14,6 +16,8 @@ from .epic import Epic
 from .milestone import Milestone
 from .roadmap import Roadmap, StoredUsage
 from .context import ProjectContext
+from .index import IndexEntry, ItemColumns, RoadmapIndex
+from .view import EpicView, MilestoneView, RoadmapView, StoryView, TaskView
 
 __all__ = [
     "Priority",
@@ -26,4 +30,12 @@ __all__ = [
     "Roadmap",
     "StoredUsage",
     "ProjectContext",
+    "IndexEntry",
+    "ItemColumns",
+    "RoadmapIndex",
+    "RoadmapView",
+    "MilestoneView",
+    "EpicView",
+    "StoryView",
+    "TaskView",
 ]
@@ -1,10 +1,14 @@
 """Base models and enums for roadmap items.
 
 This module provides the foundational types used across all roadmap items:
-Priority, Status enums and the BaseItem base class.
+Priority, Status enums, the BaseItem base class, and the rollup caching
+shared by items and the Roadmap.
 """
 
+import weakref
+from collections.abc import Callable
 from enum import Enum
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
@@ -27,7 +31,146 @@ class Status(str, Enum):
     COMPLETED = "completed"
 
 
-class BaseItem(BaseModel):
+class ChildList(list):
+    """A list of child items that invalidates its owner's rollups when mutated."""
+
+    __slots__ = ("_owner",)
+
+    def _mutating(name: str):
+        method = getattr(list, name)
+
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            owner = getattr(self, "_owner", None)
+            owner = owner() if owner is not None else None
+            if owner is not None:
+                owner._invalidate_rollups()
+            return result
+
+        wrapper.__name__ = name
+        return wrapper
+
+    append = _mutating("append")
+    extend = _mutating("extend")
+    insert = _mutating("insert")
+    remove = _mutating("remove")
+    pop = _mutating("pop")
+    clear = _mutating("clear")
+    sort = _mutating("sort")
+    reverse = _mutating("reverse")
+    __setitem__ = _mutating("__setitem__")
+    __delitem__ = _mutating("__delitem__")
+    __iadd__ = _mutating("__iadd__")
+    __imul__ = _mutating("__imul__")
+
+    del _mutating
+
+
+def _slot(model: BaseModel, name: str) -> Any:
+    """Read an unset-able slot without going through BaseModel.__getattr__."""
+    try:
+        return object.__getattribute__(model, name)
+    except AttributeError:
+        return None
+
+
+class RollupModel(BaseModel):
+    """Base for models whose computed fields roll up over their children.
+
+    Rollups (hours, item counts) are cached per model. Assigning a field
+    or mutating the child list clears the cache of that model and of every
+    ancestor, so after an edit only the path to the root is recomputed
+    and repeated reads or model_dump calls don't re-walk the tree.
+
+    Parent links are recorded when a parent computes a rollup (not when
+    a child is attached), so a parent only holds a cache while every one
+    of its current children knows to invalidate it. This also keeps
+    copies correct, since the links are rebuilt on first use.
+    """
+
+    # Slots rather than PrivateAttr so the cache stays out of __eq__,
+    # copies and serialization
+    __slots__ = ("_rollup_cache", "_rollup_parents")
+
+    # Name of the field holding child items, wrapped in a ChildList
+    children_field: ClassVar[str | None] = None
+
+    def model_post_init(self, __context: Any) -> None:
+        # Leaves hold no cache, and copies skip this entirely, so the
+        # slots are read through _slot() rather than assumed to be set
+        name = self.children_field
+        if name is not None:
+            object.__setattr__(self, "_rollup_cache", None)
+            self.__dict__[name] = ChildList(self.__dict__.get(name) or [])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_"):
+            if name == self.children_field and isinstance(value, list):
+                value = ChildList(value)
+            self._invalidate_rollups()
+        super().__setattr__(name, value)
+
+    def _invalidate_rollups(self) -> None:
+        """Drop cached rollups here and on every ancestor."""
+        object.__setattr__(self, "_rollup_cache", None)
+        parents = _slot(self, "_rollup_parents")
+        if parents:
+            for ref in parents:
+                parent = ref()
+                if parent is not None:
+                    parent._invalidate_rollups()
+
+    def _rollup(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return a cached rollup value, computing it if missing."""
+        cache = _slot(self, "_rollup_cache")
+        if cache is None:
+            self._link_children()
+            cache = {}
+            object.__setattr__(self, "_rollup_cache", cache)
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = compute()
+            return value
+
+    def _link_children(self) -> None:
+        """Make the child list and each child invalidate this model."""
+        name = self.children_field
+        if name is None:
+            return
+        children = self.__dict__.get(name)
+        if not isinstance(children, ChildList):
+            children = self.__dict__[name] = ChildList(children or [])
+        ref = weakref.ref(self)
+        object.__setattr__(children, "_owner", ref)
+        for child in children:
+            parents = _slot(child, "_rollup_parents")
+            if parents is None:
+                object.__setattr__(child, "_rollup_parents", [ref])
+            elif not any(p() is self for p in parents):
+                # Drop links to parents that no longer exist
+                parents[:] = [p for p in parents if p() is not None]
+                parents.append(ref)
+
+    def _item_counts(self) -> dict[str, int]:
+        """Counts of descendants by collection name (e.g. "tasks")."""
+        if self.children_field is None:
+            return {}
+        return self._rollup("item_counts", self._count_descendants)
+
+    def _count_descendants(self) -> dict[str, int]:
+        name = self.children_field
+        children = getattr(self, name)
+        counts = {name: len(children)}
+        for child in children:
+            if child.children_field is None:
+                continue
+            for key, value in child._item_counts().items():
+                counts[key] = counts.get(key, 0) + value
+        return counts
+
+
+class BaseItem(RollupModel):
     """Base class for all roadmap items.
 
     All roadmap items (Task, Story, Epic, Milestone) inherit from this class
@@ -4,6 +4,8 @@ An Epic represents a coherent feature area or system component
 that contains multiple Stories.
 """
 
+from typing import ClassVar
+
 from pydantic import computed_field
 
 from .base import BaseItem
@@ -17,6 +19,8 @@ class Epic(BaseItem):
     to a milestone's objective.
     """
 
+    children_field: ClassVar[str] = "stories"
+
     goal: str
     prerequisites: list[str] = []  # IDs of dependent epics
     stories: list[Story] = []
@@ -25,4 +29,6 @@ class Epic(BaseItem):
     @property
     def estimated_hours(self) -> int:
         """Total estimated hours from all stories."""
-        return sum(s.estimated_hours for s in self.stories)
+        return self._rollup(
+            "estimated_hours", lambda: sum(s.estimated_hours for s in self.stories)
+        )
@@ -0,0 +1,390 @@
+"""Flat index over a roadmap hierarchy.
+
+RoadmapIndex maps every item ID to its node, parent, position and depth
+in one pass over the tree, so lookups, ancestor chains and prerequisite
+resolution don't re-walk the nested lists. It works over Roadmap models
+and over the plain ``{"milestones": [...]}`` dicts stored by the web
+backend, and keeps itself current when edits go through its mutation
+helpers (add, remove, reorder, update).
+
+For summaries, ``columns()`` exposes per-type arrays of status, priority
+and hours that can be aggregated without touching the item objects.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from .base import Priority, Status
+
+# Item types from the top of the hierarchy down
+ITEM_TYPES = ("milestone", "epic", "story", "task")
+
+# Maps item type to the key holding its children
+CHILDREN_KEY = {
+    "roadmap": "milestones",
+    "milestone": "epics",
+    "epic": "stories",
+    "story": "tasks",
+    "task": None,
+}
+
+# Maps parent type to the type of its children
+CHILD_TYPE = {
+    "roadmap": "milestone",
+    "milestone": "epic",
+    "epic": "story",
+    "story": "task",
+}
+
+# Status and priority are stored in columns as their position in the enum
+STATUSES = tuple(Status)
+PRIORITIES = tuple(Priority)
+_STATUS_CODE = {s: i for i, s in enumerate(STATUSES)}
+_PRIORITY_CODE = {p: i for i, p in enumerate(PRIORITIES)}
+
+
+def _field(node: Any, name: str, default: Any = None) -> Any:
+    if isinstance(node, dict):
+        return node.get(name, default)
+    return getattr(node, name, default)
+
+
+def _children(node: Any, item_type: str, create: bool = False) -> list:
+    key = CHILDREN_KEY[item_type]
+    if key is None:
+        return []
+    if isinstance(node, dict):
+        return node.setdefault(key, []) if create else node.get(key) or []
+    return getattr(node, key)
+
+
+class IndexEntry(NamedTuple):
+    """Where one item sits in the hierarchy."""
+
+    item: Any
+    item_type: str
+    parent_id: str | None  # None for milestones
+    position: int  # Index within the parent's child list
+    depth: int  # 0 for milestones, 3 for tasks
+
+
+@dataclass
+class ItemColumns:
+    """Array-backed status, priority and hours for all items of one type.
+
+    Row i of every array describes ``ids[i]``. Status and priority hold
+    positions in STATUSES and PRIORITIES.
+    """
+
+    ids: list[str]
+    status: array
+    priority: array
+    hours: array
+    rows: dict[str, int]  # ID -> row
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def status_counts(self) -> dict[Status, int]:
+        """Number of items in each status."""
+        counts = Counter(self.status)
+        return {s: counts.get(i, 0) for i, s in enumerate(STATUSES)}
+
+    def priority_counts(self) -> dict[Priority, int]:
+        """Number of items at each priority."""
+        counts = Counter(self.priority)
+        return {p: counts.get(i, 0) for i, p in enumerate(PRIORITIES)}
+
+    def total_hours(self, status: Status | None = None) -> float:
+        """Sum of hours, optionally only for items in one status."""
+        if status is None:
+            return sum(self.hours)
+        code = _STATUS_CODE[status]
+        return sum(h for h, s in zip(self.hours, self.status, strict=True) if s == code)
+
+
+class RoadmapIndex:
+    """ID index over a Roadmap or a ``{"milestones": [...]}`` dict.
+
+    The index holds references to the items themselves, so field edits
+    made directly on an item are visible through it. Structural edits
+    (adding, removing or reordering items) must go through add(),
+    remove() and reorder(), or the index must be rebuilt.
+
+    When an ID appears more than once, the first occurrence in document
+    order is indexed.
+    """
+
+    def __init__(self, roadmap: Any):
+        """Index every item under roadmap.
+
+        Args:
+            roadmap: A Roadmap model or a dict with a "milestones" list.
+        """
+        self.root = roadmap
+        # Plain tuples in IndexEntry field order; building an IndexEntry
+        # per item roughly doubles the cost of indexing large roadmaps
+        self._entries: dict[str, tuple] = {}
+        self._columns: dict[str, ItemColumns] | None = None
+        self._index_children(roadmap, "roadmap", None, 0)
+
+    def _index_children(
+        self, node: Any, node_type: str, node_id: str | None, depth: int
+    ) -> None:
+        # The hierarchy is at most four levels deep, so plain recursion
+        # over child lists (in document order; first duplicate ID wins)
+        child_type = CHILD_TYPE.get(node_type)
+        if child_type is None:
+            return
+        entries = self._entries
+        has_children = CHILD_TYPE.get(child_type) is not None
+        children = _children(node, node_type)
+        if isinstance(node, dict):
+            ids = [c.get("id") for c in children]
+        else:
+            ids = [c.id for c in children]
+        for position, child in enumerate(children):
+            child_id = ids[position]
+            if child_id is not None and child_id not in entries:
+                entries[child_id] = (child, child_type, node_id, position, depth)
+            if has_children:
+                self._index_children(child, child_type, child_id, depth + 1)
+
+    def _unindex(self, item: Any, item_type: str) -> None:
+        stack = [(item, item_type)]
+        while stack:
+            node, node_type = stack.pop()
+            node_id = _field(node, "id")
+            entry = self._entries.get(node_id)
+            if entry is not None and entry[0] is node:
+                del self._entries[node_id]
+            child_type = CHILD_TYPE.get(node_type)
+            if child_type is not None:
+                stack.extend((c, child_type) for c in _children(node, node_type))
+
+    def _renumber(self, collection: list, start: int = 0) -> None:
+        entries = self._entries
+        for position in range(start, len(collection)):
+            child = collection[position]
+            child_id = _field(child, "id")
+            entry = entries.get(child_id)
+            if entry is not None and entry[0] is child:
+                entries[child_id] = entry[:3] + (position, entry[4])
+
+    # --- Lookups ---
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def entry(self, item_id: str) -> IndexEntry:
+        """Return the index entry for item_id.
+
+        Raises:
+            KeyError: If no item has that ID.
+        """
+        return IndexEntry._make(self._entries[item_id])
+
+    def get(self, item_id: str, default: Any = None) -> Any:
+        """Return the item with item_id, or default if there is none."""
+        entry = self._entries.get(item_id)
+        return default if entry is None else entry[0]
+
+    def parent(self, item_id: str) -> Any:
+        """Return the parent item, or None for milestones."""
+        parent_id = self._entries[item_id][2]
+        return None if parent_id is None else self._entries[parent_id][0]
+
+    def container(self, item_id: str) -> list:
+        """Return the list holding item_id (its parent's child list)."""
+        parent_id = self._entries[item_id][2]
+        return self.children(parent_id)
+
+    def children(self, item_id: str | None = None) -> list:
+        """Return the child list of item_id, or the milestones for None."""
+        if item_id is None:
+            return _children(self.root, "roadmap")
+        item, item_type = self._entries[item_id][:2]
+        return _children(item, item_type)
+
+    def ancestors(self, item_id: str) -> list[IndexEntry]:
+        """Return the entries above item_id, from its milestone down."""
+        chain = []
+        parent_id = self._entries[item_id][2]
+        while parent_id is not None:
+            entry = IndexEntry._make(self._entries[parent_id])
+            chain.append(entry)
+            parent_id = entry.parent_id
+        chain.reverse()
+        return chain
+
+    def path(self, item_id: str) -> tuple[int, ...]:
+        """Return the child-list positions leading from the root to item_id.
+
+        For example (0, 2) is the third epic of the first milestone.
+        """
+        positions = []
+        while item_id is not None:
+            entry = self._entries[item_id]
+            positions.append(entry[3])
+            item_id = entry[2]
+        return tuple(reversed(positions))
+
+    def items_of_type(self, item_type: str) -> Iterator[Any]:
+        """Yield every indexed item of one type."""
+        for entry in self._entries.values():
+            if entry[1] == item_type:
+                yield entry[0]
+
+    # --- Mutation helpers ---
+
+    def add(self, parent_id: str | None, item: Any) -> IndexEntry:
+        """Append item (and its subtree) under parent_id.
+
+        Args:
+            parent_id: ID of the parent item, or None to add a milestone.
+            item: Item to append; its type is implied by the parent.
+
+        Returns:
+            The new entry.
+
+        Raises:
+            KeyError: If parent_id is not in the index.
+            ValueError: If the parent is a task or the ID is already used.
+        """
+        if parent_id is None:
+            parent, parent_type, depth = self.root, "roadmap", 0
+        else:
+            parent, parent_type, _, _, parent_depth = self._entries[parent_id]
+            depth = parent_depth + 1
+        item_type = CHILD_TYPE.get(parent_type)
+        if item_type is None:
+            raise ValueError(f"Cannot add children to a {parent_type}")
+        item_id = _field(item, "id")
+        if item_id in self._entries:
+            raise ValueError(f"Duplicate item ID: {item_id}")
+
+        collection = _children(parent, parent_type, create=True)
+        collection.append(item)
+        entry = (item, item_type, parent_id, len(collection) - 1, depth)
+        self._entries[item_id] = entry
+        self._index_children(item, item_type, item_id, depth + 1)
+        self._columns = None
+        return IndexEntry._make(entry)
+
+    def remove(self, item_id: str) -> Any:
+        """Remove item_id and its subtree from the roadmap and the index.
+
+        Returns:
+            The removed item.
+        """
+        item, item_type, _, position, _ = self._entries[item_id]
+        collection = self.container(item_id)
+        del collection[position]
+        self._unindex(item, item_type)
+        self._renumber(collection, position)
+        self._columns = None
+        return item
+
+    def reorder(self, parent_id: str | None, item_ids: list[str]) -> None:
+        """Reorder the children of parent_id to match item_ids.
+
+        Raises:
+            ValueError: If item_ids are not exactly the current children.
+        """
+        collection = self.children(parent_id)
+        by_id = {_field(child, "id"): child for child in collection}
+        if set(by_id) != set(item_ids) or len(item_ids) != len(collection):
+            raise ValueError("Provided item IDs do not match existing children")
+        # In place, so models keep their (tracked) child list
+        collection[:] = [by_id[i] for i in item_ids]
+        self._renumber(collection)
+        self._columns = None
+
+    def update(self, item_id: str, **fields: Any) -> Any:
+        """Set fields on item_id and keep the columns in step.
+
+        Returns:
+            The updated item.
+        """
+        item, item_type = self._entries[item_id][:2]
+        for name, value in fields.items():
+            if isinstance(item, dict):
+                item[name] = value
+            else:
+                setattr(item, name, value)
+        if self._columns is not None:
+            if "estimated_hours" in fields:
+                # Parent hours roll up, so rebuild on next use
+                self._columns = None
+            else:
+                columns = self._columns[item_type]
+                row = columns.rows[item_id]
+                if "status" in fields:
+                    columns.status[row] = _STATUS_CODE[fields["status"]]
+                if "priority" in fields:
+                    columns.priority[row] = _PRIORITY_CODE[fields["priority"]]
+        return item
+
+    # --- Columns ---
+
+    def columns(self, item_type: str) -> ItemColumns:
+        """Return status, priority and hours columns for one item type.
+
+        Hours are a task's estimate, or the sum over the subtree for the
+        other types. Built on first use and kept until the next
+        structural edit.
+        """
+        if self._columns is None:
+            self._columns = self._build_columns()
+        return self._columns[item_type]
+
+    def _build_columns(self) -> dict[str, ItemColumns]:
+        by_type: dict[str, list[tuple[str, Any, str | None]]] = {
+            t: [] for t in ITEM_TYPES
+        }
+        for item_id, (item, item_type, parent_id, _, _) in self._entries.items():
+            by_type[item_type].append((item_id, item, parent_id))
+
+        default_priority = _PRIORITY_CODE[Priority.MEDIUM]
+        columns = {}
+        # Tasks first; each level adds its hours into its parents' totals
+        rolled_up: dict[str, float] = {}
+        for item_type in reversed(ITEM_TYPES):
+            rows = by_type[item_type]
+            ids = [row[0] for row in rows]
+            items = [row[1] for row in rows]
+            if item_type == "task":
+                hours = [float(_field(i, "estimated_hours", 0) or 0) for i in items]
+            else:
+                hours = [rolled_up.get(item_id, 0.0) for item_id in ids]
+            rolled_up = {}
+            for (_, _, parent_id), value in zip(rows, hours, strict=True):
+                if parent_id is not None:
+                    rolled_up[parent_id] = rolled_up.get(parent_id, 0.0) + value
+            columns[item_type] = ItemColumns(
+                ids=ids,
+                status=array(
+                    "b", [_STATUS_CODE.get(_field(i, "status"), 0) for i in items]
+                ),
+                priority=array(
+                    "b",
+                    [
+                        _PRIORITY_CODE.get(_field(i, "priority"), default_priority)
+                        for i in items
+                    ],
+                ),
+                hours=array("d", hours),
+                rows={item_id: row for row, item_id in enumerate(ids)},
+            )
+        return columns
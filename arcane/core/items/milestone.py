@@ -4,6 +4,8 @@ A Milestone represents a major phase or deliverable in the project
 that contains multiple Epics.
 """
 
+from typing import ClassVar
+
 from pydantic import computed_field
 
 from .base import BaseItem
@@ -17,6 +19,8 @@ class Milestone(BaseItem):
     clear, measurable goals.
     """
 
+    children_field: ClassVar[str] = "epics"
+
     goal: str
     target_date: str | None = None
     epics: list[Epic] = []
@@ -25,4 +29,6 @@ class Milestone(BaseItem):
     @property
     def estimated_hours(self) -> int:
         """Total estimated hours from all epics."""
-        return sum(e.estimated_hours for e in self.epics)
+        return self._rollup(
+            "estimated_hours", lambda: sum(e.estimated_hours for e in self.epics)
+        )
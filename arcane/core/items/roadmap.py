@@ -7,9 +7,11 @@ epics, stories, and tasks along with project context.
 from __future__ import annotations
 
 from datetime import datetime
+from typing import ClassVar
 
 from pydantic import BaseModel, computed_field
 
+from .base import RollupModel
 from .context import ProjectContext
 from .milestone import Milestone
 
@@ -68,13 +70,15 @@ class StoredUsage(BaseModel):
         )
 
 
-class Roadmap(BaseModel):
+class Roadmap(RollupModel):
     """Top-level container. The complete output of Arcane.
 
     Contains the full project roadmap with all milestones and their
     nested epics, stories, and tasks.
     """
 
+    children_field: ClassVar[str] = "milestones"
+
     id: str
     project_name: str
     created_at: datetime
@@ -87,21 +91,16 @@ class Roadmap(BaseModel):
     @property
     def total_hours(self) -> int:
         """Total estimated hours from all milestones."""
-        return sum(m.estimated_hours for m in self.milestones)
+        return self._rollup(
+            "total_hours", lambda: sum(m.estimated_hours for m in self.milestones)
+        )
 
     @computed_field
     @property
     def total_items(self) -> dict[str, int]:
         """Count of all items by type."""
-        milestones = len(self.milestones)
-        epics = sum(len(m.epics) for m in self.milestones)
-        stories = sum(len(e.stories) for m in self.milestones for e in m.epics)
-        tasks = sum(
-            len(s.tasks) for m in self.milestones for e in m.epics for s in e.stories
-        )
+        counts = self._item_counts()
         return {
-            "milestones": milestones,
-            "epics": epics,
-            "stories": stories,
-            "tasks": tasks,
+            key: counts.get(key, 0)
+            for key in ("milestones", "epics", "stories", "tasks")
         }
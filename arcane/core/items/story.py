@@ -4,6 +4,8 @@ A Story represents a user-facing capability or developer deliverable
 that contains multiple Tasks.
 """
 
+from typing import ClassVar
+
 from pydantic import computed_field
 
 from .base import BaseItem
@@ -17,6 +19,8 @@ class Story(BaseItem):
     clear acceptance criteria.
     """
 
+    children_field: ClassVar[str] = "tasks"
+
     acceptance_criteria: list[str]
     tasks: list[Task] = []
 
@@ -24,4 +28,6 @@ class Story(BaseItem):
     @property
     def estimated_hours(self) -> int:
         """Total estimated hours from all tasks."""
-        return sum(t.estimated_hours for t in self.tasks)
+        return self._rollup(
+            "estimated_hours", lambda: sum(t.estimated_hours for t in self.tasks)
+        )
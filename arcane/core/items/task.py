@@ -5,6 +5,7 @@ be done in 1-8 hours by one developer.
 """
 
 from pydantic import Field
+from pydantic.json_schema import SkipJsonSchema
 
 from .base import BaseItem
 
@@ -21,3 +22,10 @@ class Task(BaseItem):
     acceptance_criteria: list[str]
     implementation_notes: str
     claude_code_prompt: str  # Ready-to-use prompt for Claude Code implementation
+
+    # Filled in by the team scheduler (arcane.core.planning.schedule). Kept
+    # out of the JSON schema, which is also what generation asks the LLM for
+    assignee_slot: SkipJsonSchema[int | None] = None  # 0-based developer index
+    start_offset_hours: SkipJsonSchema[float | None] = None  # Working hours from schedule start
+    end_offset_hours: SkipJsonSchema[float | None] = None
+    due_date: SkipJsonSchema[str | None] = None
@@ -0,0 +1,324 @@
+"""Read-only, slotted views of a roadmap.
+
+A validated Roadmap gives every item a __dict__, a rollup cache and its
+own list and string objects, which adds up to hundreds of MB at tens of
+thousands of tasks. RoadmapView holds the same fields in __slots__
+classes instead:
+
+- child lists and string lists are tuples (empty ones share ``()``)
+- status and priority are the shared Status/Priority members
+- IDs, labels and prerequisite IDs are interned, and identical label
+  and prerequisite lists share one tuple
+- parent hours are summed once, when the view is built
+
+Views are for code that only reads a roadmap (view, export, analytics)
+and expose the same attribute names as the models, so most readers work
+with either. Build one with from_roadmap(), from_dict() or from_json(),
+and call to_roadmap() when something needs to edit or validate it.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime
+from typing import Any, ClassVar
+
+from .base import Priority, Status
+from .context import ProjectContext
+from .roadmap import Roadmap, StoredUsage
+
+# Lookups accept the enum members too, since they hash and compare
+# equal to their values
+_STATUS = {s.value: s for s in Status}
+_PRIORITY = {p.value: p for p in Priority}
+
+_intern = sys.intern
+
+
+class ItemView:
+    """Read-only fields shared by every item view."""
+
+    __slots__ = ("id", "name", "description", "priority", "status", "labels")
+
+    # Every slot in constructor order, including those of subclasses
+    fields: ClassVar[tuple[str, ...]] = __slots__
+
+    # Slot holding child views, if any
+    children_field: ClassVar[str | None] = None
+
+    # Slot descriptors' setters, in fields order. Calling them directly
+    # is about twice as fast as object.__setattr__ by name.
+    _setters: ClassVar[tuple] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._setters = tuple(getattr(cls, name).__set__ for name in cls.fields)
+
+    def __init__(self, *values: Any) -> None:
+        for set_, value in zip(self._setters, values, strict=True):
+            set_(self, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r}, name={self.name!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields as a dict, with children as nested dicts.
+
+        Tuples become lists; enum members and dates are kept as they are,
+        so the result validates straight back into the matching model.
+        """
+        data = {}
+        for name in self.fields:
+            value = getattr(self, name)
+            if name == self.children_field:
+                value = [child.to_dict() for child in value]
+            elif isinstance(value, tuple):
+                value = list(value)
+            data[name] = value
+        return data
+
+
+class TaskView(ItemView):
+    """Read-only Task."""
+
+    __slots__ = (
+        "estimated_hours",
+        "prerequisites",
+        "acceptance_criteria",
+        "implementation_notes",
+        "claude_code_prompt",
+        "assignee_slot",
+        "start_offset_hours",
+        "end_offset_hours",
+        "due_date",
+    )
+    fields = ItemView.fields + __slots__
+
+
+class StoryView(ItemView):
+    """Read-only Story."""
+
+    __slots__ = ("acceptance_criteria", "tasks", "estimated_hours")
+    fields = ItemView.fields + __slots__
+    children_field = "tasks"
+
+
+class EpicView(ItemView):
+    """Read-only Epic."""
+
+    __slots__ = ("goal", "prerequisites", "stories", "estimated_hours")
+    fields = ItemView.fields + __slots__
+    children_field = "stories"
+
+
+class MilestoneView(ItemView):
+    """Read-only Milestone."""
+
+    __slots__ = ("goal", "target_date", "epics", "estimated_hours")
+    fields = ItemView.fields + __slots__
+    children_field = "epics"
+
+
+class _Builder:
+    """Turns model or dict items into views, sharing repeated values."""
+
+    def __init__(self) -> None:
+        self._shared: dict[tuple, tuple] = {}
+
+    def ids(self, values: list[str] | None) -> tuple[str, ...]:
+        """Interned tuple of labels or IDs, shared between equal lists."""
+        if not values:
+            return ()
+        key = tuple(values)
+        shared = self._shared.get(key)
+        if shared is None:
+            shared = self._shared[key] = tuple([_intern(v) for v in key])
+        return shared
+
+    def common(self, f: dict) -> tuple:
+        """Values for the ItemView slots, read from an item's field dict."""
+        return (
+            _intern(f.get("id") or ""),
+            f.get("name") or "",
+            f.get("description") or "",
+            _PRIORITY.get(f.get("priority"), Priority.MEDIUM),
+            _STATUS.get(f.get("status"), Status.NOT_STARTED),
+            self.ids(f.get("labels")),
+        )
+
+    def task(self, f: dict) -> TaskView:
+        return TaskView(
+            *self.common(f),
+            f.get("estimated_hours") or 0,
+            self.ids(f.get("prerequisites")),
+            tuple(f.get("acceptance_criteria") or ()),
+            f.get("implementation_notes") or "",
+            f.get("claude_code_prompt") or "",
+            f.get("assignee_slot"),
+            f.get("start_offset_hours"),
+            f.get("end_offset_hours"),
+            f.get("due_date"),
+        )
+
+    def story(self, f: dict) -> StoryView:
+        tasks = tuple([self.task(_fields(t)) for t in f.get("tasks") or ()])
+        return StoryView(
+            *self.common(f),
+            tuple(f.get("acceptance_criteria") or ()),
+            tasks,
+            sum(t.estimated_hours for t in tasks),
+        )
+
+    def epic(self, f: dict) -> EpicView:
+        stories = tuple([self.story(_fields(s)) for s in f.get("stories") or ()])
+        return EpicView(
+            *self.common(f),
+            f.get("goal") or "",
+            self.ids(f.get("prerequisites")),
+            stories,
+            sum(s.estimated_hours for s in stories),
+        )
+
+    def milestone(self, f: dict) -> MilestoneView:
+        epics = tuple([self.epic(_fields(e)) for e in f.get("epics") or ()])
+        return MilestoneView(
+            *self.common(f),
+            f.get("goal") or "",
+            f.get("target_date"),
+            epics,
+            sum(e.estimated_hours for e in epics),
+        )
+
+
+def _fields(item: Any) -> dict:
+    # Pydantic keeps field values in __dict__, so models and stored dicts
+    # are read the same way (computed fields are summed by the builder)
+    return item if isinstance(item, dict) else item.__dict__
+
+
+class RoadmapView:
+    """Read-only Roadmap built from slotted item views."""
+
+    __slots__ = (
+        "id",
+        "project_name",
+        "created_at",
+        "updated_at",
+        "context",
+        "usage",
+        "milestones",
+        "total_hours",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        project_name: str,
+        created_at: datetime | None,
+        updated_at: datetime | None,
+        context: ProjectContext | None,
+        usage: StoredUsage,
+        milestones: tuple[MilestoneView, ...],
+    ) -> None:
+        set_ = object.__setattr__
+        set_(self, "id", id)
+        set_(self, "project_name", project_name)
+        set_(self, "created_at", created_at)
+        set_(self, "updated_at", updated_at)
+        set_(self, "context", context)
+        set_(self, "usage", usage)
+        set_(self, "milestones", milestones)
+        set_(self, "total_hours", sum(m.estimated_hours for m in milestones))
+
+    __setattr__ = ItemView.__setattr__
+    __delattr__ = ItemView.__delattr__
+
+    def __repr__(self) -> str:
+        return f"RoadmapView(id={self.id!r}, project_name={self.project_name!r})"
+
+    @property
+    def total_items(self) -> dict[str, int]:
+        """Count of all items by type."""
+        counts = {"milestones": len(self.milestones), "epics": 0, "stories": 0, "tasks": 0}
+        for milestone in self.milestones:
+            counts["epics"] += len(milestone.epics)
+            for epic in milestone.epics:
+                counts["stories"] += len(epic.stories)
+                for story in epic.stories:
+                    counts["tasks"] += len(story.tasks)
+        return counts
+
+    # --- Conversion ---
+
+    @classmethod
+    def from_roadmap(cls, roadmap: Roadmap) -> RoadmapView:
+        """Build a view of a Roadmap model."""
+        builder = _Builder()
+        return cls(
+            roadmap.id,
+            roadmap.project_name,
+            roadmap.created_at,
+            roadmap.updated_at,
+            roadmap.context,
+            roadmap.usage,
+            tuple([builder.milestone(m.__dict__) for m in roadmap.milestones]),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RoadmapView:
+        """Build a view of a roadmap dict, as stored in roadmap.json.
+
+        Partial dicts (such as the web backend's ``{"milestones": [...]}``
+        roadmap_data) work too; missing fields get empty defaults.
+        """
+        builder = _Builder()
+        context = data.get("context")
+        usage = data.get("usage")
+        return cls(
+            data.get("id") or "",
+            data.get("project_name") or "",
+            _datetime(data.get("created_at")),
+            _datetime(data.get("updated_at")),
+            ProjectContext.model_validate(context) if context is not None else None,
+            StoredUsage.model_validate(usage) if usage is not None else StoredUsage(),
+            tuple([builder.milestone(m) for m in data.get("milestones") or ()]),
+        )
+
+    @classmethod
+    def from_json(cls, text: str | bytes) -> RoadmapView:
+        """Build a view from roadmap JSON without validating it as a model."""
+        return cls.from_dict(json.loads(text))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the roadmap as a dict that validates into a Roadmap."""
+        return {
+            "id": self.id,
+            "project_name": self.project_name,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "context": self.context,
+            "usage": self.usage,
+            "milestones": [m.to_dict() for m in self.milestones],
+        }
+
+    def to_roadmap(self) -> Roadmap:
+        """Validate the view back into an editable Roadmap model.
+
+        Raises:
+            pydantic.ValidationError: If the view lacks fields the model
+                requires (e.g. it was built from a partial dict).
+        """
+        return Roadmap.model_validate(self.to_dict())
+
+
+def _datetime(value: Any) -> datetime | None:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
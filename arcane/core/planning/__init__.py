@@ -0,0 +1,35 @@
+"""Planning analysis for Arcane roadmaps.
+
+Works on generated roadmaps (models or stored dicts) without calling
+the AI:
+- analytics: Columnar progress stats (hours by status, priority, label
+  and milestone; completion; overdue items)
+- graph: Prerequisite DAG, cycle and dangling-ID checks, critical path
+  and slack
+- schedule: Assign tasks to a team's developers and derive dates
+"""
+
+from .analytics import MilestoneSummary, RoadmapFrame, RoadmapSummary, summarize
+from .graph import DependencyGraph, ScheduleAnalysis, analyze_dependencies
+from .schedule import (
+    Assignment,
+    TeamSchedule,
+    apply_schedule,
+    schedule_team,
+    working_date,
+)
+
+__all__ = [
+    "Assignment",
+    "DependencyGraph",
+    "MilestoneSummary",
+    "RoadmapFrame",
+    "RoadmapSummary",
+    "ScheduleAnalysis",
+    "TeamSchedule",
+    "analyze_dependencies",
+    "apply_schedule",
+    "schedule_team",
+    "summarize",
+    "working_date",
+]
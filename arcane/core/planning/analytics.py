@@ -0,0 +1,332 @@
+"""Columnar analytics over a roadmap.
+
+RoadmapFrame flattens a roadmap (model or stored dict) once into
+parallel arrays with one row per item in document order: type, parent
+row, milestone row, status, priority, hours, labels and date. summarize()
+computes the figures reported by the stats endpoints, ``arcane view``
+and the exporters as group-bys over those arrays, instead of each
+caller re-walking the nested lists with its own counters.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import compress
+from typing import Any
+
+from arcane.core.items.base import Priority, Status
+from arcane.core.items.index import CHILDREN_KEY, ITEM_TYPES, PRIORITIES, STATUSES
+
+MILESTONE, EPIC, STORY, TASK = range(len(ITEM_TYPES))
+
+# Plural keys, matching Roadmap.total_items
+_COUNT_KEYS = tuple(CHILDREN_KEY[t] for t in ("roadmap", *ITEM_TYPES[:-1]))
+
+_STATUS_CODE = {s: i for i, s in enumerate(STATUSES)}
+_PRIORITY_CODE = {p: i for i, p in enumerate(PRIORITIES)}
+_DEFAULT_PRIORITY = _PRIORITY_CODE[Priority.MEDIUM]
+_COMPLETED = _STATUS_CODE[Status.COMPLETED]
+
+
+@dataclass
+class RoadmapFrame:
+    """A roadmap flattened into columns, one row per item.
+
+    Rows are grouped by type (all milestones, then epics, stories and
+    tasks), each group in document order. So parents come before their
+    children, and the items of each type under one milestone or parent
+    are a contiguous run of rows: per-milestone figures are slices.
+
+    Status and priority hold positions in STATUSES and PRIORITIES;
+    unknown values count as not started / medium.
+
+    Attributes:
+        ids: Item IDs.
+        items: The items themselves (models or dicts).
+        types: Position of each item's type in ITEM_TYPES.
+        parents: Row of the parent item, or -1 for milestones.
+        milestones: Row of the milestone each item belongs to.
+        status: Status codes.
+        priority: Priority codes.
+        hours: A task's estimate; 0 for the other types, whose hours are
+            the sum over their tasks.
+        labels: Each item's own labels (a list, or None).
+        dates: A milestone's target_date or a task's due_date.
+        bounds: First row of each type, then the row count, so the rows
+            of type t are ``range(bounds[t], bounds[t + 1])``.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    items: list[Any] = field(default_factory=list)
+    types: array = field(default_factory=lambda: array("b"))
+    parents: array = field(default_factory=lambda: array("l"))
+    milestones: array = field(default_factory=lambda: array("l"))
+    status: array = field(default_factory=lambda: array("b"))
+    priority: array = field(default_factory=lambda: array("b"))
+    hours: array = field(default_factory=lambda: array("d"))
+    labels: list[list[str] | None] = field(default_factory=list)
+    dates: list[str | None] = field(default_factory=list)
+    bounds: list[int] = field(default_factory=lambda: [0] * (len(ITEM_TYPES) + 1))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows(self, item_type: int) -> range:
+        """Rows holding items of one type (MILESTONE, EPIC, STORY, TASK)."""
+        return range(self.bounds[item_type], self.bounds[item_type + 1])
+
+    def rows_in(self, item_type: int, milestone: int) -> range:
+        """Rows of one type that belong to the milestone at a row."""
+        rows = self.rows(item_type)
+        if item_type == MILESTONE:
+            return range(milestone, milestone + 1)
+        first = bisect_left(self.milestones, milestone, rows.start, rows.stop)
+        return range(first, bisect_right(self.milestones, milestone, first, rows.stop))
+
+    def children(self, row: int) -> range:
+        """Rows of the direct children of the item at row."""
+        item_type = self.types[row]
+        if item_type == TASK:
+            return range(0)
+        rows = self.rows(item_type + 1)
+        first = bisect_left(self.parents, row, rows.start, rows.stop)
+        return range(first, bisect_right(self.parents, row, first, rows.stop))
+
+    @classmethod
+    def from_roadmap(cls, roadmap: Any) -> RoadmapFrame:
+        """Flatten a Roadmap model or a ``{"milestones": [...]}`` dict."""
+        is_dict = isinstance(roadmap, dict)
+
+        def column(items: list, name: str, default: Any = None) -> list:
+            if is_dict:
+                return [i.get(name, default) for i in items]
+            return [getattr(i, name, default) for i in items]
+
+        frame = cls()
+        status_code, priority_code = _STATUS_CODE.get, _PRIORITY_CODE.get
+        level = list(column([roadmap], "milestones")[0] or [])
+        parents: list[int] = [-1] * len(level)
+        milestones: list[int] = list(range(len(level)))
+
+        # One level at a time, so each column is filled by a comprehension
+        for item_type, type_name in enumerate(ITEM_TYPES):
+            first = len(frame.ids)
+            frame.bounds[item_type] = first
+            frame.ids.extend(column(level, "id", ""))
+            frame.items.extend(level)
+            frame.types.extend([item_type] * len(level))
+            frame.parents.extend(parents)
+            frame.milestones.extend(milestones)
+            frame.status.extend([status_code(s, 0) for s in column(level, "status")])
+            frame.priority.extend(
+                [priority_code(p, _DEFAULT_PRIORITY) for p in column(level, "priority")]
+            )
+            frame.labels.extend(column(level, "labels"))
+            if item_type == TASK:
+                frame.hours.extend([float(h or 0) for h in column(level, "estimated_hours", 0)])
+                frame.dates.extend(column(level, "due_date"))
+                break
+            frame.hours.extend([0.0] * len(level))
+            if item_type == MILESTONE:
+                frame.dates.extend(column(level, "target_date"))
+            else:
+                frame.dates.extend([None] * len(level))
+
+            children = column(level, CHILDREN_KEY[type_name])
+            level, parents, next_milestones = [], [], []
+            for row, (kids, milestone) in enumerate(zip(children, milestones, strict=True), first):
+                if kids:
+                    level.extend(kids)
+                    parents.extend([row] * len(kids))
+                    next_milestones.extend([milestone] * len(kids))
+            milestones = next_milestones
+
+        frame.bounds[len(ITEM_TYPES)] = len(frame.ids)
+        return frame
+
+
+def sum_where(values: array, codes: array, code: int, rows: range) -> float:
+    """Sum values over the rows whose code equals code.
+
+    The match mask comes from bytes.translate and is applied with
+    compress, so the loop stays in C: several times faster than a
+    Python-level group-by over the same rows.
+    """
+    table = bytearray(256)
+    table[code] = 1
+    mask = codes[rows.start:rows.stop].tobytes().translate(table)
+    return sum(compress(values[rows.start:rows.stop], mask))
+
+
+def _name(item: Any) -> str:
+    return (item.get("name") if isinstance(item, dict) else item.name) or ""
+
+
+def _overdue(target: str | None, today: date) -> bool:
+    if not target:
+        return False
+    try:
+        return date.fromisoformat(target) < today
+    except (TypeError, ValueError):
+        return False
+
+
+def _percent(part: float, whole: float) -> float:
+    return round(part / whole * 100, 1) if whole > 0 else 0.0
+
+
+@dataclass
+class MilestoneSummary:
+    """Progress of one milestone. Item counts and hours cover its tasks."""
+
+    id: str
+    name: str
+    status: str
+    target_date: str | None
+    is_overdue: bool
+    total_items: int
+    completed_items: int
+    hours_total: float
+    hours_completed: float
+    epic_count: int
+    story_count: int
+    task_count: int
+
+    @property
+    def completion_percent(self) -> float:
+        """Completed share of task hours, rounded to 0.1%."""
+        return _percent(self.hours_completed, self.hours_total)
+
+
+@dataclass
+class RoadmapSummary:
+    """Progress figures for a whole roadmap.
+
+    Attributes:
+        item_counts: Items per type, keyed like Roadmap.total_items.
+        completed_counts: Completed items per type.
+        hours_total: Sum of task estimates.
+        hours_completed: Sum of completed task estimates.
+        hours_by_status: Task hours per status value.
+        hours_by_priority: Task hours per priority value.
+        hours_by_label: Task hours per label, counting labels set on the
+            task or on any of its ancestors.
+        milestones: Per-milestone progress, in roadmap order.
+        overdue_tasks: IDs of unfinished tasks whose due_date has passed.
+    """
+
+    item_counts: dict[str, int]
+    completed_counts: dict[str, int]
+    hours_total: float
+    hours_completed: float
+    hours_by_status: dict[str, float]
+    hours_by_priority: dict[str, float]
+    hours_by_label: dict[str, float]
+    milestones: list[MilestoneSummary]
+    overdue_tasks: list[str]
+
+    @property
+    def completion_percent(self) -> float:
+        """Completed share of task hours, rounded to 0.1%."""
+        return _percent(self.hours_completed, self.hours_total)
+
+    @property
+    def item_completion_percent(self) -> float:
+        """Completed share of all items, rounded to 0.1%."""
+        return _percent(
+            sum(self.completed_counts.values()), sum(self.item_counts.values())
+        )
+
+    @property
+    def overdue_milestones(self) -> list[MilestoneSummary]:
+        """Unfinished milestones whose target date has passed."""
+        return [m for m in self.milestones if m.is_overdue]
+
+
+def summarize(roadmap: Any, today: date | None = None) -> RoadmapSummary:
+    """Compute progress figures for a roadmap.
+
+    Args:
+        roadmap: Roadmap model, ``{"milestones": [...]}`` dict, or a
+            RoadmapFrame already built from one.
+        today: Date to check target and due dates against (default today).
+
+    Returns:
+        RoadmapSummary with totals, breakdowns and per-milestone progress.
+    """
+    frame = roadmap if isinstance(roadmap, RoadmapFrame) else RoadmapFrame.from_roadmap(roadmap)
+    today = today or date.today()
+    status, hours = frame.status, frame.hours
+    levels = [frame.rows(t) for t in range(len(ITEM_TYPES))]
+    tasks = levels[TASK]
+
+    def completed(rows: range) -> int:
+        return status[rows.start:rows.stop].count(_COMPLETED)
+
+    milestones = []
+    for row in levels[MILESTONE]:
+        task_rows = frame.rows_in(TASK, row)
+        milestones.append(
+            MilestoneSummary(
+                id=frame.ids[row],
+                name=_name(frame.items[row]),
+                status=STATUSES[status[row]].value,
+                target_date=frame.dates[row],
+                is_overdue=status[row] != _COMPLETED and _overdue(frame.dates[row], today),
+                total_items=len(task_rows),
+                completed_items=completed(task_rows),
+                hours_total=sum(hours[task_rows.start:task_rows.stop]),
+                hours_completed=sum_where(hours, status, _COMPLETED, task_rows),
+                epic_count=len(frame.rows_in(EPIC, row)),
+                story_count=len(frame.rows_in(STORY, row)),
+                task_count=len(task_rows),
+            )
+        )
+
+    by_label: dict[str, float] = {}
+    if any(frame.labels):
+        labels, parents = frame.labels, frame.parents
+        # Parents precede children, so inherited labels resolve in one pass
+        inherited: list[tuple[str, ...]] = []
+        for row in range(tasks.start):
+            own = tuple(labels[row] or ())
+            parent = parents[row]
+            inherited.append(inherited[parent] + own if parent >= 0 else own)
+        # A story's labels cover the hours of its (contiguous) tasks...
+        for row in levels[STORY]:
+            if inherited[row]:
+                task_rows = frame.children(row)
+                story_hours = sum(hours[task_rows.start:task_rows.stop])
+                for label in dict.fromkeys(inherited[row]):
+                    by_label[label] = by_label.get(label, 0.0) + story_hours
+        # ...and only tasks with labels of their own need a visit
+        for row in compress(tasks, labels[tasks.start:tasks.stop]):
+            above = inherited[parents[row]]
+            for label in dict.fromkeys(labels[row]):
+                if label not in above:
+                    by_label[label] = by_label.get(label, 0.0) + hours[row]
+
+    dated = compress(tasks, frame.dates[tasks.start:tasks.stop])
+    return RoadmapSummary(
+        item_counts={key: len(levels[t]) for t, key in enumerate(_COUNT_KEYS)},
+        completed_counts={key: completed(levels[t]) for t, key in enumerate(_COUNT_KEYS)},
+        hours_total=sum(hours[tasks.start:tasks.stop]),
+        hours_completed=sum_where(hours, status, _COMPLETED, tasks),
+        hours_by_status={
+            s.value: sum_where(hours, status, i, tasks) for i, s in enumerate(STATUSES)
+        },
+        hours_by_priority={
+            p.value: sum_where(hours, frame.priority, i, tasks)
+            for i, p in enumerate(PRIORITIES)
+        },
+        hours_by_label=dict(sorted(by_label.items(), key=lambda kv: -kv[1])),
+        milestones=milestones,
+        overdue_tasks=[
+            frame.ids[row]
+            for row in dated
+            if status[row] != _COMPLETED and _overdue(frame.dates[row], today)
+        ],
+    )
@@ -0,0 +1,331 @@
+"""Dependency graph over task and epic prerequisites.
+
+Tasks are nodes weighted by their estimated hours. Each epic adds a
+zero-hour "done" node that follows all of its tasks and, when the epic
+has prerequisites, a zero-hour "start" node that all of its tasks
+follow. A prerequisite ID may name a task or an epic, so task -> epic and
+epic -> task dependencies work too.
+
+The analysis assumes unlimited parallelism: the schedule length is the
+longest chain of hours through the graph (the critical path), and a
+task's slack is how far it can slip without lengthening it.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any
+
+# Tolerance when comparing float hours along the critical path
+_EPSILON = 1e-9
+
+
+@dataclass
+class ScheduleAnalysis:
+    """Result of analyzing a dependency graph.
+
+    Attributes:
+        order: Task and epic IDs in dependency order. Items in or
+            downstream of a cycle are left out.
+        earliest_start: Hours from the start of work until each item
+            in order can begin.
+        slack: Hours each item in order can slip without delaying the
+            end of the roadmap.
+        critical_path: Task IDs on the longest chain, in order.
+        length_hours: Total hours along the critical path.
+        cycles: Each cycle found, as a list of item IDs.
+        dangling: (item ID, prerequisite ID) pairs whose prerequisite
+            does not exist in the roadmap.
+    """
+
+    order: list[str] = field(default_factory=list)
+    earliest_start: dict[str, float] = field(default_factory=dict)
+    slack: dict[str, float] = field(default_factory=dict)
+    critical_path: list[str] = field(default_factory=list)
+    length_hours: float = 0.0
+    cycles: list[list[str]] = field(default_factory=list)
+    dangling: list[tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """True when there are no cycles or dangling prerequisites."""
+        return not self.cycles and not self.dangling
+
+    def cycle_problems(self) -> list[str]:
+        """Human-readable descriptions of each cycle."""
+        return [
+            "Prerequisite cycle: " + " -> ".join(cycle + cycle[:1])
+            for cycle in self.cycles
+        ]
+
+    def problems(self) -> list[str]:
+        """Human-readable descriptions of cycles and dangling IDs."""
+        messages = self.cycle_problems()
+        messages.extend(
+            f"{item_id} requires unknown item {missing}"
+            for item_id, missing in self.dangling
+        )
+        return messages
+
+
+class DependencyGraph:
+    """A DAG of weighted nodes built from prerequisites.
+
+    Nodes are integers; items are mapped to nodes by ID. Nodes without an
+    ID are internal (such as an epic's start node).
+    """
+
+    def __init__(self) -> None:
+        self.ids: list[str | None] = []
+        self.item_types: list[str | None] = []
+        self.hours: list[float] = []
+        self.dangling: list[tuple[str, str]] = []
+        self._succ: list[list[int]] = []
+        self._pred: list[list[int]] = []
+        self._nodes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.hours)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._nodes
+
+    def node(self, item_id: str) -> int:
+        """Return the node for item_id.
+
+        Raises:
+            KeyError: If the item is not in the graph.
+        """
+        return self._nodes[item_id]
+
+    def add_node(
+        self,
+        item_id: str | None = None,
+        hours: float = 0.0,
+        item_type: str | None = None,
+    ) -> int:
+        """Add a node and return it. The first node added for an ID wins."""
+        node = len(self.hours)
+        self.ids.append(item_id)
+        self.item_types.append(item_type)
+        self.hours.append(hours)
+        self._succ.append([])
+        self._pred.append([])
+        if item_id is not None:
+            self._nodes.setdefault(item_id, node)
+        return node
+
+    def add_edge(self, before: int, after: int) -> None:
+        """Record that after cannot start until before is done."""
+        self._succ[before].append(after)
+        self._pred[after].append(before)
+
+    @classmethod
+    def from_roadmap(cls, roadmap: Any, remaining: bool = False) -> DependencyGraph:
+        """Build the graph for a Roadmap or a ``{"milestones": [...]}`` dict.
+
+        Args:
+            roadmap: Roadmap model or roadmap data dict.
+            remaining: Count completed tasks as zero hours, so the
+                analysis covers only the work left to do.
+
+        Returns:
+            The graph, with unresolved prerequisites in ``dangling``.
+        """
+        get = dict.get if isinstance(roadmap, dict) else getattr
+        graph = cls()
+        add_node, add_edge = graph.add_node, graph.add_edge
+        # (dependent node, dependent ID, prerequisite ID), resolved once
+        # every item has a node
+        pending: list[tuple[int, str, str]] = []
+
+        for milestone in get(roadmap, "milestones", None) or []:
+            for epic in get(milestone, "epics", None) or []:
+                epic_id = get(epic, "id", None)
+                done = add_node(epic_id, 0.0, "epic")
+                prerequisites = get(epic, "prerequisites", None) or []
+                start = None
+                if prerequisites:
+                    start = add_node(None, 0.0, None)
+                    add_edge(start, done)
+                    pending.extend((start, epic_id, p) for p in prerequisites)
+                for story in get(epic, "stories", None) or []:
+                    for task in get(story, "tasks", None) or []:
+                        task_id = get(task, "id", None)
+                        hours = get(task, "estimated_hours", 0) or 0
+                        if remaining and get(task, "status", None) == "completed":
+                            hours = 0
+                        node = add_node(task_id, float(hours), "task")
+                        add_edge(node, done)
+                        if start is not None:
+                            add_edge(start, node)
+                        for p in get(task, "prerequisites", None) or []:
+                            pending.append((node, task_id, p))
+
+        nodes = graph._nodes
+        for node, item_id, prerequisite in pending:
+            before = nodes.get(prerequisite)
+            if before is None:
+                graph.dangling.append((item_id, prerequisite))
+            else:
+                add_edge(before, node)
+        return graph
+
+    def topological_order(self, document_order: bool = False) -> list[int]:
+        """Return nodes in dependency order (Kahn's algorithm).
+
+        Nodes in a cycle, and everything that depends on one, are left
+        out, so a result shorter than the graph means there is a cycle.
+
+        Args:
+            document_order: Among nodes that are ready, always take the
+                one added first, so the order follows the roadmap
+                wherever prerequisites allow. Slower (uses a heap); by
+                default ready nodes are taken first-in, first-out.
+        """
+        succ = self._succ
+        indegree = [len(p) for p in self._pred]
+        ready = [n for n, d in enumerate(indegree) if d == 0]
+
+        if document_order:
+            order = []
+            while ready:
+                v = heapq.heappop(ready)
+                order.append(v)
+                for w in succ[v]:
+                    indegree[w] -= 1
+                    if indegree[w] == 0:
+                        heapq.heappush(ready, w)
+            return order
+
+        order = ready
+        append = order.append
+        i = 0
+        while i < len(order):
+            for w in succ[order[i]]:
+                indegree[w] -= 1
+                if indegree[w] == 0:
+                    append(w)
+            i += 1
+        return order
+
+    def find_cycles(self, order: list[int] | None = None) -> list[list[int]]:
+        """Return one cycle from each group of nodes left out of order."""
+        if order is None:
+            order = self.topological_order()
+        if len(order) == len(self.hours):
+            return []
+        pred = self._pred
+        # 0: in order (acyclic), 1: unvisited leftover, 2: visited
+        state = bytearray(b"\x01") * len(self.hours)
+        for n in order:
+            state[n] = 0
+
+        cycles = []
+        for start in range(len(state)):
+            if state[start] != 1:
+                continue
+            # Every leftover node has a leftover predecessor, so walking
+            # predecessors must revisit a node on this walk or reach one
+            # visited by an earlier walk
+            walk: dict[int, int] = {}
+            node = start
+            while node not in walk and state[node] == 1:
+                walk[node] = len(walk)
+                node = next(p for p in pred[node] if state[p])
+            if node in walk:
+                cycle = list(walk)[walk[node]:]
+                cycle.reverse()
+                cycles.append(cycle)
+            for n in walk:
+                state[n] = 2
+        return cycles
+
+    def analyze(self) -> ScheduleAnalysis:
+        """Compute order, critical path and slack for the graph."""
+        order = self.topological_order()
+        hours, succ, pred, ids = self.hours, self._succ, self._pred, self.ids
+
+        # Forward pass: earliest start is the latest finish of any
+        # prerequisite
+        earliest = [0.0] * len(hours)
+        for v in order:
+            finish = earliest[v] + hours[v]
+            for w in succ[v]:
+                if finish > earliest[w]:
+                    earliest[w] = finish
+        length = max((earliest[v] + hours[v] for v in order), default=0.0)
+
+        # Backward pass: latest finish is the earliest latest-start of any
+        # dependent
+        latest = [length] * len(hours)
+        for v in reversed(order):
+            start = latest[v] - hours[v]
+            for u in pred[v]:
+                if start < latest[u]:
+                    latest[u] = start
+
+        analysis = ScheduleAnalysis(length_hours=length, dangling=list(self.dangling))
+        for v in order:
+            item_id = ids[v]
+            if item_id is not None:
+                analysis.order.append(item_id)
+                analysis.earliest_start[item_id] = earliest[v]
+                analysis.slack[item_id] = latest[v] - hours[v] - earliest[v]
+
+        analysis.critical_path = self._critical_path(order, earliest, latest, length)
+        analysis.cycles = [
+            [ids[n] for n in cycle if ids[n] is not None]
+            for cycle in self.find_cycles(order)
+        ]
+        return analysis
+
+    def _critical_path(
+        self,
+        order: list[int],
+        earliest: list[float],
+        latest: list[float],
+        length: float,
+    ) -> list[str]:
+        if not order or length <= 0:
+            return []
+        hours, pred, ids, types = self.hours, self._pred, self.ids, self.item_types
+
+        def critical(n: int) -> bool:
+            return latest[n] - hours[n] - earliest[n] <= _EPSILON
+
+        # Walk back from a node that finishes last, through predecessors
+        # that finish exactly when it starts
+        node = next(
+            v for v in reversed(order)
+            if earliest[v] + hours[v] >= length - _EPSILON and critical(v)
+        )
+        path = [node]
+        while True:
+            start = earliest[node]
+            node = next(
+                (
+                    u for u in pred[node]
+                    if critical(u) and abs(earliest[u] + hours[u] - start) <= _EPSILON
+                ),
+                None,
+            )
+            if node is None:
+                break
+            path.append(node)
+        path.reverse()
+        return [ids[n] for n in path if types[n] == "task"]
+
+
+def analyze_dependencies(roadmap: Any, remaining: bool = False) -> ScheduleAnalysis:
+    """Build the dependency graph for a roadmap and analyze it.
+
+    Args:
+        roadmap: Roadmap model or ``{"milestones": [...]}`` dict.
+        remaining: Only count hours for tasks that are not completed.
+
+    Returns:
+        ScheduleAnalysis with order, critical path, slack and problems.
+    """
+    return DependencyGraph.from_roadmap(roadmap, remaining=remaining).analyze()
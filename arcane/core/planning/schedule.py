@@ -0,0 +1,282 @@
+"""Team scheduling: assign tasks to developers over time.
+
+A list scheduler: whenever a developer is free, they take the most
+urgent task whose prerequisites are done. Urgency is milestone order
+first, then priority, then position in the roadmap, so milestones are
+worked through as phases and critical work within one goes first. Ready
+tasks and free developers are kept in heaps, so a schedule costs
+O(n log n) in the number of tasks.
+
+Times are working hours from the start of the schedule; dates count
+``hours_per_day`` focused hours per developer on each weekday.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from heapq import heapify, heappop, heappush, heapreplace
+from typing import Any
+
+from .graph import DependencyGraph, ScheduleAnalysis
+
+# Focused hours per developer per working day
+DEFAULT_HOURS_PER_DAY = 6.0
+
+# Ready-queue rank of each priority; lower is taken first
+PRIORITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+def working_date(
+    start: date, hours: float, hours_per_day: float = DEFAULT_HOURS_PER_DAY
+) -> date:
+    """Return the weekday on which work ending hours into a schedule finishes.
+
+    Work that starts on a weekend starts the following Monday.
+    """
+    day = start
+    if day.weekday() >= 5:
+        day += timedelta(days=7 - day.weekday())
+    # Tolerance keeps 12.0000001 hours from spilling into another day
+    days = max(0, math.ceil(hours / hours_per_day - 1e-6) - 1)
+    weeks, days = divmod(days, 5)
+    day += timedelta(weeks=weeks)
+    for _ in range(days):
+        day += timedelta(days=3 if day.weekday() == 4 else 1)
+    return day
+
+
+@dataclass
+class Assignment:
+    """When and by whom one task is worked on.
+
+    Attributes:
+        task_id: The scheduled task.
+        slot: 0-based developer index.
+        start_hours: Working hours from the schedule start until work begins.
+        end_hours: Working hours from the schedule start until it's done.
+    """
+
+    task_id: str
+    slot: int
+    start_hours: float
+    end_hours: float
+
+
+@dataclass
+class TeamSchedule:
+    """Result of scheduling a roadmap onto a team.
+
+    Attributes:
+        team_size: Developers the work was spread over.
+        start: Date of the first working hour.
+        hours_per_day: Focused hours per developer per working day.
+        assignments: Assignments in the order work starts.
+        milestone_end: Working hours until each milestone's remaining
+            tasks are done, by milestone ID.
+        length_hours: Working hours until all remaining work is done.
+    """
+
+    team_size: int
+    start: date
+    hours_per_day: float = DEFAULT_HOURS_PER_DAY
+    assignments: list[Assignment] = field(default_factory=list)
+    milestone_end: dict[str, float] = field(default_factory=dict)
+    length_hours: float = 0.0
+
+    def date_at(self, hours: float) -> date:
+        """Working day on which work ending hours into the schedule finishes."""
+        return working_date(self.start, hours, self.hours_per_day)
+
+    @property
+    def end_date(self) -> date:
+        """Date all remaining work is done."""
+        return self.date_at(self.length_hours)
+
+    def utilization(self) -> float:
+        """Share of developer time spent working, between 0 and 1."""
+        if self.length_hours <= 0:
+            return 0.0
+        busy = sum(a.end_hours - a.start_hours for a in self.assignments)
+        return busy / (self.length_hours * self.team_size)
+
+
+def schedule_team(
+    roadmap: Any,
+    team_size: int | None = None,
+    start: date | None = None,
+    hours_per_day: float = DEFAULT_HOURS_PER_DAY,
+) -> TeamSchedule:
+    """Assign a roadmap's remaining tasks to developers.
+
+    Completed tasks are skipped. Tasks in an epic that has prerequisites
+    wait for those too.
+
+    Args:
+        roadmap: Roadmap model or ``{"milestones": [...]}`` dict.
+        team_size: Developers working in parallel. Defaults to the
+            roadmap's context.team_size, or 1.
+        start: First day of work (default today).
+        hours_per_day: Focused hours per developer per working day.
+
+    Returns:
+        TeamSchedule with one assignment per remaining task.
+
+    Raises:
+        ValueError: If the roadmap has a prerequisite cycle.
+    """
+    get = dict.get if isinstance(roadmap, dict) else getattr
+    if team_size is None:
+        context = get(roadmap, "context", None)
+        team_size = get(context, "team_size", None) if context is not None else None
+    team_size = max(1, team_size or 1)
+
+    graph = DependencyGraph.from_roadmap(roadmap, remaining=True)
+    hours, succ, ids = graph.hours, graph._succ, graph.ids
+
+    # Urgency key per node: (milestone, priority, node). Nodes are
+    # numbered in roadmap order, so the node breaks ties by position.
+    milestone_ids: list[str] = []
+    rank: list[tuple[int, int, int]] = [(0, 0, n) for n in range(len(graph))]
+    group = [-1] * len(graph)
+    for m, milestone in enumerate(get(roadmap, "milestones", None) or []):
+        milestone_ids.append(get(milestone, "id", ""))
+        for epic in get(milestone, "epics", None) or []:
+            for story in get(epic, "stories", None) or []:
+                for task in get(story, "tasks", None) or []:
+                    task_id = get(task, "id", None)
+                    if task_id not in graph:
+                        continue
+                    node = graph.node(task_id)
+                    if group[node] >= 0:
+                        continue
+                    priority = get(task, "priority", None)
+                    priority = getattr(priority, "value", priority)
+                    rank[node] = (m, PRIORITY_RANK.get(priority, 2), node)
+                    group[node] = m
+
+    schedule = TeamSchedule(
+        team_size=team_size, start=start or date.today(), hours_per_day=hours_per_day
+    )
+    milestone_end = [0.0] * len(milestone_ids)
+    assignments = schedule.assignments
+    indegree = [len(p) for p in graph._pred]
+    ready: list[tuple[int, int, int]] = []
+    running: list[tuple[float, int]] = []
+    developers = [(0.0, slot) for slot in range(team_size)]
+    done = 0
+
+    def release(node: int) -> None:
+        """Mark node done and queue dependents that became ready."""
+        nonlocal done
+        stack = [node]
+        while stack:
+            v = stack.pop()
+            done += 1
+            for w in succ[v]:
+                indegree[w] -= 1
+                if indegree[w] == 0:
+                    # Zero-hour nodes (epic markers, completed tasks)
+                    # finish as soon as they're ready
+                    if hours[w] > 0:
+                        heappush(ready, rank[w])
+                    else:
+                        stack.append(w)
+
+    # Collect sources before releasing any, which lowers indegrees
+    for v in [n for n, d in enumerate(indegree) if d == 0]:
+        if hours[v] > 0:
+            ready.append(rank[v])
+        else:
+            release(v)
+    heapify(ready)
+
+    now = 0.0
+    while ready or running:
+        free_at, slot = developers[0]
+        if free_at > now:
+            now = free_at
+        # Everything finished by now frees its dependents
+        while running and running[0][0] <= now:
+            release(heappop(running)[1])
+        if not ready:
+            if not running:
+                break
+            # Idle until the next task finishes
+            now = running[0][0]
+            continue
+        v = heappop(ready)[2]
+        end = now + hours[v]
+        heappush(running, (end, v))
+        heapreplace(developers, (end, slot))
+        assignments.append(Assignment(ids[v], slot, now, end))
+        if end > schedule.length_hours:
+            schedule.length_hours = end
+        if group[v] >= 0 and end > milestone_end[group[v]]:
+            milestone_end[group[v]] = end
+
+    if done < len(graph):
+        cycles = ScheduleAnalysis(
+            cycles=[
+                [ids[n] for n in cycle if ids[n] is not None]
+                for cycle in graph.find_cycles(graph.topological_order())
+            ]
+        )
+        raise ValueError("; ".join(cycles.cycle_problems()))
+
+    schedule.milestone_end = dict(zip(milestone_ids, milestone_end, strict=True))
+    return schedule
+
+
+def apply_schedule(roadmap: Any, schedule: TeamSchedule) -> int:
+    """Write a schedule into a roadmap's tasks and milestone target dates.
+
+    Scheduled tasks get assignee_slot, start/end offsets and a due_date;
+    completed tasks keep whatever they had. Milestones with remaining
+    work get a target_date.
+
+    Args:
+        roadmap: Roadmap model or ``{"milestones": [...]}`` dict.
+        schedule: Schedule computed for this roadmap.
+
+    Returns:
+        Number of tasks updated.
+    """
+    by_id = {a.task_id: a for a in schedule.assignments}
+    is_dict = isinstance(roadmap, dict)
+    get = dict.get if is_dict else getattr
+
+    def set_fields(item: Any, **values: Any) -> None:
+        if is_dict:
+            item.update(values)
+        else:
+            for name, value in values.items():
+                setattr(item, name, value)
+
+    # Tasks ending at the same hour share a date; cache the string
+    due_dates: dict[float, str] = {}
+    updated = 0
+    for milestone in get(roadmap, "milestones", None) or []:
+        for epic in get(milestone, "epics", None) or []:
+            for story in get(epic, "stories", None) or []:
+                for task in get(story, "tasks", None) or []:
+                    assignment = by_id.get(get(task, "id", None))
+                    if assignment is None:
+                        continue
+                    end = assignment.end_hours
+                    due = due_dates.get(end)
+                    if due is None:
+                        due = due_dates[end] = schedule.date_at(end).isoformat()
+                    set_fields(
+                        task,
+                        assignee_slot=assignment.slot,
+                        start_offset_hours=assignment.start_hours,
+                        end_offset_hours=end,
+                        due_date=due,
+                    )
+                    updated += 1
+        end = schedule.milestone_end.get(get(milestone, "id", None))
+        if end:
+            set_fields(milestone, target_date=schedule.date_at(end).isoformat())
+    return updated
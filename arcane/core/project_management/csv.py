@@ -7,7 +7,8 @@ that accepts CSV imports (Jira, Asana, Trello, etc.).
 import csv
 from pathlib import Path
 
-from arcane.core.items import Roadmap
+from arcane.core.items import Roadmap, RoadmapView
+from arcane.core.utils.tracing import traced
 
 from .base import BasePMClient, ExportResult, ProgressCallback
 from .docs import build_all_pages, render_markdown
@@ -21,7 +22,9 @@ class CSVClient(BasePMClient):
     integrations aren't available.
 
     The CSV includes all roadmap item types (milestones, epics, stories,
-    tasks) with Parent_ID columns to preserve hierarchy.
+    tasks) with Parent_ID columns to preserve hierarchy. Scheduling
+    columns are filled for tasks placed by the team scheduler, and
+    Due_Date holds a milestone's target date.
     """
 
     # CSV column headers
@@ -38,6 +41,10 @@ class CSVClient(BasePMClient):
         "Acceptance_Criteria",
         "Labels",
         "Claude_Code_Prompt",
+        "Assignee_Slot",
+        "Start_Offset_Hours",
+        "End_Offset_Hours",
+        "Due_Date",
     ]
 
     @property
@@ -49,9 +56,10 @@ class CSVClient(BasePMClient):
         """CSV export requires no credentials."""
         return True
 
+    @traced("export.csv")
     async def export(
         self,
-        roadmap: Roadmap,
+        roadmap: Roadmap | RoadmapView,
         progress_callback: ProgressCallback | None = None,
         output_path: str | None = None,
         **kwargs,
@@ -59,7 +67,7 @@ class CSVClient(BasePMClient):
         """Export roadmap to a CSV file.
 
         Args:
-            roadmap: The Roadmap to export.
+            roadmap: The Roadmap (or read-only RoadmapView) to export.
             progress_callback: Optional callback called with (item_type, item_name)
                 after each item is written.
             output_path: Optional path for the CSV file. If not provided,
@@ -122,7 +130,7 @@ class CSVClient(BasePMClient):
                 errors=[str(e)],
             )
 
-    def _flatten(self, roadmap: Roadmap) -> list[dict]:
+    def _flatten(self, roadmap: Roadmap | RoadmapView) -> list[dict]:
         """Flatten roadmap hierarchy into a list of row dictionaries.
 
         Walks the complete hierarchy: milestones -> epics -> stories -> tasks.
@@ -138,6 +146,7 @@ class CSVClient(BasePMClient):
                     item=milestone,
                     parent_id=roadmap.id,
                     goal=milestone.goal,
+                    due_date=milestone.target_date,
                 )
             )
 
@@ -174,6 +183,7 @@ class CSVClient(BasePMClient):
                                 prerequisites=task.prerequisites,
                                 acceptance_criteria=task.acceptance_criteria,
                                 claude_code_prompt=task.claude_code_prompt,
+                                due_date=task.due_date,
                             )
                         )
 
@@ -188,6 +198,7 @@ class CSVClient(BasePMClient):
         prerequisites: list[str] | None = None,
         acceptance_criteria: list[str] | None = None,
         claude_code_prompt: str = "",
+        due_date: str | None = None,
     ) -> dict:
         """Create a CSV row dictionary for an item.
 
@@ -199,6 +210,7 @@ class CSVClient(BasePMClient):
             prerequisites: Optional list of prerequisite IDs.
             acceptance_criteria: Optional list of acceptance criteria.
             claude_code_prompt: Optional prompt for Claude Code (tasks only).
+            due_date: Optional due date (tasks) or target date (milestones).
 
         Returns:
             Dictionary suitable for csv.DictWriter.
@@ -222,6 +234,10 @@ class CSVClient(BasePMClient):
             "Acceptance_Criteria": " | ".join(acceptance_criteria or []),
             "Labels": ", ".join(item.labels),
             "Claude_Code_Prompt": claude_code_prompt,
+            "Assignee_Slot": getattr(item, "assignee_slot", None),
+            "Start_Offset_Hours": getattr(item, "start_offset_hours", None),
+            "End_Offset_Hours": getattr(item, "end_offset_hours", None),
+            "Due_Date": due_date,
         }
 
     @staticmethod
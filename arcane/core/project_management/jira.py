@@ -15,7 +15,9 @@ import logging
 
 import httpx
 
-from arcane.core.items import Priority, Roadmap, Status
+from arcane.core.items import Priority, Roadmap, RoadmapIndex, Status
+from arcane.core.planning import analyze_dependencies
+from arcane.core.utils.tracing import span, traced
 
 from .base import BasePMClient, ExportResult, ProgressCallback
 
@@ -183,13 +185,15 @@ class JiraClient(BasePMClient):
         client = self._http or httpx.AsyncClient()
         own_client = self._http is None
         try:
-            resp = await client.request(
-                method,
-                f"{self.base_url}{endpoint}",
-                auth=self.auth,
-                json=json,
-                timeout=30.0,
-            )
+            with span("jira.request", **{"http.method": method, "http.route": endpoint}) as current:
+                resp = await client.request(
+                    method,
+                    f"{self.base_url}{endpoint}",
+                    auth=self.auth,
+                    json=json,
+                    timeout=30.0,
+                )
+                current.set_attribute("http.status_code", resp.status_code)
             if resp.status_code >= 400:
                 try:
                     error_body = resp.json()
@@ -344,6 +348,7 @@ class JiraClient(BasePMClient):
         parent_key: str | None = None,
         labels: list[str] | None = None,
         story_points: int | None = None,
+        due_date: str | None = None,
     ) -> dict:
         """Create a Jira issue. Returns {id, key, self}."""
         fields: dict = {
@@ -365,6 +370,8 @@ class JiraClient(BasePMClient):
             fields["labels"] = labels
         if story_points is not None and self._story_points_field:
             fields[self._story_points_field] = story_points
+        if due_date:
+            fields["duedate"] = due_date
 
         result = await self._request("POST", "/issue", json={"fields": fields})
         return {
@@ -442,6 +449,7 @@ class JiraClient(BasePMClient):
 
     # -- Main export --
 
+    @traced("export.jira")
     async def export(
         self,
         roadmap: Roadmap,
@@ -475,6 +483,10 @@ class JiraClient(BasePMClient):
         first_url: str | None = None
         pending_transitions: list[tuple[str, Status]] = []
         pending_links: list[tuple[str, str]] = []
+        # Used to tell unknown prerequisites from ones that failed to export
+        index = RoadmapIndex(roadmap)
+        # Unknown IDs are reported per link below; cycles only up front
+        warnings.extend(analyze_dependencies(roadmap).cycle_problems())
 
         self._http = httpx.AsyncClient()
         try:
@@ -600,6 +612,7 @@ class JiraClient(BasePMClient):
                                 parent_key=story_issue["key"],
                                 labels=task_labels or None,
                                 story_points=task.estimated_hours,
+                                due_date=task.due_date,
                             )
                             id_mapping[task.id] = task_issue["key"]
                             uuid_map[task.id] = task_issue["id"]
@@ -676,11 +689,16 @@ class JiraClient(BasePMClient):
                             f"Could not create link "
                             f"{prereq_arcane_id} -> {blocked_arcane_id}: {e}"
                         )
-                else:
+                elif prereq_arcane_id not in index:
                     warnings.append(
                         f"Prerequisite {prereq_arcane_id} not found "
                         f"for link"
                     )
+                else:
+                    warnings.append(
+                        f"Prerequisite {prereq_arcane_id} was not exported; "
+                        f"skipped link to {blocked_arcane_id}"
+                    )
 
             # Documentation pages require Confluence (separate product)
             logger.info(
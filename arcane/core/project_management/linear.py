@@ -14,7 +14,9 @@ Epic context is preserved by adding "Epic: {name}" to story descriptions.
 
 import httpx
 
-from arcane.core.items import Priority, Roadmap, Status
+from arcane.core.items import Priority, Roadmap, RoadmapIndex, Status
+from arcane.core.planning import analyze_dependencies
+from arcane.core.utils.tracing import span, traced
 
 from .base import BasePMClient, ExportResult, ProgressCallback
 from .docs import build_all_pages, render_markdown
@@ -88,9 +90,11 @@ class LinearClient(BasePMClient):
         client = self._http or httpx.AsyncClient()
         own_client = self._http is None
         try:
-            resp = await client.post(
-                self.GRAPHQL_URL, headers=self.headers, json=payload
-            )
+            with span("linear.graphql") as current:
+                resp = await client.post(
+                    self.GRAPHQL_URL, headers=self.headers, json=payload
+                )
+                current.set_attribute("http.status_code", resp.status_code)
             resp.raise_for_status()
             result = resp.json()
             if "errors" in result:
@@ -242,6 +246,7 @@ class LinearClient(BasePMClient):
         estimate: int | None = None,
         project_id: str | None = None,
         parent_id: str | None = None,
+        due_date: str | None = None,
     ) -> dict:
         """Create a Linear Issue. Returns {id, identifier, url}."""
         mutation = """
@@ -268,6 +273,8 @@ class LinearClient(BasePMClient):
             input_data["projectId"] = project_id
         if parent_id:
             input_data["parentId"] = parent_id
+        if due_date:
+            input_data["dueDate"] = due_date
 
         data = await self._graphql(mutation, {"input": input_data})
         issue = data["issueCreate"]["issue"]
@@ -322,6 +329,7 @@ class LinearClient(BasePMClient):
             input_data["projectId"] = project_id
         await self._graphql(mutation, {"input": input_data})
 
+    @traced("export.linear")
     async def export(
         self,
         roadmap: Roadmap,
@@ -346,6 +354,10 @@ class LinearClient(BasePMClient):
         items_created = 0
         first_url: str | None = None
         pending_relations: list[tuple[str, str]] = []
+        # Used to tell unknown prerequisites from ones that failed to export
+        index = RoadmapIndex(roadmap)
+        # Unknown IDs are reported per link below; cycles only up front
+        warnings.extend(analyze_dependencies(roadmap).cycle_problems())
 
         self._http = httpx.AsyncClient()
         try:
@@ -434,6 +446,7 @@ class LinearClient(BasePMClient):
                                 estimate=task.estimated_hours,
                                 project_id=project["id"],
                                 parent_id=issue["id"],
+                                due_date=task.due_date,
                             )
                             id_mapping[task.id] = task_issue["identifier"]
                             uuid_map[task.id] = task_issue["id"]
@@ -471,10 +484,15 @@ class LinearClient(BasePMClient):
                             f"Could not create relation "
                             f"{prereq_arcane_id} \u2192 {blocked_arcane_id}: {e}"
                         )
-                else:
+                elif prereq_arcane_id not in index:
                     warnings.append(
                         f"Prerequisite {prereq_arcane_id} not found for relation"
                     )
+                else:
+                    warnings.append(
+                        f"Prerequisite {prereq_arcane_id} was not exported; "
+                        f"skipped relation to {blocked_arcane_id}"
+                    )
 
             # Phase 3: Create documentation pages
             first_project_id = next(
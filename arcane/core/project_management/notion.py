@@ -10,6 +10,8 @@ import logging
 import httpx
 
 from arcane.core.items import Roadmap
+from arcane.core.planning import summarize
+from arcane.core.utils.tracing import span, traced
 
 from .base import BasePMClient, ExportResult, ProgressCallback
 from .docs import DocSection, build_all_pages
@@ -112,14 +114,17 @@ class NotionClient(BasePMClient):
         max_retries = 3
         for attempt in range(max_retries):
             async with self._rate_limiter:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.request(
-                        method,
-                        f"{self.API_URL}{endpoint}",
-                        headers=self.headers,
-                        json=json,
-                        timeout=30.0,
-                    )
+                attributes = {"http.method": method, "http.route": endpoint}
+                with span("notion.request", **attributes) as current:
+                    async with httpx.AsyncClient() as client:
+                        resp = await client.request(
+                            method,
+                            f"{self.API_URL}{endpoint}",
+                            headers=self.headers,
+                            json=json,
+                            timeout=30.0,
+                        )
+                    current.set_attribute("http.status_code", resp.status_code)
                 await asyncio.sleep(0.35)
 
             if resp.status_code == 429:
@@ -490,6 +495,8 @@ class NotionClient(BasePMClient):
     @staticmethod
     def _build_toc_header_blocks(roadmap: Roadmap) -> list[dict]:
         """Build the TOC header: divider, heading, and summary paragraph."""
+        summary = summarize(roadmap)
+        counts = summary.item_counts
         return [
             {
                 "object": "block",
@@ -512,24 +519,27 @@ class NotionClient(BasePMClient):
                     "rich_text": [
                         {
                             "type": "text",
-                            "text": {"content": f"{roadmap.total_hours} hours across "},
+                            "text": {
+                                "content": f"{summary.hours_total:g} hours "
+                                f"({summary.completion_percent:g}% complete) across "
+                            },
                         },
                         {
                             "type": "text",
-                            "text": {"content": f"{roadmap.total_items['milestones']} milestones, "},
+                            "text": {"content": f"{counts['milestones']} milestones, "},
                             "annotations": {"bold": True},
                         },
                         {
                             "type": "text",
-                            "text": {"content": f"{roadmap.total_items['epics']} epics, "},
+                            "text": {"content": f"{counts['epics']} epics, "},
                         },
                         {
                             "type": "text",
-                            "text": {"content": f"{roadmap.total_items['stories']} stories, "},
+                            "text": {"content": f"{counts['stories']} stories, "},
                         },
                         {
                             "type": "text",
-                            "text": {"content": f"{roadmap.total_items['tasks']} tasks"},
+                            "text": {"content": f"{counts['tasks']} tasks"},
                         },
                     ]
                 },
@@ -623,6 +633,7 @@ class NotionClient(BasePMClient):
 
     # -- Main export --
 
+    @traced("export.notion")
     async def export(
         self,
         roadmap: Roadmap,
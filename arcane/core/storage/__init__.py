@@ -2,8 +2,96 @@
 
 Provides persistence for roadmaps and project contexts,
 with support for resuming incomplete generations.
+
+Two backends are available:
+- json: One roadmap.json + context.yaml per project directory (default)
+- sqlite: One arcane.db workspace database with per-item rows
+
+VersionStore keeps content-addressed snapshots of roadmaps for history
+and diffs, independent of the storage backend.
 """
 
+from pathlib import Path
+
 from .manager import StorageManager
+from .sqlite import SQLiteStorageManager
+from .versions import (
+    VERSIONS_DIR,
+    Change,
+    FileObjectBackend,
+    MemoryObjectBackend,
+    ObjectBackend,
+    Snapshot,
+    VersionStore,
+    encode_object,
+)
+
+STORAGE_BACKENDS = {
+    "json": StorageManager,
+    "sqlite": SQLiteStorageManager,
+}
+
+
+def create_storage(backend: str, base_path: Path) -> StorageManager:
+    """Create a storage manager for the given backend.
+
+    Args:
+        backend: Backend name ("json" or "sqlite").
+        base_path: Base directory for stored roadmaps.
+
+    Returns:
+        A StorageManager instance.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    storage_cls = STORAGE_BACKENDS.get(backend.lower())
+    if storage_cls is None:
+        raise ValueError(
+            f"Unknown storage backend: {backend}. "
+            f"Available: {', '.join(STORAGE_BACKENDS)}"
+        )
+    return storage_cls(Path(base_path))
+
+
+def resolve_storage(path: Path) -> StorageManager:
+    """Pick the storage manager that can load the roadmap at path.
+
+    Paths pointing at a roadmap.json file or a project directory that
+    contains one use the JSON backend. Otherwise, a ``<workspace>/<slug>``
+    path with a ``<workspace>/arcane.db`` next to it uses the SQLite
+    backend, keyed by the slug.
+
+    Args:
+        path: Path to roadmap.json, a project directory, or
+            ``<workspace>/<slug>`` for a SQLite workspace.
+
+    Returns:
+        A StorageManager able to load the roadmap.
+    """
+    path = Path(path)
+    if path.is_file() or (path / "roadmap.json").exists():
+        return StorageManager(path.parent if path.is_file() else path)
+
+    workspace = path.parent
+    if (workspace / SQLiteStorageManager.DB_FILENAME).exists():
+        return SQLiteStorageManager(workspace)
+
+    return StorageManager(path if path.is_dir() else workspace)
+
 
-__all__ = ["StorageManager"]
+__all__ = [
+    "StorageManager",
+    "SQLiteStorageManager",
+    "STORAGE_BACKENDS",
+    "create_storage",
+    "resolve_storage",
+    "VERSIONS_DIR",
+    "Change",
+    "FileObjectBackend",
+    "MemoryObjectBackend",
+    "ObjectBackend",
+    "Snapshot",
+    "VersionStore",
+    "encode_object",
+]
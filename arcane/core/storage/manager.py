@@ -4,17 +4,24 @@ Handles persistence of roadmaps to disk as JSON and YAML files,
 and provides resume point detection for incomplete generations.
 """
 
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
 
-from arcane.core.items import Roadmap, ProjectContext
+from arcane.core.clients.telemetry import GenerationTelemetry
+from arcane.core.items import Roadmap, RoadmapView, ProjectContext
+from arcane.core.utils.cost_estimator import UsageSample
+from arcane.core.utils.tracing import traced
 
 
 class StorageManager:
     """Handles saving, loading, and resuming roadmaps on disk."""
 
+    # Generation telemetry report, saved in the project directory
+    TELEMETRY_FILENAME = "telemetry.json"
+
     def __init__(self, base_path: Path):
         """Initialize the storage manager.
 
@@ -23,6 +30,7 @@ class StorageManager:
         """
         self.base_path = Path(base_path)
 
+    @traced("storage.save_roadmap")
     async def save_roadmap(self, roadmap: Roadmap) -> Path:
         """Save a roadmap to disk.
 
@@ -53,6 +61,7 @@ class StorageManager:
 
         return roadmap_path
 
+    @traced("storage.load_roadmap")
     async def load_roadmap(self, path: Path) -> Roadmap:
         """Load a roadmap from disk.
 
@@ -67,6 +76,75 @@ class StorageManager:
             path = path / "roadmap.json"
         return Roadmap.model_validate_json(path.read_text())
 
+    @traced("storage.load_view")
+    async def load_view(self, path: Path) -> RoadmapView:
+        """Load a read-only view of a roadmap from disk.
+
+        Uses far less memory than load_roadmap() for large roadmaps, for
+        callers that only read it (viewing, exporting, reporting).
+
+        Args:
+            path: Path to roadmap.json file or project directory.
+
+        Returns:
+            The loaded RoadmapView.
+        """
+        path = Path(path)
+        if path.is_dir():
+            path = path / "roadmap.json"
+        return RoadmapView.from_json(path.read_text())
+
+    @traced("storage.save_telemetry")
+    async def save_telemetry(
+        self, roadmap: Roadmap, telemetry: GenerationTelemetry
+    ) -> Path:
+        """Save a generation telemetry report next to the roadmap.
+
+        Args:
+            roadmap: The roadmap the report belongs to.
+            telemetry: Report covering every generation session so far.
+
+        Returns:
+            Path to the saved telemetry.json file.
+        """
+        project_dir = self.base_path / self._slugify(roadmap.project_name)
+        project_dir.mkdir(parents=True, exist_ok=True)
+        path = project_dir / self.TELEMETRY_FILENAME
+        path.write_text(json.dumps(telemetry.to_dict(), indent=2))
+        return path
+
+    @traced("storage.load_telemetry")
+    async def load_telemetry(self, roadmap: Roadmap) -> GenerationTelemetry:
+        """Load the telemetry report saved for a roadmap.
+
+        Returns:
+            The saved report, or an empty one if none was saved.
+        """
+        path = (
+            self.base_path / self._slugify(roadmap.project_name) / self.TELEMETRY_FILENAME
+        )
+        if not path.exists():
+            return GenerationTelemetry()
+        return GenerationTelemetry.from_dict(json.loads(path.read_text()))
+
+    @traced("storage.load_usage_history")
+    async def load_usage_history(self) -> list[UsageSample]:
+        """Usage samples from every complete roadmap under base_path.
+
+        Used to calibrate cost estimates; unreadable and incomplete
+        roadmaps are skipped.
+        """
+        samples = []
+        for path in sorted(self.base_path.glob("*/roadmap.json")):
+            try:
+                view = RoadmapView.from_json(path.read_text())
+            except (OSError, ValueError):
+                continue
+            sample = UsageSample.from_roadmap(view)
+            if sample is not None:
+                samples.append(sample)
+        return samples
+
     async def load_context(self, path: Path) -> ProjectContext:
         """Load project context from a YAML file.
 
@@ -0,0 +1,629 @@
+"""SQLite-backed storage manager for roadmaps.
+
+Stores every roadmap item as its own row (with parent, type, status,
+priority and hours columns) in a single workspace database, so listing,
+searching and partial loads don't need to parse whole roadmap.json files.
+
+The database lives at ``<base_path>/arcane.db`` and runs in WAL mode.
+Each save only rewrites the rows that changed since the previous save,
+inside one transaction, so the per-story incremental saves made by the
+orchestrator stay cheap as the roadmap grows.
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from arcane.core.items import ProjectContext, Roadmap, RoadmapView
+from arcane.core.utils.cost_estimator import UsageSample
+from arcane.core.utils.tracing import traced
+
+from .manager import StorageManager
+
+# Maps item type to the key holding its children in the serialized roadmap
+_CHILDREN_KEY = {
+    "milestone": "epics",
+    "epic": "stories",
+    "story": "tasks",
+    "task": None,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS roadmaps (
+    id TEXT PRIMARY KEY,
+    project_name TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    context TEXT NOT NULL,
+    usage TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_roadmaps_slug ON roadmaps (slug);
+
+CREATE TABLE IF NOT EXISTS items (
+    rowid INTEGER PRIMARY KEY,
+    roadmap_id TEXT NOT NULL REFERENCES roadmaps (id) ON DELETE CASCADE,
+    id TEXT NOT NULL,
+    parent_id TEXT,
+    type TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    estimated_hours INTEGER NOT NULL DEFAULT 0,
+    payload TEXT NOT NULL,
+    UNIQUE (roadmap_id, id)
+);
+CREATE INDEX IF NOT EXISTS ix_items_parent ON items (roadmap_id, parent_id, position);
+CREATE INDEX IF NOT EXISTS ix_items_type_status ON items (roadmap_id, type, status);
+CREATE INDEX IF NOT EXISTS ix_items_priority ON items (roadmap_id, priority);
+
+-- External-content index over items(name, description). Kept in sync by
+-- save_roadmap rather than triggers: one INSERT ... SELECT for a whole
+-- roadmap is several times faster than a trigger firing per row.
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5 (
+    name, description, content='items', content_rowid='rowid'
+);
+"""
+
+_FTS_DELETE = """
+INSERT INTO items_fts (items_fts, rowid, name, description)
+SELECT 'delete', rowid, name, description FROM items
+WHERE roadmap_id = ? AND id = ?
+"""
+
+_FTS_INSERT = """
+INSERT INTO items_fts (rowid, name, description)
+SELECT rowid, name, description FROM items
+WHERE roadmap_id = ? AND id = ?
+"""
+
+_UPSERT_ITEM = """
+INSERT INTO items (
+    roadmap_id, id, parent_id, type, position, name, description,
+    status, priority, estimated_hours, payload
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (roadmap_id, id) DO UPDATE SET
+    parent_id = excluded.parent_id,
+    type = excluded.type,
+    position = excluded.position,
+    name = excluded.name,
+    description = excluded.description,
+    status = excluded.status,
+    priority = excluded.priority,
+    estimated_hours = excluded.estimated_hours,
+    payload = excluded.payload
+"""
+
+
+def _fts_string(term: str) -> str:
+    """Quote a search term as an FTS5 string (a phrase of its tokens)."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+class SQLiteStorageManager(StorageManager):
+    """Stores roadmaps as per-item rows in a SQLite workspace database.
+
+    Drop-in replacement for StorageManager: the orchestrator and CLI use
+    the same save_roadmap/load_roadmap/get_resume_point interface. On top
+    of that it offers cross-roadmap listing, full-text search and partial
+    loads by parent, type or status.
+    """
+
+    DB_FILENAME = "arcane.db"
+
+    def __init__(self, base_path: Path, db_path: Path | None = None):
+        """Initialize the SQLite storage manager.
+
+        Args:
+            base_path: Workspace directory that holds the database.
+            db_path: Optional explicit database path. Defaults to
+                ``<base_path>/arcane.db``.
+        """
+        super().__init__(base_path)
+        self.db_path = Path(db_path) if db_path else self.base_path / self.DB_FILENAME
+        self._conn: sqlite3.Connection | None = None
+        # roadmap_id -> {item_id: row signature} for rows known to be on disk
+        self._written: dict[str, dict[str, tuple]] = {}
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open (and initialize) the database connection on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._written.clear()
+
+    # -- Save --
+
+    @traced("sqlite.save_roadmap")
+    async def save_roadmap(self, roadmap: Roadmap) -> Path:
+        """Save a roadmap, rewriting only the items that changed.
+
+        All changed rows (plus the roadmap header) are written in a single
+        transaction, so a crash mid-save never leaves a half-written story.
+
+        Args:
+            roadmap: The roadmap to save.
+
+        Returns:
+            Path to the workspace database.
+        """
+        data = roadmap.model_dump(mode="json")
+        rows = self._flatten(data)
+
+        conn = self.conn
+        known = self._known_rows(roadmap.id)
+        current: dict[str, tuple] = {}
+        changed = []
+        reindex = []  # (roadmap_id, item_id) whose name/description changed
+        for row in rows:
+            signature = row[2:]
+            current[row[1]] = signature
+            previous = known.get(row[1])
+            if previous != signature:
+                # Payloads are compared as dicts; only encode the rows we write
+                changed.append(row[:-1] + (json.dumps(row[-1]),))
+                if previous is None or previous[3:5] != signature[3:5]:
+                    reindex.append(row[:2])
+        removed = [(roadmap.id, item_id) for item_id in known.keys() - current.keys()]
+
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO roadmaps (id, project_name, slug, created_at, updated_at, context, usage)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    project_name = excluded.project_name,
+                    slug = excluded.slug,
+                    updated_at = excluded.updated_at,
+                    context = excluded.context,
+                    usage = excluded.usage
+                """,
+                (
+                    roadmap.id,
+                    roadmap.project_name,
+                    self._slugify(roadmap.project_name),
+                    data["created_at"],
+                    data["updated_at"],
+                    json.dumps(data["context"]),
+                    json.dumps(data["usage"]),
+                ),
+            )
+            stale = removed + [key for key in reindex if key[1] in known]
+            if stale:
+                conn.executemany(_FTS_DELETE, stale)
+            if removed:
+                conn.executemany(
+                    "DELETE FROM items WHERE roadmap_id = ? AND id = ?", removed
+                )
+            if changed:
+                conn.executemany(_UPSERT_ITEM, changed)
+            if not known:
+                conn.execute(
+                    "INSERT INTO items_fts (rowid, name, description) "
+                    "SELECT rowid, name, description FROM items WHERE roadmap_id = ?",
+                    (roadmap.id,),
+                )
+            elif reindex:
+                conn.executemany(_FTS_INSERT, reindex)
+
+        self._written[roadmap.id] = current
+        return self.db_path
+
+    def _known_rows(self, roadmap_id: str) -> dict[str, tuple]:
+        """Return signatures of rows already stored for a roadmap."""
+        if roadmap_id not in self._written:
+            cursor = self.conn.execute(
+                """
+                SELECT id, parent_id, type, position, name, description,
+                       status, priority, estimated_hours, payload
+                FROM items WHERE roadmap_id = ?
+                """,
+                (roadmap_id,),
+            )
+            self._written[roadmap_id] = {
+                row[0]: tuple(row[1:-1]) + (json.loads(row[-1]),) for row in cursor
+            }
+        return self._written[roadmap_id]
+
+    @staticmethod
+    def _flatten(data: dict) -> list[tuple]:
+        """Build one row tuple per item from a serialized roadmap.
+
+        Row layout matches _UPSERT_ITEM, except the payload is left as a
+        dict so unchanged rows can be skipped without encoding them. Child
+        collections are stripped from the payload since the hierarchy
+        lives in parent_id/position.
+        """
+        roadmap_id = data["id"]
+        rows: list[tuple] = []
+        stack = [(data.get("milestones", []), "milestone", None)]
+        while stack:
+            items, item_type, parent_id = stack.pop()
+            children_key = _CHILDREN_KEY[item_type]
+            for position, item in enumerate(items):
+                payload = item
+                if children_key:
+                    # The dump is ours to modify; detach the children
+                    payload = dict(item)
+                    stack.append(
+                        (payload.pop(children_key, []), _child_type(item_type), item["id"])
+                    )
+                rows.append(
+                    (
+                        roadmap_id,
+                        item["id"],
+                        parent_id,
+                        item_type,
+                        position,
+                        item["name"],
+                        item["description"],
+                        item["status"],
+                        item["priority"],
+                        item.get("estimated_hours", 0),
+                        payload,
+                    )
+                )
+        return rows
+
+    # -- Load --
+
+    @traced("sqlite.load_roadmap")
+    async def load_roadmap(self, path: Path | str) -> Roadmap:
+        """Load a roadmap by ID, slug, or ``<workspace>/<slug>`` path.
+
+        Args:
+            path: A roadmap ID, a project slug, or a path whose final
+                component is the project slug.
+
+        Returns:
+            The loaded Roadmap instance.
+
+        Raises:
+            FileNotFoundError: If no matching roadmap is stored.
+        """
+        return Roadmap.model_validate_json(self._load_document(path))
+
+    @traced("sqlite.load_view")
+    async def load_view(self, path: Path | str) -> RoadmapView:
+        """Load a read-only view of a roadmap by ID, slug or path.
+
+        Raises:
+            FileNotFoundError: If no matching roadmap is stored.
+        """
+        return RoadmapView.from_json(self._load_document(path))
+
+    def _load_document(self, path: Path | str) -> str:
+        """Assemble the stored roadmap as a roadmap.json document."""
+        roadmap_id = self._resolve_roadmap_id(str(path))
+        header = self.conn.execute(
+            "SELECT * FROM roadmaps WHERE id = ?", (roadmap_id,)
+        ).fetchone()
+        rows = self.conn.execute(
+            "SELECT id, parent_id, type, payload FROM items "
+            "WHERE roadmap_id = ? ORDER BY parent_id, position",
+            (roadmap_id,),
+        ).fetchall()
+
+        # Splice the stored JSON payloads together and validate the whole
+        # document in one pass instead of decoding every row separately
+        head = json.dumps(
+            {
+                "id": header["id"],
+                "project_name": header["project_name"],
+                "created_at": header["created_at"],
+                "updated_at": header["updated_at"],
+            }
+        )
+        return (
+            f'{head[:-1]}, "context": {header["context"]}, '
+            f'"usage": {header["usage"]}, '
+            f'"milestones": {self._assemble(rows, root_id=None)}}}'
+        )
+
+    async def load_context(self, path: Path | str) -> ProjectContext:
+        """Load only the project context of a stored roadmap.
+
+        Args:
+            path: A roadmap ID, slug, or ``<workspace>/<slug>`` path.
+
+        Returns:
+            The stored ProjectContext.
+        """
+        roadmap_id = self._resolve_roadmap_id(str(path))
+        row = self.conn.execute(
+            "SELECT context FROM roadmaps WHERE id = ?", (roadmap_id,)
+        ).fetchone()
+        return ProjectContext(**json.loads(row["context"]))
+
+    def load_subtree(self, roadmap_id: str, item_id: str) -> dict | None:
+        """Load a single item with all of its descendants as a dict.
+
+        Only the rows under the item are read, using the parent index.
+
+        Returns:
+            The item dict with nested children, or None if not found.
+        """
+        rows = self.conn.execute(
+            """
+            WITH RECURSIVE subtree (id) AS (
+                SELECT id FROM items WHERE roadmap_id = :rid AND id = :iid
+                UNION ALL
+                SELECT items.id FROM items JOIN subtree ON items.parent_id = subtree.id
+                WHERE items.roadmap_id = :rid
+            )
+            SELECT items.id, items.parent_id, items.type, items.payload
+            FROM items JOIN subtree ON items.id = subtree.id
+            WHERE items.roadmap_id = :rid
+            ORDER BY items.parent_id, items.position
+            """,
+            {"rid": roadmap_id, "iid": item_id},
+        ).fetchall()
+        if not rows:
+            return None
+        root = next(row for row in rows if row["id"] == item_id)
+        subtree = self._assemble(rows, root_id=root["parent_id"], only=item_id)
+        return json.loads(subtree)[0]
+
+    def get_item(self, roadmap_id: str, item_id: str) -> dict | None:
+        """Look up a single item (without children) by ID."""
+        row = self.conn.execute(
+            "SELECT payload FROM items WHERE roadmap_id = ? AND id = ?",
+            (roadmap_id, item_id),
+        ).fetchone()
+        return json.loads(row["payload"]) if row else None
+
+    def query_items(
+        self,
+        roadmap_id: str,
+        item_type: str | None = None,
+        status: str | None = None,
+        priority: str | None = None,
+        parent_id: str | None = None,
+    ) -> list[dict]:
+        """Return items matching the given column filters (without children).
+
+        Args:
+            roadmap_id: The roadmap to query.
+            item_type: Optional type filter ("milestone", "epic", ...).
+            status: Optional status filter.
+            priority: Optional priority filter.
+            parent_id: Optional parent filter (direct children only).
+
+        Returns:
+            Item payload dicts in hierarchy order.
+        """
+        clauses = ["roadmap_id = ?"]
+        params: list = [roadmap_id]
+        for column, value in (
+            ("type", item_type),
+            ("status", status),
+            ("priority", priority),
+            ("parent_id", parent_id),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        rows = self.conn.execute(
+            f"SELECT payload FROM items WHERE {' AND '.join(clauses)} "
+            "ORDER BY parent_id, position",
+            params,
+        )
+        return [json.loads(row["payload"]) for row in rows]
+
+    @staticmethod
+    def _assemble(
+        rows: list, root_id: str | None, only: str | None = None
+    ) -> str:
+        """Rebuild the nested JSON array under root_id from item rows.
+
+        Works on the stored payload text directly: each payload object is
+        reopened to append its child array, so no row is decoded.
+
+        Args:
+            rows: (id, parent_id, type, payload) rows ordered by
+                (parent_id, position).
+            root_id: Parent whose children form the returned array.
+            only: Optional single child of root_id to restrict the array to.
+
+        Returns:
+            A JSON array string.
+        """
+        children: dict[str | None, list] = {}
+        for row in rows:
+            children.setdefault(row["parent_id"], []).append(row)
+
+        def render(row) -> str:
+            children_key = _CHILDREN_KEY[row["type"]]
+            if not children_key:
+                return row["payload"]
+            nested = ", ".join(render(child) for child in children.get(row["id"], []))
+            return f'{row["payload"][:-1]}, "{children_key}": [{nested}]}}'
+
+        roots = children.get(root_id, [])
+        if only is not None:
+            roots = [row for row in roots if row["id"] == only]
+        return "[" + ", ".join(render(row) for row in roots) + "]"
+
+    def _resolve_roadmap_id(self, key: str) -> str:
+        """Resolve a roadmap ID, slug, or slug-terminated path to an ID."""
+        candidates = [key, Path(key).name]
+        for candidate in candidates:
+            row = self.conn.execute(
+                "SELECT id FROM roadmaps WHERE id = ? OR slug = ? "
+                "ORDER BY updated_at DESC LIMIT 1",
+                (candidate, self._slugify(candidate)),
+            ).fetchone()
+            if row:
+                return row["id"]
+        raise FileNotFoundError(f"No roadmap '{key}' in {self.db_path}")
+
+    # -- Workspace queries --
+
+    def list_roadmaps(self) -> list[dict]:
+        """List all stored roadmaps with item counts and total hours.
+
+        Computed with one aggregate query over the items table; no
+        roadmap payloads are parsed.
+        """
+        rows = self.conn.execute(
+            """
+            SELECT r.id, r.project_name, r.slug, r.created_at, r.updated_at,
+                   SUM(i.type = 'milestone') AS milestones,
+                   SUM(i.type = 'epic') AS epics,
+                   SUM(i.type = 'story') AS stories,
+                   SUM(i.type = 'task') AS tasks,
+                   SUM(CASE WHEN i.type = 'task' THEN i.estimated_hours ELSE 0 END) AS total_hours,
+                   SUM(i.type = 'task' AND i.status = 'completed') AS tasks_completed
+            FROM roadmaps r LEFT JOIN items i ON i.roadmap_id = r.id
+            GROUP BY r.id
+            ORDER BY r.updated_at DESC
+            """
+        ).fetchall()
+        return [
+            {
+                "id": row["id"],
+                "project_name": row["project_name"],
+                "slug": row["slug"],
+                "created_at": datetime.fromisoformat(row["created_at"]),
+                "updated_at": datetime.fromisoformat(row["updated_at"]),
+                "total_items": {
+                    "milestones": row["milestones"] or 0,
+                    "epics": row["epics"] or 0,
+                    "stories": row["stories"] or 0,
+                    "tasks": row["tasks"] or 0,
+                },
+                "total_hours": row["total_hours"] or 0,
+                "tasks_completed": row["tasks_completed"] or 0,
+            }
+            for row in rows
+        ]
+
+    async def load_usage_history(self) -> list[UsageSample]:
+        """Usage samples from every complete roadmap in the workspace.
+
+        Item counts come from one aggregate query; a roadmap counts as
+        complete when no milestone, epic or story is left without children.
+        """
+        rows = self.conn.execute(
+            """
+            SELECT r.usage,
+                   SUM(i.type = 'milestone') AS milestones,
+                   SUM(i.type = 'epic') AS epics,
+                   SUM(i.type = 'story') AS stories,
+                   SUM(i.type = 'task') AS tasks,
+                   SUM(i.type != 'task' AND NOT EXISTS (
+                       SELECT 1 FROM items c
+                       WHERE c.roadmap_id = i.roadmap_id AND c.parent_id = i.id
+                   )) AS pending
+            FROM roadmaps r JOIN items i ON i.roadmap_id = r.id
+            GROUP BY r.id
+            ORDER BY r.created_at
+            """
+        ).fetchall()
+        samples = []
+        for row in rows:
+            if row["pending"]:
+                continue
+            sample = UsageSample.from_usage(
+                json.loads(row["usage"]),
+                {
+                    "milestones": row["milestones"],
+                    "epics": row["epics"],
+                    "stories": row["stories"],
+                    "tasks": row["tasks"],
+                },
+            )
+            if sample is not None:
+                samples.append(sample)
+        return samples
+
+    def search(
+        self, query: str, roadmap_id: str | None = None, limit: int = 50
+    ) -> list[dict]:
+        """Full-text search item names and descriptions across roadmaps.
+
+        Each whitespace-separated term is matched as typed, so hyphens,
+        quotes and operators in user input are not FTS5 syntax. Items
+        must contain every term.
+
+        Args:
+            query: Words to search for.
+            roadmap_id: Optional roadmap to restrict the search to.
+            limit: Maximum number of hits to return.
+
+        Returns:
+            Hits ordered by relevance, each with roadmap and item fields.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+        sql = """
+            SELECT items.roadmap_id, r.project_name, items.id, items.type,
+                   items.name, items.status, items.priority
+            FROM items_fts
+            JOIN items ON items.rowid = items_fts.rowid
+            JOIN roadmaps r ON r.id = items.roadmap_id
+            WHERE items_fts MATCH ?
+        """
+        params: list = [" ".join(_fts_string(term) for term in terms)]
+        if roadmap_id:
+            sql += " AND items.roadmap_id = ?"
+            params.append(roadmap_id)
+        sql += " ORDER BY items_fts.rank LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    async def delete_roadmap(self, roadmap_id: str) -> None:
+        """Delete a roadmap and all of its items."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO items_fts (items_fts, rowid, name, description) "
+                "SELECT 'delete', rowid, name, description FROM items "
+                "WHERE roadmap_id = ?",
+                (roadmap_id,),
+            )
+            self.conn.execute("DELETE FROM roadmaps WHERE id = ?", (roadmap_id,))
+        self._written.pop(roadmap_id, None)
+
+    # -- roadmap.json interop --
+
+    async def import_json(self, path: Path) -> Roadmap:
+        """Import a roadmap.json file (or project directory) into the database."""
+        roadmap = await StorageManager(Path(path).parent).load_roadmap(path)
+        await self.save_roadmap(roadmap)
+        return roadmap
+
+    async def export_json(self, key: str, output_dir: Path) -> Path:
+        """Write a stored roadmap out as roadmap.json + context.yaml.
+
+        Args:
+            key: Roadmap ID or slug.
+            output_dir: Directory under which the project folder is created.
+
+        Returns:
+            Path to the written roadmap.json file.
+        """
+        roadmap = await self.load_roadmap(key)
+        return await StorageManager(output_dir).save_roadmap(roadmap)
+
+
+def _child_type(item_type: str) -> str:
+    """Return the item type of the children of item_type."""
+    return {"milestone": "epic", "epic": "story", "story": "task"}[item_type]
@@ -0,0 +1,480 @@
+"""Content-addressed version history for roadmaps.
+
+Every item (milestone, epic, story, task) is stored as an immutable
+object keyed by the SHA-256 of its own fields plus the (id, hash) pairs
+of its children, Merkle-style. Unchanged subtrees hash identically, so
+each snapshot only writes the objects along changed paths and a snapshot
+itself is just a pointer to a root hash.
+
+Diffs walk both trees from the roots and skip any pair of subtrees with
+equal hashes, so their cost scales with what changed rather than with
+the size of the roadmap.
+
+Objects and snapshot logs go through an ObjectBackend, so the same store
+works on local directories (CLI) and in process (tests). Stores kept
+elsewhere, like the web backend's database tables, write objects in the
+same format with encode_object.
+"""
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from arcane.core.items import Roadmap
+
+# Maps item type to the key holding its children in the serialized roadmap
+_CHILDREN_KEY = {
+    "roadmap": "milestones",
+    "milestone": "epics",
+    "epic": "stories",
+    "story": "tasks",
+    "task": None,
+}
+
+_CHILD_TYPE = {
+    "roadmap": "milestone",
+    "milestone": "epic",
+    "epic": "story",
+    "story": "task",
+}
+
+# Directory name used for version stores next to roadmap files
+VERSIONS_DIR = ".arcane"
+
+# Upper bound on decoded objects kept in memory per store
+_CACHE_LIMIT = 50_000
+
+# Roadmap-level fields captured in the root object. updated_at is left out
+# so re-saving an unchanged roadmap yields the same root hash.
+_ROOT_FIELDS = ("project_name", "created_at", "context", "usage")
+
+
+def encode_object(item_type: str, item: dict, children: list[list[str]]) -> tuple[str, bytes]:
+    """Encode one item as a version object.
+
+    Args:
+        item_type: "roadmap" for the root, else the item's type.
+        item: The serialized item; its child list is ignored.
+        children: [id, hash] pairs of the item's children, in order.
+
+    Returns:
+        The object's hash and its encoded bytes.
+    """
+    children_key = _CHILDREN_KEY[item_type]
+    fields = {
+        key: value
+        for key, value in item.items()
+        if key != children_key
+        # Rolled-up hours on parents are derived from the tasks
+        and not (children_key and key == "estimated_hours")
+    }
+    obj = {"type": item_type, "fields": fields, "children": children}
+    encoded = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest(), encoded
+
+
+class ObjectBackend(ABC):
+    """Abstract storage for version objects and snapshot logs."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Return the object stored under key, or None."""
+        ...
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        """Store an object under key (no-op if it already exists)."""
+        ...
+
+    @abstractmethod
+    def has(self, key: str) -> bool:
+        """Whether an object is stored under key."""
+        ...
+
+    @abstractmethod
+    def read_log(self, roadmap_id: str) -> list[dict]:
+        """Return all snapshot entries for a roadmap, oldest first."""
+        ...
+
+    @abstractmethod
+    def append_log(self, roadmap_id: str, entry: dict) -> None:
+        """Append a snapshot entry to a roadmap's log."""
+        ...
+
+
+class MemoryObjectBackend(ObjectBackend):
+    """Keeps objects and logs in process memory."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.logs: dict[str, list[dict]] = {}
+
+    def get(self, key: str) -> bytes | None:
+        return self.objects.get(key)
+
+    def put(self, key: str, data: bytes) -> None:
+        self.objects.setdefault(key, data)
+
+    def has(self, key: str) -> bool:
+        return key in self.objects
+
+    def read_log(self, roadmap_id: str) -> list[dict]:
+        return list(self.logs.get(roadmap_id, []))
+
+    def append_log(self, roadmap_id: str, entry: dict) -> None:
+        self.logs.setdefault(roadmap_id, []).append(entry)
+
+
+class FileObjectBackend(ObjectBackend):
+    """Stores objects and logs under a directory.
+
+    Layout:
+        objects/ab/cdef...   one file per object, fanned out by hash prefix
+        logs/<roadmap_id>.jsonl   append-only snapshot log
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _object_path(self, key: str) -> Path:
+        return self.root / "objects" / key[:2] / key[2:]
+
+    def _log_path(self, roadmap_id: str) -> Path:
+        return self.root / "logs" / f"{roadmap_id}.jsonl"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._object_path(key)
+        return path.read_bytes() if path.exists() else None
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._object_path(key)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a crash never leaves a truncated object
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+    def has(self, key: str) -> bool:
+        return self._object_path(key).exists()
+
+    def read_log(self, roadmap_id: str) -> list[dict]:
+        path = self._log_path(roadmap_id)
+        if not path.exists():
+            return []
+        return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+    def append_log(self, roadmap_id: str, entry: dict) -> None:
+        path = self._log_path(roadmap_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+@dataclass
+class Snapshot:
+    """A recorded version of a roadmap."""
+
+    version: int
+    root: str
+    created_at: datetime
+    message: str = ""
+    total_items: dict[str, int] = field(default_factory=dict)
+    total_hours: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "root": self.root,
+            "created_at": self.created_at.isoformat(),
+            "message": self.message,
+            "total_items": self.total_items,
+            "total_hours": self.total_hours,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Snapshot":
+        return cls(
+            version=data["version"],
+            root=data["root"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            message=data.get("message", ""),
+            total_items=data.get("total_items", {}),
+            total_hours=data.get("total_hours", 0),
+        )
+
+
+@dataclass
+class Change:
+    """A single difference between two versions of a roadmap.
+
+    kind is one of "added", "removed", "modified" or "reordered".
+    For "modified", fields lists the item fields whose values changed.
+    """
+
+    kind: str
+    item_type: str
+    item_id: str
+    name: str
+    fields: list[str] = field(default_factory=list)
+
+
+class VersionStore:
+    """Records and compares roadmap snapshots in a content-addressed store."""
+
+    def __init__(self, backend: ObjectBackend):
+        """Initialize the version store.
+
+        Args:
+            backend: Where objects and snapshot logs are kept.
+        """
+        self.backend = backend
+        # Decoded objects, keyed by hash; objects are immutable
+        self._cache: dict[str, dict] = {}
+
+    @classmethod
+    def at(cls, path: Path) -> "VersionStore":
+        """Create a store backed by files under path."""
+        return cls(FileObjectBackend(path))
+
+    # -- Writing --
+
+    def commit(self, roadmap: Roadmap, message: str = "") -> Snapshot:
+        """Record a snapshot of a roadmap.
+
+        Args:
+            roadmap: The roadmap to snapshot.
+            message: Short description of what produced this version.
+
+        Returns:
+            The new Snapshot, or the latest one if nothing changed.
+        """
+        data = roadmap.model_dump(mode="json")
+        return self.commit_data(
+            roadmap.id,
+            {key: data[key] for key in _ROOT_FIELDS},
+            data["milestones"],
+            message=message,
+        )
+
+    def commit_data(
+        self,
+        roadmap_id: str,
+        meta: dict,
+        milestones: list[dict],
+        message: str = "",
+    ) -> Snapshot:
+        """Record a snapshot from serialized roadmap data.
+
+        Used where roadmaps live as plain dicts (e.g. the web backend).
+
+        Args:
+            roadmap_id: ID the snapshot log is kept under.
+            meta: Roadmap-level fields to keep with the snapshot.
+            milestones: Serialized milestone hierarchy.
+            message: Short description of what produced this version.
+
+        Returns:
+            The new Snapshot, or the latest one if nothing changed.
+        """
+        counts = {"milestones": 0, "epics": 0, "stories": 0, "tasks": 0}
+        hours = [0]
+        root = self._store_node("roadmap", {**meta, "milestones": milestones}, counts, hours)
+
+        history = self.history(roadmap_id)
+        if history and history[-1].root == root:
+            return history[-1]
+
+        snapshot = Snapshot(
+            version=len(history) + 1,
+            root=root,
+            created_at=datetime.now(timezone.utc),
+            message=message,
+            total_items=counts,
+            total_hours=hours[0],
+        )
+        self.backend.append_log(roadmap_id, snapshot.to_dict())
+        return snapshot
+
+    def _store_node(
+        self, item_type: str, item: dict, counts: dict, hours: list[int]
+    ) -> str:
+        """Store an item and its subtree; return the item's hash."""
+        children_key = _CHILDREN_KEY[item_type]
+        children = []
+        if children_key:
+            child_type = _CHILD_TYPE[item_type]
+            counts_key = _CHILDREN_KEY[item_type]
+            for child in item.get(children_key) or []:
+                counts[counts_key] += 1
+                children.append(
+                    [child["id"], self._store_node(child_type, child, counts, hours)]
+                )
+        else:
+            hours[0] += item.get("estimated_hours", 0)
+
+        key, encoded = encode_object(item_type, item, children)
+        if not self.backend.has(key):
+            self.backend.put(key, encoded)
+        return key
+
+    # -- Reading --
+
+    def history(self, roadmap_id: str) -> list[Snapshot]:
+        """Return all snapshots of a roadmap, oldest first."""
+        return [Snapshot.from_dict(e) for e in self.backend.read_log(roadmap_id)]
+
+    def resolve(self, roadmap_id: str, ref: str | int | None = None) -> Snapshot:
+        """Find a snapshot by version number, root hash prefix, or relative ref.
+
+        Args:
+            roadmap_id: The roadmap whose history to search.
+            ref: A version number (``3``), a negative offset from the latest
+                (``-1`` is the one before it), a root hash prefix of at
+                least 4 characters, or None for the latest snapshot. A
+                string that is both digits and a hash prefix resolves
+                to the hash.
+
+        Returns:
+            The matching Snapshot.
+
+        Raises:
+            KeyError: If no snapshot matches.
+        """
+        history = self.history(roadmap_id)
+        if not history:
+            raise KeyError(f"No snapshots recorded for roadmap {roadmap_id}")
+        if ref is None:
+            return history[-1]
+
+        if isinstance(ref, str) and len(ref) >= 4:
+            # Hashes are hex, so a prefix that history printed can be all digits
+            matches = [s for s in history if s.root.startswith(ref)]
+            if matches:
+                return matches[-1]
+        ref = str(ref)
+        if ref.lstrip("-").isdigit():
+            number = int(ref)
+            index = number - 1 if number > 0 else len(history) - 1 + number
+            if 0 <= index < len(history):
+                return history[index]
+        raise KeyError(f"No snapshot '{ref}' for roadmap {roadmap_id}")
+
+    def checkout_data(self, root: str) -> dict:
+        """Rebuild the serialized roadmap dict stored under a root hash."""
+        return self._expand(root)
+
+    def checkout(self, roadmap_id: str, ref: str | int | None = None) -> Roadmap:
+        """Rebuild a Roadmap as it was at a snapshot."""
+        snapshot = self.resolve(roadmap_id, ref)
+        data = self.checkout_data(snapshot.root)
+        data.update(id=roadmap_id, updated_at=snapshot.created_at.isoformat())
+        return Roadmap.model_validate(data)
+
+    def _load(self, key: str) -> dict:
+        obj = self._cache.get(key)
+        if obj is None:
+            raw = self.backend.get(key)
+            if raw is None:
+                raise KeyError(f"Missing version object {key}")
+            if len(self._cache) >= _CACHE_LIMIT:
+                self._cache.clear()
+            obj = self._cache[key] = json.loads(raw)
+        return obj
+
+    def _expand(self, key: str) -> dict:
+        obj = self._load(key)
+        item = dict(obj["fields"])
+        children_key = _CHILDREN_KEY[obj["type"]]
+        if children_key:
+            item[children_key] = [self._expand(h) for _, h in obj["children"]]
+        return item
+
+    # -- Diffing --
+
+    def diff(
+        self,
+        roadmap_id: str,
+        old: str | int | None = -1,
+        new: str | int | None = None,
+    ) -> list[Change]:
+        """List the changes between two snapshots of a roadmap.
+
+        Args:
+            roadmap_id: The roadmap to compare.
+            old: Ref of the older snapshot (default: the one before latest).
+            new: Ref of the newer snapshot (default: latest).
+
+        Returns:
+            Changes in hierarchy order.
+        """
+        old_root = self.resolve(roadmap_id, old).root
+        new_root = self.resolve(roadmap_id, new).root
+        return self.diff_roots(old_root, new_root)
+
+    def diff_roots(self, old_root: str, new_root: str) -> list[Change]:
+        """List the changes between two root hashes."""
+        changes: list[Change] = []
+        if old_root != new_root:
+            self._diff_children(self._load(old_root), self._load(new_root), changes)
+        return changes
+
+    def _diff_children(self, old: dict, new: dict, changes: list[Change]) -> None:
+        old_children = dict(old["children"])
+        new_children = dict(new["children"])
+
+        for item_id, new_hash in new["children"]:
+            old_hash = old_children.get(item_id)
+            if old_hash == new_hash:
+                continue
+            if old_hash is None:
+                self._collect(new_hash, "added", changes)
+                continue
+            old_obj, new_obj = self._load(old_hash), self._load(new_hash)
+            changed_fields = sorted(
+                key
+                for key in old_obj["fields"].keys() | new_obj["fields"].keys()
+                if old_obj["fields"].get(key) != new_obj["fields"].get(key)
+            )
+            if changed_fields:
+                changes.append(
+                    Change(
+                        "modified",
+                        new_obj["type"],
+                        item_id,
+                        new_obj["fields"].get("name", ""),
+                        changed_fields,
+                    )
+                )
+            self._diff_children(old_obj, new_obj, changes)
+
+        for item_id, old_hash in old["children"]:
+            if item_id not in new_children:
+                self._collect(old_hash, "removed", changes)
+
+        # Same children in a different order
+        old_order = [i for i, _ in old["children"] if i in new_children]
+        new_order = [i for i, _ in new["children"] if i in old_children]
+        if old_order != new_order:
+            fields = new["fields"]
+            changes.append(
+                Change(
+                    "reordered",
+                    new["type"],
+                    fields.get("id", ""),
+                    fields.get("name", fields.get("project_name", "")),
+                )
+            )
+
+    def _collect(self, key: str, kind: str, changes: list[Change]) -> None:
+        """Record a whole subtree as added or removed."""
+        obj = self._load(key)
+        changes.append(
+            Change(kind, obj["type"], obj["fields"]["id"], obj["fields"].get("name", ""))
+        )
+        for _, child_hash in obj["children"]:
+            self._collect(child_hash, kind, changes)
@@ -3,11 +3,16 @@
 from .ids import generate_id
 from .console import console, success, error, warning, info, header
 from .cost_estimator import (
+    CostCalibration,
     CostEstimate,
+    UsageSample,
     estimate_generation_cost,
     format_cost_estimate,
     format_actual_usage,
+    model_pricing,
 )
+from .profiling import FunctionStats, Profiler
+from .tracing import Span, Tracer, get_tracer, span, start_tracing, stop_tracing, traced
 
 __all__ = [
     "generate_id",
@@ -17,8 +22,20 @@ __all__ = [
     "warning",
     "info",
     "header",
+    "CostCalibration",
     "CostEstimate",
+    "UsageSample",
     "estimate_generation_cost",
     "format_cost_estimate",
     "format_actual_usage",
+    "model_pricing",
+    "FunctionStats",
+    "Profiler",
+    "Span",
+    "Tracer",
+    "get_tracer",
+    "span",
+    "start_tracing",
+    "stop_tracing",
+    "traced",
 ]
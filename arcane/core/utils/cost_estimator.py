@@ -1,9 +1,18 @@
 """Cost estimation for roadmap generation.
 
 Provides estimates for API calls, tokens, and costs before generation starts.
+
+Out of the box the estimate uses the typical TOKENS_PER_CALL and
+DEFAULT_ESTIMATES. A CostCalibration learns both from roadmaps saved
+earlier (their StoredUsage and item counts) instead, gives an interval
+around the cost by resampling those roadmaps, and can re-estimate a
+roadmap mid-run once its milestones and epics are known.
 """
 
-from dataclasses import dataclass
+import random
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
 
 from arcane.core.models import SUPPORTED_MODELS, _MODEL_ID_TO_ALIAS
 
@@ -24,6 +33,15 @@ class CostEstimate:
     story_calls: int
     task_calls: int
 
+    # Interval around estimated_cost_usd; only set by calibrated estimates
+    low_cost_usd: float | None = None
+    high_cost_usd: float | None = None
+    confidence: float | None = None
+    # Number of saved roadmaps the estimate was calibrated from
+    samples: int = 0
+    # Cost already spent, included in estimated_cost_usd (mid-run estimates)
+    spent_cost_usd: float = 0.0
+
 
 # Average tokens per API call (based on typical prompts and responses)
 TOKENS_PER_CALL = {
@@ -66,12 +84,18 @@ def _resolve_model_id(model: str) -> str:
     return model
 
 
+def model_pricing(model: str) -> dict[str, float]:
+    """Price per million input and output tokens for a model alias or ID."""
+    return MODEL_PRICING.get(_resolve_model_id(model), MODEL_PRICING["default"])
+
+
 def estimate_generation_cost(
     model: str = "sonnet",
     milestones: int | None = None,
     epics_per_milestone: int | None = None,
     stories_per_epic: int | None = None,
     tasks_per_story: int | None = None,
+    calibration: "CostCalibration | None" = None,
 ) -> CostEstimate:
     """Estimate the cost of generating a roadmap.
 
@@ -81,66 +105,286 @@ def estimate_generation_cost(
         epics_per_milestone: Expected epics per milestone (default: 3).
         stories_per_epic: Expected stories per epic (default: 3).
         tasks_per_story: Expected tasks per story (default: 3).
+        calibration: Learned token and fan-out figures to use instead of
+            the defaults (explicit counts still take precedence).
 
     Returns:
         CostEstimate with API calls, tokens, and cost breakdown.
     """
-    # Use defaults if not specified
-    ms = milestones or DEFAULT_ESTIMATES["milestones"]
-    ep_per_ms = epics_per_milestone or DEFAULT_ESTIMATES["epics_per_milestone"]
-    st_per_ep = stories_per_epic or DEFAULT_ESTIMATES["stories_per_epic"]
-    tk_per_st = tasks_per_story or DEFAULT_ESTIMATES["tasks_per_story"]
-
-    # Calculate total items at each level
-    total_epics = ms * ep_per_ms
-    total_stories = total_epics * st_per_ep
-    total_tasks = total_stories * tk_per_st
-
-    # API calls: 1 per milestone gen + 1 per epic gen + 1 per story gen + 1 per task gen
-    # But milestones/epics/stories are generated in batches, tasks individually
-    milestone_calls = 1  # One call generates all milestones
-    epic_calls = ms  # One call per milestone to generate its epics
-    story_calls = total_epics  # One call per epic to generate its stories
-    task_calls = total_stories  # One call per story to generate its tasks
-
-    total_calls = milestone_calls + epic_calls + story_calls + task_calls
-
-    # Calculate tokens
-    input_tokens = (
-        milestone_calls * TOKENS_PER_CALL["milestone"]["input"]
-        + epic_calls * TOKENS_PER_CALL["epic"]["input"]
-        + story_calls * TOKENS_PER_CALL["story"]["input"]
-        + task_calls * TOKENS_PER_CALL["task"]["input"]
+    overrides = {
+        "milestones": milestones,
+        "epics_per_milestone": epics_per_milestone,
+        "stories_per_epic": stories_per_epic,
+        "tasks_per_story": tasks_per_story,
+    }
+    return (calibration or CostCalibration()).estimate(
+        model,
+        fan_out={k: v for k, v in overrides.items() if v},
     )
 
-    output_tokens = (
-        milestone_calls * TOKENS_PER_CALL["milestone"]["output"]
-        + epic_calls * TOKENS_PER_CALL["epic"]["output"]
-        + story_calls * TOKENS_PER_CALL["story"]["output"]
-        + task_calls * TOKENS_PER_CALL["task"]["output"]
-    )
 
-    total_tokens = input_tokens + output_tokens
+# --- Calibration from saved roadmaps ---
 
-    # Get pricing for model (resolve alias if needed)
-    model_id = _resolve_model_id(model)
-    pricing = MODEL_PRICING.get(model_id, MODEL_PRICING["default"])
+LEVELS = ("milestone", "epic", "story", "task")
+
+
+def _get(obj: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a model, view or stored dict alike."""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+@dataclass
+class _Progress:
+    """Item counts of a (possibly partial) roadmap.
 
-    # Calculate cost (pricing is per million tokens)
-    input_cost = (input_tokens / 1_000_000) * pricing["input"]
-    output_cost = (output_tokens / 1_000_000) * pricing["output"]
-    total_cost = input_cost + output_cost
-
-    return CostEstimate(
-        api_calls=total_calls,
-        input_tokens=input_tokens,
-        output_tokens=output_tokens,
-        total_tokens=total_tokens,
-        estimated_cost_usd=total_cost,
-        milestone_calls=milestone_calls,
-        epic_calls=epic_calls,
-        story_calls=story_calls,
-        task_calls=task_calls,
+    ``pending_*`` count items whose children haven't been generated yet;
+    each still needs one API call.
+    """
+
+    milestones: int = 0
+    epics: int = 0
+    stories: int = 0
+    tasks: int = 0
+    pending_milestones: int = 0
+    pending_epics: int = 0
+    pending_stories: int = 0
+
+    @classmethod
+    def of(cls, roadmap: Any) -> "_Progress":
+        progress = cls()
+        for milestone in _get(roadmap, "milestones") or ():
+            progress.milestones += 1
+            epics = _get(milestone, "epics") or ()
+            progress.pending_milestones += not epics
+            for epic in epics:
+                progress.epics += 1
+                stories = _get(epic, "stories") or ()
+                progress.pending_epics += not stories
+                for story in stories:
+                    progress.stories += 1
+                    tasks = _get(story, "tasks") or ()
+                    progress.pending_stories += not tasks
+                    progress.tasks += len(tasks)
+        return progress
+
+    @property
+    def complete(self) -> bool:
+        return self.milestones > 0 and not (
+            self.pending_milestones or self.pending_epics or self.pending_stories
+        )
+
+    @property
+    def total_items(self) -> dict[str, int]:
+        return {
+            "milestones": self.milestones,
+            "epics": self.epics,
+            "stories": self.stories,
+            "tasks": self.tasks,
+        }
+
+
+@dataclass
+class UsageSample:
+    """Token usage and item counts of one fully generated roadmap."""
+
+    calls_by_level: dict[str, int]
+    tokens_by_level: dict[str, dict[str, int]]
+    total_items: dict[str, int]
+
+    @classmethod
+    def from_roadmap(cls, roadmap: Any) -> "UsageSample | None":
+        """Sample a Roadmap, RoadmapView or roadmap dict.
+
+        Returns None for roadmaps that are still being generated, since
+        their item counts would understate the fan-out.
+        """
+        progress = _Progress.of(roadmap)
+        if not progress.complete:
+            return None
+        return cls.from_usage(_get(roadmap, "usage"), progress.total_items)
+
+    @classmethod
+    def from_usage(cls, usage: Any, total_items: dict[str, int]) -> "UsageSample | None":
+        """Sample stored usage and the item counts of a complete roadmap.
+
+        Returns None if the usage doesn't cover every level (e.g. it
+        predates per-level tracking).
+        """
+        if usage is None:
+            return None
+        calls = dict(_get(usage, "calls_by_level") or {})
+        tokens = {k: dict(v) for k, v in (_get(usage, "tokens_by_level") or {}).items()}
+        if not all(calls.get(level) for level in LEVELS) or not total_items.get("tasks"):
+            return None
+        return cls(calls, tokens, dict(total_items))
+
+    def tokens_per_call(self, level: str) -> tuple[float, float]:
+        """Mean (input, output) tokens per call at a level."""
+        calls = self.calls_by_level[level]
+        tokens = self.tokens_by_level.get(level, {})
+        return tokens.get("input", 0) / calls, tokens.get("output", 0) / calls
+
+    def fan_out(self) -> dict[str, float]:
+        """Milestones, and children per parent at each level below."""
+        items = self.total_items
+        return {
+            "milestones": items["milestones"],
+            "epics_per_milestone": items["epics"] / items["milestones"],
+            "stories_per_epic": items["stories"] / items["epics"],
+            "tasks_per_story": items["tasks"] / items["stories"],
+        }
+
+
+@dataclass
+class CostCalibration:
+    """Tokens per call and fan-out learned from saved roadmaps.
+
+    Point estimates pool all samples (total tokens over total calls, total
+    children over total parents). The interval comes from bootstrapping:
+    each draw prices the remaining calls with the figures of one randomly
+    chosen sample, so it reflects how much past projects differed. With
+    fewer than two samples there is no interval, and with none the
+    module defaults are used.
+    """
+
+    samples: list[UsageSample] = field(default_factory=list)
+
+    @classmethod
+    def from_roadmaps(cls, roadmaps: Iterable[Any]) -> "CostCalibration":
+        """Calibrate from roadmaps, skipping incomplete ones."""
+        samples = [UsageSample.from_roadmap(r) for r in roadmaps]
+        return cls([s for s in samples if s is not None])
+
+    def tokens_per_call(self) -> dict[str, tuple[float, float]]:
+        """Pooled (input, output) tokens per call by level."""
+        if not self.samples:
+            return {lv: (t["input"], t["output"]) for lv, t in TOKENS_PER_CALL.items()}
+        rates = {}
+        for level in LEVELS:
+            calls = sum(s.calls_by_level[level] for s in self.samples)
+            tokens = [s.tokens_by_level.get(level, {}) for s in self.samples]
+            rates[level] = (
+                sum(t.get("input", 0) for t in tokens) / calls,
+                sum(t.get("output", 0) for t in tokens) / calls,
+            )
+        return rates
+
+    def fan_out(self) -> dict[str, float]:
+        """Pooled milestones and children per parent."""
+        if not self.samples:
+            return dict(DEFAULT_ESTIMATES)
+        totals = {
+            key: sum(s.total_items[key] for s in self.samples)
+            for key in ("milestones", "epics", "stories", "tasks")
+        }
+        return {
+            "milestones": totals["milestones"] / len(self.samples),
+            "epics_per_milestone": totals["epics"] / totals["milestones"],
+            "stories_per_epic": totals["stories"] / totals["epics"],
+            "tasks_per_story": totals["tasks"] / totals["stories"],
+        }
+
+    def estimate(
+        self,
+        model: str = "sonnet",
+        roadmap: Any = None,
+        fan_out: dict[str, float] | None = None,
+        confidence: float = 0.8,
+        simulations: int = 1000,
+        seed: int | None = 0,
+    ) -> CostEstimate:
+        """Estimate the total cost of generating a roadmap.
+
+        Args:
+            model: The model name to use for pricing.
+            roadmap: A partially generated roadmap (model, view or dict).
+                Its known items replace the expected fan-out, and the cost
+                already recorded in its usage is included.
+            fan_out: Fixed values for any of the DEFAULT_ESTIMATES keys.
+            confidence: Probability mass of the cost interval.
+            simulations: Bootstrap draws for the interval.
+            seed: Random seed, for reproducible intervals.
+
+        Returns:
+            CostEstimate whose calls and tokens cover the remaining work.
+        """
+        fixed = fan_out or {}
+        progress = _Progress.of(roadmap) if roadmap is not None else _Progress()
+        pricing = model_pricing(model)
+        spent = _usage_cost(_get(roadmap, "usage"), pricing) if roadmap is not None else 0.0
+
+        calls = _remaining_calls(progress, {**self.fan_out(), **fixed})
+        rates = self.tokens_per_call()
+        input_tokens = round(sum(calls[lv] * rates[lv][0] for lv in LEVELS))
+        output_tokens = round(sum(calls[lv] * rates[lv][1] for lv in LEVELS))
+        cost = _token_cost(input_tokens, output_tokens, pricing)
+
+        estimate = CostEstimate(
+            api_calls=sum(round(c) for c in calls.values()),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+            estimated_cost_usd=spent + cost,
+            milestone_calls=round(calls["milestone"]),
+            epic_calls=round(calls["epic"]),
+            story_calls=round(calls["story"]),
+            task_calls=round(calls["task"]),
+            samples=len(self.samples),
+            spent_cost_usd=spent,
+        )
+        if len(self.samples) >= 2:
+            rng = random.Random(seed)
+            costs = []
+            for _ in range(simulations):
+                sample = rng.choice(self.samples)
+                draw = _remaining_calls(progress, {**sample.fan_out(), **fixed})
+                costs.append(
+                    _token_cost(
+                        sum(draw[lv] * sample.tokens_per_call(lv)[0] for lv in LEVELS),
+                        sum(draw[lv] * sample.tokens_per_call(lv)[1] for lv in LEVELS),
+                        pricing,
+                    )
+                )
+            costs.sort()
+            tail = (1 - confidence) / 2
+            estimate.low_cost_usd = spent + costs[int(tail * (simulations - 1))]
+            estimate.high_cost_usd = spent + costs[int((1 - tail) * (simulations - 1))]
+            estimate.confidence = confidence
+        return estimate
+
+
+def _remaining_calls(progress: _Progress, fan_out: dict[str, float]) -> dict[str, float]:
+    """Expected API calls per level to finish a roadmap.
+
+    Milestones come from one call, then each milestone, epic and story
+    without children takes one call to generate them.
+    """
+    if progress.milestones:
+        milestone_calls, epic_calls = 0.0, float(progress.pending_milestones)
+    else:
+        milestone_calls, epic_calls = 1.0, float(fan_out["milestones"])
+    story_calls = progress.pending_epics + epic_calls * fan_out["epics_per_milestone"]
+    task_calls = progress.pending_stories + story_calls * fan_out["stories_per_epic"]
+    return {
+        "milestone": milestone_calls,
+        "epic": epic_calls,
+        "story": story_calls,
+        "task": task_calls,
+    }
+
+
+def _token_cost(input_tokens: float, output_tokens: float, pricing: dict[str, float]) -> float:
+    # Pricing is per million tokens
+    return (input_tokens * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
+
+
+def _usage_cost(usage: Any, pricing: dict[str, float]) -> float:
+    if usage is None:
+        return 0.0
+    return _token_cost(
+        _get(usage, "input_tokens", 0), _get(usage, "output_tokens", 0), pricing
     )
 
 
@@ -159,6 +403,15 @@ def format_cost_estimate(estimate: CostEstimate) -> str:
         f"   ~{estimate.total_tokens:,} tokens ({estimate.input_tokens:,} in / {estimate.output_tokens:,} out)",
         f"   ~${estimate.estimated_cost_usd:.2f} estimated cost",
     ]
+    if estimate.low_cost_usd is not None and estimate.high_cost_usd is not None:
+        lines.append(
+            f"   {estimate.confidence:.0%} range ${estimate.low_cost_usd:.2f}"
+            f"–${estimate.high_cost_usd:.2f}"
+        )
+    if estimate.samples:
+        lines.append(f"   Calibrated from {estimate.samples} previous roadmap(s)")
+    if estimate.spent_cost_usd:
+        lines.append(f"   (includes ${estimate.spent_cost_usd:.2f} already spent)")
     return "\n".join(lines)
 
 
@@ -0,0 +1,228 @@
+"""Built-in profiler for CLI runs.
+
+Profiler runs a command under three collectors at once:
+
+- cProfile, for exact call counts and cumulative time per function
+- a sampling thread, which records the main thread's stack every few
+  milliseconds as collapsed stacks (``a;b;c count``), the input format
+  of flamegraph.pl, speedscope and inferno
+- tracemalloc, for peak memory and the lines that allocated it
+
+All three slow the run down (tracemalloc the most), so compare profiled
+runs with each other rather than with unprofiled timings.
+
+Usage:
+    profiler = Profiler()
+    profiler.start()
+    ...
+    profiler.stop()
+    profiler.write(Path("profile/export"))  # export.prof, .collapsed, .tracemalloc
+    profiler.print_summary(console)
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+
+from rich.console import Console
+from rich.table import Table
+
+# Directory of the arcane package; functions defined under it are "ours"
+PACKAGE_DIR = str(Path(__file__).resolve().parents[2])
+
+# Seconds between stack samples
+SAMPLE_INTERVAL = 0.005
+
+
+@dataclass
+class FunctionStats:
+    """Time spent in one function, from cProfile."""
+
+    name: str
+    location: str
+    calls: int
+    own_seconds: float
+    cumulative_seconds: float
+
+
+class _Sampler(threading.Thread):
+    """Samples one thread's stack at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        super().__init__(name="arcane-profiler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def _collapse(frame: FrameType | None) -> str:
+    """Render a stack root-first as ``func (file:line);...``."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def _short_path(filename: str) -> str:
+    if filename.startswith(PACKAGE_DIR):
+        return filename[len(PACKAGE_DIR) + 1 :]
+    return Path(filename).name
+
+
+class Profiler:
+    """Collects a cProfile, sampled stacks and memory for one run."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, memory: bool = True) -> None:
+        self.interval = interval
+        self.memory = memory
+        self.elapsed = 0.0
+        self.peak_memory = 0
+        self._profile = cProfile.Profile()
+        self._sampler: _Sampler | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._started = 0.0
+
+    @property
+    def stacks(self) -> Counter[str]:
+        """Collapsed stack -> number of samples."""
+        return self._sampler.stacks if self._sampler else Counter()
+
+    def start(self) -> None:
+        """Start profiling the calling thread."""
+        if self.memory:
+            tracemalloc.start()
+        self._sampler = _Sampler(threading.get_ident(), self.interval)
+        self._sampler.start()
+        self._started = time.perf_counter()
+        self._profile.enable()
+
+    def stop(self) -> None:
+        """Stop every collector; must be called from the starting thread."""
+        self._profile.disable()
+        self.elapsed = time.perf_counter() - self._started
+        if self._sampler is not None:
+            self._sampler.stop()
+        if self.memory and tracemalloc.is_tracing():
+            self._snapshot = tracemalloc.take_snapshot()
+            _, self.peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    # --- Reports ---
+
+    def top_functions(self, limit: int = 15, owned_only: bool = True) -> list[FunctionStats]:
+        """Functions with the most own time, slowest first.
+
+        Args:
+            limit: Maximum number of functions to return.
+            owned_only: Only include functions defined in the arcane package.
+        """
+        stats = pstats.Stats(self._profile)
+        rows = []
+        for (filename, line, func), (_, calls, own, cumulative, _) in stats.stats.items():
+            if owned_only and (not filename.startswith(PACKAGE_DIR) or filename == __file__):
+                continue
+            rows.append(
+                FunctionStats(
+                    name=func,
+                    location=f"{_short_path(filename)}:{line}",
+                    calls=calls,
+                    own_seconds=own,
+                    cumulative_seconds=cumulative,
+                )
+            )
+        rows.sort(key=lambda r: r.own_seconds, reverse=True)
+        return rows[:limit]
+
+    def top_allocations(self, limit: int = 10) -> list[tracemalloc.Statistic]:
+        """Lines in the arcane package holding the most memory at the end."""
+        if self._snapshot is None:
+            return []
+        snapshot = self._snapshot.filter_traces(
+            [
+                tracemalloc.Filter(True, f"{PACKAGE_DIR}/*"),
+                # The sampler's own stacks
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        return snapshot.statistics("lineno")[:limit]
+
+    def write(self, prefix: Path) -> list[Path]:
+        """Write ``<prefix>.prof``, ``.collapsed`` and ``.tracemalloc``.
+
+        The .prof file loads with pstats or snakeviz, and the .tracemalloc
+        snapshot with tracemalloc.Snapshot.load().
+
+        Returns:
+            The paths written.
+        """
+        prefix = Path(prefix)
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        paths = []
+
+        prof_path = prefix.with_name(prefix.name + ".prof")
+        self._profile.dump_stats(prof_path)
+        paths.append(prof_path)
+
+        collapsed_path = prefix.with_name(prefix.name + ".collapsed")
+        collapsed_path.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+        )
+        paths.append(collapsed_path)
+
+        if self._snapshot is not None:
+            memory_path = prefix.with_name(prefix.name + ".tracemalloc")
+            self._snapshot.dump(str(memory_path))
+            paths.append(memory_path)
+        return paths
+
+    def print_summary(self, console: Console, limit: int = 15) -> None:
+        """Print the hottest arcane functions and allocation sites."""
+        table = Table(
+            title=f"Hottest Arcane Functions ({self.elapsed:.2f}s profiled)", show_header=True
+        )
+        table.add_column("Function")
+        table.add_column("Location", style="dim")
+        table.add_column("Calls", justify="right")
+        table.add_column("Own (s)", justify="right")
+        table.add_column("Cumulative (s)", justify="right")
+        for row in self.top_functions(limit):
+            table.add_row(
+                row.name,
+                row.location,
+                str(row.calls),
+                f"{row.own_seconds:.3f}",
+                f"{row.cumulative_seconds:.3f}",
+            )
+        console.print(table)
+
+        if self.memory:
+            peak_mb = self.peak_memory / 1024 / 1024
+            console.print(f"[bold]Peak traced memory:[/bold] {peak_mb:.1f} MB")
+            for stat in self.top_allocations(5):
+                frame = stat.traceback[0]
+                console.print(
+                    f"  {stat.size / 1024:10.1f} KB  "
+                    f"{_short_path(frame.filename)}:{frame.lineno}"
+                )
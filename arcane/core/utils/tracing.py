@@ -0,0 +1,271 @@
+"""Span tracing for generation, storage and exports.
+
+A span times one operation (a generator run, an API call, a storage
+save, an HTTP request to a PM tool) and nests under the span that was
+open when it started, so a trace shows where the wall-clock time of a
+run went. Spans follow the OpenTelemetry shape (name, start/end,
+parent, attributes, error status, ``gen_ai.*``/``http.*`` attribute
+names) without depending on it.
+
+Tracing is off until start_tracing() installs a Tracer; until then
+``span()`` and ``@traced`` cost one global lookup. Finished spans export
+to the Chrome trace format (open in chrome://tracing or Perfetto) or to
+a console summary of time per span name.
+
+Usage:
+    tracer = start_tracing()
+    with span("storage.save", path=str(path)):
+        ...
+    stop_tracing()
+    tracer.write_chrome_trace(Path("trace.json"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from rich.console import Console
+from rich.table import Table
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """One timed operation. Times are perf_counter_ns() values."""
+
+    name: str
+    span_id: int
+    parent_id: int | None
+    track: int
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to end (or to now, if still open)."""
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class _NoopSpan(Span):
+    """Stand-in yielded by span() while tracing is off."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan(name="", span_id=0, parent_id=None, track=0, start_ns=0)
+
+# The innermost open span in the current task or thread
+_current_span: ContextVar[Span | None] = ContextVar("arcane_current_span", default=None)
+
+
+class Tracer:
+    """Collects finished spans and exports them."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._epoch_ns = time.perf_counter_ns()
+        self._ids = itertools.count(1)
+        self._tracks: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Time the block as a span nested under the current one."""
+        parent = _current_span.get()
+        current = Span(
+            name=name,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent else None,
+            track=self._track(),
+            start_ns=time.perf_counter_ns(),
+            attributes=attributes,
+        )
+        token = _current_span.set(current)
+        try:
+            yield current
+        except BaseException as e:
+            current.error = type(e).__name__
+            raise
+        finally:
+            current.end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            with self._lock:
+                self.spans.append(current)
+
+    def _track(self) -> int:
+        """Small integer for the running asyncio task (or thread).
+
+        Concurrent tasks get their own tracks, since Chrome trace viewers
+        only nest events that are on the same thread.
+        """
+        try:
+            key = id(asyncio.current_task())
+        except RuntimeError:
+            key = threading.get_ident()
+        with self._lock:
+            track = self._tracks.get(key)
+            if track is None:
+                track = self._tracks[key] = len(self._tracks) + 1
+        return track
+
+    # --- Export ---
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Spans as Chrome trace "complete" events (microseconds)."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "arcane"}}
+        ]
+        for s in sorted(self.spans, key=lambda s: (s.start_ns, s.span_id)):
+            args = {k: _json_value(v) for k, v in s.attributes.items()}
+            args["span_id"] = s.span_id
+            if s.parent_id is not None:
+                args["parent_id"] = s.parent_id
+            if s.error:
+                args["error.type"] = s.error
+            events.append(
+                {
+                    "name": s.name,
+                    "cat": s.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": (s.start_ns - self._epoch_ns) / 1000,
+                    "dur": ((s.end_ns or s.start_ns) - s.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": s.track,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        """Write the Chrome trace JSON file and return its path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()))
+        return path
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Count, total, max and error count per span name, slowest first."""
+        rows: dict[str, dict[str, Any]] = {}
+        for s in self.spans:
+            row = rows.setdefault(
+                s.name, {"name": s.name, "count": 0, "total": 0.0, "max": 0.0, "errors": 0}
+            )
+            row["count"] += 1
+            row["total"] += s.duration
+            row["max"] = max(row["max"], s.duration)
+            row["errors"] += s.error is not None
+        return sorted(rows.values(), key=lambda r: r["total"], reverse=True)
+
+    def print_summary(self, console: Console) -> None:
+        """Print the per-name summary as a table."""
+        table = Table(title="Trace Summary", show_header=True)
+        table.add_column("Span")
+        table.add_column("Count", justify="right")
+        table.add_column("Total (s)", justify="right")
+        table.add_column("Mean (s)", justify="right")
+        table.add_column("Max (s)", justify="right")
+        table.add_column("Errors", justify="right")
+        for row in self.summary():
+            table.add_row(
+                row["name"],
+                str(row["count"]),
+                f"{row['total']:.3f}",
+                f"{row['total'] / row['count']:.3f}",
+                f"{row['max']:.3f}",
+                str(row["errors"]) if row["errors"] else "",
+            )
+        console.print(table)
+
+
+def _json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+# --- Global tracer ---
+
+_tracer: Tracer | None = None
+
+
+def start_tracing() -> Tracer:
+    """Install a new global tracer and return it."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Tracer | None:
+    """Remove the global tracer and return it (with its spans)."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Tracer | None:
+    """Return the global tracer, or None if tracing is off."""
+    return _tracer
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span in this task, if tracing is on."""
+    return _current_span.get() if _tracer is not None else None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Time the block on the global tracer, if tracing is on."""
+    if _tracer is None:
+        yield _NOOP_SPAN
+        return
+    with _tracer.span(name, **attributes) as current:
+        yield current
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorate a function or coroutine function to run inside a span."""
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with _tracer.span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _tracer.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
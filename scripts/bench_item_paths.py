@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark item edits with and without the cached item path index.
+
+Builds a synthetic roadmap document, then times the web backend's item
+helpers (find_item_by_id, find_parent_chain, cascade_status_update and
+reorder_children) when each request builds a RoadmapIndex first, as
+they did before, and when it reuses ItemPaths entries cached for the
+roadmap version. No database or API calls are made.
+
+Usage:
+    python scripts/bench_item_paths.py [--tasks 18000] [--repeat 20]
+
+Output:
+    - Prints a timing table (milliseconds per request, lower is better)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root and the web backend to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "web" / "backend"))
+
+from app.services.item_paths import ItemPaths  # noqa: E402
+from app.services.roadmap_items import (  # noqa: E402
+    cascade_status_update,
+    find_item_by_id,
+    find_parent_chain,
+    reorder_children,
+)
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+
+from arcane.core.items import RoadmapIndex  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).parent))
+from bench_storage import build_roadmap  # noqa: E402
+
+console = Console()
+
+
+def timed(fn, repeat: int) -> float:
+    """Run fn repeat times and return the mean wall time in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=18000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    data = build_roadmap("bench-item-paths", args.tasks).model_dump(mode="json")
+    entries = ItemPaths(data).entries
+    last_milestone = data["milestones"][-1]
+    last_story = last_milestone["epics"][-1]["stories"][-1]
+    task_id = last_story["tasks"][-1]["id"]
+    story_ids = [s["id"] for s in last_milestone["epics"][-1]["stories"]]
+
+    def reorder(index):
+        story_ids.reverse()
+        reorder_children(last_milestone["epics"][-1]["id"], story_ids, data, index)
+
+    operations = {
+        "find_item_by_id": lambda index: find_item_by_id(data, task_id, index),
+        "find_parent_chain": lambda index: find_parent_chain(data, task_id, index),
+        "cascade_status_update": lambda index: cascade_status_update(data, task_id, index),
+        "reorder_children": reorder,
+    }
+
+    table = Table(title=f"Item edits on {len(entries)} items (ms per request)")
+    table.add_column("Operation")
+    table.add_column("Build RoadmapIndex", justify="right")
+    table.add_column("Cached ItemPaths", justify="right")
+    table.add_column("Speedup", justify="right")
+    for name, operation in operations.items():
+        cold = timed(lambda op=operation: op(RoadmapIndex(data)), args.repeat)
+        # Each request wraps the cached entries it took around its own document
+        cached = timed(
+            lambda op=operation: op(ItemPaths(data, entries)), args.repeat
+        )
+        table.add_row(name, f"{cold:.3f}", f"{cached:.3f}", f"{cold / cached:.0f}x")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
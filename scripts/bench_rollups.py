@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark rollup fields (estimated_hours, total_hours, total_items).
+
+Times the operations that read rollups on a large roadmap: serialization,
+the summary numbers printed by the CLI, and the save-after-every-story
+pattern used during generation. No API calls are made.
+
+Usage:
+    python scripts/bench_rollups.py [--tasks 10000]
+
+Output:
+    - Prints a timing table (milliseconds, lower is better)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+
+from arcane.core.items import Priority, Story, Task  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).parent))
+from bench_storage import build_roadmap  # noqa: E402
+
+console = Console()
+
+
+def timed(fn, repeat: int = 1) -> float:
+    """Run fn repeat times and return the best wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    args = parser.parse_args()
+
+    roadmap = build_roadmap("bench-rollups", args.tasks)
+    counts = roadmap.total_items
+    epic = roadmap.milestones[-1].epics[-1]
+
+    def summary():
+        _ = roadmap.total_items
+        _ = roadmap.total_hours
+        for milestone in roadmap.milestones:
+            _ = milestone.estimated_hours
+
+    def add_story_and_summarize():
+        # What the orchestrator does after each story: append, then read totals
+        epic.stories.append(
+            Story(
+                id="story-bench",
+                name="Bench story",
+                description="Appended during the benchmark",
+                priority=Priority.LOW,
+                acceptance_criteria=[],
+                tasks=[
+                    Task(
+                        id=f"task-bench-{i}",
+                        name="Bench task",
+                        description="Bench",
+                        priority=Priority.LOW,
+                        estimated_hours=2,
+                        acceptance_criteria=[],
+                        implementation_notes="",
+                        claude_code_prompt="",
+                    )
+                    for i in range(5)
+                ],
+            )
+        )
+        summary()
+        epic.stories.pop()
+
+    fresh = build_roadmap("bench-rollups-cold", args.tasks)
+    results = {
+        "model_dump() (first, cold)": timed(fresh.model_dump),
+        "model_dump()": timed(roadmap.model_dump, repeat=5),
+        "model_dump_json()": timed(roadmap.model_dump_json, repeat=5),
+        "summary (repeated)": timed(summary, repeat=100),
+        "append story + summary": timed(add_story_and_summarize, repeat=20),
+    }
+
+    table = Table(title=f"Rollup benchmark ({sum(counts.values())} items, {counts['tasks']} tasks)")
+    table.add_column("Operation")
+    table.add_column("ms", justify="right")
+    for op, ms in results.items():
+        table.add_row(op, f"{ms:.3f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Benchmark the JSON and SQLite storage backends.
+
+Builds a synthetic roadmap, then times full saves, per-story incremental
+saves, full loads, single-item and subtree lookups and workspace listing for both
+backends. No API calls are made.
+
+Usage:
+    python scripts/bench_storage.py [--tasks 10000] [--roadmaps 20]
+
+Output:
+    - Prints a timing table (milliseconds, lower is better)
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+
+from arcane.core.items import (  # noqa: E402
+    Epic,
+    Milestone,
+    Priority,
+    ProjectContext,
+    Roadmap,
+    Status,
+    Story,
+    Task,
+)
+from arcane.core.storage import SQLiteStorageManager, StorageManager  # noqa: E402
+
+console = Console()
+
+
+def build_roadmap(name: str, tasks: int) -> Roadmap:
+    """Build a roadmap with roughly the requested number of tasks.
+
+    Shape is 5 milestones x 5 epics x N stories x 8 tasks.
+    """
+    stories_per_epic = max(1, tasks // (5 * 5 * 8))
+    context = ProjectContext(
+        project_name=name,
+        vision="Benchmark",
+        problem_statement="Benchmark",
+        target_users=["developers"],
+        timeline="6 months",
+        team_size=4,
+        developer_experience="senior",
+        budget_constraints="moderate",
+        tech_stack=["Python"],
+        infrastructure_preferences="AWS",
+        existing_codebase=False,
+        must_have_features=["speed"],
+        nice_to_have_features=[],
+        out_of_scope=[],
+        similar_products=[],
+        notes="",
+    )
+
+    def task(m, e, s, t):
+        return Task(
+            id=f"task-{m}-{e}-{s}-{t}",
+            name=f"Task {t} of story {s}",
+            description=f"Implement part {t} of the {s} flow in epic {e}",
+            priority=Priority.MEDIUM,
+            estimated_hours=1 + t % 8,
+            acceptance_criteria=["Tests pass"],
+            implementation_notes="Follow existing patterns",
+            claude_code_prompt="Implement the change described above.",
+        )
+
+    milestones = [
+        Milestone(
+            id=f"milestone-{m}",
+            name=f"Milestone {m}",
+            description=f"Milestone {m}",
+            priority=Priority.HIGH,
+            goal="Ship",
+            epics=[
+                Epic(
+                    id=f"epic-{m}-{e}",
+                    name=f"Epic {e}",
+                    description=f"Epic {e} of milestone {m}",
+                    priority=Priority.HIGH,
+                    goal="Deliver",
+                    stories=[
+                        Story(
+                            id=f"story-{m}-{e}-{s}",
+                            name=f"Story {s}",
+                            description=f"As a user I want feature {s}",
+                            priority=Priority.MEDIUM,
+                            acceptance_criteria=["Works"],
+                            tasks=[task(m, e, s, t) for t in range(8)],
+                        )
+                        for s in range(stories_per_epic)
+                    ],
+                )
+                for e in range(5)
+            ],
+        )
+        for m in range(5)
+    ]
+    now = datetime.now(timezone.utc)
+    return Roadmap(
+        id=f"bench-{name}",
+        project_name=name,
+        created_at=now,
+        updated_at=now,
+        context=context,
+        milestones=milestones,
+    )
+
+
+def timed(fn, repeat: int = 1) -> float:
+    """Run fn repeat times and return the mean wall time in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def bench_backend(storage, roadmaps: list[Roadmap], lookup_key) -> dict:
+    """Time the common storage operations for one backend."""
+    run = asyncio.run
+    results = {}
+    main = roadmaps[0]
+
+    results["full save"] = timed(lambda: run(storage.save_roadmap(main)))
+    for other in roadmaps[1:]:
+        run(storage.save_roadmap(other))
+
+    story = main.milestones[-1].epics[-1].stories[-1]
+
+    def incremental():
+        story.tasks[0].status = Status.COMPLETED
+        run(storage.save_roadmap(main))
+        story.tasks[0].status = Status.NOT_STARTED
+
+    results["incremental save"] = timed(incremental, repeat=5)
+    key = lookup_key(storage, main)
+    results["full load"] = timed(lambda: run(storage.load_roadmap(key)))
+
+    if isinstance(storage, SQLiteStorageManager):
+        results["item lookup"] = timed(
+            lambda: storage.get_item(main.id, story.tasks[-1].id), repeat=100
+        )
+        epic_id = main.milestones[-1].epics[-1].id
+        results["epic subtree load"] = timed(
+            lambda: storage.load_subtree(main.id, epic_id), repeat=10
+        )
+        results["list roadmaps"] = timed(storage.list_roadmaps, repeat=5)
+    else:
+        def json_lookup():
+            roadmap = run(storage.load_roadmap(key))
+            next(
+                t
+                for m in roadmap.milestones
+                for e in m.epics
+                for s in e.stories
+                for t in s.tasks
+                if t.id == story.tasks[-1].id
+            )
+
+        def json_list():
+            for path in storage.base_path.glob("*/roadmap.json"):
+                r = Roadmap.model_validate_json(path.read_text())
+                _ = r.total_items, r.total_hours
+
+        def json_subtree():
+            roadmap = run(storage.load_roadmap(key))
+            roadmap.milestones[-1].epics[-1].model_dump(mode="json")
+
+        results["item lookup"] = timed(json_lookup)
+        results["epic subtree load"] = timed(json_subtree)
+        results["list roadmaps"] = timed(json_list)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--roadmaps", type=int, default=20)
+    args = parser.parse_args()
+
+    console.print(
+        f"[dim]Building {args.roadmaps} roadmaps (~{args.tasks} tasks in the first)...[/dim]"
+    )
+    roadmaps = [build_roadmap("bench-main", args.tasks)] + [
+        build_roadmap(f"bench-{i}", 400) for i in range(args.roadmaps - 1)
+    ]
+    items = sum(roadmaps[0].total_items.values())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_storage = StorageManager(Path(tmp) / "json")
+        sqlite_storage = SQLiteStorageManager(Path(tmp) / "sqlite")
+        json_results = bench_backend(
+            json_storage,
+            roadmaps,
+            lambda s, r: s.base_path / s._slugify(r.project_name),
+        )
+        sqlite_results = bench_backend(
+            sqlite_storage, roadmaps, lambda _, r: r.id
+        )
+        sqlite_storage.close()
+
+    table = Table(title=f"Storage benchmark ({items} items, {args.roadmaps} roadmaps)")
+    table.add_column("Operation")
+    table.add_column("JSON (ms)", justify="right")
+    table.add_column("SQLite (ms)", justify="right")
+    table.add_column("Speedup", justify="right")
+    for op, json_ms in json_results.items():
+        sqlite_ms = sqlite_results[op]
+        table.add_row(
+            op, f"{json_ms:.2f}", f"{sqlite_ms:.2f}", f"{json_ms / sqlite_ms:.1f}x"
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
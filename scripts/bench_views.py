@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark memory of Roadmap models against read-only RoadmapViews.
+
+Builds a synthetic roadmap.json at each size, then loads it both as a
+validated Roadmap and as a RoadmapView and measures the memory each one
+keeps alive (tracemalloc) and the load time. No API calls are made.
+
+Usage:
+    python scripts/bench_views.py [--tasks 1000,10000,100000]
+
+Output:
+    - Prints a table of retained MB and load time per size
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from rich.console import Console
+from rich.table import Table
+
+from arcane.core.items import Roadmap, RoadmapView
+
+sys.path.insert(0, str(Path(__file__).parent))
+from bench_storage import build_roadmap  # noqa: E402
+
+console = Console()
+
+LABELS = (["backend", "api"], ["frontend"], ["infra", "ci"], [])
+STATUSES = ("not_started", "in_progress", "completed", "completed")
+
+
+def roadmap_json(tasks: int) -> str:
+    """Serialized roadmap with varied labels, status and prerequisites."""
+    data = build_roadmap(f"bench-views-{tasks}", tasks).model_dump(mode="json")
+    n = 0
+    for milestone in data["milestones"]:
+        for epic in milestone["epics"]:
+            epic["labels"] = ["epic-label"]
+            for story in epic["stories"]:
+                previous = None
+                for task in story["tasks"]:
+                    task["labels"] = LABELS[n % len(LABELS)]
+                    task["status"] = STATUSES[n % len(STATUSES)]
+                    if previous is not None:
+                        task["prerequisites"] = [previous]
+                    previous = task["id"]
+                    n += 1
+    return json.dumps(data)
+
+
+def measure(load, text: str) -> tuple[float, float]:
+    """Return (MB kept alive by the loaded object, load seconds)."""
+    # Timed without tracing, which slows Python-level code far more than
+    # pydantic's Rust parser
+    gc.collect()
+    start = time.perf_counter()
+    loaded = load(text)
+    elapsed = time.perf_counter() - start
+    del loaded
+
+    gc.collect()
+    tracemalloc.start()
+    loaded = load(text)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return retained / 1024 / 1024, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", default="1000,10000,100000")
+    args = parser.parse_args()
+
+    table = Table(title="Roadmap vs RoadmapView (retained memory)")
+    table.add_column("Tasks", justify="right")
+    table.add_column("Roadmap MB", justify="right")
+    table.add_column("View MB", justify="right")
+    table.add_column("Ratio", justify="right")
+    table.add_column("Roadmap load s", justify="right")
+    table.add_column("View load s", justify="right")
+
+    for size in (int(s) for s in args.tasks.split(",")):
+        text = roadmap_json(size)
+        model_mb, model_s = measure(Roadmap.model_validate_json, text)
+        view_mb, view_s = measure(RoadmapView.from_json, text)
+        table.add_row(
+            str(size),
+            f"{model_mb:.1f}",
+            f"{view_mb:.1f}",
+            f"{model_mb / view_mb:.1f}x",
+            f"{model_s:.2f}",
+            f"{view_s:.2f}",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 import pytest
 import typer
 
-from arcane.cli import _split_csv, _build_prefilled
+from arcane.cli import _build_budget, _split_csv, _build_prefilled
 
 
 class TestSplitCsv:
@@ -142,3 +142,24 @@ class TestBuildPrefilled:
         """Empty lists are included (not treated as None)."""
         result = _build_prefilled(tech_stack=[])
         assert result["tech_stack"] == []
+
+
+class TestBuildBudget:
+    """Tests for the _build_budget helper."""
+
+    def test_no_limits_is_no_budget(self):
+        assert _build_budget(None, None, None, None) is None
+
+    def test_parses_limits_and_item_caps(self):
+        budget = _build_budget(600, None, 2.5, ["tasks=200", "epics = 10"])
+        assert budget.max_seconds == 600
+        assert budget.max_cost_usd == 2.5
+        assert budget.max_items == {"tasks": 200, "epics": 10}
+
+    def test_invalid_item_cap(self):
+        with pytest.raises(typer.BadParameter, match="LEVEL=COUNT"):
+            _build_budget(None, None, None, ["tasks"])
+
+    def test_unknown_item_level(self):
+        with pytest.raises(typer.BadParameter, match="subtasks"):
+            _build_budget(None, None, None, ["subtasks=5"])
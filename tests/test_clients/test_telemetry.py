@@ -0,0 +1,181 @@
+"""Tests for generation telemetry."""
+
+import json
+
+import pytest
+from rich.console import Console
+
+from arcane.core.clients import GenerationTelemetry
+from arcane.core.clients.telemetry import Histogram, current_call
+from arcane.core.generators.orchestrator import RoadmapOrchestrator
+from arcane.core.items import ProjectContext
+from arcane.core.storage import StorageManager
+from arcane.core.templates.loader import TemplateLoader
+from tests.test_generators.test_base import (
+    MilestoneGeneratorStub,
+    MilestoneSkeletonList,
+    MockClient,
+)
+from tests.test_generators.test_orchestrator import MockClient as FixtureClient
+
+from .test_base import RateLimitTestClient
+
+
+@pytest.fixture
+def sample_context():
+    """Sample ProjectContext for testing."""
+    return ProjectContext(
+        project_name="TestApp",
+        vision="A test application",
+        problem_statement="Testing is important",
+        target_users=["developers"],
+        timeline="3 months",
+        team_size=2,
+        developer_experience="senior",
+        budget_constraints="moderate",
+        tech_stack=["Python", "React"],
+        infrastructure_preferences="AWS",
+        existing_codebase=False,
+        must_have_features=["auth", "dashboard"],
+        nice_to_have_features=["dark mode"],
+        out_of_scope=["mobile app"],
+        similar_products=["other apps"],
+        notes="Test notes",
+    )
+
+
+class TestHistogram:
+    """Tests for the fixed-bucket histogram."""
+
+    def test_observe_and_cumulative(self):
+        hist = Histogram(bounds=(1.0, 5.0))
+        for value in (0.5, 0.9, 3.0, 9.0):
+            hist.observe(value)
+        assert hist.counts == [2, 1]
+        assert hist.cumulative() == [2, 3]
+        assert hist.count == 4
+        assert hist.max == 9.0
+        assert hist.mean == pytest.approx(13.4 / 4)
+
+    def test_roundtrip_and_merge(self):
+        hist = Histogram()
+        hist.observe(0.2)
+        hist.observe(42.0)
+        restored = Histogram.from_dict(json.loads(json.dumps(hist.to_dict())))
+        assert restored == hist
+        restored.merge(hist)
+        assert restored.count == 4
+        assert restored.cumulative()[-1] == 4
+
+    def test_merge_rejects_other_buckets(self):
+        with pytest.raises(ValueError):
+            Histogram().merge(Histogram(bounds=(1.0,)))
+
+
+class TestTrackCall:
+    """Tests for per-call recording."""
+
+    def test_successful_call(self):
+        telemetry = GenerationTelemetry()
+        with telemetry.track_call("epic") as call:
+            assert current_call() is call
+            call.mark_first_byte()
+            call.add_tokens(100, 50)
+        assert current_call() is None
+        epic = telemetry.levels["epic"]
+        assert (epic.calls, epic.failed_calls) == (1, 0)
+        assert (epic.input_tokens, epic.output_tokens) == (100, 50)
+        assert epic.latency.count == 1
+        assert epic.first_byte.count == 1
+
+    def test_failed_call(self):
+        telemetry = GenerationTelemetry()
+        with pytest.raises(RuntimeError), telemetry.track_call(None):
+            raise RuntimeError("boom")
+        other = telemetry.levels["other"]
+        assert (other.calls, other.failed_calls) == (0, 1)
+        assert other.latency.count == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits_recorded(self):
+        client = RateLimitTestClient(rate_limit_count=2)
+        with client.telemetry.track_call("story"):
+            await client._call_with_backoff(client.mock_api_call)
+        story = client.telemetry.levels["story"]
+        assert story.rate_limits == 2
+        assert story.rate_limit_wait_seconds == pytest.approx(0.01 + 0.02)
+        assert story.calls == 1
+
+
+class TestReports:
+    """Tests for JSON and Prometheus output."""
+
+    def make(self) -> GenerationTelemetry:
+        telemetry = GenerationTelemetry()
+        with telemetry.track_call("task") as call:
+            call.add_tokens(10, 20)
+        telemetry.record_generation("task", 2.5, attempts=3, validation_failures=1)
+        return telemetry
+
+    def test_json_roundtrip_and_totals(self):
+        telemetry = self.make()
+        report = json.loads(json.dumps(telemetry.to_dict()))
+        assert report["total"]["retries"] == 2
+        assert report["levels"]["task"]["validation_failures"] == 1
+        assert GenerationTelemetry.from_dict(report).to_dict() == report
+
+    def test_merged_with(self):
+        merged = self.make().merged_with(self.make())
+        assert merged.levels["task"].calls == 2
+        assert merged.levels["task"].output_tokens == 40
+
+    def test_prometheus(self):
+        text = self.make().to_prometheus()
+        assert "# TYPE arcane_generation_call_seconds histogram" in text
+        assert 'arcane_generation_call_seconds_bucket{level="task",le="+Inf"} 1' in text
+        assert 'arcane_generation_calls_total{level="task"} 1' in text
+        assert 'arcane_generation_retries_total{level="task"} 2' in text
+        assert text.endswith("\n")
+
+
+@pytest.mark.asyncio
+async def test_generator_records_attempts(sample_context):
+    """Retries of a generator run are counted against its level."""
+    client = MockClient(response=MilestoneSkeletonList(milestones=[]), fail_count=1)
+    generator = MilestoneGeneratorStub(client, Console(quiet=True), TemplateLoader())
+    await generator.generate(sample_context)
+
+    milestone = client.telemetry.levels["milestone"]
+    assert milestone.generations == 1
+    assert milestone.retries == 1
+    assert milestone.generation_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_saves_report(tmp_path, sample_context):
+    """Generation writes telemetry.json next to roadmap.json."""
+    storage = StorageManager(tmp_path)
+    orchestrator = RoadmapOrchestrator(
+        FixtureClient(), Console(quiet=True), storage, interactive=False
+    )
+    roadmap = await orchestrator.generate(sample_context)
+
+    path = tmp_path / "testapp" / "telemetry.json"
+    report = json.loads(path.read_text())
+    assert report["levels"]["milestone"]["generations"] == 1
+    assert report["levels"]["task"]["generations"] == roadmap.total_items["stories"]
+    loaded = await storage.load_telemetry(roadmap)
+    assert loaded.levels["epic"].generations == 2
+
+
+@pytest.mark.asyncio
+async def test_http_hook_marks_first_byte():
+    """The Anthropic client's response hook times the call in flight."""
+    from arcane.core.clients.anthropic import _mark_first_byte
+
+    await _mark_first_byte(None)  # no call in flight: ignored
+    telemetry = GenerationTelemetry()
+    with telemetry.track_call("task") as call:
+        await _mark_first_byte(None)
+        assert call.first_byte is not None
+    assert telemetry.levels["task"].first_byte.count == 1
@@ -0,0 +1,139 @@
+"""Tests for budget-bounded generation runs."""
+
+import pytest
+from rich.console import Console
+
+from arcane.core.generators import GenerationBudget, RoadmapOrchestrator
+from arcane.core.items import ProjectContext
+from arcane.core.storage import StorageManager
+
+from .test_orchestrator import MockClient
+
+
+@pytest.fixture
+def sample_context():
+    """Sample ProjectContext for testing."""
+    return ProjectContext(
+        project_name="TestApp",
+        vision="A test application",
+        problem_statement="Testing is important",
+        target_users=["developers"],
+        timeline="3 months",
+        team_size=2,
+        developer_experience="senior",
+        budget_constraints="moderate",
+        tech_stack=["Python", "React"],
+        infrastructure_preferences="AWS",
+        existing_codebase=False,
+        must_have_features=["auth", "dashboard"],
+        nice_to_have_features=["dark mode"],
+        out_of_scope=["mobile app"],
+        similar_products=["other apps"],
+        notes="Test notes",
+    )
+
+
+class UsageClient(MockClient):
+    """Mock client that records 1,000 input and 2,000 output tokens per call."""
+
+    async def generate(self, system_prompt, user_prompt, response_model, level=None, **kwargs):
+        result = await super().generate(
+            system_prompt, user_prompt, response_model, level=level, **kwargs
+        )
+        self._usage.add(1000, 2000, level)
+        return result
+
+
+def orchestrator(tmp_path, client=None, **budget):
+    return RoadmapOrchestrator(
+        client or UsageClient(),
+        Console(quiet=True),
+        StorageManager(tmp_path),
+        interactive=False,
+        budget=GenerationBudget(**budget) if budget else None,
+    )
+
+
+class TestGenerationBudget:
+    """Tests for GenerationBudget validation."""
+
+    def test_rejects_unknown_item_level(self):
+        with pytest.raises(ValueError, match="subtasks"):
+            GenerationBudget(max_items={"subtasks": 3})
+
+    def test_rejects_negative_limits(self):
+        with pytest.raises(ValueError):
+            GenerationBudget(max_cost_usd=-1)
+
+
+class TestBudgetedGeneration:
+    """Tests for the orchestrator stopping at a budget."""
+
+    @pytest.mark.asyncio
+    async def test_unlimited_run_completes(self, tmp_path, sample_context):
+        orch = orchestrator(tmp_path)
+        roadmap = await orch.generate(sample_context)
+        assert roadmap.total_items["tasks"] == 8
+        assert orch.budget_report is None
+
+    @pytest.mark.asyncio
+    async def test_item_cap_stops_before_next_batch(self, tmp_path, sample_context):
+        orch = orchestrator(tmp_path, max_items={"epics": 2})
+        roadmap = await orch.generate(sample_context)
+
+        # The first milestone is fully expanded, the second never gets epics
+        assert roadmap.total_items == {"milestones": 2, "epics": 2, "stories": 2, "tasks": 4}
+        report = orch.budget_report
+        assert report.reason == "epics: 2 of 2 generated"
+        assert report.pending == {"milestones": 1, "epics": 0, "stories": 0}
+        assert report.remaining_calls > 0
+
+    @pytest.mark.asyncio
+    async def test_token_budget_leaves_resumable_roadmap(self, tmp_path, sample_context):
+        # Milestone, epic and story calls fit in 10,000 tokens (3,000 each);
+        # the first task call is expected to need ~4,000 more
+        orch = orchestrator(tmp_path, max_tokens=10_000)
+        roadmap = await orch.generate(sample_context)
+
+        report = orch.budget_report
+        assert report.reason.startswith("tokens: 9,000 of 10,000 used")
+        assert report.tokens == 9000
+        assert report.pending == {"milestones": 1, "epics": 1, "stories": 1}
+
+        storage = StorageManager(tmp_path)
+        saved = await storage.load_roadmap(tmp_path / "testapp")
+        assert saved.total_items == roadmap.total_items
+        assert storage.get_resume_point(saved) is not None
+
+        resumed = await orchestrator(tmp_path).resume(saved)
+        assert resumed.total_items["tasks"] == 8
+        assert storage.get_resume_point(resumed) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("budget", [{"max_cost_usd": 0}, {"max_seconds": 0}])
+    async def test_exhausted_budget_generates_nothing(self, tmp_path, sample_context, budget):
+        client = UsageClient()
+        orch = orchestrator(tmp_path, client, **budget)
+        roadmap = await orch.generate(sample_context)
+
+        assert roadmap.milestones == []
+        assert client.usage.api_calls == 0
+        assert orch.budget_report.remaining_calls == 40
+        assert not (tmp_path / "testapp").exists()
+
+    @pytest.mark.asyncio
+    async def test_report_serializes(self, tmp_path, sample_context):
+        orch = orchestrator(tmp_path, max_cost_usd=0.05)
+        await orch.generate(sample_context)
+        data = orch.budget_report.to_dict()
+        assert data["reason"].startswith("cost:")
+        assert data["cost_usd"] <= 0.05
+        assert set(data) == {
+            "reason",
+            "elapsed_seconds",
+            "tokens",
+            "cost_usd",
+            "pending",
+            "remaining_calls",
+            "cost_to_complete_usd",
+        }
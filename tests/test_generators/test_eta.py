@@ -0,0 +1,120 @@
+"""Tests for arcane.generators.eta module."""
+
+import pytest
+
+from arcane.core.clients.telemetry import GenerationTelemetry
+from arcane.core.generators import EtaSnapshot, EtaTracker
+from arcane.core.generators.eta import format_duration
+from arcane.core.utils import CostCalibration
+
+from ..test_items.test_hierarchy import create_roadmap
+from ..test_utils import roadmap_with_usage
+
+
+def empty_roadmap():
+    """A roadmap before its milestones are generated, as a stored dict."""
+    return {"milestones": []}
+
+
+def milestone_shells():
+    """The 2-milestone test roadmap with no epics generated yet."""
+    roadmap = create_roadmap()
+    for milestone in roadmap.milestones:
+        milestone.epics = []
+    return roadmap
+
+
+def record(telemetry, level, seconds, generations=1, calls=1, output_tokens=0):
+    for _ in range(generations):
+        telemetry.record_generation(level, seconds / generations, attempts=1)
+    stats = telemetry.level(level)
+    stats.calls += calls
+    stats.output_tokens += output_tokens
+
+
+class TestEtaTracker:
+    """Tests for EtaTracker."""
+
+    def test_no_eta_before_first_generation(self):
+        tracker = EtaTracker(GenerationTelemetry())
+        snapshot = tracker.snapshot(empty_roadmap())
+        # The default fan-out: 1 + 3 + 9 + 27 calls
+        assert snapshot.remaining_calls == 40
+        assert snapshot.completed_calls == 0
+        assert snapshot.eta_seconds is None
+        assert snapshot.calls_per_minute == 0
+        assert snapshot.cost_to_complete_usd > 0
+
+    def test_eta_from_per_level_latency(self):
+        telemetry = GenerationTelemetry()
+        tracker = EtaTracker(telemetry)
+        record(telemetry, "milestone", 10.0)
+        record(telemetry, "epic", 4.0, generations=2, calls=2)
+        snapshot = tracker.snapshot(milestone_shells())
+        # Epic calls at the epic latency; stories and tasks, not seen
+        # yet, at the mean of everything seen (14s / 3)
+        remaining = {"epic": 2, "story": 6, "task": 18}
+        assert snapshot.remaining_calls == sum(remaining.values())
+        assert snapshot.eta_seconds == pytest.approx(2 * 2.0 + 24 * 14.0 / 3)
+        assert snapshot.completed_calls == 3
+        assert snapshot.calls_per_minute == pytest.approx(3 * 60 / 14)
+
+    def test_calibrated_fan_out(self):
+        calibration = CostCalibration.from_roadmaps([roadmap_with_usage()])
+        tracker = EtaTracker(GenerationTelemetry(), calibration)
+        snapshot = tracker.snapshot(milestone_shells())
+        estimate = calibration.estimate("sonnet", roadmap=milestone_shells())
+        # One epic call per milestone, then 1 story call per epic and 1
+        # task call per story, as in the calibration roadmap
+        assert snapshot.remaining_calls == 2 + 2 + 4
+        assert snapshot.cost_to_complete_usd == pytest.approx(estimate.estimated_cost_usd)
+
+    def test_complete_roadmap_has_nothing_left(self):
+        telemetry = GenerationTelemetry()
+        record(telemetry, "task", 3.0)
+        snapshot = EtaTracker(telemetry).snapshot(roadmap_with_usage())
+        assert snapshot.remaining_calls == 0
+        assert snapshot.eta_seconds == 0
+        assert snapshot.cost_to_complete_usd == pytest.approx(0)
+
+    def test_rolling_window_forgets_old_latency(self):
+        telemetry = GenerationTelemetry()
+        tracker = EtaTracker(telemetry, window=2)
+        for seconds in (30.0, 2.0, 4.0):
+            record(telemetry, "task", seconds, output_tokens=100)
+            tracker.observe()
+        assert tracker.latency("task") == pytest.approx(3.0)
+        assert tracker.latency("story") == pytest.approx(3.0)
+        snapshot = tracker.snapshot(empty_roadmap())
+        assert snapshot.tokens_per_second == pytest.approx(200 / 6)
+
+
+class TestEtaSnapshot:
+    """Tests for EtaSnapshot output."""
+
+    def test_to_dict_and_describe(self):
+        snapshot = EtaSnapshot(
+            completed_calls=5,
+            remaining_calls=12,
+            eta_seconds=185.04,
+            calls_per_minute=4.123,
+            tokens_per_second=51.66,
+            cost_to_complete_usd=0.421234,
+        )
+        assert snapshot.to_dict() == {
+            "completed_calls": 5,
+            "remaining_calls": 12,
+            "eta_seconds": 185.0,
+            "calls_per_minute": 4.12,
+            "tokens_per_second": 51.7,
+            "cost_to_complete_usd": 0.4212,
+        }
+        assert snapshot.describe() == (
+            "~12 remaining · ETA 3m 05s · 4.1 calls/min · 52 tok/s · ~$0.42 to go"
+        )
+
+    @pytest.mark.parametrize(
+        "seconds,expected", [(45, "45s"), (185, "3m 05s"), (3720, "1h 02m")]
+    )
+    def test_format_duration(self, seconds, expected):
+        assert format_duration(seconds) == expected
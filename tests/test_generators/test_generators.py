@@ -374,3 +374,33 @@ class TestTaskList:
 
         assert len(restored.tasks) == 1
         assert restored.tasks[0].name == "Test"
+
+    def test_schema_leaves_out_scheduler_fields(self):
+        """The schema sent to the LLM doesn't ask for schedule data."""
+        task_schema = TaskList.model_json_schema()["$defs"]["Task"]
+
+        assert "estimated_hours" in task_schema["properties"]
+        for field in ("assignee_slot", "start_offset_hours", "end_offset_hours", "due_date"):
+            assert field not in task_schema["properties"]
+
+    def test_scheduler_fields_still_round_trip(self):
+        """Scheduled tasks keep their schedule through save and load."""
+        task = Task(
+            id="task-001",
+            name="Test",
+            description="Desc",
+            priority=Priority.LOW,
+            estimated_hours=1,
+            acceptance_criteria=["AC"],
+            implementation_notes="Notes",
+            claude_code_prompt="Prompt",
+            assignee_slot=1,
+            start_offset_hours=8.0,
+            end_offset_hours=9.0,
+            due_date="2026-11-02",
+        )
+
+        restored = Task.model_validate_json(task.model_dump_json())
+
+        assert restored.assignee_slot == 1
+        assert restored.due_date == "2026-11-02"
@@ -274,6 +274,31 @@ class TestRoadmapOrchestrator:
         # Actually saves once per story = 4, plus final = 5
         assert save_count >= 4
 
+    @pytest.mark.asyncio
+    async def test_reports_eta_at_each_save(
+        self, tmp_path, sample_context, console, mock_client
+    ):
+        """on_progress gets an ETA snapshot per save, ending with nothing left."""
+        snapshots = []
+        orchestrator = RoadmapOrchestrator(
+            mock_client,
+            console,
+            StorageManager(tmp_path),
+            interactive=False,
+            on_progress=snapshots.append,
+        )
+
+        await orchestrator.generate(sample_context)
+
+        # Milestone shells: 2 epic calls plus the default fan-out below them
+        assert snapshots[0].completed_calls == 1
+        assert snapshots[0].remaining_calls == 2 + 6 + 18
+        assert snapshots[0].eta_seconds is not None
+        # 1 milestone + 2 epic + 4 story + 4 task generations
+        assert snapshots[-1].completed_calls == 11
+        assert snapshots[-1].remaining_calls == 0
+        assert snapshots[-1].eta_seconds == 0
+
     @pytest.mark.asyncio
     async def test_roadmap_saved_to_disk(
         self, tmp_path, sample_context, console, mock_client
@@ -419,3 +419,153 @@ class TestRoadmapHierarchy:
             "stories": 1,
             "tasks": 1,
         }
+
+
+def create_roadmap() -> Roadmap:
+    """Helper to create a 2-milestone roadmap with 4h tasks."""
+
+    def story(id: str, tasks: int) -> Story:
+        return Story(
+            id=id,
+            name=f"Story {id}",
+            description="Story",
+            priority=Priority.MEDIUM,
+            acceptance_criteria=["Done"],
+            tasks=[create_task(f"{id}-t{i}") for i in range(tasks)],
+        )
+
+    def epic(id: str) -> Epic:
+        return Epic(
+            id=id,
+            name=f"Epic {id}",
+            description="Epic",
+            priority=Priority.HIGH,
+            goal="Goal",
+            stories=[story(f"{id}-s1", 2), story(f"{id}-s2", 1)],
+        )
+
+    return Roadmap(
+        id="roadmap-rollups",
+        project_name="Rollups",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        context=create_context(),
+        milestones=[
+            Milestone(
+                id=f"m{i}",
+                name=f"Milestone {i}",
+                description="Milestone",
+                priority=Priority.HIGH,
+                goal="Goal",
+                epics=[epic(f"m{i}-e1")],
+            )
+            for i in (1, 2)
+        ],
+    )
+
+
+class TestRollupInvalidation:
+    """Cached rollups stay correct as the tree is edited."""
+
+    def test_task_hours_change_propagates(self):
+        """Editing a task updates every ancestor's cached hours."""
+        roadmap = create_roadmap()
+        milestone = roadmap.milestones[0]
+        assert roadmap.total_hours == 24
+        assert milestone.estimated_hours == 12
+
+        milestone.epics[0].stories[0].tasks[0].estimated_hours = 10
+
+        assert milestone.epics[0].stories[0].estimated_hours == 14
+        assert milestone.estimated_hours == 18
+        assert roadmap.total_hours == 30
+
+    def test_child_list_mutations(self):
+        """append, insert, pop, del, slice assignment and extend invalidate."""
+        roadmap = create_roadmap()
+        tasks = roadmap.milestones[0].epics[0].stories[0].tasks
+        assert roadmap.total_items["tasks"] == 6
+
+        tasks.append(create_task("new-1"))
+        assert roadmap.total_items["tasks"] == 7
+        assert roadmap.total_hours == 28
+
+        tasks.insert(0, create_task("new-2", hours=1))
+        tasks.pop()
+        assert roadmap.total_hours == 25
+
+        del tasks[0]
+        tasks[0] = create_task("new-3", hours=8)
+        assert roadmap.total_hours == 28
+
+        tasks[:] = []
+        roadmap.milestones[1].epics[0].stories.extend([])
+        assert roadmap.total_items["tasks"] == 4
+        assert roadmap.total_hours == 16
+
+    def test_list_replacement(self):
+        """Assigning a new child list invalidates and stays tracked."""
+        roadmap = create_roadmap()
+        assert roadmap.total_items["epics"] == 2
+
+        roadmap.milestones[0].epics = []
+        assert roadmap.total_items["epics"] == 1
+        assert roadmap.total_hours == 12
+
+        roadmap.milestones = roadmap.milestones[1:]
+        roadmap.milestones.clear()
+        assert roadmap.total_items == {
+            "milestones": 0, "epics": 0, "stories": 0, "tasks": 0,
+        }
+
+    def test_total_items_returns_copy(self):
+        """Mutating the returned counts doesn't affect the cache."""
+        roadmap = create_roadmap()
+        roadmap.total_items["tasks"] = 999
+
+        assert roadmap.total_items["tasks"] == 6
+
+    def test_deep_copy_is_independent(self):
+        """Edits to a deep copy update the copy and leave the original alone."""
+        roadmap = create_roadmap()
+        assert roadmap.total_hours == 24
+
+        copy = roadmap.model_copy(deep=True)
+        assert copy.total_hours == 24
+        copy.milestones[0].epics[0].stories[0].tasks.pop()
+        copy.milestones[1].epics[0].stories[0].tasks[0].estimated_hours = 1
+
+        assert copy.total_hours == 17
+        assert roadmap.total_hours == 24
+
+    def test_shared_child_updates_all_parents(self):
+        """A task referenced from two stories invalidates both."""
+        task = create_task("shared", hours=2)
+        stories = [
+            Story(
+                id=f"s{i}",
+                name="Story",
+                description="Story",
+                priority=Priority.LOW,
+                acceptance_criteria=[],
+                tasks=[task],
+            )
+            for i in (1, 2)
+        ]
+        # Validation keeps the same instance for model fields
+        stories[0].tasks[0] = task
+        stories[1].tasks[0] = task
+        assert [s.estimated_hours for s in stories] == [2, 2]
+
+        task.estimated_hours = 5
+
+        assert [s.estimated_hours for s in stories] == [5, 5]
+
+    def test_caches_do_not_affect_equality_or_dump(self):
+        """Cached state isn't part of equality or serialization."""
+        roadmap = create_roadmap()
+        restored = Roadmap.model_validate_json(roadmap.model_dump_json())
+        _ = roadmap.total_hours  # fills roadmap's rollup cache only
+
+        assert restored == roadmap
+        assert restored.model_dump() == roadmap.model_dump()
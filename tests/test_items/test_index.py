@@ -0,0 +1,159 @@
+"""Tests for RoadmapIndex."""
+
+import pytest
+
+from arcane.core.items import Priority, RoadmapIndex, Status, Story
+
+from .test_hierarchy import create_roadmap, create_task
+
+
+def roadmap_dict() -> dict:
+    """The roadmap_data shape stored by the web backend."""
+    return {
+        "milestones": [
+            {
+                "id": "ms-1",
+                "status": "in_progress",
+                "epics": [
+                    {
+                        "id": "ep-1",
+                        "stories": [
+                            {
+                                "id": "st-1",
+                                "tasks": [
+                                    {"id": "tk-1", "estimated_hours": 3, "status": "completed"},
+                                    {"id": "tk-2", "estimated_hours": 5, "priority": "high"},
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            },
+            {"id": "ms-2", "epics": []},
+        ]
+    }
+
+
+class TestLookups:
+    """Tests for lookups over models and dicts."""
+
+    def test_indexes_every_item(self):
+        roadmap = create_roadmap()
+        index = RoadmapIndex(roadmap)
+        assert len(index) == sum(roadmap.total_items.values())
+        task = roadmap.milestones[1].epics[0].stories[1].tasks[0]
+        assert index.get(task.id) is task
+        assert index.entry(task.id).item_type == "task"
+        assert index.entry(task.id).depth == 3
+
+    def test_parent_and_ancestors(self):
+        roadmap = create_roadmap()
+        index = RoadmapIndex(roadmap)
+        story = roadmap.milestones[0].epics[0].stories[1]
+        assert index.parent(story.tasks[0].id) is story
+        assert index.parent("m1") is None
+        chain = index.ancestors(story.tasks[0].id)
+        assert [e.item_type for e in chain] == ["milestone", "epic", "story"]
+        assert chain[-1].item is story
+
+    def test_path_and_container(self):
+        data = roadmap_dict()
+        index = RoadmapIndex(data)
+        assert index.path("tk-2") == (0, 0, 0, 1)
+        assert index.path("ms-2") == (1,)
+        assert index.container("tk-2") is data["milestones"][0]["epics"][0]["stories"][0]["tasks"]
+
+    def test_missing_id(self):
+        index = RoadmapIndex(roadmap_dict())
+        assert "nope" not in index
+        assert index.get("nope") is None
+        with pytest.raises(KeyError):
+            index.entry("nope")
+
+    def test_first_duplicate_wins(self):
+        data = roadmap_dict()
+        data["milestones"][1]["epics"].append({"id": "tk-1", "stories": []})
+        index = RoadmapIndex(data)
+        assert index.entry("tk-1").item_type == "task"
+
+    def test_reading_does_not_add_child_keys(self):
+        data = {"milestones": [{"id": "ms-1"}]}
+        RoadmapIndex(data)
+        assert data == {"milestones": [{"id": "ms-1"}]}
+
+
+class TestMutations:
+    """Tests for the helpers that keep the index current."""
+
+    def test_add_indexes_subtree(self):
+        roadmap = create_roadmap()
+        index = RoadmapIndex(roadmap)
+        story = Story(
+            id="new-story",
+            name="New",
+            description="New",
+            priority=Priority.LOW,
+            acceptance_criteria=[],
+            tasks=[create_task("new-task", hours=6)],
+        )
+        entry = index.add("m1-e1", story)
+        assert entry.position == 2
+        assert roadmap.milestones[0].epics[0].stories[-1] is story
+        assert index.path("new-task") == (0, 0, 2, 0)
+        # Goes through the tracked child list, so rollups see it
+        assert roadmap.milestones[0].estimated_hours == 18
+
+    def test_add_rejects_bad_parent_and_duplicates(self):
+        index = RoadmapIndex(roadmap_dict())
+        with pytest.raises(ValueError):
+            index.add("tk-1", {"id": "x"})
+        with pytest.raises(ValueError):
+            index.add("st-1", {"id": "tk-1"})
+        with pytest.raises(KeyError):
+            index.add("nope", {"id": "x"})
+
+    def test_remove_renumbers_siblings(self):
+        data = roadmap_dict()
+        index = RoadmapIndex(data)
+        index.remove("tk-1")
+        assert "tk-1" not in index
+        assert index.entry("tk-2").position == 0
+        index.remove("ms-1")
+        assert len(index) == 1
+        assert index.path("ms-2") == (0,)
+
+    def test_reorder(self):
+        roadmap = create_roadmap()
+        index = RoadmapIndex(roadmap)
+        index.reorder(None, ["m2", "m1"])
+        assert [m.id for m in roadmap.milestones] == ["m2", "m1"]
+        assert index.path("m1-e1") == (1, 0)
+        with pytest.raises(ValueError):
+            index.reorder(None, ["m1"])
+
+
+class TestColumns:
+    """Tests for the per-type columns."""
+
+    def test_task_columns(self):
+        index = RoadmapIndex(roadmap_dict())
+        tasks = index.columns("task")
+        assert tasks.ids == ["tk-1", "tk-2"]
+        assert tasks.total_hours() == 8
+        assert tasks.total_hours(Status.COMPLETED) == 3
+        assert tasks.status_counts()[Status.NOT_STARTED] == 1
+        assert tasks.priority_counts()[Priority.HIGH] == 1
+
+    def test_parent_hours_roll_up(self):
+        roadmap = create_roadmap()
+        index = RoadmapIndex(roadmap)
+        milestones = index.columns("milestone")
+        assert list(milestones.hours) == [m.estimated_hours for m in roadmap.milestones]
+
+    def test_update_keeps_columns_current(self):
+        index = RoadmapIndex(roadmap_dict())
+        assert index.columns("task").total_hours(Status.COMPLETED) == 3
+        index.update("tk-2", status="completed")
+        assert index.columns("task").total_hours(Status.COMPLETED) == 8
+        index.update("tk-2", estimated_hours=1)
+        assert index.columns("story").total_hours() == 4
@@ -0,0 +1,84 @@
+"""Tests for the read-only RoadmapView."""
+
+import pytest
+
+from arcane.core.items import Priority, RoadmapView, Status, TaskView
+from arcane.core.planning import summarize
+
+from .test_hierarchy import create_roadmap
+from .test_index import roadmap_dict
+
+
+class TestConversion:
+    """Tests for converting between models, dicts and views."""
+
+    def test_matches_model_fields_and_rollups(self):
+        roadmap = create_roadmap()
+        view = RoadmapView.from_roadmap(roadmap)
+        assert view.id == roadmap.id
+        assert view.total_hours == roadmap.total_hours
+        assert view.total_items == roadmap.total_items
+        story = view.milestones[0].epics[0].stories[0]
+        model_story = roadmap.milestones[0].epics[0].stories[0]
+        assert story.estimated_hours == model_story.estimated_hours
+        assert [t.id for t in story.tasks] == [t.id for t in model_story.tasks]
+        assert isinstance(story.tasks[0], TaskView)
+
+    def test_roundtrip_through_json(self):
+        roadmap = create_roadmap()
+        view = RoadmapView.from_json(roadmap.model_dump_json())
+        assert view.created_at == roadmap.created_at
+        assert view.to_roadmap().model_dump() == roadmap.model_dump()
+
+    def test_roundtrip_from_model(self):
+        roadmap = create_roadmap()
+        assert RoadmapView.from_roadmap(roadmap).to_roadmap() == roadmap
+
+    def test_partial_dict_gets_defaults(self):
+        view = RoadmapView.from_dict(roadmap_dict())
+        task = view.milestones[0].epics[0].stories[0].tasks[1]
+        assert task.priority is Priority.HIGH
+        assert task.status is Status.NOT_STARTED
+        assert task.labels == ()
+        assert view.context is None
+        assert view.total_hours == 8
+        assert view.total_items == {"milestones": 2, "epics": 1, "stories": 1, "tasks": 2}
+
+
+class TestCompactness:
+    """Tests for the memory-saving representation."""
+
+    def test_no_instance_dict(self):
+        view = RoadmapView.from_roadmap(create_roadmap())
+        task = view.milestones[0].epics[0].stories[0].tasks[0]
+        assert not hasattr(view, "__dict__")
+        assert not hasattr(task, "__dict__")
+
+    def test_enums_and_labels_shared(self):
+        roadmap = create_roadmap()
+        for story in roadmap.milestones[0].epics[0].stories:
+            for task in story.tasks:
+                task.labels = ["backend", "api"]
+                task.status = Status.COMPLETED
+        data = roadmap.model_dump(mode="json")
+        view = RoadmapView.from_dict(data)
+        tasks = [t for s in view.milestones[0].epics[0].stories for t in s.tasks]
+        assert all(t.status is Status.COMPLETED for t in tasks)
+        assert all(t.labels is tasks[0].labels for t in tasks)
+        assert tasks[0].labels == ("backend", "api")
+
+    def test_read_only(self):
+        view = RoadmapView.from_roadmap(create_roadmap())
+        task = view.milestones[0].epics[0].stories[0].tasks[0]
+        with pytest.raises(AttributeError):
+            task.name = "Renamed"
+        with pytest.raises(AttributeError):
+            view.project_name = "Renamed"
+
+
+def test_readers_accept_views():
+    """Analytics computes the same summary from a view as from the model."""
+    roadmap = create_roadmap()
+    roadmap.milestones[0].epics[0].stories[0].tasks[0].status = Status.COMPLETED
+    view = RoadmapView.from_roadmap(roadmap)
+    assert summarize(view) == summarize(roadmap)
@@ -0,0 +1,180 @@
+"""Tests for columnar roadmap analytics."""
+
+import time
+from datetime import date
+
+from arcane.core.planning import RoadmapFrame, summarize
+from arcane.core.planning.analytics import EPIC, MILESTONE, STORY, TASK
+
+TODAY = date(2026, 11, 2)
+
+
+def roadmap_data() -> dict:
+    """Two milestones; labels on an epic and on single tasks."""
+    return {
+        "milestones": [
+            {
+                "id": "ms-1",
+                "name": "One",
+                "status": "in_progress",
+                "target_date": "2026-10-01",
+                "epics": [
+                    {
+                        "id": "ep-1",
+                        "labels": ["backend"],
+                        "stories": [
+                            {
+                                "id": "st-1",
+                                "tasks": [
+                                    {"id": "tk-1", "estimated_hours": 3, "status": "completed"},
+                                    {
+                                        "id": "tk-2",
+                                        "estimated_hours": 5,
+                                        "priority": "high",
+                                        "labels": ["api", "backend"],
+                                        "due_date": "2026-10-30",
+                                    },
+                                ],
+                            },
+                            {"id": "st-2", "tasks": [{"id": "tk-3", "estimated_hours": 2}]},
+                        ],
+                    }
+                ],
+            },
+            {
+                "id": "ms-2",
+                "name": "Two",
+                "target_date": "2027-01-01",
+                "epics": [
+                    {
+                        "id": "ep-2",
+                        "stories": [
+                            {
+                                "id": "st-3",
+                                "tasks": [
+                                    {
+                                        "id": "tk-4",
+                                        "estimated_hours": 6,
+                                        "labels": ["ui"],
+                                        "due_date": "2026-10-30",
+                                        "status": "completed",
+                                    },
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            },
+        ]
+    }
+
+
+class TestRoadmapFrame:
+    """Tests for flattening a roadmap into columns."""
+
+    def test_rows_grouped_by_type(self):
+        frame = RoadmapFrame.from_roadmap(roadmap_data())
+        assert frame.ids == [
+            "ms-1", "ms-2", "ep-1", "ep-2", "st-1", "st-2", "st-3",
+            "tk-1", "tk-2", "tk-3", "tk-4",
+        ]
+        assert [len(frame.rows(t)) for t in (MILESTONE, EPIC, STORY, TASK)] == [2, 2, 3, 4]
+        assert list(frame.hours[7:]) == [3, 5, 2, 6]
+
+    def test_parent_milestone_and_children(self):
+        frame = RoadmapFrame.from_roadmap(roadmap_data())
+        assert frame.parents[frame.ids.index("tk-3")] == frame.ids.index("st-2")
+        assert frame.milestones[frame.ids.index("tk-4")] == 1
+        assert [frame.ids[r] for r in frame.children(frame.ids.index("st-1"))] == ["tk-1", "tk-2"]
+        assert [frame.ids[r] for r in frame.rows_in(TASK, 0)] == ["tk-1", "tk-2", "tk-3"]
+
+    def test_models_and_dicts_agree(self):
+        from tests.test_items.test_hierarchy import create_roadmap
+
+        roadmap = create_roadmap()
+        from_model = RoadmapFrame.from_roadmap(roadmap)
+        from_dict = RoadmapFrame.from_roadmap(roadmap.model_dump(mode="json"))
+        assert from_model.ids == from_dict.ids
+        assert from_model.status == from_dict.status
+        assert from_model.priority == from_dict.priority
+        assert from_model.hours == from_dict.hours
+
+    def test_empty_roadmap(self):
+        frame = RoadmapFrame.from_roadmap({"milestones": []})
+        assert len(frame) == 0
+        summary = summarize(frame)
+        assert summary.hours_total == 0
+        assert summary.completion_percent == 0.0
+        assert summary.milestones == []
+
+
+class TestSummarize:
+    """Tests for the summary figures."""
+
+    def test_totals_and_breakdowns(self):
+        summary = summarize(roadmap_data(), today=TODAY)
+        assert summary.item_counts == {"milestones": 2, "epics": 2, "stories": 3, "tasks": 4}
+        assert summary.completed_counts["tasks"] == 2
+        assert (summary.hours_total, summary.hours_completed) == (16, 9)
+        assert summary.completion_percent == 56.2
+        assert summary.item_completion_percent == 18.2
+        assert summary.hours_by_status == {
+            "not_started": 7, "in_progress": 0, "blocked": 0, "completed": 9,
+        }
+        assert summary.hours_by_priority == {"critical": 0, "high": 5, "medium": 11, "low": 0}
+
+    def test_labels_are_inherited_once(self):
+        summary = summarize(roadmap_data(), today=TODAY)
+        # ep-1's label covers all its tasks; tk-2 repeats it without double counting
+        assert summary.hours_by_label == {"backend": 10, "ui": 6, "api": 5}
+
+    def test_milestones(self):
+        one, two = summarize(roadmap_data(), today=TODAY).milestones
+        assert (one.id, one.name, one.status) == ("ms-1", "One", "in_progress")
+        assert (one.epic_count, one.story_count, one.task_count) == (1, 2, 3)
+        assert (one.hours_total, one.hours_completed, one.completed_items) == (10, 3, 1)
+        assert one.completion_percent == 30.0
+        assert (two.hours_total, two.completion_percent) == (6, 100.0)
+
+    def test_overdue(self):
+        summary = summarize(roadmap_data(), today=TODAY)
+        assert [m.id for m in summary.overdue_milestones] == ["ms-1"]
+        # tk-4 is past due but completed
+        assert summary.overdue_tasks == ["tk-2"]
+
+    def test_matches_model_rollups(self):
+        from tests.test_items.test_hierarchy import create_roadmap
+
+        roadmap = create_roadmap()
+        summary = summarize(roadmap)
+        assert summary.item_counts == roadmap.total_items
+        assert summary.hours_total == roadmap.total_hours
+        assert [m.hours_total for m in summary.milestones] == [
+            m.estimated_hours for m in roadmap.milestones
+        ]
+
+
+def test_50k_tasks_quickly():
+    """Flattening and summarizing 50k tasks takes well under a second."""
+    stories = [
+        {
+            "id": f"st-{s}",
+            "labels": ["api"] if s % 4 == 0 else [],
+            "tasks": [
+                {"id": f"tk-{s}-{t}", "estimated_hours": 1 + t % 8, "status": "completed" if t % 3 else "not_started"}
+                for t in range(50)
+            ],
+        }
+        for s in range(1000)
+    ]
+    data = {
+        "milestones": [
+            {"id": f"ms-{m}", "epics": [{"id": f"ep-{m}", "stories": stories[m * 100:(m + 1) * 100]}]}
+            for m in range(10)
+        ]
+    }
+    start = time.perf_counter()
+    summary = summarize(data)
+    assert time.perf_counter() - start < 2.0
+    assert summary.item_counts["tasks"] == 50_000
+    assert sum(m.hours_total for m in summary.milestones) == summary.hours_total
@@ -0,0 +1,105 @@
+"""Tests for Monte Carlo schedule forecasting."""
+
+import time
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from arcane.core.planning.forecast import forecast_roadmap, parse_timeline  # noqa: E402
+
+from .test_graph import epic, roadmap_data, task  # noqa: E402
+
+MONDAY = date(2026, 11, 2)
+
+
+def exact(data: dict, team_size: int, **kwargs):
+    """Forecast with no duration uncertainty, so results are exact."""
+    return forecast_roadmap(
+        data, team_size=team_size, uncertainty=0, simulations=10, start=MONDAY, **kwargs
+    )
+
+
+class TestScheduling:
+    """Tests for scheduling with exact durations."""
+
+    def test_single_developer_does_all_work(self):
+        data = roadmap_data([epic("ep-1", [task("a", 4), task("b", 6), task("c", 2)])])
+        assert exact(data, 1).completion.hours[50] == 12
+
+    def test_team_respects_prerequisites(self):
+        data = roadmap_data([
+            epic("ep-1", [task("a", 4), task("b", 6), task("c", 2, ["a"]), task("d", 3)]),
+        ])
+        # Developers take tasks in roadmap order: c follows a on one
+        # developer, then d waits for whoever frees up first (6h)
+        assert exact(data, 2).completion.hours[50] == 9
+        # Enough developers: the a -> c chain and b bound the schedule
+        assert exact(data, 4).completion.hours[50] == 6
+
+    def test_completed_tasks_are_skipped(self):
+        data = roadmap_data([
+            epic("ep-1", [task("a", 4, status="completed"), task("b", 6, ["a"])]),
+        ])
+        assert exact(data, 1).completion.hours[50] == 6
+
+    def test_milestones_finish_in_order(self):
+        data = {
+            "milestones": [
+                {"id": "ms-1", "name": "One", "epics": [epic("ep-1", [task("a", 6), task("b", 6)])]},
+                {"id": "ms-2", "name": "Two", "epics": [epic("ep-2", [task("c", 12)])]},
+            ]
+        }
+        forecast = exact(data, 1, hours_per_day=6)
+        one, two = forecast.milestones
+        assert (one.id, one.hours[50]) == ("ms-1", 12)
+        assert (two.id, two.hours[50]) == ("ms-2", 24)
+        # Two 6h days from Monday end on Tuesday; four on Thursday
+        assert one.dates[50] == date(2026, 11, 3)
+        assert two.dates[50] == date(2026, 11, 5)
+
+    def test_cycle_raises(self):
+        data = roadmap_data([epic("ep-1", [task("a", 1, ["b"]), task("b", 1, ["a"])])])
+        with pytest.raises(ValueError, match="Prerequisite cycle"):
+            exact(data, 1)
+
+
+class TestUncertainty:
+    """Tests for the simulated distribution."""
+
+    def test_percentiles_are_ordered_and_seeded(self):
+        data = roadmap_data([epic("ep-1", [task(f"t{i}", 4) for i in range(20)])])
+        first = forecast_roadmap(data, team_size=2, simulations=2000, seed=5, start=MONDAY)
+        again = forecast_roadmap(data, team_size=2, simulations=2000, seed=5, start=MONDAY)
+        hours = first.completion.hours
+        assert hours[50] < hours[80] < hours[95]
+        # Median per task equals the estimate, so the total is near 40h
+        assert 35 < hours[50] < 50
+        assert first.completion.hours == again.completion.hours
+
+    def test_uses_context_team_size_and_timeline(self):
+        from tests.test_items.test_hierarchy import create_roadmap
+
+        roadmap = create_roadmap()  # 24h of tasks, team of 2, 3 months
+        forecast = forecast_roadmap(roadmap, simulations=500, seed=1, start=MONDAY)
+        assert forecast.team_size == 2
+        assert forecast.deadline == date(2027, 2, 1)
+        assert forecast.on_time_probability == 1.0
+        assert forecast.fits_timeline() is True
+
+
+def test_parse_timeline():
+    assert parse_timeline("3 months", MONDAY) == date(2027, 2, 1)
+    assert parse_timeline("1 month MVP", MONDAY) == date(2026, 12, 2)
+    assert parse_timeline("2 weeks", MONDAY) == date(2026, 11, 16)
+    assert parse_timeline("custom", MONDAY) is None
+
+
+def test_5k_tasks_under_a_second():
+    """10k simulations of a 5k-task roadmap finish in about a second."""
+    tasks = [task(f"t{i}", 1 + i % 8, [f"t{i - 3}"] if i % 5 == 0 and i else None) for i in range(5000)]
+    data = roadmap_data([epic(f"ep-{e}", tasks[e * 500:(e + 1) * 500]) for e in range(10)])
+    start = time.perf_counter()
+    forecast_roadmap(data, team_size=4, simulations=10_000, seed=1, start=MONDAY)
+    assert time.perf_counter() - start < 3.0
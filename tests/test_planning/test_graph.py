@@ -0,0 +1,135 @@
+"""Tests for the prerequisite dependency graph."""
+
+import random
+import time
+
+from arcane.core.planning import DependencyGraph, analyze_dependencies
+from tests.test_items.test_hierarchy import create_roadmap
+
+
+def task(id: str, hours: int, prerequisites: list[str] | None = None, **extra) -> dict:
+    return {"id": id, "estimated_hours": hours, "prerequisites": prerequisites or [], **extra}
+
+
+def roadmap_data(epics: list[dict]) -> dict:
+    return {"milestones": [{"id": "ms-1", "epics": epics}]}
+
+
+def epic(id: str, tasks: list[dict], prerequisites: list[str] | None = None) -> dict:
+    return {
+        "id": id,
+        "prerequisites": prerequisites or [],
+        "stories": [{"id": f"{id}-story", "tasks": tasks}],
+    }
+
+
+class TestCriticalPath:
+    """Tests for ordering, critical path and slack."""
+
+    def test_independent_tasks(self):
+        """Without prerequisites the longest task is the critical path."""
+        data = roadmap_data([epic("ep-1", [task("a", 2), task("b", 5)])])
+        analysis = analyze_dependencies(data)
+        assert analysis.length_hours == 5
+        assert analysis.critical_path == ["b"]
+        assert analysis.slack["a"] == 3
+        assert analysis.is_valid
+
+    def test_task_chain(self):
+        data = roadmap_data([
+            epic("ep-1", [task("a", 2), task("b", 3, ["a"]), task("c", 1)]),
+        ])
+        analysis = analyze_dependencies(data)
+        assert analysis.length_hours == 5
+        assert analysis.critical_path == ["a", "b"]
+        assert analysis.order.index("a") < analysis.order.index("b")
+        assert analysis.earliest_start["b"] == 2
+        assert analysis.slack["c"] == 4
+
+    def test_epic_prerequisite_orders_all_tasks(self):
+        data = roadmap_data([
+            epic("ep-1", [task("a", 2), task("b", 4)]),
+            epic("ep-2", [task("c", 1)], prerequisites=["ep-1"]),
+        ])
+        analysis = analyze_dependencies(data)
+        assert analysis.earliest_start["c"] == 4
+        assert analysis.critical_path == ["b", "c"]
+
+    def test_task_can_require_an_epic(self):
+        data = roadmap_data([
+            epic("ep-1", [task("a", 2), task("b", 4)]),
+            epic("ep-2", [task("c", 1, ["ep-1"])]),
+        ])
+        assert analyze_dependencies(data).earliest_start["c"] == 4
+
+    def test_remaining_ignores_completed_work(self):
+        data = roadmap_data([
+            epic("ep-1", [task("a", 6, status="completed"), task("b", 3, ["a"])]),
+        ])
+        assert analyze_dependencies(data).length_hours == 9
+        assert analyze_dependencies(data, remaining=True).length_hours == 3
+
+    def test_models_and_dicts_agree(self):
+        roadmap = create_roadmap()
+        stories = roadmap.milestones[0].epics[0].stories
+        stories[1].tasks[0].prerequisites = [stories[0].tasks[1].id]
+        from_models = analyze_dependencies(roadmap)
+        from_dicts = analyze_dependencies(roadmap.model_dump(mode="json"))
+        assert from_models.length_hours == from_dicts.length_hours == 8
+        assert from_models.critical_path == from_dicts.critical_path
+
+    def test_empty_roadmap(self):
+        analysis = analyze_dependencies({"milestones": []})
+        assert analysis.length_hours == 0
+        assert analysis.critical_path == []
+
+
+class TestProblems:
+    """Tests for cycle and dangling-ID detection."""
+
+    def test_dangling_prerequisite(self):
+        data = roadmap_data([epic("ep-1", [task("a", 2, ["nope"])])])
+        analysis = analyze_dependencies(data)
+        assert analysis.dangling == [("a", "nope")]
+        assert analysis.problems() == ["a requires unknown item nope"]
+        assert not analysis.is_valid
+
+    def test_cycle_is_reported_and_excluded(self):
+        data = roadmap_data([
+            epic("ep-1", [task("a", 2, ["b"]), task("b", 3, ["a"]), task("c", 1)]),
+        ])
+        analysis = analyze_dependencies(data)
+        assert len(analysis.cycles) == 1
+        assert sorted(analysis.cycles[0]) == ["a", "b"]
+        # The epic follows its tasks, so it is downstream of the cycle
+        assert analysis.order == ["c"]
+        assert analysis.problems()[0].startswith("Prerequisite cycle: ")
+
+    def test_cycle_through_epics(self):
+        data = roadmap_data([
+            epic("ep-1", [task("a", 2)], prerequisites=["ep-2"]),
+            epic("ep-2", [task("b", 2)], prerequisites=["ep-1"]),
+        ])
+        analysis = analyze_dependencies(data)
+        assert len(analysis.cycles) == 1
+        assert set(analysis.cycles[0]) <= {"a", "b", "ep-1", "ep-2"}
+
+
+def test_scales_to_100k_nodes():
+    """A 100k-task graph with 200k edges is analyzed in about a second."""
+    graph = DependencyGraph()
+    rng = random.Random(7)
+    for i in range(100_000):
+        graph.add_node(f"task-{i}", float(1 + i % 8), "task")
+        for _ in range(2 if i else 0):
+            graph.add_edge(rng.randrange(max(0, i - 50), i), i)
+
+    start = time.perf_counter()
+    analysis = graph.analyze()
+    elapsed = time.perf_counter() - start
+
+    assert len(analysis.order) == 100_000
+    assert analysis.length_hours == sum(
+        graph.hours[graph.node(task_id)] for task_id in analysis.critical_path
+    )
+    assert elapsed < 3.0
@@ -0,0 +1,140 @@
+"""Tests for the team scheduler."""
+
+import time
+from datetime import date
+
+import pytest
+
+from arcane.core.planning import apply_schedule, schedule_team, working_date
+
+from .test_graph import epic, roadmap_data, task
+
+MONDAY = date(2026, 11, 2)
+
+
+def assignments(data: dict, team_size: int) -> dict:
+    """Map task ID to (slot, start, end)."""
+    schedule = schedule_team(data, team_size=team_size, start=MONDAY)
+    return {a.task_id: (a.slot, a.start_hours, a.end_hours) for a in schedule.assignments}
+
+
+class TestScheduleTeam:
+    """Tests for assigning tasks to developers."""
+
+    def test_single_developer_works_in_order(self):
+        data = roadmap_data([epic("ep-1", [task("a", 4), task("b", 6)])])
+        assert assignments(data, 1) == {"a": (0, 0, 4), "b": (0, 4, 10)}
+
+    def test_parallel_developers(self):
+        data = roadmap_data([epic("ep-1", [task("a", 4), task("b", 6), task("c", 2)])])
+        schedule = schedule_team(data, team_size=2, start=MONDAY)
+        assert [(a.task_id, a.slot, a.start_hours) for a in schedule.assignments] == [
+            ("a", 0, 0), ("b", 1, 0), ("c", 0, 4),
+        ]
+        assert schedule.length_hours == 6
+        assert schedule.utilization() == 1.0
+
+    def test_prerequisites_are_respected(self):
+        data = roadmap_data([epic("ep-1", [task("a", 4), task("b", 1, ["a"]), task("c", 2)])])
+        result = assignments(data, 2)
+        assert result["b"][1] == 4
+        assert result["c"] == (1, 0, 2)
+
+    def test_epic_prerequisites_are_respected(self):
+        data = roadmap_data([
+            epic("ep-1", [task("a", 3)]),
+            epic("ep-2", [task("b", 1), task("c", 1)], prerequisites=["ep-1"]),
+        ])
+        result = assignments(data, 3)
+        assert result["b"][1] == 3
+        assert result["c"][1] == 3
+
+    def test_priority_orders_ready_tasks(self):
+        data = roadmap_data([
+            epic("ep-1", [
+                task("low", 2, priority="low"),
+                task("critical", 2, priority="critical"),
+                task("medium", 2),
+            ]),
+        ])
+        result = assignments(data, 1)
+        assert [t for t, _ in sorted(result.items(), key=lambda kv: kv[1][1])] == [
+            "critical", "medium", "low",
+        ]
+
+    def test_earlier_milestones_go_first(self):
+        data = {
+            "milestones": [
+                {"id": "ms-1", "epics": [epic("ep-1", [task("a", 2, priority="low")])]},
+                {"id": "ms-2", "epics": [epic("ep-2", [task("b", 2, priority="critical")])]},
+            ]
+        }
+        schedule = schedule_team(data, team_size=1, start=MONDAY)
+        assert [a.task_id for a in schedule.assignments] == ["a", "b"]
+        assert schedule.milestone_end == {"ms-1": 2, "ms-2": 4}
+
+    def test_completed_tasks_are_skipped(self):
+        data = roadmap_data([
+            epic("ep-1", [task("a", 4, status="completed"), task("b", 2, ["a"])]),
+        ])
+        assert assignments(data, 1) == {"b": (0, 0, 2)}
+
+    def test_team_size_from_context(self):
+        from tests.test_items.test_hierarchy import create_roadmap
+
+        schedule = schedule_team(create_roadmap(), start=MONDAY)
+        assert schedule.team_size == 2
+        assert {a.slot for a in schedule.assignments} == {0, 1}
+
+    def test_cycle_raises(self):
+        data = roadmap_data([epic("ep-1", [task("a", 1, ["b"]), task("b", 1, ["a"])])])
+        with pytest.raises(ValueError, match="Prerequisite cycle"):
+            schedule_team(data, start=MONDAY)
+
+    def test_50k_tasks_quickly(self):
+        tasks = [
+            task(f"t{i}", 1 + i % 8, [f"t{i - 7}"] if i % 3 == 0 and i >= 7 else None)
+            for i in range(50_000)
+        ]
+        data = roadmap_data([epic(f"ep-{e}", tasks[e * 1000:(e + 1) * 1000]) for e in range(50)])
+        start = time.perf_counter()
+        schedule = schedule_team(data, team_size=10, start=MONDAY)
+        assert time.perf_counter() - start < 5.0
+        assert len(schedule.assignments) == 50_000
+
+
+class TestApplySchedule:
+    """Tests for writing a schedule back into a roadmap."""
+
+    def test_updates_task_models_and_milestone_dates(self):
+        from tests.test_items.test_hierarchy import create_roadmap
+
+        roadmap = create_roadmap()  # two milestones of 3 x 4h tasks, team of 2
+        schedule = schedule_team(roadmap, start=MONDAY, hours_per_day=8)
+        assert schedule.milestone_end == {"m1": 8, "m2": 12}
+        assert apply_schedule(roadmap, schedule) == 6
+        first = roadmap.milestones[0].epics[0].stories[0].tasks[0]
+        assert first.assignee_slot == 0
+        assert first.start_offset_hours == 0
+        assert first.due_date == "2026-11-02"
+        assert roadmap.milestones[0].target_date == "2026-11-02"
+        assert roadmap.milestones[1].target_date == "2026-11-03"
+
+    def test_updates_dicts(self):
+        data = roadmap_data([epic("ep-1", [task("a", 8), task("b", 8, status="completed")])])
+        apply_schedule(data, schedule_team(data, start=MONDAY))
+        a, b = data["milestones"][0]["epics"][0]["stories"][0]["tasks"]
+        assert (a["assignee_slot"], a["end_offset_hours"], a["due_date"]) == (0, 8, "2026-11-03")
+        assert "due_date" not in b
+        assert data["milestones"][0]["target_date"] == "2026-11-03"
+
+
+def test_working_date():
+    assert working_date(MONDAY, 0) == MONDAY
+    assert working_date(MONDAY, 6) == MONDAY
+    assert working_date(MONDAY, 6.5) == date(2026, 11, 3)
+    # Day 6 of work skips the weekend
+    assert working_date(MONDAY, 36) == date(2026, 11, 9)
+    assert working_date(MONDAY, 66) == date(2026, 11, 16)
+    # A Saturday start begins on Monday
+    assert working_date(date(2026, 10, 31), 6) == MONDAY
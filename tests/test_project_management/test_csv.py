@@ -1,10 +1,12 @@
 """Tests for arcane.project_management.csv module."""
 
 import csv
+from datetime import date
 from pathlib import Path
 
 import pytest
 
+from arcane.core.planning import apply_schedule, schedule_team
 from arcane.core.project_management import CSVClient, ExportResult
 
 
@@ -119,6 +121,28 @@ class TestCSVClient:
         assert rows["task-001"]["Claude_Code_Prompt"] != ""
         assert "login form" in rows["task-001"]["Claude_Code_Prompt"].lower()
 
+    @pytest.mark.asyncio
+    async def test_export_schedule_columns(self, tmp_path, sample_roadmap):
+        """Scheduled tasks and milestone target dates fill the schedule columns."""
+        schedule = schedule_team(sample_roadmap, team_size=1, start=date(2026, 11, 2))
+        apply_schedule(sample_roadmap, schedule)
+        client = CSVClient()
+        output_path = tmp_path / "output.csv"
+
+        await client.export(sample_roadmap, output_path=str(output_path))
+
+        with open(output_path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            rows = {row["ID"]: row for row in reader}
+
+        # task-002 (2h) follows its prerequisite task-001 (4h)
+        assert rows["task-002"]["Assignee_Slot"] == "0"
+        assert rows["task-002"]["Start_Offset_Hours"] == "4.0"
+        assert rows["task-002"]["End_Offset_Hours"] == "6.0"
+        assert rows["task-002"]["Due_Date"] == "2026-11-02"
+        assert rows["milestone-001"]["Due_Date"] == "2026-11-02"
+        assert rows["story-001"]["Due_Date"] == ""
+
     @pytest.mark.asyncio
     async def test_export_prerequisites_preserved(self, tmp_path, sample_roadmap):
         """Export preserves prerequisite IDs."""
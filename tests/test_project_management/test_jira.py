@@ -434,6 +434,18 @@ class TestJiraExport:
         # task-002 estimated_hours = 2
         assert issue_calls[3][2]["fields"]["customfield_10016"] == 2
 
+    @pytest.mark.asyncio
+    async def test_scheduled_due_date_set(self, jira_client, mock_api, sample_roadmap):
+        """Scheduled tasks carry their due date; others have none."""
+        sample_roadmap.milestones[0].epics[0].stories[0].tasks[0].due_date = "2026-11-03"
+        await jira_client.export(sample_roadmap, project_key="PROJ")
+        issue_calls = [
+            (m, e, j) for m, e, j in mock_api.calls
+            if m == "POST" and e == "/issue"
+        ]
+        assert issue_calls[2][2]["fields"]["duedate"] == "2026-11-03"
+        assert "duedate" not in issue_calls[3][2]["fields"]
+
 
 class TestJiraExportProgress:
     """Tests for progress callback during export."""
@@ -357,6 +357,17 @@ class TestLinearExport:
         # task-002 estimate = 2
         assert issue_creates[2][1]["input"]["estimate"] == 2
 
+    @pytest.mark.asyncio
+    async def test_scheduled_due_date_set(self, linear_client, mock_gql, sample_roadmap):
+        """Scheduled tasks carry their due date; others have none."""
+        sample_roadmap.milestones[0].epics[0].stories[0].tasks[0].due_date = "2026-11-03"
+        await linear_client.export(sample_roadmap, team_id="team-123")
+        issue_creates = [
+            (q, v) for q, v in mock_gql.calls if "issueCreate" in q
+        ]
+        assert issue_creates[1][1]["input"]["dueDate"] == "2026-11-03"
+        assert "dueDate" not in issue_creates[2][1]["input"]
+
 
 class TestLinearExportProgress:
     """Tests for progress callback during export."""
@@ -18,6 +18,8 @@ from arcane.core.items import (
 )
 from arcane.core.storage import StorageManager
 
+from ..test_utils import roadmap_with_usage
+
 
 @pytest.fixture
 def sample_context():
@@ -206,6 +208,33 @@ class TestStorageManagerSaveLoad:
 
         assert loaded.id == complete_roadmap.id
 
+    @pytest.mark.asyncio
+    async def test_load_view(self, tmp_path, complete_roadmap):
+        """load_view returns a read-only view that converts back losslessly."""
+        storage = StorageManager(tmp_path)
+        saved_path = await storage.save_roadmap(complete_roadmap)
+
+        view = await storage.load_view(saved_path.parent)
+
+        assert view.total_items == complete_roadmap.total_items
+        assert view.to_roadmap().model_dump() == complete_roadmap.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_load_usage_history(self, tmp_path):
+        """Only complete roadmaps with per-level usage are sampled."""
+        storage = StorageManager(tmp_path)
+        await storage.save_roadmap(roadmap_with_usage())
+        incomplete = roadmap_with_usage()
+        incomplete.project_name = "Incomplete"
+        incomplete.milestones[1].epics = []
+        await storage.save_roadmap(incomplete)
+
+        samples = await storage.load_usage_history()
+
+        assert [s.total_items for s in samples] == [
+            {"milestones": 2, "epics": 2, "stories": 4, "tasks": 6}
+        ]
+
     @pytest.mark.asyncio
     async def test_context_yaml_saved(self, tmp_path, complete_roadmap):
         """context.yaml is saved alongside roadmap.json."""
@@ -0,0 +1,511 @@
+"""Tests for arcane.storage.sqlite module."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from arcane.core.items import (
+    Epic,
+    Milestone,
+    Priority,
+    ProjectContext,
+    Roadmap,
+    Status,
+    Story,
+    Task,
+)
+from arcane.core.storage import (
+    SQLiteStorageManager,
+    StorageManager,
+    create_storage,
+    resolve_storage,
+)
+from arcane.core.utils import UsageSample
+
+from ..test_utils import roadmap_with_usage
+
+
+@pytest.fixture
+def sample_context():
+    """Sample ProjectContext for testing."""
+    return ProjectContext(
+        project_name="Test Project",
+        vision="A test project for storage tests",
+        problem_statement="Testing storage is important",
+        target_users=["developers", "testers"],
+        timeline="3 months",
+        team_size=2,
+        developer_experience="senior",
+        budget_constraints="moderate",
+        tech_stack=["Python", "pytest"],
+        infrastructure_preferences="AWS",
+        existing_codebase=False,
+        must_have_features=["save", "load"],
+        nice_to_have_features=["resume"],
+        out_of_scope=["cloud sync"],
+        similar_products=["other tools"],
+        notes="Test notes",
+    )
+
+
+@pytest.fixture
+def sample_task():
+    """Sample Task for testing."""
+    return Task(
+        id="task-001",
+        name="Implement feature",
+        description="Implement the core feature",
+        priority=Priority.HIGH,
+        status=Status.NOT_STARTED,
+        estimated_hours=4,
+        acceptance_criteria=["Tests pass", "Code reviewed"],
+        implementation_notes="Follow existing patterns",
+        claude_code_prompt="Create a new module...",
+    )
+
+
+@pytest.fixture
+def sample_story(sample_task):
+    """Sample Story with tasks for testing."""
+    return Story(
+        id="story-001",
+        name="User can do something",
+        description="As a user, I want to do something",
+        priority=Priority.HIGH,
+        acceptance_criteria=["Feature works"],
+        tasks=[sample_task],
+    )
+
+
+@pytest.fixture
+def sample_epic(sample_story):
+    """Sample Epic with stories for testing."""
+    return Epic(
+        id="epic-001",
+        name="Core Features",
+        description="Core functionality",
+        priority=Priority.CRITICAL,
+        goal="Deliver core features",
+        stories=[sample_story],
+    )
+
+
+@pytest.fixture
+def sample_milestone(sample_epic):
+    """Sample Milestone with epics for testing."""
+    return Milestone(
+        id="milestone-001",
+        name="MVP",
+        description="Minimum viable product",
+        priority=Priority.CRITICAL,
+        goal="Launch MVP",
+        epics=[sample_epic],
+    )
+
+
+@pytest.fixture
+def complete_roadmap(sample_context, sample_milestone):
+    """Complete roadmap with full hierarchy for testing."""
+    return Roadmap(
+        id="roadmap-001",
+        project_name="Test Project",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        context=sample_context,
+        milestones=[sample_milestone],
+    )
+
+
+@pytest.fixture
+def large_roadmap(sample_context):
+    """Larger roadmap with 2 milestones for testing."""
+    tasks = [
+        Task(
+            id=f"task-{i}",
+            name=f"Task {i}",
+            description=f"Task {i} description",
+            priority=Priority.MEDIUM,
+            estimated_hours=3,
+            acceptance_criteria=["Done"],
+            implementation_notes="Notes",
+            claude_code_prompt="Prompt",
+        )
+        for i in range(1, 5)
+    ]
+
+    stories = [
+        Story(
+            id=f"story-{i}",
+            name=f"Story {i}",
+            description=f"Story {i} description",
+            priority=Priority.HIGH,
+            acceptance_criteria=["Completed"],
+            tasks=tasks[i * 2 - 2 : i * 2] if i <= 2 else [],
+        )
+        for i in range(1, 3)
+    ]
+
+    epics = [
+        Epic(
+            id=f"epic-{i}",
+            name=f"Epic {i}",
+            description=f"Epic {i} description",
+            priority=Priority.HIGH,
+            goal=f"Epic {i} goal",
+            stories=[stories[i - 1]] if i <= 2 else [],
+        )
+        for i in range(1, 3)
+    ]
+
+    milestones = [
+        Milestone(
+            id=f"milestone-{i}",
+            name=f"Milestone {i}",
+            description=f"Milestone {i} description",
+            priority=Priority.CRITICAL,
+            goal=f"Milestone {i} goal",
+            epics=[epics[i - 1]] if i <= 2 else [],
+        )
+        for i in range(1, 3)
+    ]
+
+    return Roadmap(
+        id="roadmap-large",
+        project_name="Large Project",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        context=sample_context,
+        milestones=milestones,
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """SQLite storage manager rooted in a temporary workspace."""
+    manager = SQLiteStorageManager(tmp_path)
+    yield manager
+    manager.close()
+
+
+class TestSQLiteSaveLoad:
+    """Tests for save and load operations."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_roundtrip(self, storage, complete_roadmap):
+        """Roadmap can be saved and loaded back with all fields intact."""
+        saved_path = await storage.save_roadmap(complete_roadmap)
+
+        assert saved_path == storage.db_path
+        assert saved_path.exists()
+
+        loaded = await storage.load_roadmap(complete_roadmap.id)
+
+        assert loaded.model_dump() == complete_roadmap.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_load_by_slug_and_path(self, storage, tmp_path, complete_roadmap):
+        """load_roadmap accepts the project slug or <workspace>/<slug>."""
+        await storage.save_roadmap(complete_roadmap)
+
+        by_slug = await storage.load_roadmap("test-project")
+        by_path = await storage.load_roadmap(tmp_path / "test-project")
+
+        assert by_slug.id == complete_roadmap.id
+        assert by_path.id == complete_roadmap.id
+
+    @pytest.mark.asyncio
+    async def test_load_view(self, storage, large_roadmap):
+        """load_view reads the same document as load_roadmap."""
+        await storage.save_roadmap(large_roadmap)
+
+        view = await storage.load_view(large_roadmap.id)
+
+        assert view.total_hours == large_roadmap.total_hours
+        assert view.to_roadmap().model_dump() == large_roadmap.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_load_usage_history(self, storage):
+        """Usage history matches the JSON backend's, from SQL counts."""
+        complete = roadmap_with_usage()
+        await storage.save_roadmap(complete)
+        incomplete = roadmap_with_usage()
+        incomplete.id = "roadmap-incomplete"
+        incomplete.project_name = "Incomplete"
+        incomplete.milestones[0].epics[0].stories[1].tasks = []
+        await storage.save_roadmap(incomplete)
+
+        samples = await storage.load_usage_history()
+
+        assert samples == [UsageSample.from_roadmap(complete)]
+
+    @pytest.mark.asyncio
+    async def test_load_missing_raises(self, storage):
+        """Unknown roadmaps raise FileNotFoundError like the JSON backend."""
+        with pytest.raises(FileNotFoundError):
+            await storage.load_roadmap("nope")
+
+    @pytest.mark.asyncio
+    async def test_child_order_preserved(self, storage, large_roadmap):
+        """Children come back in their original order."""
+        large_roadmap.milestones.reverse()
+        await storage.save_roadmap(large_roadmap)
+
+        loaded = await storage.load_roadmap(large_roadmap.id)
+
+        assert [m.id for m in loaded.milestones] == ["milestone-2", "milestone-1"]
+
+    @pytest.mark.asyncio
+    async def test_load_context(self, storage, complete_roadmap, sample_context):
+        """load_context returns the stored project context."""
+        await storage.save_roadmap(complete_roadmap)
+
+        context = await storage.load_context(complete_roadmap.id)
+
+        assert context == sample_context
+
+    @pytest.mark.asyncio
+    async def test_resume_point_after_reload(self, storage, large_roadmap):
+        """get_resume_point works on roadmaps loaded from the database."""
+        await storage.save_roadmap(large_roadmap)
+
+        loaded = await storage.load_roadmap(large_roadmap.id)
+
+        assert storage.get_resume_point(loaded) == storage.get_resume_point(
+            large_roadmap
+        )
+
+
+class TestSQLiteIncrementalSave:
+    """Tests for diff-based saves."""
+
+    @staticmethod
+    def _rowids(storage, roadmap_id):
+        rows = storage.conn.execute(
+            "SELECT id, rowid, payload FROM items WHERE roadmap_id = ?", (roadmap_id,)
+        )
+        return {row["id"]: (row["rowid"], row["payload"]) for row in rows}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_items_not_rewritten(self, storage, large_roadmap):
+        """Saving twice without changes leaves rows untouched."""
+        await storage.save_roadmap(large_roadmap)
+        before = storage.conn.total_changes
+
+        await storage.save_roadmap(large_roadmap)
+
+        # Only the roadmap header row is upserted
+        assert storage.conn.total_changes - before == 1
+
+    @pytest.mark.asyncio
+    async def test_added_and_removed_items(self, storage, large_roadmap):
+        """New children are inserted and dropped children are deleted."""
+        await storage.save_roadmap(large_roadmap)
+
+        story = large_roadmap.milestones[0].epics[0].stories[0]
+        story.tasks.pop()
+        story.tasks.append(
+            Task(
+                id="task-new",
+                name="Brand new task",
+                description="Added later",
+                priority=Priority.LOW,
+                estimated_hours=2,
+                acceptance_criteria=["Works"],
+                implementation_notes="",
+                claude_code_prompt="",
+            )
+        )
+        await storage.save_roadmap(large_roadmap)
+
+        rows = self._rowids(storage, large_roadmap.id)
+        assert "task-new" in rows
+        assert "task-2" not in rows
+
+        loaded = await storage.load_roadmap(large_roadmap.id)
+        assert loaded.model_dump() == large_roadmap.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_fresh_manager_reads_existing_rows(self, tmp_path, large_roadmap):
+        """A new manager diffs against rows already in the database."""
+        first = SQLiteStorageManager(tmp_path)
+        await first.save_roadmap(large_roadmap)
+        first.close()
+
+        second = SQLiteStorageManager(tmp_path)
+        before = second.conn.total_changes
+        await second.save_roadmap(large_roadmap)
+
+        assert second.conn.total_changes - before == 1
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_wal_mode_enabled(self, storage):
+        """The workspace database runs in WAL mode."""
+        mode = storage.conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+
+class TestSQLiteQueries:
+    """Tests for partial loads, listing and search."""
+
+    @pytest.mark.asyncio
+    async def test_get_item(self, storage, complete_roadmap):
+        """get_item returns a single item without children."""
+        await storage.save_roadmap(complete_roadmap)
+
+        item = storage.get_item(complete_roadmap.id, "story-001")
+
+        assert item["name"] == "User can do something"
+        assert "tasks" not in item
+        assert storage.get_item(complete_roadmap.id, "missing") is None
+
+    @pytest.mark.asyncio
+    async def test_load_subtree(self, storage, large_roadmap):
+        """load_subtree returns one item with its nested descendants."""
+        await storage.save_roadmap(large_roadmap)
+
+        epic = storage.load_subtree(large_roadmap.id, "epic-1")
+
+        assert epic["id"] == "epic-1"
+        assert [s["id"] for s in epic["stories"]] == ["story-1"]
+        assert [t["id"] for t in epic["stories"][0]["tasks"]] == ["task-1", "task-2"]
+        assert Epic.model_validate(epic).estimated_hours == 6
+
+    @pytest.mark.asyncio
+    async def test_query_items_filters(self, storage, large_roadmap):
+        """query_items filters on the indexed columns."""
+        large_roadmap.milestones[0].epics[0].stories[0].tasks[0].status = (
+            Status.COMPLETED
+        )
+        await storage.save_roadmap(large_roadmap)
+
+        tasks = storage.query_items(large_roadmap.id, item_type="task")
+        done = storage.query_items(
+            large_roadmap.id, item_type="task", status="completed"
+        )
+        children = storage.query_items(large_roadmap.id, parent_id="story-2")
+
+        assert len(tasks) == 4
+        assert [t["id"] for t in done] == ["task-1"]
+        assert [t["id"] for t in children] == ["task-3", "task-4"]
+
+    @pytest.mark.asyncio
+    async def test_list_roadmaps(self, storage, complete_roadmap, large_roadmap):
+        """list_roadmaps aggregates counts and hours per roadmap."""
+        await storage.save_roadmap(complete_roadmap)
+        await storage.save_roadmap(large_roadmap)
+
+        listing = {entry["id"]: entry for entry in storage.list_roadmaps()}
+
+        assert listing["roadmap-large"]["total_items"] == large_roadmap.total_items
+        assert listing["roadmap-large"]["total_hours"] == large_roadmap.total_hours
+        assert listing["roadmap-001"]["slug"] == "test-project"
+
+    @pytest.mark.asyncio
+    async def test_search(self, storage, complete_roadmap, large_roadmap):
+        """search matches names and descriptions across roadmaps."""
+        await storage.save_roadmap(complete_roadmap)
+        await storage.save_roadmap(large_roadmap)
+
+        hits = storage.search("core")
+        scoped = storage.search("description", roadmap_id="roadmap-large")
+
+        assert {hit["id"] for hit in hits} == {"task-001", "epic-001"}
+        assert scoped
+        assert all(hit["roadmap_id"] == "roadmap-large" for hit in scoped)
+
+    @pytest.mark.asyncio
+    async def test_search_tracks_renames(self, storage, complete_roadmap):
+        """The FTS index follows updates and deletes."""
+        await storage.save_roadmap(complete_roadmap)
+
+        complete_roadmap.milestones[0].name = "Quasar launch"
+        await storage.save_roadmap(complete_roadmap)
+
+        assert [hit["id"] for hit in storage.search("quasar")] == ["milestone-001"]
+        assert storage.search("MVP") == []
+
+    @pytest.mark.asyncio
+    async def test_search_treats_input_as_words(self, storage, complete_roadmap):
+        """Hyphens, quotes and operators in a query are not FTS5 syntax."""
+        complete_roadmap.milestones[0].name = 'user-auth for C++ "core" API'
+        await storage.save_roadmap(complete_roadmap)
+
+        assert [hit["id"] for hit in storage.search("user-auth")] == ["milestone-001"]
+        assert [hit["id"] for hit in storage.search("c++ API")] == ["milestone-001"]
+        assert "milestone-001" in {hit["id"] for hit in storage.search('"core')}
+        assert storage.search("user-auth NOT") == []
+        assert storage.search("  ") == []
+
+    @pytest.mark.asyncio
+    async def test_delete_roadmap(self, storage, complete_roadmap):
+        """delete_roadmap removes the roadmap and its items."""
+        await storage.save_roadmap(complete_roadmap)
+
+        await storage.delete_roadmap(complete_roadmap.id)
+
+        assert storage.list_roadmaps() == []
+        assert storage.search("core") == []
+
+
+class TestSQLiteJsonInterop:
+    """Tests for roadmap.json import and export."""
+
+    @pytest.mark.asyncio
+    async def test_import_json(self, tmp_path, storage, complete_roadmap):
+        """import_json loads a roadmap.json into the database."""
+        json_path = await StorageManager(tmp_path / "json").save_roadmap(
+            complete_roadmap
+        )
+
+        await storage.import_json(json_path)
+
+        loaded = await storage.load_roadmap(complete_roadmap.id)
+        assert loaded.model_dump() == complete_roadmap.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_export_json(self, tmp_path, storage, complete_roadmap):
+        """export_json writes a standard roadmap.json project directory."""
+        await storage.save_roadmap(complete_roadmap)
+
+        path = await storage.export_json("test-project", tmp_path / "out")
+
+        assert path == tmp_path / "out" / "test-project" / "roadmap.json"
+        assert json.loads(path.read_text())["id"] == complete_roadmap.id
+        assert (path.parent / "context.yaml").exists()
+
+
+class TestStorageFactory:
+    """Tests for create_storage and resolve_storage."""
+
+    def test_create_storage(self, tmp_path):
+        """create_storage maps backend names to managers."""
+        assert type(create_storage("json", tmp_path)) is StorageManager
+        assert type(create_storage("SQLite", tmp_path)) is SQLiteStorageManager
+
+    def test_create_storage_unknown(self, tmp_path):
+        """Unknown backends raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown storage backend"):
+            create_storage("mongo", tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_resolve_storage(self, tmp_path, complete_roadmap):
+        """resolve_storage picks SQLite only for slug paths next to arcane.db."""
+        json_path = await StorageManager(tmp_path / "json").save_roadmap(
+            complete_roadmap
+        )
+        sqlite = SQLiteStorageManager(tmp_path / "db")
+        await sqlite.save_roadmap(complete_roadmap)
+        sqlite.close()
+
+        assert type(resolve_storage(json_path)) is StorageManager
+        assert type(resolve_storage(json_path.parent)) is StorageManager
+        # A project folder without roadmap.json (e.g. a CSV export) is ignored
+        (tmp_path / "db" / "test-project").mkdir()
+        resolved = resolve_storage(tmp_path / "db" / "test-project")
+        assert type(resolved) is SQLiteStorageManager
+        loaded = await resolved.load_roadmap(tmp_path / "db" / "test-project")
+        assert loaded.id == complete_roadmap.id
+        resolved.close()
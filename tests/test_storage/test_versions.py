@@ -0,0 +1,373 @@
+"""Tests for arcane.storage.versions module."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from arcane.core.items import (
+    Epic,
+    Milestone,
+    Priority,
+    ProjectContext,
+    Roadmap,
+    Status,
+    Story,
+    Task,
+)
+from arcane.core.storage import (
+    FileObjectBackend,
+    MemoryObjectBackend,
+    Snapshot,
+    VersionStore,
+)
+
+
+@pytest.fixture
+def sample_context():
+    """Sample ProjectContext for testing."""
+    return ProjectContext(
+        project_name="Test Project",
+        vision="A test project for storage tests",
+        problem_statement="Testing storage is important",
+        target_users=["developers", "testers"],
+        timeline="3 months",
+        team_size=2,
+        developer_experience="senior",
+        budget_constraints="moderate",
+        tech_stack=["Python", "pytest"],
+        infrastructure_preferences="AWS",
+        existing_codebase=False,
+        must_have_features=["save", "load"],
+        nice_to_have_features=["resume"],
+        out_of_scope=["cloud sync"],
+        similar_products=["other tools"],
+        notes="Test notes",
+    )
+
+
+@pytest.fixture
+def sample_task():
+    """Sample Task for testing."""
+    return Task(
+        id="task-001",
+        name="Implement feature",
+        description="Implement the core feature",
+        priority=Priority.HIGH,
+        status=Status.NOT_STARTED,
+        estimated_hours=4,
+        acceptance_criteria=["Tests pass", "Code reviewed"],
+        implementation_notes="Follow existing patterns",
+        claude_code_prompt="Create a new module...",
+    )
+
+
+@pytest.fixture
+def sample_story(sample_task):
+    """Sample Story with tasks for testing."""
+    return Story(
+        id="story-001",
+        name="User can do something",
+        description="As a user, I want to do something",
+        priority=Priority.HIGH,
+        acceptance_criteria=["Feature works"],
+        tasks=[sample_task],
+    )
+
+
+@pytest.fixture
+def sample_epic(sample_story):
+    """Sample Epic with stories for testing."""
+    return Epic(
+        id="epic-001",
+        name="Core Features",
+        description="Core functionality",
+        priority=Priority.CRITICAL,
+        goal="Deliver core features",
+        stories=[sample_story],
+    )
+
+
+@pytest.fixture
+def sample_milestone(sample_epic):
+    """Sample Milestone with epics for testing."""
+    return Milestone(
+        id="milestone-001",
+        name="MVP",
+        description="Minimum viable product",
+        priority=Priority.CRITICAL,
+        goal="Launch MVP",
+        epics=[sample_epic],
+    )
+
+
+@pytest.fixture
+def complete_roadmap(sample_context, sample_milestone):
+    """Complete roadmap with full hierarchy for testing."""
+    return Roadmap(
+        id="roadmap-001",
+        project_name="Test Project",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        context=sample_context,
+        milestones=[sample_milestone],
+    )
+
+
+@pytest.fixture
+def large_roadmap(sample_context):
+    """Larger roadmap with 2 milestones for testing."""
+    tasks = [
+        Task(
+            id=f"task-{i}",
+            name=f"Task {i}",
+            description=f"Task {i} description",
+            priority=Priority.MEDIUM,
+            estimated_hours=3,
+            acceptance_criteria=["Done"],
+            implementation_notes="Notes",
+            claude_code_prompt="Prompt",
+        )
+        for i in range(1, 5)
+    ]
+
+    stories = [
+        Story(
+            id=f"story-{i}",
+            name=f"Story {i}",
+            description=f"Story {i} description",
+            priority=Priority.HIGH,
+            acceptance_criteria=["Completed"],
+            tasks=tasks[i * 2 - 2 : i * 2] if i <= 2 else [],
+        )
+        for i in range(1, 3)
+    ]
+
+    epics = [
+        Epic(
+            id=f"epic-{i}",
+            name=f"Epic {i}",
+            description=f"Epic {i} description",
+            priority=Priority.HIGH,
+            goal=f"Epic {i} goal",
+            stories=[stories[i - 1]] if i <= 2 else [],
+        )
+        for i in range(1, 3)
+    ]
+
+    milestones = [
+        Milestone(
+            id=f"milestone-{i}",
+            name=f"Milestone {i}",
+            description=f"Milestone {i} description",
+            priority=Priority.CRITICAL,
+            goal=f"Milestone {i} goal",
+            epics=[epics[i - 1]] if i <= 2 else [],
+        )
+        for i in range(1, 3)
+    ]
+
+    return Roadmap(
+        id="roadmap-large",
+        project_name="Large Project",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        context=sample_context,
+        milestones=milestones,
+    )
+
+
+class CountingBackend(MemoryObjectBackend):
+    """Memory backend that records object reads and writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads: list[str] = []
+        self.writes: list[str] = []
+
+    def get(self, key):
+        self.reads.append(key)
+        return super().get(key)
+
+    def put(self, key, data):
+        self.writes.append(key)
+        super().put(key, data)
+
+
+@pytest.fixture
+def backend():
+    return CountingBackend()
+
+
+@pytest.fixture
+def store(backend):
+    return VersionStore(backend)
+
+
+class TestVersionStoreCommit:
+    """Tests for recording snapshots."""
+
+    def test_commit_and_checkout_roundtrip(self, store, large_roadmap):
+        """A snapshot can be checked out with all items intact."""
+        snapshot = store.commit(large_roadmap, "initial")
+
+        restored = store.checkout(large_roadmap.id, snapshot.version)
+
+        assert snapshot.version == 1
+        assert snapshot.message == "initial"
+        assert snapshot.total_items == large_roadmap.total_items
+        assert snapshot.total_hours == large_roadmap.total_hours
+        assert restored.model_dump(exclude={"updated_at"}) == large_roadmap.model_dump(
+            exclude={"updated_at"}
+        )
+
+    def test_unchanged_commit_is_noop(self, store, backend, large_roadmap):
+        """Committing an unchanged roadmap returns the latest snapshot."""
+        first = store.commit(large_roadmap)
+        large_roadmap.updated_at = datetime.now(timezone.utc)
+        writes = len(backend.writes)
+
+        second = store.commit(large_roadmap)
+
+        assert second == first
+        assert len(store.history(large_roadmap.id)) == 1
+        assert len(backend.writes) == writes
+
+    def test_structural_sharing(self, store, backend, large_roadmap):
+        """Only objects on the changed path are written."""
+        store.commit(large_roadmap)
+        writes = len(backend.writes)
+
+        large_roadmap.milestones[0].epics[0].stories[0].tasks[0].name = "Renamed"
+        store.commit(large_roadmap)
+
+        # task -> story -> epic -> milestone -> root
+        assert len(backend.writes) - writes == 5
+        assert len(store.history(large_roadmap.id)) == 2
+
+    def test_file_backend_persists(self, tmp_path, large_roadmap):
+        """Snapshots written to disk are readable by a new store."""
+        VersionStore.at(tmp_path).commit(large_roadmap, "saved")
+
+        reopened = VersionStore(FileObjectBackend(tmp_path))
+        restored = reopened.checkout(large_roadmap.id)
+
+        assert reopened.history(large_roadmap.id)[0].message == "saved"
+        assert restored.total_items == large_roadmap.total_items
+        assert list((tmp_path / "logs").iterdir())
+
+    def test_commit_data_from_dicts(self, store):
+        """commit_data accepts plain serialized data."""
+        milestones = [
+            {
+                "id": "m1",
+                "name": "MVP",
+                "epics": [{"id": "e1", "name": "Core", "stories": []}],
+            }
+        ]
+
+        snapshot = store.commit_data("r1", {"project_name": "X"}, milestones)
+
+        assert snapshot.total_items == {
+            "milestones": 1,
+            "epics": 1,
+            "stories": 0,
+            "tasks": 0,
+        }
+        assert store.checkout_data(snapshot.root)["milestones"] == milestones
+
+
+class TestVersionStoreResolve:
+    """Tests for snapshot refs."""
+
+    def test_resolve_refs(self, store, large_roadmap):
+        """Snapshots resolve by number, negative offset and hash prefix."""
+        first = store.commit(large_roadmap)
+        large_roadmap.milestones[0].name = "Changed"
+        second = store.commit(large_roadmap)
+
+        assert store.resolve(large_roadmap.id) == second
+        assert store.resolve(large_roadmap.id, 1) == first
+        assert store.resolve(large_roadmap.id, "-1") == first
+        assert store.resolve(large_roadmap.id, first.root[:8]) == first
+
+    def test_resolve_digit_hash_prefix(self, store):
+        """A hash prefix of digits only resolves to the hash, not a version."""
+        created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for version, root in [(1, "12345678" + "a" * 56), (2, "f" * 64)]:
+            store.backend.append_log(
+                "rm", Snapshot(version=version, root=root, created_at=created).to_dict()
+            )
+
+        assert store.resolve("rm", "12345").version == 1
+        assert store.resolve("rm", "1234").version == 1
+        assert store.resolve("rm", "2").version == 2
+        assert store.resolve("rm", 2).version == 2
+        with pytest.raises(KeyError):
+            store.resolve("rm", "12340")
+
+    def test_resolve_unknown(self, store, large_roadmap):
+        """Unknown refs and empty histories raise KeyError."""
+        with pytest.raises(KeyError):
+            store.resolve(large_roadmap.id)
+
+        store.commit(large_roadmap)
+        with pytest.raises(KeyError):
+            store.resolve(large_roadmap.id, 7)
+
+
+class TestVersionStoreDiff:
+    """Tests for diffing snapshots."""
+
+    def test_diff_modified_added_removed(self, store, large_roadmap):
+        """Field edits, additions and removals are reported."""
+        store.commit(large_roadmap)
+
+        story = large_roadmap.milestones[0].epics[0].stories[0]
+        story.tasks[0].status = Status.COMPLETED
+        story.tasks.pop()
+        large_roadmap.milestones[1].epics[0].stories.append(
+            Story(
+                id="story-new",
+                name="New story",
+                description="Added",
+                priority=Priority.LOW,
+                acceptance_criteria=[],
+            )
+        )
+        store.commit(large_roadmap)
+
+        changes = {(c.kind, c.item_id): c for c in store.diff(large_roadmap.id)}
+
+        assert changes[("modified", "task-1")].fields == ["status"]
+        assert ("removed", "task-2") in changes
+        assert ("added", "story-new") in changes
+        assert len(changes) == 3
+
+    def test_diff_reordered(self, store, large_roadmap):
+        """Reordering children is reported on the parent."""
+        store.commit(large_roadmap)
+        large_roadmap.milestones[0].epics[0].stories[0].tasks.reverse()
+        store.commit(large_roadmap)
+
+        changes = store.diff(large_roadmap.id)
+
+        assert [(c.kind, c.item_id) for c in changes] == [("reordered", "story-1")]
+
+    def test_diff_skips_unchanged_subtrees(self, store, backend, large_roadmap):
+        """Diffing only reads objects along changed paths."""
+        store.commit(large_roadmap)
+        large_roadmap.milestones[1].epics[0].stories[0].tasks[0].name = "Edited"
+        store.commit(large_roadmap)
+        backend.reads.clear()
+
+        changes = VersionStore(backend).diff(large_roadmap.id, 1, 2)
+
+        assert [(c.kind, c.item_id) for c in changes] == [("modified", "task-3")]
+        # Two roots plus old/new of milestone, epic, story and task
+        assert len(backend.reads) == 10
+
+    def test_diff_same_version_empty(self, store, large_roadmap):
+        """Diffing a snapshot against itself yields no changes."""
+        store.commit(large_roadmap)
+
+        assert store.diff(large_roadmap.id, 1, 1) == []
@@ -1,8 +1,28 @@
 """Tests for arcane.utils module."""
 
+import asyncio
+import json
+import time
+import tracemalloc
+
 import pytest
 
-from arcane.core.utils import generate_id
+from arcane.core.items import RoadmapView, StoredUsage
+from arcane.core.storage import StorageManager
+from arcane.core.utils import (
+    CostCalibration,
+    Profiler,
+    UsageSample,
+    estimate_generation_cost,
+    generate_id,
+    get_tracer,
+    span,
+    start_tracing,
+    stop_tracing,
+    traced,
+)
+
+from .test_items.test_hierarchy import create_roadmap
 
 
 class TestGenerateId:
@@ -38,3 +58,170 @@ class TestGenerateId:
         assert parts[0] == "epic"
         # ULID is 26 characters
         assert len(parts[1]) == 26
+
+
+class TestTracing:
+    """Tests for span tracing and the Chrome trace exporter."""
+
+    @pytest.fixture
+    def tracer(self):
+        tracer = start_tracing()
+        yield tracer
+        stop_tracing()
+
+    def test_spans_nest_under_the_open_span(self, tracer):
+        with span("outer", kind="test"), span("inner") as inner:
+            inner.set_attribute("items", 3)
+        inner_span, outer_span = tracer.spans
+        assert inner_span.parent_id == outer_span.span_id
+        assert outer_span.parent_id is None
+        assert outer_span.attributes == {"kind": "test"}
+        assert inner_span.attributes == {"items": 3}
+        assert outer_span.duration >= inner_span.duration
+
+    def test_error_is_recorded_and_reraised(self, tracer):
+        with pytest.raises(ValueError), span("failing"):
+            raise ValueError("boom")
+        assert tracer.spans[0].error == "ValueError"
+        assert tracer.summary()[0]["errors"] == 1
+
+    def test_noop_when_tracing_is_off(self):
+        assert get_tracer() is None
+        with span("ignored") as current:
+            current.set_attribute("key", "value")
+        assert current.attributes == {}
+
+    async def test_traced_coroutine_and_concurrent_tasks(self, tracer):
+        @traced("work")
+        async def work():
+            await asyncio.sleep(0)
+
+        with span("root"):
+            await asyncio.gather(asyncio.create_task(work()), asyncio.create_task(work()))
+        work_spans = [s for s in tracer.spans if s.name == "work"]
+        root = next(s for s in tracer.spans if s.name == "root")
+        assert all(s.parent_id == root.span_id for s in work_spans)
+        # Concurrent tasks are drawn on separate tracks
+        assert len({s.track for s in work_spans}) == 2
+
+    async def test_storage_is_instrumented(self, tracer, tmp_path):
+        storage = StorageManager(tmp_path)
+        await storage.save_roadmap(create_roadmap())
+        assert [s.name for s in tracer.spans] == ["storage.save_roadmap"]
+
+    def test_chrome_trace_file(self, tracer, tmp_path):
+        with span("storage.save", path=tmp_path):
+            pass
+        path = tracer.write_chrome_trace(tmp_path / "trace.json")
+        events = json.loads(path.read_text())["traceEvents"]
+        event = next(e for e in events if e["ph"] == "X")
+        assert event["name"] == "storage.save"
+        assert event["cat"] == "storage"
+        assert event["dur"] >= 0
+        assert event["args"]["path"] == str(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def profiler():
+    """Profiler that has run RoadmapView.from_roadmap() for 100ms."""
+    roadmap = create_roadmap()
+    profiler = Profiler(interval=0.001)
+    profiler.start()
+    deadline = time.perf_counter() + 0.1
+    while time.perf_counter() < deadline:
+        RoadmapView.from_roadmap(roadmap)
+    profiler.stop()
+    return profiler
+
+
+class TestProfiler:
+    """Tests for the --profile collectors and reports."""
+
+    def test_top_functions_are_arcane_owned(self, profiler):
+        top = profiler.top_functions(limit=5)
+        assert top
+        assert all(row.location.startswith("core/") for row in top)
+        assert "core/items/view.py" in {row.location.split(":")[0] for row in top}
+        assert top == sorted(top, key=lambda r: r.own_seconds, reverse=True)
+
+    def test_collapsed_stacks_are_root_first(self, profiler):
+        assert profiler.stacks
+        stack = next(s for s in profiler.stacks if "from_roadmap" in s)
+        names = [frame.split(" ", 1)[0] for frame in stack.split(";")]
+        assert names.index("profiler") < names.index("from_roadmap")
+
+    def test_write_files(self, profiler, tmp_path):
+        paths = profiler.write(tmp_path / "out" / "run")
+        assert [p.name for p in paths] == ["run.prof", "run.collapsed", "run.tracemalloc"]
+        line = paths[1].read_text().splitlines()[0]
+        assert int(line.rsplit(" ", 1)[1]) > 0
+        assert tracemalloc.Snapshot.load(str(paths[2])).traces
+        assert profiler.peak_memory > 0
+
+
+def roadmap_with_usage(output_per_task_call: int = 2000):
+    """The 2-milestone test roadmap with usage for every level recorded."""
+    roadmap = create_roadmap()
+    # One milestone call, one epic call per milestone, one story call per
+    # epic and one task call per story (2 / 2 / 4)
+    calls = {"milestone": 1, "epic": 2, "story": 2, "task": 4}
+    tokens = {level: {"input": 1000 * n, "output": 1000 * n} for level, n in calls.items()}
+    tokens["task"]["output"] = output_per_task_call * 4
+    roadmap.usage = StoredUsage(
+        api_calls=sum(calls.values()),
+        input_tokens=sum(t["input"] for t in tokens.values()),
+        output_tokens=sum(t["output"] for t in tokens.values()),
+        calls_by_level=calls,
+        tokens_by_level=tokens,
+    )
+    return roadmap
+
+
+class TestCostCalibration:
+    """Tests for cost estimates calibrated from saved roadmaps."""
+
+    def test_empty_calibration_matches_defaults(self):
+        assert CostCalibration().estimate("sonnet") == estimate_generation_cost("sonnet")
+        estimate = estimate_generation_cost("sonnet")
+        assert estimate.task_calls == 27
+        assert estimate.low_cost_usd is None
+
+    def test_learns_fan_out_and_tokens(self):
+        calibration = CostCalibration.from_roadmaps([roadmap_with_usage()])
+        assert calibration.fan_out() == {
+            "milestones": 2,
+            "epics_per_milestone": 1,
+            "stories_per_epic": 2,
+            "tasks_per_story": 1.5,
+        }
+        assert calibration.tokens_per_call()["task"] == (1000, 2000)
+        estimate = calibration.estimate("sonnet")
+        assert (estimate.epic_calls, estimate.story_calls, estimate.task_calls) == (2, 2, 4)
+        assert estimate.samples == 1
+
+    def test_skips_incomplete_roadmaps_and_missing_usage(self):
+        incomplete = roadmap_with_usage()
+        incomplete.milestones[0].epics[0].stories[0].tasks = []
+        assert UsageSample.from_roadmap(incomplete) is None
+        assert UsageSample.from_roadmap(create_roadmap()) is None
+
+    def test_interval_covers_the_samples(self):
+        cheap, costly = roadmap_with_usage(1000), roadmap_with_usage(9000)
+        calibration = CostCalibration.from_roadmaps(
+            [cheap.model_dump(mode="json"), RoadmapView.from_roadmap(costly)]
+        )
+        estimate = calibration.estimate("sonnet", seed=3)
+        assert estimate.low_cost_usd < estimate.estimated_cost_usd < estimate.high_cost_usd
+        assert estimate == calibration.estimate("sonnet", seed=3)
+
+    def test_refines_partial_roadmap(self):
+        calibration = CostCalibration.from_roadmaps([roadmap_with_usage()])
+        partial = roadmap_with_usage()
+        # Milestone 2's epic hasn't been expanded yet
+        partial.milestones[1].epics[0].stories = []
+        estimate = calibration.estimate("sonnet", roadmap=partial)
+        assert estimate.milestone_calls == 0
+        assert estimate.epic_calls == 0
+        assert (estimate.story_calls, estimate.task_calls) == (1, 2)
+        assert estimate.spent_cost_usd > 0
+        assert estimate.estimated_cost_usd > estimate.spent_cost_usd
@@ -0,0 +1,82 @@
+"""usage_records table
+
+Revision ID: 3b9d2e61f0a7
+Revises: e7b3f41a9c20
+Create Date: 2026-10-19 14:06:51.207734
+
+A per-user ledger of the tokens each generation job and AI edit used,
+which quotas are charged against instead of the usage stored on the
+user's current roadmaps. Backfilled with one row per roadmap from that
+stored usage.
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import Text
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d2e61f0a7'
+down_revision: Union[str, None] = 'e7b3f41a9c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JsonType = sa.JSON().with_variant(postgresql.JSONB(astext_type=Text()), 'postgresql')
+
+
+def upgrade() -> None:
+    usage_records = op.create_table('usage_records',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('roadmap_id', sa.Uuid(), nullable=True),
+    sa.Column('kind', sa.String(length=50), nullable=False),
+    sa.Column('model', sa.String(length=100), nullable=True),
+    sa.Column('input_tokens', sa.Integer(), nullable=False),
+    sa.Column('output_tokens', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['roadmap_id'], ['roadmaps.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_usage_records_user_id'), 'usage_records', ['user_id'], unique=False)
+
+    # Backfill, loading one document at a time
+    bind = op.get_bind()
+    roadmaps = sa.table(
+        'roadmaps',
+        sa.column('id', sa.Uuid()),
+        sa.column('project_id', sa.Uuid()),
+        sa.column('roadmap_data', JsonType),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+    )
+    projects = sa.table('projects', sa.column('id', sa.Uuid()), sa.column('user_id', sa.Uuid()))
+    owned = bind.execute(
+        sa.select(roadmaps.c.id, projects.c.user_id, roadmaps.c.created_at)
+        .join(projects, roadmaps.c.project_id == projects.c.id)
+        .where(roadmaps.c.roadmap_data.is_not(None))
+    ).all()
+    for roadmap_id, user_id, created_at in owned:
+        data = bind.execute(
+            sa.select(roadmaps.c.roadmap_data).where(roadmaps.c.id == roadmap_id)
+        ).scalar()
+        usage = (data or {}).get('usage') or {}
+        input_tokens = usage.get('input_tokens') or 0
+        output_tokens = usage.get('output_tokens') or 0
+        if input_tokens or output_tokens:
+            bind.execute(usage_records.insert().values(
+                id=uuid.uuid4(),
+                user_id=user_id,
+                roadmap_id=roadmap_id,
+                kind='backfill',
+                model=None,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                created_at=created_at,
+            ))
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_usage_records_user_id'), table_name='usage_records')
+    op.drop_table('usage_records')
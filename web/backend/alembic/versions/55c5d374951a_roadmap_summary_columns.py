@@ -0,0 +1,71 @@
+"""roadmap summary columns
+
+Revision ID: 55c5d374951a
+Revises: a85bb92e61ae
+Create Date: 2026-10-19 00:12:51.902114
+
+Item counts, hours and completion stored on each roadmap so list
+endpoints don't have to load roadmap_data. Backfilled from the existing
+documents one roadmap at a time.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import Text
+from sqlalchemy.dialects import postgresql
+
+from arcane.core.planning import summarize
+
+# revision identifiers, used by Alembic.
+revision: str = '55c5d374951a'
+down_revision: Union[str, None] = 'a85bb92e61ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JsonType = sa.JSON().with_variant(postgresql.JSONB(astext_type=Text()), 'postgresql')
+
+
+def upgrade() -> None:
+    op.add_column('roadmaps', sa.Column('item_counts', JsonType, nullable=True))
+    op.add_column('roadmaps', sa.Column('completion_percent', sa.Float(), nullable=True))
+    op.add_column('roadmaps', sa.Column('hours_completed', sa.Integer(), nullable=True))
+    op.add_column('roadmaps', sa.Column('hours_total', sa.Integer(), nullable=True))
+
+    bind = op.get_bind()
+    roadmaps = sa.table(
+        'roadmaps',
+        sa.column('id', sa.Uuid()),
+        sa.column('roadmap_data', JsonType),
+        sa.column('item_counts', JsonType),
+        sa.column('completion_percent', sa.Float()),
+        sa.column('hours_completed', sa.Integer()),
+        sa.column('hours_total', sa.Integer()),
+    )
+    roadmap_ids = bind.execute(
+        sa.select(roadmaps.c.id).where(roadmaps.c.roadmap_data.is_not(None))
+    ).scalars().all()
+    for roadmap_id in roadmap_ids:
+        data = bind.execute(
+            sa.select(roadmaps.c.roadmap_data).where(roadmaps.c.id == roadmap_id)
+        ).scalar()
+        if not data:
+            continue
+        summary = summarize(data)
+        bind.execute(
+            roadmaps.update()
+            .where(roadmaps.c.id == roadmap_id)
+            .values(
+                item_counts=summary.item_counts,
+                completion_percent=summary.item_completion_percent,
+                hours_completed=int(summary.hours_completed),
+                hours_total=int(summary.hours_total),
+            )
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('roadmaps', 'hours_total')
+    op.drop_column('roadmaps', 'hours_completed')
+    op.drop_column('roadmaps', 'completion_percent')
+    op.drop_column('roadmaps', 'item_counts')
@@ -0,0 +1,99 @@
+"""roadmap_items table
+
+Revision ID: a85bb92e61ae
+Revises: 5238fba93d43
+Create Date: 2026-10-18 23:40:12.418305
+
+One row per roadmap item alongside roadmaps.roadmap_data, backfilled
+from the existing documents one roadmap at a time.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import Text
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a85bb92e61ae'
+down_revision: Union[str, None] = '5238fba93d43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JsonType = sa.JSON().with_variant(postgresql.JSONB(astext_type=Text()), 'postgresql')
+
+# Item type -> (key of its child list, type of its children)
+CHILDREN = {
+    'milestone': ('epics', 'epic'),
+    'epic': ('stories', 'story'),
+    'story': ('tasks', 'task'),
+    'task': (None, None),
+}
+
+
+def _item_rows(roadmap_id, data: dict) -> list[dict]:
+    """Flatten a roadmap document; the first occurrence of an ID wins."""
+    rows: list[dict] = []
+    seen: set[str] = set()
+
+    def walk(items: list, item_type: str, parent_id: str | None) -> None:
+        children_key, child_type = CHILDREN[item_type]
+        for position, item in enumerate(items):
+            item_id = item.get('id')
+            if item_id is not None and item_id not in seen:
+                seen.add(item_id)
+                hours = item.get('estimated_hours')
+                rows.append({
+                    'roadmap_id': roadmap_id,
+                    'id': item_id,
+                    'parent_id': parent_id,
+                    'type': item_type,
+                    'position': position,
+                    'status': item.get('status') or 'not_started',
+                    'priority': item.get('priority'),
+                    'estimated_hours': hours if isinstance(hours, (int, float)) else None,
+                    'payload': {k: v for k, v in item.items() if k != children_key},
+                })
+            if children_key is not None:
+                walk(item.get(children_key) or [], child_type, item_id)
+
+    walk(data.get('milestones') or [], 'milestone', None)
+    return rows
+
+
+def upgrade() -> None:
+    roadmap_items = op.create_table('roadmap_items',
+    sa.Column('roadmap_id', sa.Uuid(), nullable=False),
+    sa.Column('id', sa.String(length=100), nullable=False),
+    sa.Column('parent_id', sa.String(length=100), nullable=True),
+    sa.Column('type', sa.String(length=20), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('priority', sa.String(length=50), nullable=True),
+    sa.Column('estimated_hours', sa.Float(), nullable=True),
+    sa.Column('payload', JsonType, nullable=False),
+    sa.ForeignKeyConstraint(['roadmap_id'], ['roadmaps.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('roadmap_id', 'id')
+    )
+    op.create_index('ix_roadmap_items_parent', 'roadmap_items', ['roadmap_id', 'parent_id', 'position'], unique=False)
+    op.create_index('ix_roadmap_items_status', 'roadmap_items', ['roadmap_id', 'status'], unique=False)
+
+    # Backfill, loading one document at a time
+    bind = op.get_bind()
+    roadmaps = sa.table('roadmaps', sa.column('id', sa.Uuid()), sa.column('roadmap_data', JsonType))
+    roadmap_ids = bind.execute(
+        sa.select(roadmaps.c.id).where(roadmaps.c.roadmap_data.is_not(None))
+    ).scalars().all()
+    for roadmap_id in roadmap_ids:
+        data = bind.execute(
+            sa.select(roadmaps.c.roadmap_data).where(roadmaps.c.id == roadmap_id)
+        ).scalar()
+        rows = _item_rows(roadmap_id, data or {})
+        if rows:
+            bind.execute(roadmap_items.insert(), rows)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_roadmap_items_status', table_name='roadmap_items')
+    op.drop_index('ix_roadmap_items_parent', table_name='roadmap_items')
+    op.drop_table('roadmap_items')
@@ -0,0 +1,30 @@
+"""roadmap version columns
+
+Revision ID: c41d7e09b2f6
+Revises: 55c5d374951a
+Create Date: 2026-10-19 01:06:37.215480
+
+A version counter on roadmaps, checked and bumped by every write, and
+on each roadmap_items row the roadmap version that last changed it.
+Existing rows start at version 1.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e09b2f6'
+down_revision: Union[str, None] = '55c5d374951a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('roadmaps', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('roadmap_items', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('roadmap_items', 'version')
+    op.drop_column('roadmaps', 'version')
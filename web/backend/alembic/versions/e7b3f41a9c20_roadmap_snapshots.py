@@ -0,0 +1,50 @@
+"""roadmap snapshot tables
+
+Revision ID: e7b3f41a9c20
+Revises: c41d7e09b2f6
+Create Date: 2026-10-19 09:42:18.503117
+
+Version history in the database instead of a per-process store: one
+row per snapshot, keyed by roadmap version, and the content-addressed
+objects snapshots point to. History starts with the next write.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import Text
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3f41a9c20'
+down_revision: Union[str, None] = 'c41d7e09b2f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JsonType = sa.JSON().with_variant(postgresql.JSONB(astext_type=Text()), 'postgresql')
+
+
+def upgrade() -> None:
+    op.create_table('roadmap_snapshots',
+    sa.Column('roadmap_id', sa.Uuid(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('root', sa.String(length=64), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('total_items', JsonType, nullable=False),
+    sa.Column('total_hours', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['roadmap_id'], ['roadmaps.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('roadmap_id', 'version')
+    )
+    op.create_table('roadmap_version_objects',
+    sa.Column('roadmap_id', sa.Uuid(), nullable=False),
+    sa.Column('hash', sa.String(length=64), nullable=False),
+    sa.Column('data', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['roadmap_id'], ['roadmaps.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('roadmap_id', 'hash')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('roadmap_version_objects')
+    op.drop_table('roadmap_snapshots')
@@ -17,6 +17,27 @@ class Settings(BaseSettings):
     refresh_token_expire_days: int = 7
     encryption_key: str = ""  # Fernet key; empty = PM credential encryption disabled
 
+    # Caches
+    # Roadmaps whose item ID index is kept in process between edits; 0 = off
+    item_path_cache_size: int = 64
+    # Serialized GET /roadmaps/{id} responses kept in process; 0 = off
+    roadmap_response_cache_mb: int = 64
+    roadmap_response_gzip: bool = True
+
+    # Events waiting per SSE subscriber before the oldest are dropped, and
+    # the window within which item_created events are sent as one batch
+    sse_queue_size: int = 256
+    sse_batch_seconds: float = 0.25
+    # How SSE events reach other workers: "memory" (single worker),
+    # "postgres" (LISTEN/NOTIFY), or "auto" to follow database_url
+    event_bus_backend: str = "auto"
+    event_bus_channel: str = "arcane_events"
+
+    # Generation limits; 0 = unlimited. Quotas cover all of a user's roadmaps.
+    user_quota_tokens: int = 0
+    user_quota_usd: float = 0.0
+    generation_max_seconds: float = 0.0  # Per job; a stopped job resumes on the next run
+
     model_config = {"env_prefix": "ARCANE_"}
 
 
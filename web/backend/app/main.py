@@ -1,7 +1,9 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm.exc import StaleDataError
 
 from .config import get_settings
 from .database import get_engine
@@ -11,11 +13,14 @@ from .routers.health import router as health_router
 from .routers.projects import router as projects_router
 from .routers.exports import router as exports_router
 from .routers.roadmaps import router as roadmaps_router
+from .services import event_bus
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await event_bus.start()
     yield
+    await event_bus.stop()
     await get_engine().dispose()
 
 
@@ -36,6 +41,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.exception_handler(StaleDataError)
+async def stale_data_handler(request: Request, exc: StaleDataError):
+    # A whole-record write whose version check failed (see RoadmapRecord.version)
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": "Roadmap was changed by another edit; reload and retry"},
+    )
+
+
 app.include_router(health_router)
 app.include_router(auth_router, prefix="/auth", tags=["auth"])
 app.include_router(projects_router, prefix="/projects", tags=["projects"])
@@ -2,9 +2,12 @@ from .base import Base, TimestampMixin, JsonType
 from .user import User
 from .project import Project
 from .roadmap import RoadmapRecord
+from .roadmap_item import RoadmapItem
+from .roadmap_snapshot import RoadmapSnapshot, RoadmapVersionObject
 from .generation_job import GenerationJob
 from .pm_credential import PMCredential
 from .export_job import ExportJob
+from .usage_record import UsageRecord
 
 __all__ = [
     "Base",
@@ -13,7 +16,11 @@ __all__ = [
     "User",
     "Project",
     "RoadmapRecord",
+    "RoadmapItem",
+    "RoadmapSnapshot",
+    "RoadmapVersionObject",
     "GenerationJob",
     "PMCredential",
     "ExportJob",
+    "UsageRecord",
 ]
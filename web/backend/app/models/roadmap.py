@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String, Uuid
+from sqlalchemy import Float, ForeignKey, Integer, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, JsonType, TimestampMixin, UUIDPrimaryKey
@@ -14,7 +14,17 @@ class RoadmapRecord(UUIDPrimaryKey, TimestampMixin, Base):
     context: Mapped[dict | None] = mapped_column(JsonType, nullable=True)
     roadmap_data: Mapped[dict | None] = mapped_column(JsonType, nullable=True)
     status: Mapped[str] = mapped_column(String(50), default="draft", nullable=False)
+    # Bumped on every write; writes are checked against the version they read
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
+    # Summary of roadmap_data, updated whenever it is written (services.roadmap_summary)
+    item_counts: Mapped[dict | None] = mapped_column(JsonType, nullable=True)
+    completion_percent: Mapped[float | None] = mapped_column(Float, nullable=True)
+    hours_completed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    hours_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     project = relationship("Project", back_populates="roadmaps")
     generation_jobs = relationship("GenerationJob", back_populates="roadmap", cascade="all, delete-orphan")
     export_jobs = relationship("ExportJob", back_populates="roadmap", cascade="all, delete-orphan")
+
+    __mapper_args__ = {"version_id_col": version}
@@ -0,0 +1,38 @@
+"""RoadmapItem model: one row per item of a roadmap's hierarchy."""
+
+import uuid
+
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, JsonType
+
+
+class RoadmapItem(Base):
+    """A milestone, epic, story or task, kept alongside roadmap_data.
+
+    ``payload`` holds the item's fields without its child list; status,
+    priority and hours are copied into columns for filtering. Rows are
+    rewritten from the JSONB document whenever it is saved whole, and
+    row by row for item edits (see services.item_rows). ``version`` is
+    the roadmap version that last changed the row.
+    """
+
+    __tablename__ = "roadmap_items"
+    __table_args__ = (
+        Index("ix_roadmap_items_parent", "roadmap_id", "parent_id", "position"),
+        Index("ix_roadmap_items_status", "roadmap_id", "status"),
+    )
+
+    roadmap_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("roadmaps.id", ondelete="CASCADE"), primary_key=True
+    )
+    id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    parent_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    type: Mapped[str] = mapped_column(String(20), nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    priority: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    estimated_hours: Mapped[float | None] = mapped_column(Float, nullable=True)
+    payload: Mapped[dict] = mapped_column(JsonType, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
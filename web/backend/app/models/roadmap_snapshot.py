@@ -0,0 +1,50 @@
+"""Roadmap version history: snapshots and the objects they point to."""
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, JsonType
+
+
+class RoadmapSnapshot(Base):
+    """A recorded version of a roadmap's items.
+
+    ``version`` is the roadmap version the snapshot was taken at and
+    ``root`` the hash of its root object (see services.versions).
+    """
+
+    __tablename__ = "roadmap_snapshots"
+
+    roadmap_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("roadmaps.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(Integer, primary_key=True)
+    root: Mapped[str] = mapped_column(String(64), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    total_items: Mapped[dict] = mapped_column(JsonType, nullable=False)
+    total_hours: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class RoadmapVersionObject(Base):
+    """One item of a roadmap's snapshots, keyed by the hash of its content.
+
+    ``data`` is the object as encoded by arcane-core's encode_object.
+    Objects are shared by every snapshot in which the item's subtree is
+    unchanged.
+    """
+
+    __tablename__ = "roadmap_version_objects"
+
+    roadmap_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("roadmaps.id", ondelete="CASCADE"), primary_key=True
+    )
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    data: Mapped[str] = mapped_column(Text, nullable=False)
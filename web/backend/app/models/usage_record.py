@@ -0,0 +1,37 @@
+"""UsageRecord model: the ledger generation quotas are charged against."""
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, UUIDPrimaryKey
+
+
+class UsageRecord(UUIDPrimaryKey, Base):
+    """Tokens one generation job or AI edit used, charged to a user.
+
+    Rows are only ever added, so deleting a roadmap doesn't give its
+    usage back; ``roadmap_id`` is cleared when the roadmap goes. ``model``
+    is None for usage backfilled from roadmaps, which don't record the
+    model that generated them (see services.quotas).
+    """
+
+    __tablename__ = "usage_records"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    roadmap_id: Mapped[uuid.UUID | None] = mapped_column(
+        Uuid, ForeignKey("roadmaps.id", ondelete="SET NULL"), nullable=True
+    )
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    model: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    input_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    output_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
@@ -186,6 +186,23 @@ async def get_export_job(
     return ExportJobResponse.model_validate(job)
 
 
+def _terminal_event(job: ExportJob) -> dict:
+    if job.status == "completed":
+        return {"event": "complete", "data": job.result or {}}
+    return {"event": "error", "data": {"message": job.error or "Export failed"}}
+
+
+async def _finished_event(job_id: uuid.UUID) -> dict | None:
+    """The terminal event of a job that has ended, read from the database."""
+    async with get_session_factory()() as session:
+        job = await session.get(ExportJob, job_id)
+    if job is None:
+        return {"event": "error", "data": {"message": "Export job was deleted"}}
+    if job.status in ("completed", "failed"):
+        return _terminal_event(job)
+    return None
+
+
 @router.get("/export-jobs/{job_id}/stream")
 async def stream_export_progress(
     job_id: uuid.UUID,
@@ -210,16 +227,8 @@ async def stream_export_progress(
 
     if job.status in ("completed", "failed"):
         async def _terminal_events():
-            if job.status == "completed":
-                yield {
-                    "event": "complete",
-                    "data": json.dumps(job.result or {}),
-                }
-            else:
-                yield {
-                    "event": "error",
-                    "data": json.dumps({"message": job.error or "Export failed"}),
-                }
+            event = _terminal_event(job)
+            yield {"event": event["event"], "data": json.dumps(event["data"])}
 
         return EventSourceResponse(_terminal_events())
 
@@ -231,14 +240,11 @@ async def stream_export_progress(
                     "event": "progress",
                     "data": json.dumps(job.progress),
                 }
-            while True:
-                event = await queue.get()
+            async for event in event_bus.events(queue, lambda: _finished_event(job_id)):
                 yield {
                     "event": event["event"],
                     "data": json.dumps(event["data"]),
                 }
-                if event["event"] in ("complete", "error"):
-                    break
         finally:
             event_bus.unsubscribe(job_id_str, queue)
 
@@ -19,6 +19,7 @@ from ..models.user import User
 from ..schemas.generation import GenerateRequest, GenerationJobResponse
 from ..services import event_bus
 from ..services.generation import run_generation, run_regeneration
+from ..services.quotas import generation_budget, get_user_usage
 from ..services.roadmap_items import (
     get_roadmap_for_user,
     ensure_roadmap_data,
@@ -40,7 +41,12 @@ async def start_generation(
     user: User = Depends(get_current_user),
     settings: Settings = Depends(get_settings),
 ):
-    """Start background AI generation for a roadmap."""
+    """Start background AI generation for a roadmap.
+
+    The job runs under what is left of the user's generation quotas. A
+    roadmap whose last job stopped at its budget ("partial") is resumed
+    rather than generated again.
+    """
     roadmap = await get_roadmap_for_user(db, roadmap_id, user)
 
     # Resolve context: body overrides stored context
@@ -71,6 +77,10 @@ async def start_generation(
             detail="A generation job is already active for this roadmap",
         )
 
+    usage = await get_user_usage(db, user.id, settings.model)
+    budget = generation_budget(settings, usage)
+    resume = roadmap.status == "partial" and bool(roadmap.roadmap_data)
+
     # Create job
     job = GenerationJob(roadmap_id=roadmap_id, status="pending")
     db.add(job)
@@ -88,9 +98,12 @@ async def start_generation(
             session_factory=session_factory,
             roadmap_record_id=str(roadmap_id),
             job_id=str(job.id),
+            user_id=str(user.id),
             context_dict=context,
             anthropic_api_key=settings.anthropic_api_key,
             model=settings.model,
+            budget=budget,
+            resume=resume,
         )
     )
 
@@ -153,6 +166,9 @@ async def regenerate_item_children(
             detail="Tasks have no children to regenerate",
         )
 
+    # Regeneration isn't budgeted, but is refused once a quota is used up
+    generation_budget(settings, await get_user_usage(db, user.id, settings.model))
+
     # Create job and launch background task
     job = GenerationJob(roadmap_id=roadmap_id, status="pending")
     db.add(job)
@@ -165,6 +181,7 @@ async def regenerate_item_children(
             session_factory=session_factory,
             roadmap_record_id=str(roadmap_id),
             job_id=str(job.id),
+            user_id=str(user.id),
             item_id=item_id,
             anthropic_api_key=settings.anthropic_api_key,
             model=settings.model,
@@ -199,6 +216,26 @@ async def get_generation_job(
     return GenerationJobResponse.model_validate(job)
 
 
+def _terminal_event(job: GenerationJob) -> dict:
+    if job.status == "completed":
+        return {
+            "event": "complete",
+            "data": {"roadmap_id": str(job.roadmap_id), "total_items": job.progress or {}},
+        }
+    return {"event": "error", "data": {"message": job.error or "Generation failed"}}
+
+
+async def _finished_event(job_id: uuid.UUID) -> dict | None:
+    """The terminal event of a job that has ended, read from the database."""
+    async with get_session_factory()() as session:
+        job = await session.get(GenerationJob, job_id)
+    if job is None:
+        return {"event": "error", "data": {"message": "Generation job was deleted"}}
+    if job.status in ("completed", "failed"):
+        return _terminal_event(job)
+    return None
+
+
 @router.get("/generation-jobs/{job_id}/stream")
 async def stream_generation_progress(
     job_id: uuid.UUID,
@@ -226,19 +263,8 @@ async def stream_generation_progress(
     if job.status in ("completed", "failed"):
 
         async def _terminal_events():
-            if job.status == "completed":
-                yield {
-                    "event": "complete",
-                    "data": json.dumps({
-                        "roadmap_id": str(job.roadmap_id),
-                        "total_items": job.progress or {},
-                    }),
-                }
-            else:
-                yield {
-                    "event": "error",
-                    "data": json.dumps({"message": job.error or "Generation failed"}),
-                }
+            event = _terminal_event(job)
+            yield {"event": event["event"], "data": json.dumps(event["data"])}
 
         return EventSourceResponse(_terminal_events())
 
@@ -253,15 +279,12 @@ async def stream_generation_progress(
                     "data": json.dumps(job.progress),
                 }
 
-            while True:
-                event = await queue.get()
+            # Ends after the terminal event
+            async for event in event_bus.events(queue, lambda: _finished_event(job_id)):
                 yield {
                     "event": event["event"],
                     "data": json.dumps(event["data"]),
                 }
-                # Stop after terminal events
-                if event["event"] in ("complete", "error"):
-                    break
         finally:
             event_bus.unsubscribe(job_id_str, queue)
 
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..deps import get_db
+from ..services import event_bus, metrics
 
 router = APIRouter()
 
@@ -20,3 +22,12 @@ async def health(db: AsyncSession = Depends(get_db)):
         "database": db_status,
         "version": "0.1.0",
     }
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Generation telemetry and SSE queue metrics in the Prometheus text format."""
+    return PlainTextResponse(
+        metrics.render_prometheus() + event_bus.render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
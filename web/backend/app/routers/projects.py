@@ -17,70 +17,11 @@ from ..schemas.projects import (
     RoadmapSummary,
 )
 from ..services.roadmap_items import get_project_for_user
+from ..services.roadmap_summary import SUMMARY_COLUMNS
 
 router = APIRouter()
 
 
-def _compute_roadmap_stats(
-    roadmap_data: dict | None,
-) -> tuple[dict[str, int] | None, float | None, int | None, int | None]:
-    """Walk the JSONB hierarchy and return (item_counts, completion_percent, hours_completed, hours_total)."""
-    if not roadmap_data:
-        return None, None, None, None
-
-    counts = {"milestones": 0, "epics": 0, "stories": 0, "tasks": 0}
-    total = 0
-    completed = 0
-    hours_total = 0
-    hours_completed = 0
-
-    for ms in roadmap_data.get("milestones", []):
-        counts["milestones"] += 1
-        total += 1
-        if ms.get("status") == "completed":
-            completed += 1
-        for ep in ms.get("epics", []):
-            counts["epics"] += 1
-            total += 1
-            if ep.get("status") == "completed":
-                completed += 1
-            for st in ep.get("stories", []):
-                counts["stories"] += 1
-                total += 1
-                if st.get("status") == "completed":
-                    completed += 1
-                for tk in st.get("tasks", []):
-                    counts["tasks"] += 1
-                    total += 1
-                    if tk.get("status") == "completed":
-                        completed += 1
-                    h = tk.get("estimated_hours", 0) or 0
-                    hours_total += h
-                    if tk.get("status") == "completed":
-                        hours_completed += h
-
-    if total == 0:
-        return counts, 0.0, 0, 0
-
-    pct = round(completed / total * 100, 1)
-    return counts, pct, hours_completed, hours_total
-
-
-def _roadmap_summary(r: RoadmapRecord) -> RoadmapSummary:
-    item_counts, completion_percent, hours_completed, hours_total = _compute_roadmap_stats(r.roadmap_data)
-    return RoadmapSummary(
-        id=r.id,
-        name=r.name,
-        status=r.status,
-        created_at=r.created_at,
-        updated_at=r.updated_at,
-        item_counts=item_counts,
-        completion_percent=completion_percent,
-        hours_completed=hours_completed,
-        hours_total=hours_total,
-    )
-
-
 @router.post("/", response_model=ProjectDetail, status_code=status.HTTP_201_CREATED)
 async def create_project(
     body: ProjectCreate,
@@ -139,7 +80,7 @@ async def get_project(
 ):
     result = await db.execute(
         select(Project)
-        .options(selectinload(Project.roadmaps))
+        .options(selectinload(Project.roadmaps).load_only(*SUMMARY_COLUMNS))
         .where(Project.id == project_id, Project.user_id == user.id)
     )
     project = result.scalar_one_or_none()
@@ -150,7 +91,7 @@ async def get_project(
         name=project.name,
         created_at=project.created_at,
         updated_at=project.updated_at,
-        roadmaps=[_roadmap_summary(r) for r in project.roadmaps],
+        roadmaps=[RoadmapSummary.model_validate(r) for r in project.roadmaps],
     )
 
 
@@ -168,7 +109,7 @@ async def update_project(
     # Load roadmaps for response
     result = await db.execute(
         select(Project)
-        .options(selectinload(Project.roadmaps))
+        .options(selectinload(Project.roadmaps).load_only(*SUMMARY_COLUMNS))
         .where(Project.id == project.id)
     )
     project = result.scalar_one()
@@ -177,7 +118,7 @@ async def update_project(
         name=project.name,
         created_at=project.created_at,
         updated_at=project.updated_at,
-        roadmaps=[_roadmap_summary(r) for r in project.roadmaps],
+        roadmaps=[RoadmapSummary.model_validate(r) for r in project.roadmaps],
     )
 
 
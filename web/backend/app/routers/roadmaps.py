@@ -1,9 +1,17 @@
+import asyncio
 import uuid
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, load_only
+
+from arcane.core.items import RoadmapIndex
+from arcane.core.models import DEFAULT_MODEL
+from arcane.core.planning import analyze_dependencies, summarize
+from arcane.core.planning.forecast import forecast_roadmap
+from arcane.core.utils import CostCalibration
 
 from ..config import Settings, get_settings
 from ..deps import get_current_user, get_db
@@ -13,27 +21,60 @@ from ..models.user import User
 from ..schemas.items import (
     AiEditRequest,
     AiEditResponse,
+    BatchCreate,
+    BatchDelete,
+    BatchOperation,
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
+    BatchUpdate,
     DeleteResponse,
     ItemCreate,
     ItemResponse,
+    ItemRow,
     ItemUpdate,
     ReorderRequest,
 )
 from ..schemas.projects import RoadmapSummary
-from ..schemas.roadmaps import MilestoneStats, RoadmapCreate, RoadmapDetail, RoadmapStats
+from ..schemas.roadmaps import (
+    MilestoneStats,
+    RoadmapCostEstimate,
+    RoadmapCreate,
+    RoadmapDetail,
+    RoadmapForecast,
+    RoadmapStats,
+    RoadmapVersion,
+    RoadmapVersionDetail,
+    RoadmapVersionDiff,
+    VersionChange,
+)
 from ..services.ai_edit import run_ai_edit
+from ..services.item_rows import list_item_rows, load_item_subtree, load_roadmap_data
+from ..services.quotas import generation_budget, get_user_usage, record_usage
 from ..services.roadmap_items import (
-    apply_item_update,
-    cascade_status_update,
     count_descendants,
-    create_child_item,
     ensure_roadmap_data,
     find_item_by_id,
     find_parent_chain,
     get_project_for_user,
     get_roadmap_for_user,
-    reorder_children,
-    save_roadmap_data,
+)
+from ..services.roadmap_patch import RoadmapPatch, apply_edit
+from ..services.roadmap_responses import (
+    SerializedResponse,
+    etag_for,
+    etag_matches,
+    get_roadmap_response_cache,
+    if_match_version,
+    not_modified,
+)
+from ..services.roadmap_summary import SUMMARY_COLUMNS
+from ..services.versions import (
+    checkout_data,
+    diff_roots,
+    find_snapshot,
+    list_snapshots,
+    record_version,
 )
 
 router = APIRouter()
@@ -75,6 +116,7 @@ async def list_roadmaps(
     await get_project_for_user(db, project_id, user)
     result = await db.execute(
         select(RoadmapRecord)
+        .options(load_only(*SUMMARY_COLUMNS))
         .where(RoadmapRecord.project_id == project_id)
         .order_by(RoadmapRecord.created_at.desc())
     )
@@ -82,14 +124,63 @@ async def list_roadmaps(
     return [RoadmapSummary.model_validate(r) for r in roadmaps]
 
 
+def _projection(fields: str | None, depth: int | None) -> tuple[frozenset[str] | None, str]:
+    """Parse a fields= list; also return the cache variant for fields and depth."""
+    if fields is None and depth is None:
+        return None, ""
+    selected = frozenset(fields.split(",")) if fields is not None else None
+    variant = f"fields={','.join(sorted(selected)) if selected is not None else '*'};depth={depth}"
+    return selected, variant
+
+
+FIELDS_QUERY = Query(
+    None,
+    pattern=r"^\w+(,\w+)*$",
+    description="Comma-separated item fields to return; id and child lists are always kept",
+)
+
+
 @router.get("/roadmaps/{roadmap_id}", response_model=RoadmapDetail)
 async def get_roadmap(
     roadmap_id: uuid.UUID,
+    request: Request,
+    fields: str | None = FIELDS_QUERY,
+    depth: int | None = Query(
+        None, ge=1, le=4, description="Item levels to return, 1 for milestones only"
+    ),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
+    settings: Settings = Depends(get_settings),
 ):
-    roadmap = await get_roadmap_for_user(db, roadmap_id, user)
-    return RoadmapDetail.model_validate(roadmap)
+    # Items come from roadmap_items; the document itself isn't loaded
+    roadmap = await get_roadmap_for_user(
+        db, roadmap_id, user, defer(RoadmapRecord.roadmap_data)
+    )
+    selected, variant = _projection(fields, depth)
+    version = roadmap.version
+    etag = etag_for(version, variant)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    cache = get_roadmap_response_cache()
+    serialized = cache.get(roadmap.id, version, variant)
+    if serialized is None:
+        detail = RoadmapDetail(
+            id=roadmap.id,
+            project_id=roadmap.project_id,
+            name=roadmap.name,
+            status=roadmap.status,
+            context=roadmap.context,
+            roadmap_data=await load_roadmap_data(db, roadmap.id, selected, depth),
+            version=roadmap.version,
+            created_at=roadmap.created_at,
+            updated_at=roadmap.updated_at,
+        )
+        serialized = SerializedResponse(
+            detail.model_dump_json().encode(), compress=settings.roadmap_response_gzip
+        )
+        cache.put(roadmap.id, version, serialized, variant)
+    return serialized.response(etag, request.headers.get("accept-encoding"))
 
 
 @router.delete("/roadmaps/{roadmap_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -100,6 +191,7 @@ async def delete_roadmap(
 ):
     roadmap = await get_roadmap_for_user(db, roadmap_id, user)
     await db.delete(roadmap)
+    get_roadmap_response_cache().discard(roadmap_id)
 
 
 @router.get("/roadmaps/{roadmap_id}/stats", response_model=RoadmapStats)
@@ -111,95 +203,262 @@ async def get_roadmap_stats(
     roadmap = await get_roadmap_for_user(db, roadmap_id, user)
     data = ensure_roadmap_data(roadmap)
 
-    today = date.today()
-    total_hours = 0
-    total_hours_completed = 0
-    milestone_stats: list[MilestoneStats] = []
-
-    for ms in data.get("milestones", []):
-        ms_hours = 0
-        ms_hours_completed = 0
-        ms_total_items = 0
-        ms_completed_items = 0
-        epic_count = 0
-        story_count = 0
-        task_count = 0
-
-        for ep in ms.get("epics", []):
-            epic_count += 1
-            for st in ep.get("stories", []):
-                story_count += 1
-                for tk in st.get("tasks", []):
-                    task_count += 1
-                    ms_total_items += 1
-                    h = tk.get("estimated_hours", 0) or 0
-                    ms_hours += h
-                    if tk.get("status") == "completed":
-                        ms_completed_items += 1
-                        ms_hours_completed += h
-
-        target_date = ms.get("target_date")
-        is_overdue = False
-        if target_date and ms.get("status") != "completed":
-            try:
-                td = date.fromisoformat(target_date)
-                is_overdue = td < today
-            except (ValueError, TypeError):
-                pass
-
-        milestone_stats.append(MilestoneStats(
-            id=ms.get("id", ""),
-            name=ms.get("name", ""),
-            status=ms.get("status", "not_started"),
-            target_date=target_date,
-            is_overdue=is_overdue,
-            total_items=ms_total_items,
-            completed_items=ms_completed_items,
-            hours_total=ms_hours,
-            hours_completed=ms_hours_completed,
-            epic_count=epic_count,
-            story_count=story_count,
-            task_count=task_count,
-        ))
-
-        total_hours += ms_hours
-        total_hours_completed += ms_hours_completed
-
-    completion_percent = 0.0
-    if total_hours > 0:
-        completion_percent = round(total_hours_completed / total_hours * 100, 1)
+    summary = summarize(data)
+
+    analysis = analyze_dependencies(data)
 
     return RoadmapStats(
-        hours_total=total_hours,
-        hours_completed=total_hours_completed,
-        completion_percent=completion_percent,
-        milestones=milestone_stats,
+        hours_total=summary.hours_total,
+        hours_completed=summary.hours_completed,
+        completion_percent=summary.completion_percent,
+        milestones=[
+            MilestoneStats.model_validate(m, from_attributes=True)
+            for m in summary.milestones
+        ],
+        hours_by_status=summary.hours_by_status,
+        hours_by_priority=summary.hours_by_priority,
+        hours_by_label=summary.hours_by_label,
+        overdue_tasks=summary.overdue_tasks,
+        critical_path_hours=analysis.length_hours,
+        critical_path=analysis.critical_path,
+        dependency_problems=analysis.problems(),
+    )
+
+
+@router.get("/roadmaps/{roadmap_id}/forecast", response_model=RoadmapForecast)
+async def get_roadmap_forecast(
+    roadmap_id: uuid.UUID,
+    simulations: int = Query(10_000, ge=100, le=50_000),
+    team_size: int | None = Query(None, ge=1, le=100),
+    start: date | None = None,
+    hours_per_day: float = Query(6.0, gt=0, le=24),
+    seed: int | None = None,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Monte Carlo forecast of milestone finish dates for the remaining work."""
+    roadmap = await get_roadmap_for_user(db, roadmap_id, user)
+    data = roadmap.roadmap_data or {"milestones": []}
+    context = roadmap.context or {}
+    try:
+        # CPU-bound; keep it off the event loop
+        forecast = await asyncio.to_thread(
+            forecast_roadmap,
+            data,
+            team_size=team_size or context.get("team_size"),
+            simulations=simulations,
+            start=start,
+            timeline=context.get("timeline"),
+            hours_per_day=hours_per_day,
+            seed=seed,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot forecast: {e}",
+        ) from e
+    return RoadmapForecast.model_validate(forecast)
+
+
+@router.get("/roadmaps/{roadmap_id}/cost-estimate", response_model=RoadmapCostEstimate)
+async def get_roadmap_cost_estimate(
+    roadmap_id: uuid.UUID,
+    model: str = DEFAULT_MODEL,
+    confidence: float = Query(0.8, gt=0, lt=1),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Estimate the AI cost of generating (the rest of) a roadmap.
+
+    Tokens per call and fan-out are calibrated from the user's other
+    complete roadmaps; items the roadmap already has replace the expected
+    fan-out.
+    """
+    roadmap = await get_roadmap_for_user(db, roadmap_id, user)
+    result = await db.execute(
+        select(RoadmapRecord.roadmap_data)
+        .join(Project)
+        .where(
+            Project.user_id == user.id,
+            RoadmapRecord.id != roadmap_id,
+            RoadmapRecord.roadmap_data.is_not(None),
+        )
+    )
+    calibration = CostCalibration.from_roadmaps(result.scalars())
+    estimate = calibration.estimate(
+        model, roadmap=roadmap.roadmap_data or {"milestones": []}, confidence=confidence
+    )
+    return RoadmapCostEstimate(
+        model=model,
+        estimated_cost_usd=estimate.estimated_cost_usd,
+        spent_cost_usd=estimate.spent_cost_usd,
+        low_cost_usd=estimate.low_cost_usd,
+        high_cost_usd=estimate.high_cost_usd,
+        confidence=estimate.confidence,
+        api_calls=estimate.api_calls,
+        input_tokens=estimate.input_tokens,
+        output_tokens=estimate.output_tokens,
+        samples=estimate.samples,
+    )
+
+
+# --- Version endpoints ---
+
+
+@router.get("/roadmaps/{roadmap_id}/versions", response_model=list[RoadmapVersion])
+async def list_versions(
+    roadmap_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    roadmap = await get_roadmap_for_user(db, roadmap_id, user, defer(RoadmapRecord.roadmap_data))
+    snapshots = await list_snapshots(db, roadmap.id)
+    return [RoadmapVersion.model_validate(s) for s in snapshots]
+
+
+@router.get("/roadmaps/{roadmap_id}/versions/diff", response_model=RoadmapVersionDiff)
+async def diff_versions(
+    roadmap_id: uuid.UUID,
+    from_version: int | None = None,
+    to_version: int | None = None,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Compare two versions (default: the one before to_version against it; latest)."""
+    roadmap = await get_roadmap_for_user(db, roadmap_id, user, defer(RoadmapRecord.roadmap_data))
+    new = await find_snapshot(db, roadmap.id, to_version)
+    old = None
+    if new is not None:
+        old = await find_snapshot(db, roadmap.id, from_version, before=new.version)
+    if old is None or new is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Version not found")
+    changes = await diff_roots(db, roadmap.id, old.root, new.root)
+    return RoadmapVersionDiff(
+        from_version=old.version,
+        to_version=new.version,
+        changes=[VersionChange.model_validate(c) for c in changes],
+    )
+
+
+@router.get(
+    "/roadmaps/{roadmap_id}/versions/{version}",
+    response_model=RoadmapVersionDetail,
+)
+async def get_version(
+    roadmap_id: uuid.UUID,
+    version: int,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    roadmap = await get_roadmap_for_user(db, roadmap_id, user, defer(RoadmapRecord.roadmap_data))
+    snapshot = await find_snapshot(db, roadmap.id, version)
+    if snapshot is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Version not found")
+    data = await checkout_data(db, roadmap.id, snapshot.root)
+    return RoadmapVersionDetail(
+        **RoadmapVersion.model_validate(snapshot).model_dump(),
+        roadmap_data={"milestones": data.get("milestones", [])},
     )
 
 
 # --- Item endpoints ---
 
 
+async def _record_edit(db: AsyncSession, patch: RoadmapPatch, message: str) -> None:
+    """Commit an item edit, then record the new version in the history."""
+    await db.commit()
+    await record_version(db, patch.roadmap, message, patch)
+
+
+def _item_type(patch: RoadmapPatch, item_id: str) -> str:
+    result = find_item_by_id(patch.data, item_id, patch.index)
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
+    return result[3]
+
+
+@router.get("/roadmaps/{roadmap_id}/items", response_model=list[ItemRow])
+async def list_items(
+    roadmap_id: uuid.UUID,
+    item_status: str | None = Query(None, alias="status"),
+    item_type: str | None = Query(None, pattern=r"^(milestone|epic|story|task)$"),
+    parent_id: str | None = Query(None, description="Parent item ID, or 'root' for milestones"),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """List items (without their children), filtered by status, type or parent."""
+    roadmap = await get_roadmap_for_user(
+        db, roadmap_id, user, defer(RoadmapRecord.roadmap_data)
+    )
+    rows = await list_item_rows(db, roadmap.id, item_status, item_type, parent_id)
+    return [
+        ItemRow(
+            item_id=row.id,
+            item_type=row.type,
+            parent_id=row.parent_id,
+            position=row.position,
+            status=row.status,
+            priority=row.priority,
+            estimated_hours=row.estimated_hours,
+            data=row.payload,
+        )
+        for row in rows
+    ]
+
+
+@router.get("/roadmaps/{roadmap_id}/items/{item_id}", response_model=ItemResponse)
+async def get_item(
+    roadmap_id: uuid.UUID,
+    item_id: str,
+    request: Request,
+    response: Response,
+    fields: str | None = FIELDS_QUERY,
+    depth: int | None = Query(
+        None, ge=0, le=3, description="Levels below the item to return, 0 for the item alone"
+    ),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Return an item with its subtree, for loading branches on demand."""
+    roadmap = await get_roadmap_for_user(
+        db, roadmap_id, user, defer(RoadmapRecord.roadmap_data)
+    )
+    selected, variant = _projection(fields, depth)
+    etag = etag_for(roadmap.version, f"item={item_id};{variant}")
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    subtree = await load_item_subtree(db, roadmap.id, item_id, selected, depth)
+    if subtree is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
+    item_type, item = subtree
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return ItemResponse(item_id=item_id, item_type=item_type, data=item)
+
+
 @router.patch("/roadmaps/{roadmap_id}/items/{item_id}", response_model=ItemResponse)
 async def update_item(
     roadmap_id: uuid.UUID,
     item_id: str,
     body: ItemUpdate,
+    response: Response,
+    if_match: str | None = Header(None),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    roadmap = await get_roadmap_for_user(db, roadmap_id, user)
-    data = ensure_roadmap_data(roadmap)
-    result = find_item_by_id(data, item_id)
-    if result is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
-    item, _, _, item_type = result
     updates = body.model_dump(exclude_unset=True)
-    apply_item_update(item, updates)
-    cascaded = []
-    if "status" in updates:
-        cascaded = cascade_status_update(data, item_id)
-    save_roadmap_data(roadmap, data)
+
+    def edit(patch: RoadmapPatch):
+        item_type = _item_type(patch, item_id)
+        item = patch.update(item_id, updates)
+        cascaded = patch.cascade_status(item_id) if "status" in updates else []
+        return item, item_type, cascaded
+
+    patch, (item, item_type, cascaded) = await apply_edit(
+        db, roadmap_id, user, edit, if_match_version(if_match)
+    )
+    await _record_edit(db, patch, f"Update {item_type} {item_id}")
+    response.headers["ETag"] = etag_for(patch.roadmap.version)
     return ItemResponse(item_id=item["id"], item_type=item_type, data=item, cascaded=cascaded)
 
 
@@ -207,18 +466,21 @@ async def update_item(
 async def delete_item(
     roadmap_id: uuid.UUID,
     item_id: str,
+    response: Response,
+    if_match: str | None = Header(None),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    roadmap = await get_roadmap_for_user(db, roadmap_id, user)
-    data = ensure_roadmap_data(roadmap)
-    result = find_item_by_id(data, item_id)
-    if result is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
-    item, parent_list, index, item_type = result
-    children_count = count_descendants(item, item_type)
-    parent_list.pop(index)
-    save_roadmap_data(roadmap, data)
+    def edit(patch: RoadmapPatch):
+        item_type = _item_type(patch, item_id)
+        item = patch.remove(item_id)
+        return item_type, count_descendants(item, item_type)
+
+    patch, (item_type, children_count) = await apply_edit(
+        db, roadmap_id, user, edit, if_match_version(if_match)
+    )
+    await _record_edit(db, patch, f"Delete {item_type} {item_id}")
+    response.headers["ETag"] = etag_for(patch.roadmap.version)
     return DeleteResponse(
         deleted_id=item_id,
         deleted_type=item_type,
@@ -235,13 +497,20 @@ async def add_child_item(
     roadmap_id: uuid.UUID,
     parent_id: str,
     body: ItemCreate,
+    response: Response,
+    if_match: str | None = Header(None),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    roadmap = await get_roadmap_for_user(db, roadmap_id, user)
-    data = ensure_roadmap_data(roadmap)
-    new_item = create_child_item(parent_id, body.item_type, body.data, data)
-    save_roadmap_data(roadmap, data)
+    patch, new_item = await apply_edit(
+        db,
+        roadmap_id,
+        user,
+        lambda patch: patch.add_child(parent_id, body.item_type, body.data),
+        if_match_version(if_match),
+    )
+    await _record_edit(db, patch, f"Add {body.item_type} {new_item['id']}")
+    response.headers["ETag"] = etag_for(patch.roadmap.version)
     return ItemResponse(item_id=new_item["id"], item_type=body.item_type, data=new_item)
 
 
@@ -249,16 +518,92 @@ async def add_child_item(
 async def reorder_items(
     roadmap_id: uuid.UUID,
     body: ReorderRequest,
+    response: Response,
+    if_match: str | None = Header(None),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    roadmap = await get_roadmap_for_user(db, roadmap_id, user)
-    data = ensure_roadmap_data(roadmap)
-    reorder_children(body.parent_id, body.item_ids, data)
-    save_roadmap_data(roadmap, data)
+    patch, _ = await apply_edit(
+        db,
+        roadmap_id,
+        user,
+        lambda patch: patch.reorder(body.parent_id, body.item_ids),
+        if_match_version(if_match),
+    )
+    await _record_edit(db, patch, f"Reorder children of {body.parent_id}")
+    response.headers["ETag"] = etag_for(patch.roadmap.version)
     return {"status": "ok"}
 
 
+def _apply_operation(
+    patch: RoadmapPatch, operation: BatchOperation, status_changed: list[str]
+) -> BatchResult:
+    if isinstance(operation, BatchUpdate):
+        item_type = _item_type(patch, operation.item_id)
+        updates = operation.fields.model_dump(exclude_unset=True)
+        item = patch.update(operation.item_id, updates)
+        if "status" in updates:
+            status_changed.append(operation.item_id)
+        return BatchResult(op=operation.op, item_id=item["id"], item_type=item_type, data=item)
+    if isinstance(operation, BatchCreate):
+        new_item = patch.add_child(operation.parent_id, operation.item_type, operation.data)
+        return BatchResult(
+            op=operation.op, item_id=new_item["id"], item_type=operation.item_type, data=new_item
+        )
+    if isinstance(operation, BatchDelete):
+        item_type = _item_type(patch, operation.item_id)
+        item = patch.remove(operation.item_id)
+        return BatchResult(
+            op=operation.op,
+            item_id=operation.item_id,
+            item_type=item_type,
+            children_deleted=count_descendants(item, item_type),
+        )
+    patch.reorder(operation.parent_id, operation.item_ids)
+    parent_type = (
+        "root" if operation.parent_id == "root"
+        else patch.index.entry(operation.parent_id).item_type
+    )
+    return BatchResult(op=operation.op, item_id=operation.parent_id, item_type=parent_type)
+
+
+@router.post("/roadmaps/{roadmap_id}/items:batch", response_model=BatchResponse)
+async def batch_items(
+    roadmap_id: uuid.UUID,
+    body: BatchRequest,
+    response: Response,
+    if_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Apply item updates, creates, deletes and reorders as one write.
+
+    Operations run in order, each seeing the ones before it; an item
+    created with an ``id`` in its data can be targeted later in the
+    batch. Statuses cascade once at the end, to the ancestors of every
+    item whose status was set. If any operation fails, none is applied
+    and the error names the operation's position.
+    """
+    def edit(patch: RoadmapPatch):
+        results = []
+        status_changed: list[str] = []
+        for position, operation in enumerate(body.operations):
+            try:
+                results.append(_apply_operation(patch, operation, status_changed))
+            except HTTPException as exc:
+                raise HTTPException(
+                    status_code=exc.status_code, detail=f"Operation {position}: {exc.detail}"
+                ) from exc
+        return results, patch.cascade_statuses(status_changed)
+
+    patch, (results, cascaded) = await apply_edit(
+        db, roadmap_id, user, edit, if_match_version(if_match)
+    )
+    await _record_edit(db, patch, f"Batch of {len(results)} item edits")
+    response.headers["ETag"] = etag_for(patch.roadmap.version)
+    return BatchResponse(results=results, cascaded=cascaded)
+
+
 @router.post(
     "/roadmaps/{roadmap_id}/items/{item_id}/ai-edit",
     response_model=AiEditResponse,
@@ -271,7 +616,10 @@ async def ai_edit_item(
     user: User = Depends(get_current_user),
     settings: Settings = Depends(get_settings),
 ):
-    """Edit a roadmap item using AI based on a natural language command."""
+    """Edit a roadmap item using AI based on a natural language command.
+
+    Refused once the user's generation quota is used up, and charged to it.
+    """
     roadmap = await get_roadmap_for_user(db, roadmap_id, user)
 
     if not roadmap.context:
@@ -287,7 +635,8 @@ async def ai_edit_item(
         )
 
     data = ensure_roadmap_data(roadmap)
-    result = find_item_by_id(data, item_id)
+    index = RoadmapIndex(data)
+    result = find_item_by_id(data, item_id, index)
     if result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -295,10 +644,11 @@ async def ai_edit_item(
         )
     item, _, _, item_type = result
 
-    parent_context = find_parent_chain(data, item_id)
+    parent_context = find_parent_chain(data, item_id, index)
     original = dict(item)
+    generation_budget(settings, await get_user_usage(db, user.id, settings.model))
 
-    edited = await run_ai_edit(
+    edited, usage = await run_ai_edit(
         item=item,
         item_type=item_type,
         command=body.command,
@@ -307,11 +657,22 @@ async def ai_edit_item(
         anthropic_api_key=settings.anthropic_api_key,
         model=settings.model,
     )
-
-    # Apply edited fields back into the roadmap data
-    for key, value in edited.items():
-        item[key] = value
-    save_roadmap_data(roadmap, data)
+    # Committed now so a conflicting write below doesn't undo the charge
+    record_usage(db, user.id, "ai_edit", settings.model, usage, roadmap_id)
+    await db.commit()
+
+    # Apply edited fields back into the roadmap data; children are unchanged.
+    # The AI call takes a while, so this rebases onto whatever was written
+    # meanwhile, unless the item itself was changed.
+    changes = {k: v for k, v in edited.items() if original.get(k) != v}
+    patch, _ = await apply_edit(
+        db,
+        roadmap_id,
+        user,
+        lambda patch: patch.update(item_id, changes),
+        expected_version=roadmap.version,
+    )
+    await _record_edit(db, patch, f"AI edit {item_type} {item_id}")
 
     return AiEditResponse(
         item_id=item_id,
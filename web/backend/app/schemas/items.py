@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -40,12 +40,65 @@ class ItemResponse(BaseModel):
     cascaded: list[CascadedUpdate] = []
 
 
+class ItemRow(BaseModel):
+    item_id: str
+    item_type: str
+    parent_id: str | None
+    position: int
+    status: str
+    priority: str | None
+    estimated_hours: float | None
+    data: dict[str, Any]
+
+
 class DeleteResponse(BaseModel):
     deleted_id: str
     deleted_type: str
     children_deleted: int
 
 
+class BatchUpdate(BaseModel):
+    op: Literal["update"]
+    item_id: str
+    fields: ItemUpdate
+
+
+class BatchCreate(ItemCreate):
+    op: Literal["create"]
+    parent_id: str = Field(description="Parent item ID, or 'root' for milestones")
+
+
+class BatchDelete(BaseModel):
+    op: Literal["delete"]
+    item_id: str
+
+
+class BatchReorder(ReorderRequest):
+    op: Literal["reorder"]
+
+
+BatchOperation = Annotated[
+    BatchUpdate | BatchCreate | BatchDelete | BatchReorder, Field(discriminator="op")
+]
+
+
+class BatchRequest(BaseModel):
+    operations: list[BatchOperation] = Field(min_length=1, max_length=1000)
+
+
+class BatchResult(BaseModel):
+    op: str
+    item_id: str
+    item_type: str
+    data: dict[str, Any] | None = None
+    children_deleted: int | None = None
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchResult]
+    cascaded: list[CascadedUpdate] = []
+
+
 class AiEditRequest(BaseModel):
     command: str = Field(min_length=1, max_length=2000)
 
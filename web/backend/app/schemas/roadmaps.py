@@ -1,5 +1,5 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -17,6 +17,7 @@ class RoadmapDetail(BaseModel):
     status: str
     context: dict[str, Any] | None
     roadmap_data: dict[str, Any] | None
+    version: int
     created_at: datetime
     updated_at: datetime
 
@@ -43,3 +44,85 @@ class RoadmapStats(BaseModel):
     hours_completed: int
     completion_percent: float
     milestones: list[MilestoneStats]
+    # Task hours keyed by status, priority and label (labels include
+    # those set on the task's story, epic and milestone)
+    hours_by_status: dict[str, float] = {}
+    hours_by_priority: dict[str, float] = {}
+    hours_by_label: dict[str, float] = {}
+    # Unfinished tasks whose scheduled due_date has passed
+    overdue_tasks: list[str] = []
+    # Longest chain of task prerequisites, assuming unlimited parallelism
+    critical_path_hours: float = 0
+    critical_path: list[str] = []
+    dependency_problems: list[str] = []
+
+
+class MilestoneForecast(BaseModel):
+    id: str
+    name: str
+    # Keyed by percentile (50, 80, 95)
+    hours: dict[int, float]
+    dates: dict[int, date]
+
+    model_config = {"from_attributes": True}
+
+
+class RoadmapForecast(BaseModel):
+    start: date
+    team_size: int
+    simulations: int
+    hours_per_day: float
+    milestones: list[MilestoneForecast]
+    completion: MilestoneForecast
+    deadline: date | None
+    on_time_probability: float | None
+
+    model_config = {"from_attributes": True}
+
+
+class RoadmapCostEstimate(BaseModel):
+    model: str
+    # Total cost, including what the roadmap's recorded usage already spent
+    estimated_cost_usd: float
+    spent_cost_usd: float
+    # Interval at the given confidence; null with fewer than two samples
+    low_cost_usd: float | None
+    high_cost_usd: float | None
+    confidence: float | None
+    # Remaining API calls and tokens
+    api_calls: int
+    input_tokens: int
+    output_tokens: int
+    # Complete roadmaps of the user the estimate was calibrated from
+    samples: int
+
+
+class RoadmapVersion(BaseModel):
+    version: int
+    root: str
+    created_at: datetime
+    message: str
+    total_items: dict[str, int]
+    total_hours: int
+
+    model_config = {"from_attributes": True}
+
+
+class RoadmapVersionDetail(RoadmapVersion):
+    roadmap_data: dict[str, Any]
+
+
+class VersionChange(BaseModel):
+    kind: str
+    item_type: str
+    item_id: str
+    name: str
+    fields: list[str]
+
+    model_config = {"from_attributes": True}
+
+
+class RoadmapVersionDiff(BaseModel):
+    from_version: int
+    to_version: int
+    changes: list[VersionChange]
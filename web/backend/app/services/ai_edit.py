@@ -8,11 +8,13 @@ import json
 
 from pydantic import BaseModel
 
-from arcane.core.clients import create_client
+from arcane.core.clients import UsageStats, create_client
 from arcane.core.items.base import Priority
 from arcane.core.items.task import Task
 from arcane.core.templates.loader import TemplateLoader
 
+from . import metrics
+
 
 # --- Response models for each item type ---
 
@@ -62,11 +64,11 @@ async def run_ai_edit(
     parent_context: dict | None,
     anthropic_api_key: str,
     model: str,
-) -> dict:
+) -> tuple[dict, UsageStats]:
     """Edit a roadmap item using AI based on a natural language command.
 
     Returns a new dict with the AI-edited fields merged into the original item,
-    preserving id, status, and child collections.
+    preserving id, status, and child collections, and the tokens the call used.
     """
     client = create_client("anthropic", api_key=anthropic_api_key, model=model)
     templates = TemplateLoader()
@@ -84,12 +86,15 @@ async def run_ai_edit(
     )
 
     response_model = RESPONSE_MODELS[item_type]
-    result = await client.generate(
-        system_prompt=system_prompt,
-        user_prompt=user_prompt,
-        response_model=response_model,
-        level=item_type,
-    )
+    try:
+        result = await client.generate(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            response_model=response_model,
+            level=item_type,
+        )
+    finally:
+        metrics.record_client(client)
 
     # Merge AI result into a copy of the original, preserving protected keys
     edited = dict(item)
@@ -101,4 +106,4 @@ async def run_ai_edit(
                 value = value.value
             edited[key] = value
 
-    return edited
+    return edited, client.usage
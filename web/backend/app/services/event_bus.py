@@ -1,22 +1,184 @@
-"""In-memory pub/sub event bus for SSE streaming.
+"""Pub/sub event bus for SSE streaming.
 
 Each generation job can have multiple SSE subscribers (browser tabs).
 Events are published by WebStorageAdapter and consumed by the SSE endpoint.
+
+Subscribers are bounded queues (Subscription) in the worker serving
+their SSE request, so a slow or stalled tab can't hold a job's every
+event in memory. publish() fills this worker's queues, then hands the
+event to the configured backend to reach the other workers:
+
+- "memory": no backend; only this worker sees events. Enough for one
+  worker, tests and SQLite.
+- "postgres": events go out with NOTIFY on one channel that every
+  worker LISTENs to, so the SSE request and the job can run on
+  different workers. NOTIFY payloads are capped at 8000 bytes; larger
+  events are split into chunks, sent in one transaction and put back
+  together by the listener.
+
+start() picks the backend from settings at app startup; until then,
+events stay in process.
 """
 
 import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import time
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from ..config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Events that end a job's stream
+TERMINAL = frozenset({"complete", "error"})
+# Events a subscriber always receives, however far behind it is
+ALWAYS_DELIVERED = TERMINAL | {"budget_exceeded"}
+# Idle time after which a stream checks whether its job ended unseen
+IDLE_CHECK_SECONDS = 15.0
+
+
+class Subscription:
+    """One subscriber's pending events, bounded and coalesced.
+
+    Used like an asyncio.Queue with a single consumer. While events wait:
+
+    - a new ``progress`` replaces the pending one, which it supersedes;
+    - ``item_created`` events arriving within batch_seconds of each
+      other are merged into one ``items_created`` event whose data is
+      ``{"items": [...]}``;
+    - past max_events pending (counting each batched item), the oldest
+      event is dropped, except those in ALWAYS_DELIVERED;
+    - nothing is queued after a terminal event.
+
+    A subscriber that keeps up sees every event as published.
+    """
+
+    def __init__(self, max_events: int = 256, batch_seconds: float = 0.25):
+        self.max_events = max_events
+        self.batch_seconds = batch_seconds
+        # (time queued, event); items_created batches are our own dicts
+        self._events: deque[tuple[float, dict]] = deque()
+        self._size = 0
+        self._ready = asyncio.Event()
+        self.published = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_pending = 0
+
+    def put_nowait(self, event: dict) -> None:
+        self.published += 1
+        if self._events and self._events[-1][1]["event"] in TERMINAL:
+            # The stream ends there; nothing after it would be read
+            return
+        now = time.monotonic()
+        kind = event["event"]
+        if kind == "progress":
+            for i, (_, pending) in enumerate(self._events):
+                if pending["event"] == "progress":
+                    del self._events[i]
+                    self._size -= 1
+                    self.coalesced += 1
+                    break
+        elif kind == "item_created" and self._events:
+            queued_at, last = self._events[-1]
+            if last["event"] in ("item_created", "items_created") and (
+                now - queued_at < self.batch_seconds
+            ):
+                if last["event"] == "item_created":
+                    last = {"event": "items_created", "data": {"items": [last["data"]]}}
+                    self._events[-1] = (queued_at, last)
+                last["data"]["items"].append(event["data"])
+                self._size += 1
+                self.coalesced += 1
+                self._make_room()
+                return
+        self._events.append((now, event))
+        self._size += 1
+        self._make_room()
+        self._ready.set()
+
+    def _make_room(self) -> None:
+        while self._size > self.max_events:
+            for i, (_, pending) in enumerate(self._events):
+                if pending["event"] not in ALWAYS_DELIVERED:
+                    del self._events[i]
+                    weight = _weight(pending)
+                    self._size -= weight
+                    self.dropped += weight
+                    break
+            else:
+                break
+        self.max_pending = max(self.max_pending, self._size)
+
+    def get_nowait(self) -> dict:
+        if not self._events:
+            raise asyncio.QueueEmpty
+        _, event = self._events.popleft()
+        weight = _weight(event)
+        self._size -= weight
+        self.delivered += weight
+        return event
+
+    async def get(self) -> dict:
+        while not self._events:
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
 
-_subscribers: dict[str, list[asyncio.Queue]] = {}
+    def empty(self) -> bool:
+        return not self._events
 
+    def qsize(self) -> int:
+        return len(self._events)
 
-def subscribe(job_id: str) -> asyncio.Queue:
+    @property
+    def lag_seconds(self) -> float:
+        """How long the oldest pending event has waited."""
+        if not self._events:
+            return 0.0
+        return time.monotonic() - self._events[0][0]
+
+    def stats(self) -> dict:
+        return {
+            "pending": self._size,
+            "max_pending": self.max_pending,
+            "lag_seconds": round(self.lag_seconds, 3),
+            "published": self.published,
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
+
+
+def _weight(event: dict) -> int:
+    if event["event"] == "items_created":
+        return len(event["data"]["items"])
+    return 1
+
+
+_subscribers: dict[str, list[Subscription]] = {}
+# Counts from subscriptions that have ended
+_retired = {"coalesced": 0, "dropped": 0}
+
+
+def subscribe(job_id: str) -> Subscription:
     """Create and register a new subscriber queue for a job."""
-    queue: asyncio.Queue = asyncio.Queue()
+    settings = get_settings()
+    queue = Subscription(settings.sse_queue_size, settings.sse_batch_seconds)
     _subscribers.setdefault(job_id, []).append(queue)
     return queue
 
 
-def unsubscribe(job_id: str, queue: asyncio.Queue) -> None:
+def unsubscribe(job_id: str, queue: Subscription) -> None:
     """Remove a subscriber queue. Cleans up empty entries."""
     queues = _subscribers.get(job_id)
     if queues is None:
@@ -25,12 +187,29 @@ def unsubscribe(job_id: str, queue: asyncio.Queue) -> None:
         queues.remove(queue)
     except ValueError:
         pass
+    else:
+        _retire(job_id, queue)
     if not queues:
         _subscribers.pop(job_id, None)
 
 
+def _retire(job_id: str, queue: Subscription) -> None:
+    _retired["coalesced"] += queue.coalesced
+    _retired["dropped"] += queue.dropped
+    if queue.dropped:
+        logger.info(
+            "SSE subscriber for job %s fell behind and missed %d events", job_id, queue.dropped
+        )
+
+
 def publish(job_id: str, event: dict) -> None:
     """Publish an event to all subscribers for a job (non-blocking)."""
+    _deliver(job_id, event)
+    if _backend is not None:
+        _backend.send(job_id, event)
+
+
+def _deliver(job_id: str, event: dict) -> None:
     queues = _subscribers.get(job_id)
     if not queues:
         return
@@ -40,4 +219,260 @@ def publish(job_id: str, event: dict) -> None:
 
 def cleanup(job_id: str) -> None:
     """Remove all subscribers for a job (called on completion)."""
-    _subscribers.pop(job_id, None)
+    for queue in _subscribers.pop(job_id, []):
+        _retire(job_id, queue)
+
+
+async def events(
+    queue: Subscription,
+    finished: Callable[[], Awaitable[dict | None]],
+    idle_seconds: float = IDLE_CHECK_SECONDS,
+) -> AsyncIterator[dict]:
+    """Yield a subscriber's events, ending after a terminal one.
+
+    A job can end without its terminal event reaching the queue: just
+    before the subscription, or while this worker's listener was
+    reconnecting. So after idle_seconds without events, finished() is
+    asked for the terminal event of an ended job (None while it runs).
+    """
+    while True:
+        try:
+            event = await asyncio.wait_for(queue.get(), idle_seconds)
+        except TimeoutError:
+            event = await finished()
+            if event is None:
+                continue
+        yield event
+        if event["event"] in TERMINAL:
+            return
+
+
+def subscriber_stats() -> dict[str, list[dict]]:
+    """Per-subscriber queue stats of this worker, by job ID."""
+    return {job_id: [q.stats() for q in queues] for job_id, queues in _subscribers.items()}
+
+
+def render_prometheus(prefix: str = "arcane_sse") -> str:
+    """Render subscriber queue metrics in the Prometheus text format."""
+    queues = [q for qs in _subscribers.values() for q in qs]
+    metrics = [
+        ("subscribers", "gauge", "Open SSE subscriber queues.", len(queues)),
+        (
+            "pending_events_max",
+            "gauge",
+            "Most events waiting in any one subscriber queue.",
+            max((q._size for q in queues), default=0),
+        ),
+        (
+            "lag_seconds_max",
+            "gauge",
+            "Longest any pending event has waited for its subscriber.",
+            round(max((q.lag_seconds for q in queues), default=0.0), 3),
+        ),
+        (
+            "coalesced_events_total",
+            "counter",
+            "Events merged into a later or batched event.",
+            _retired["coalesced"] + sum(q.coalesced for q in queues),
+        ),
+        (
+            "dropped_events_total",
+            "counter",
+            "Events dropped from subscribers that fell behind.",
+            _retired["dropped"] + sum(q.dropped for q in queues),
+        ),
+    ]
+    lines = []
+    for name, kind, help_text, value in metrics:
+        lines += [
+            f"# HELP {prefix}_{name} {help_text}",
+            f"# TYPE {prefix}_{name} {kind}",
+            f"{prefix}_{name} {value}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+# --- Cross-worker delivery ---
+
+# NOTIFY rejects payloads of 8000 bytes or more; leave room for the chunk header
+MAX_PAYLOAD = 7900
+
+
+def encode(origin: str, message_id: str, job_id: str, event: dict) -> list[str]:
+    """Encode an event as one or more NOTIFY payloads.
+
+    A payload either is the JSON message itself, or starts with
+    ``<message id>:<part>:<parts>:`` followed by part of it. ASCII-only
+    JSON keeps every character a single byte, so chunks split cleanly.
+    """
+    message = json.dumps({"o": origin, "j": job_id, "e": event}, separators=(",", ":"))
+    if len(message) <= MAX_PAYLOAD:
+        return [message]
+    header_size = len(message_id) + 24
+    size = MAX_PAYLOAD - header_size
+    parts = [message[i:i + size] for i in range(0, len(message), size)]
+    return [f"{message_id}:{n}:{len(parts)}:{part}" for n, part in enumerate(parts)]
+
+
+class Reassembler:
+    """Puts chunked payloads back together as they arrive."""
+
+    # Messages whose chunks are still arriving; a lost connection can
+    # leave one incomplete, so only the newest few are kept
+    MAX_PENDING = 64
+
+    def __init__(self):
+        self._pending: dict[str, list[str | None]] = {}
+
+    def feed(self, payload: str) -> dict | None:
+        """Return the decoded message once all of it has arrived."""
+        if payload.startswith("{"):
+            return json.loads(payload)
+        message_id, part, parts, chunk = payload.split(":", 3)
+        chunks = self._pending.get(message_id)
+        if chunks is None:
+            if len(self._pending) >= self.MAX_PENDING:
+                self._pending.pop(next(iter(self._pending)))
+            chunks = self._pending[message_id] = [None] * int(parts)
+        chunks[int(part)] = chunk
+        if any(c is None for c in chunks):
+            return None
+        del self._pending[message_id]
+        return json.loads("".join(chunks))
+
+
+class PostgresBackend:
+    """Relays events between workers over PostgreSQL LISTEN/NOTIFY.
+
+    Two connections of its own: one LISTENs, reconnecting if it drops,
+    and one sends queued events in publish order. Each worker skips the
+    notifications it sent, having delivered those events locally already.
+    Events sent while a worker's listener is reconnecting are lost to
+    its subscribers; a reconnecting SSE client catches up from the job's
+    stored progress.
+    """
+
+    RECONNECT_SECONDS = 1.0
+    START_TIMEOUT_SECONDS = 10.0
+
+    def __init__(self, dsn: str, channel: str):
+        self.dsn = dsn
+        self.channel = channel
+        self.origin = uuid.uuid4().hex[:12]
+        self._ids = itertools.count()
+        self._outbox: asyncio.Queue[list[str]] = asyncio.Queue()
+        self._reassembler = Reassembler()
+        self._tasks: list[asyncio.Task] = []
+        self._listening = asyncio.Event()
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._send()),
+        ]
+        # Don't miss events published right after startup
+        try:
+            await asyncio.wait_for(self._listening.wait(), self.START_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.warning("Event listener not connected yet; starting without it")
+
+    async def stop(self) -> None:
+        try:
+            await asyncio.wait_for(self._outbox.join(), timeout=5)
+        except TimeoutError:
+            logger.warning("Dropping %d unsent events", self._outbox.qsize())
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def send(self, job_id: str, event: dict) -> None:
+        message_id = f"{self.origin}-{next(self._ids)}"
+        self._outbox.put_nowait(encode(self.origin, message_id, job_id, event))
+
+    def receive(self, payload: str) -> None:
+        """Deliver a notification to this worker's subscribers."""
+        try:
+            message = self._reassembler.feed(payload)
+        except (ValueError, KeyError):
+            logger.warning("Ignoring malformed event payload on %s", self.channel)
+            return
+        if message is not None and message["o"] != self.origin:
+            _deliver(message["j"], message["e"])
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                conn = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError):
+                logger.exception("Event listener could not connect; retrying")
+                await asyncio.sleep(self.RECONNECT_SECONDS)
+                continue
+            lost = asyncio.Event()
+            # Bound now: a late callback from an old connection mustn't end the next one
+            conn.add_termination_listener(lambda _conn, lost=lost: lost.set())
+            try:
+                await conn.add_listener(
+                    self.channel, lambda _conn, _pid, _channel, payload: self.receive(payload)
+                )
+                self._listening.set()
+                await lost.wait()
+                logger.warning("Event listener connection lost; reconnecting")
+            finally:
+                await conn.close()
+
+    async def _send(self) -> None:
+        conn = None
+        while True:
+            payloads = await self._outbox.get()
+            try:
+                if conn is None or conn.is_closed():
+                    conn = await asyncpg.connect(self.dsn)
+                # One transaction: chunks are delivered together or not at all
+                async with conn.transaction():
+                    for payload in payloads:
+                        await conn.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+            except (OSError, asyncpg.PostgresError):
+                logger.exception("Could not send event on %s", self.channel)
+                if conn is not None:
+                    # Release the broken connection before the next send reconnects
+                    with contextlib.suppress(Exception):
+                        await conn.close()
+                conn = None
+            finally:
+                self._outbox.task_done()
+
+
+_backend: PostgresBackend | None = None
+
+
+def backend_name(settings: Settings) -> str:
+    """The backend settings select, resolving "auto" from the database URL."""
+    name = settings.event_bus_backend
+    if name == "auto":
+        dialect = make_url(settings.database_url).get_backend_name()
+        name = "postgres" if dialect == "postgresql" else "memory"
+    if name not in ("memory", "postgres"):
+        raise ValueError(f"Unknown event bus backend: {name}")
+    return name
+
+
+async def start(settings: Settings | None = None) -> None:
+    """Start the configured backend (called at app startup)."""
+    global _backend
+    settings = settings or get_settings()
+    if backend_name(settings) == "memory":
+        return
+    url = make_url(settings.database_url).set(drivername="postgresql")
+    backend = PostgresBackend(
+        url.render_as_string(hide_password=False), settings.event_bus_channel
+    )
+    await backend.start()
+    _backend = backend
+
+
+async def stop() -> None:
+    """Send what's queued and close the backend (called at app shutdown)."""
+    global _backend
+    if _backend is not None:
+        backend, _backend = _backend, None
+        await backend.stop()
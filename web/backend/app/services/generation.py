@@ -8,28 +8,136 @@ import copy
 import io
 import logging
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 
 from rich.console import Console
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import defer
+from sqlalchemy.orm.exc import StaleDataError
 
-from arcane.core.clients import create_client
+from arcane.core.clients import BaseAIClient, GenerationTelemetry, create_client
+from arcane.core.generators.budget import GenerationBudget
+from arcane.core.generators.eta import EtaSnapshot
 from arcane.core.generators.orchestrator import RoadmapOrchestrator
 from arcane.core.generators.epic import EpicGenerator
 from arcane.core.generators.story import StoryGenerator
 from arcane.core.generators.task import TaskGenerator
 from arcane.core.items.context import ProjectContext
+from arcane.core.items.index import RoadmapIndex
+from arcane.core.items.roadmap import Roadmap
 from arcane.core.templates.loader import TemplateLoader
+from arcane.core.utils import CostCalibration
 from arcane.core.utils.ids import generate_id
+from arcane.core.utils.tracing import traced
 
 from ..models.generation_job import GenerationJob
+from ..models.project import Project
 from ..models.roadmap import RoadmapRecord
+from ..models.roadmap_item import RoadmapItem
+from .item_rows import items_changed_since
+from .quotas import record_usage
 from .roadmap_items import find_item_by_id, find_parent_chain
-from . import event_bus
+from .versions import record_version
+from . import event_bus, metrics
 
 logger = logging.getLogger(__name__)
 
+# Tries at a background save before giving up on a roadmap that keeps changing
+MAX_SAVE_ATTEMPTS = 5
+
+
+class RoadmapWriter:
+    """Whole-document saves from a background job, checked against the roadmap version.
+
+    A job works on its own copy of the document and saves it whole,
+    which would silently drop item edits made through the API while it
+    runs. Each save compares the roadmap's version with the one the job
+    last wrote. When someone else wrote in between, the items they
+    changed, added or deleted (found through the roadmap_items row
+    versions) are carried into this save and every later one. A save
+    that races another write is retried.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, roadmap_id: uuid.UUID):
+        self.session_factory = session_factory
+        self.roadmap_id = roadmap_id
+        # Version the job last read or wrote; None overwrites on the first save
+        self.version: int | None = None
+        # The document as last written, with others' edits
+        self.document: dict | None = None
+        self._written_ids: set[str] = set()
+        # Item ID -> (parent ID, fields) changed by others, and IDs they deleted
+        self._edited: dict[str, tuple[str | None, dict]] = {}
+        self._deleted: set[str] = set()
+
+    def start(self, version: int, document: dict) -> None:
+        """Base the job on document as read at version."""
+        self.version = version
+        self.document = document
+        self._written_ids = set(RoadmapIndex(document))
+
+    async def save(
+        self,
+        data: dict,
+        before_commit: Callable[[AsyncSession], Awaitable[None]] | None = None,
+    ) -> dict:
+        """Write a copy of data, with others' edits, as the roadmap's document.
+
+        before_commit runs in the same transaction (e.g. to store job
+        progress). Returns the document written.
+        """
+        for _ in range(MAX_SAVE_ATTEMPTS):
+            async with self.session_factory() as session:
+                record = await session.get(
+                    RoadmapRecord, self.roadmap_id, options=[defer(RoadmapRecord.roadmap_data)]
+                )
+                if self.version is not None and record.version != self.version:
+                    await self._collect_edits(session)
+                document = self._apply_edits(copy.deepcopy(data))
+                record.roadmap_data = document
+                if before_commit is not None:
+                    await before_commit(session)
+                try:
+                    await session.flush()
+                except StaleDataError:
+                    await session.rollback()
+                    continue
+                version = record.version
+                await session.commit()
+            self.start(version, document)
+            return document
+        raise RuntimeError(f"Roadmap {self.roadmap_id} kept changing; could not save it")
+
+    async def _collect_edits(self, session: AsyncSession) -> None:
+        current_ids = set(
+            (await session.execute(
+                select(RoadmapItem.id).where(RoadmapItem.roadmap_id == self.roadmap_id)
+            )).scalars()
+        )
+        self._deleted |= self._written_ids - current_ids
+        for row in await items_changed_since(session, self.roadmap_id, self.version):
+            self._edited[row.id] = (row.parent_id, row.payload)
+            self._deleted.discard(row.id)
+        for item_id in self._deleted:
+            self._edited.pop(item_id, None)
+
+    def _apply_edits(self, document: dict) -> dict:
+        if not self._edited and not self._deleted:
+            return document
+        index = RoadmapIndex(document)
+        for item_id in self._deleted:
+            if item_id in index:
+                index.remove(item_id)
+        for item_id, (parent_id, fields) in self._edited.items():
+            item = index.get(item_id)
+            if item is not None:
+                item.update(fields)
+            elif parent_id is None or parent_id in index:
+                index.add(parent_id, copy.deepcopy(fields))
+        return document
+
 
 class WebStorageAdapter:
     """Duck-typed storage adapter for the RoadmapOrchestrator.
@@ -40,7 +148,9 @@ class WebStorageAdapter:
     counts into the GenerationJob.progress JSONB column.
 
     It also publishes progress and item_created events to the event bus
-    so that SSE subscribers receive real-time updates.
+    so that SSE subscribers receive real-time updates. Once the
+    orchestrator reports an ETA (through ``set_eta``), progress carries
+    it under ``"eta"``.
     """
 
     def __init__(
@@ -53,32 +163,35 @@ class WebStorageAdapter:
         self.roadmap_record_id = uuid.UUID(roadmap_record_id)
         self.job_id = uuid.UUID(job_id)
         self.job_id_str = job_id
+        self.writer = RoadmapWriter(session_factory, self.roadmap_record_id)
         self._prev_counts: dict[str, int] = {
             "milestones": 0,
             "epics": 0,
             "stories": 0,
             "tasks": 0,
         }
+        self._eta: dict | None = None
+
+    def set_eta(self, snapshot: EtaSnapshot) -> None:
+        """Orchestrator on_progress hook; called just before each save."""
+        self._eta = snapshot.to_dict()
 
+    @traced("web.save_roadmap")
     async def save_roadmap(self, roadmap) -> None:
         """Persist roadmap data and progress to the database."""
         roadmap_data = roadmap.model_dump(mode="json")
         progress = self._extract_progress(roadmap)
+        if self._eta is not None:
+            progress["eta"] = self._eta
 
-        async with self.session_factory() as session:
-            result = await session.execute(
-                select(RoadmapRecord).where(RoadmapRecord.id == self.roadmap_record_id)
-            )
-            record = result.scalar_one()
-            record.roadmap_data = copy.deepcopy(roadmap_data)
-
+        async def save_progress(session: AsyncSession) -> None:
             job_result = await session.execute(
                 select(GenerationJob).where(GenerationJob.id == self.job_id)
             )
             job = job_result.scalar_one()
             job.progress = copy.deepcopy(progress)
 
-            await session.commit()
+        await self.writer.save(roadmap_data, save_progress)
 
         # Emit item_created events for newly added items
         self._emit_item_created_events(roadmap, progress)
@@ -97,6 +210,24 @@ class WebStorageAdapter:
             "tasks": progress["tasks"],
         }
 
+    async def save_telemetry(self, roadmap, telemetry) -> None:
+        """Telemetry goes to /metrics when the job ends, not per save."""
+
+    async def load_telemetry(self, roadmap) -> GenerationTelemetry:
+        """Resumed jobs start their telemetry afresh (see save_telemetry)."""
+        return GenerationTelemetry()
+
+    def start_from(self, roadmap, version: int | None = None) -> None:
+        """Treat the items of a roadmap being resumed as already announced.
+
+        With the version the roadmap was read at, later saves keep item
+        edits made since then.
+        """
+        progress = self._extract_progress(roadmap)
+        self._prev_counts = {key: progress[key] for key in self._prev_counts}
+        if version is not None:
+            self.writer.start(version, roadmap.model_dump(mode="json"))
+
     def _emit_item_created_events(self, roadmap, progress: dict) -> None:
         """Detect newly added items and emit item_created events."""
         # Walk the hierarchy and emit events for new items
@@ -182,18 +313,66 @@ class WebStorageAdapter:
         }
 
 
+async def _load_calibration(
+    session_factory: async_sessionmaker, roadmap_uuid: uuid.UUID
+) -> CostCalibration:
+    """Calibrate from the other roadmaps of the roadmap's owner."""
+    async with session_factory() as session:
+        owner = await session.scalar(
+            select(Project.user_id)
+            .join(RoadmapRecord, RoadmapRecord.project_id == Project.id)
+            .where(RoadmapRecord.id == roadmap_uuid)
+        )
+        result = await session.execute(
+            select(RoadmapRecord.roadmap_data)
+            .join(Project)
+            .where(
+                Project.user_id == owner,
+                RoadmapRecord.id != roadmap_uuid,
+                RoadmapRecord.roadmap_data.is_not(None),
+            )
+        )
+        return CostCalibration.from_roadmaps(result.scalars())
+
+
+async def _charge_usage(
+    session_factory: async_sessionmaker,
+    user_id: str,
+    roadmap_id: uuid.UUID,
+    kind: str,
+    model: str,
+    client: BaseAIClient,
+) -> None:
+    """Add what a job's client used to its user's quota ledger."""
+    try:
+        async with session_factory() as session:
+            record_usage(session, uuid.UUID(user_id), kind, model, client.usage, roadmap_id)
+            await session.commit()
+    except Exception:
+        logger.exception("Could not record %s usage for roadmap %s", kind, roadmap_id)
+
+
 async def run_generation(
     session_factory: async_sessionmaker,
     roadmap_record_id: str,
     job_id: str,
+    user_id: str,
     context_dict: dict,
     anthropic_api_key: str,
     model: str,
+    budget: GenerationBudget | None = None,
+    resume: bool = False,
 ) -> None:
     """Background task that runs the arcane-core orchestrator.
 
     Creates its own DB sessions (short-lived, committed per operation)
     because it runs outside the request lifecycle.
+
+    With ``resume``, the partial roadmap already stored is completed
+    instead of generating a new one. If ``budget`` is reached the job
+    still completes, with the roadmap left "partial" and the budget
+    report in the job's progress. Whatever the job used, even if it
+    fails, is charged to ``user_id``'s quotas.
     """
     job_uuid = uuid.UUID(job_id)
     roadmap_uuid = uuid.UUID(roadmap_record_id)
@@ -208,6 +387,7 @@ async def run_generation(
         job.started_at = datetime.now(timezone.utc)
         await session.commit()
 
+    client = None
     try:
         context = ProjectContext(**context_dict)
         client = create_client("anthropic", api_key=anthropic_api_key, model=model)
@@ -218,9 +398,23 @@ async def run_generation(
             console=console,
             storage=adapter,
             interactive=False,
+            calibration=await _load_calibration(session_factory, roadmap_uuid),
+            on_progress=adapter.set_eta,
+            budget=budget,
         )
 
-        roadmap = await orchestrator.generate(context)
+        if resume:
+            async with session_factory() as session:
+                record = await session.get(RoadmapRecord, roadmap_uuid)
+                partial = Roadmap.model_validate(record.roadmap_data)
+            adapter.start_from(partial, record.version)
+            roadmap = await orchestrator.resume(partial)
+        else:
+            roadmap = await orchestrator.generate(context)
+
+        report = orchestrator.budget_report
+        if report is not None:
+            event_bus.publish(job_id, {"event": "budget_exceeded", "data": report.to_dict()})
 
         # Emit complete event before DB update
         event_bus.publish(job_id, {
@@ -239,14 +433,22 @@ async def run_generation(
             job = result.scalar_one()
             job.status = "completed"
             job.completed_at = datetime.now(timezone.utc)
+            if report is not None:
+                job.progress = {**(job.progress or {}), "budget": report.to_dict()}
 
             rm_result = await session.execute(
                 select(RoadmapRecord).where(RoadmapRecord.id == roadmap_uuid)
             )
             roadmap_record = rm_result.scalar_one()
-            roadmap_record.status = "generated"
+            if report is not None:
+                roadmap_record.status = "partial"
+                message = "Generate roadmap (budget reached)"
+            else:
+                roadmap_record.status = "generated"
+                message = "Generate roadmap"
 
             await session.commit()
+            await record_version(session, roadmap_record, message)
 
     except Exception as exc:
         logger.exception("Generation failed for job %s", job_id)
@@ -275,6 +477,11 @@ async def run_generation(
             await session.commit()
 
     finally:
+        if client is not None:
+            metrics.record_client(client)
+            await _charge_usage(
+                session_factory, user_id, roadmap_uuid, "generation", model, client
+            )
         event_bus.cleanup(job_id)
 
 
@@ -327,12 +534,10 @@ async def _regenerate_children(
     context: ProjectContext,
     generators: dict,
     job_id_str: str,
-    session_factory,
-    roadmap_record_id: str,
+    writer: RoadmapWriter,
     data: dict,
 ) -> int:
     """Generate new children for an item, cascading downward. Returns items created count."""
-    roadmap_uuid = uuid.UUID(roadmap_record_id)
     total_created = 0
 
     if item_type == "milestone":
@@ -359,19 +564,13 @@ async def _regenerate_children(
         item["epics"] = new_epics
 
         # Save intermediate state
-        async with session_factory() as session:
-            result = await session.execute(
-                select(RoadmapRecord).where(RoadmapRecord.id == roadmap_uuid)
-            )
-            record = result.scalar_one()
-            record.roadmap_data = copy.deepcopy(data)
-            await session.commit()
+        await writer.save(data)
 
         # Recurse: generate stories+tasks for each epic
         for epic_dict in new_epics:
             count = await _regenerate_children(
                 epic_dict, "epic", child_parent_ctx, context, generators,
-                job_id_str, session_factory, roadmap_record_id, data,
+                job_id_str, writer, data,
             )
             total_created += count
 
@@ -398,19 +597,13 @@ async def _regenerate_children(
         item["stories"] = new_stories
 
         # Save intermediate state
-        async with session_factory() as session:
-            result = await session.execute(
-                select(RoadmapRecord).where(RoadmapRecord.id == roadmap_uuid)
-            )
-            record = result.scalar_one()
-            record.roadmap_data = copy.deepcopy(data)
-            await session.commit()
+        await writer.save(data)
 
         # Recurse: generate tasks for each story
         for story_dict in new_stories:
             count = await _regenerate_children(
                 story_dict, "story", child_parent_ctx, context, generators,
-                job_id_str, session_factory, roadmap_record_id, data,
+                job_id_str, writer, data,
             )
             total_created += count
 
@@ -436,13 +629,7 @@ async def _regenerate_children(
         item["tasks"] = new_tasks
 
         # Save to DB
-        async with session_factory() as session:
-            result = await session.execute(
-                select(RoadmapRecord).where(RoadmapRecord.id == roadmap_uuid)
-            )
-            record = result.scalar_one()
-            record.roadmap_data = copy.deepcopy(data)
-            await session.commit()
+        await writer.save(data)
 
     # Emit progress event
     event_bus.publish(job_id_str, {
@@ -457,11 +644,15 @@ async def run_regeneration(
     session_factory: async_sessionmaker,
     roadmap_record_id: str,
     job_id: str,
+    user_id: str,
     item_id: str,
     anthropic_api_key: str,
     model: str,
 ) -> None:
-    """Background task that regenerates children of a specific item."""
+    """Background task that regenerates children of a specific item.
+
+    What it used is charged to ``user_id``'s quotas.
+    """
     job_uuid = uuid.UUID(job_id)
     roadmap_uuid = uuid.UUID(roadmap_record_id)
 
@@ -475,6 +666,7 @@ async def run_regeneration(
         job.started_at = datetime.now(timezone.utc)
         await session.commit()
 
+    client = None
     try:
         # Load roadmap data and context
         async with session_factory() as session:
@@ -484,14 +676,18 @@ async def run_regeneration(
             roadmap_record = result.scalar_one()
             data = copy.deepcopy(roadmap_record.roadmap_data) or {"milestones": []}
             context_dict = roadmap_record.context
+            await record_version(session, roadmap_record, f"Before regenerating {item_id}")
+        writer = RoadmapWriter(session_factory, roadmap_uuid)
+        writer.start(roadmap_record.version, data)
 
         # Find item and parent chain
-        found = find_item_by_id(data, item_id)
+        index = RoadmapIndex(data)
+        found = find_item_by_id(data, item_id, index)
         if found is None:
             raise ValueError(f"Item {item_id} not found in roadmap data")
         item, _, _, item_type = found
 
-        parent_chain = find_parent_chain(data, item_id) or {}
+        parent_chain = find_parent_chain(data, item_id, index) or {}
         context = ProjectContext(**context_dict)
 
         # Create AI client and generators
@@ -508,9 +704,13 @@ async def run_regeneration(
         # Run cascading regeneration
         total_created = await _regenerate_children(
             item, item_type, parent_chain, context, generators,
-            job_id, session_factory, roadmap_record_id, data,
+            job_id, writer, data,
         )
 
+        async with session_factory() as session:
+            roadmap_record = await session.get(RoadmapRecord, roadmap_uuid)
+            await record_version(session, roadmap_record, f"Regenerate {item_id}")
+
         # Emit complete event
         event_bus.publish(job_id, {
             "event": "complete",
@@ -549,4 +749,9 @@ async def run_regeneration(
             await session.commit()
 
     finally:
+        if client is not None:
+            metrics.record_client(client)
+            await _charge_usage(
+                session_factory, user_id, roadmap_uuid, "regeneration", model, client
+            )
         event_bus.cleanup(job_id)
@@ -0,0 +1,251 @@
+"""Item ID index cached across requests for each roadmap version.
+
+A RoadmapIndex holds references to the item objects, so it is only good
+for the one loaded document, and every item edit had to walk the whole
+roadmap to build one before it could find anything. ItemPaths records
+only where each item sits (type, parent, position, depth). Those entries
+fit every copy of the document at the same version, so they are cached
+in process by roadmap ID and version and kept current by the edits made
+through them. On a cache hit, finding an item, its parent chain or the
+ancestors a status change cascades to costs O(depth), not O(items).
+
+ItemPaths provides the part of RoadmapIndex's interface that the helpers
+in roadmap_items use, and resolves items by following their positions
+down from the root.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from arcane.core.items import IndexEntry, RoadmapIndex
+from arcane.core.items.index import CHILD_TYPE, CHILDREN_KEY
+
+from ..config import get_settings
+from .roadmap_summary import SummaryTally
+
+# item ID -> (item_type, parent_id, position, depth), as in IndexEntry
+Entries = dict[str, tuple[str, str | None, int, int]]
+
+
+def _child_list(node: dict, node_type: str, create: bool = False) -> list:
+    key = CHILDREN_KEY[node_type]
+    if key is None:
+        return []
+    return node.setdefault(key, []) if create else node.get(key) or []
+
+
+class ItemPaths:
+    """Where every item of a ``{"milestones": [...]}`` document sits.
+
+    Structural edits must go through add(), remove() and reorder() to
+    keep the entries current, as with RoadmapIndex. When an ID appears
+    more than once, the first occurrence in document order is indexed.
+    """
+
+    def __init__(self, root: dict, entries: Entries | None = None):
+        """Index root, or reuse entries cached for the same document version."""
+        self.root = root
+        if entries is None:
+            index = RoadmapIndex(root)
+            entries = {}
+            for item_id in index:
+                _, item_type, parent_id, position, depth = index.entry(item_id)
+                entries[item_id] = (item_type, parent_id, position, depth)
+        self.entries = entries
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def _walk(self, item_id: str) -> list[IndexEntry]:
+        """Entries from the item's milestone down to the item itself."""
+        chain = []
+        while item_id is not None:
+            chain.append(item_id)
+            item_id = self.entries[item_id][1]
+        node, node_type = self.root, "roadmap"
+        walked = []
+        for chain_id in reversed(chain):
+            item_type, parent_id, position, depth = self.entries[chain_id]
+            node = _child_list(node, node_type)[position]
+            node_type = item_type
+            walked.append(IndexEntry(node, item_type, parent_id, position, depth))
+        return walked
+
+    def entry(self, item_id: str) -> IndexEntry:
+        """Return the index entry for item_id.
+
+        Raises:
+            KeyError: If item_id is not in the index.
+        """
+        return self._walk(item_id)[-1]
+
+    def get(self, item_id: str, default: Any = None) -> Any:
+        """Return the item with item_id, or default if there is none."""
+        return self.entry(item_id).item if item_id in self.entries else default
+
+    def ancestors(self, item_id: str) -> list[IndexEntry]:
+        """Return the entries above item_id, from its milestone down."""
+        return self._walk(item_id)[:-1]
+
+    def path(self, item_id: str) -> tuple[int, ...]:
+        """Return the child-list positions leading from the root to item_id."""
+        positions = []
+        while item_id is not None:
+            _, item_id, position, _ = self.entries[item_id]
+            positions.append(position)
+        return tuple(reversed(positions))
+
+    def children(self, item_id: str | None = None) -> list:
+        """Return the child list of item_id, or the milestones for None."""
+        if item_id is None:
+            return _child_list(self.root, "roadmap")
+        return _child_list(self.entry(item_id).item, self.entries[item_id][0])
+
+    def container(self, item_id: str) -> list:
+        """Return the list holding item_id (its parent's child list)."""
+        return self.children(self.entries[item_id][1])
+
+    # --- Mutation helpers ---
+
+    def update(self, item_id: str, **fields: Any) -> dict:
+        """Set fields on item_id and return it."""
+        item = self.entry(item_id).item
+        item.update(fields)
+        return item
+
+    def add(self, parent_id: str | None, item: dict) -> IndexEntry:
+        """Append item (and its subtree) under parent_id.
+
+        Raises:
+            KeyError: If parent_id is not in the index.
+            ValueError: If the parent is a task or the ID is already used.
+        """
+        if parent_id is None:
+            parent, parent_type, depth = self.root, "roadmap", 0
+        else:
+            parent, parent_type, _, _, parent_depth = self.entry(parent_id)
+            depth = parent_depth + 1
+        item_type = CHILD_TYPE.get(parent_type)
+        if item_type is None:
+            raise ValueError(f"Cannot add children to a {parent_type}")
+        if item.get("id") in self.entries:
+            raise ValueError(f"Duplicate item ID: {item.get('id')}")
+
+        collection = _child_list(parent, parent_type, create=True)
+        collection.append(item)
+        self._index_subtree(item, item_type, parent_id, len(collection) - 1, depth)
+        return IndexEntry(item, item_type, parent_id, len(collection) - 1, depth)
+
+    def _index_subtree(
+        self, item: dict, item_type: str, parent_id: str | None, position: int, depth: int
+    ) -> None:
+        item_id = item.get("id")
+        if item_id is not None and item_id not in self.entries:
+            self.entries[item_id] = (item_type, parent_id, position, depth)
+        child_type = CHILD_TYPE.get(item_type)
+        if child_type is not None:
+            for child_position, child in enumerate(_child_list(item, item_type)):
+                self._index_subtree(child, child_type, item_id, child_position, depth + 1)
+
+    def remove(self, item_id: str) -> dict:
+        """Remove item_id and its subtree; returns the removed item."""
+        item, item_type, parent_id, position, _ = self.entry(item_id)
+        collection = self.container(item_id)
+        del collection[position]
+        stack = [(item, item_type, parent_id)]
+        while stack:
+            node, node_type, node_parent = stack.pop()
+            node_id = node.get("id")
+            entry = self.entries.get(node_id)
+            if entry is not None and entry[1] == node_parent:
+                del self.entries[node_id]
+            child_type = CHILD_TYPE.get(node_type)
+            if child_type is not None:
+                stack.extend((c, child_type, node_id) for c in _child_list(node, node_type))
+        self._renumber(collection, parent_id, position)
+        return item
+
+    def reorder(self, parent_id: str | None, item_ids: list[str]) -> None:
+        """Reorder the children of parent_id to match item_ids.
+
+        Raises:
+            ValueError: If item_ids are not exactly the current children.
+        """
+        collection = self.children(parent_id)
+        by_id = {child.get("id"): child for child in collection}
+        if set(by_id) != set(item_ids) or len(item_ids) != len(collection):
+            raise ValueError("Provided item IDs do not match existing children")
+        collection[:] = [by_id[i] for i in item_ids]
+        self._renumber(collection, parent_id)
+
+    def _renumber(self, collection: list, parent_id: str | None, start: int = 0) -> None:
+        entries = self.entries
+        for position in range(start, len(collection)):
+            child_id = collection[position].get("id")
+            entry = entries.get(child_id)
+            if entry is not None and entry[1] == parent_id:
+                entries[child_id] = (entry[0], parent_id, position, entry[3])
+
+
+class ItemPathCache:
+    """LRU of ItemPaths entries, one version per roadmap.
+
+    Each version's summary tally (see roadmap_summary) is kept with its
+    entries. take() hands both over to a single request, which edits
+    them in place and put()s them back under the version it wrote. A
+    request that fails never puts them back, so a half-edited index
+    can't be served.
+    """
+
+    def __init__(self, max_roadmaps: int = 64):
+        self.max_roadmaps = max_roadmaps
+        self._entries: OrderedDict[
+            Hashable, tuple[Hashable, Entries, SummaryTally | None]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def take(
+        self, roadmap_id: Hashable, version: Hashable
+    ) -> tuple[Entries, SummaryTally | None] | None:
+        """Remove and return the entries and tally for this version, if cached."""
+        cached = self._entries.pop(roadmap_id, None)
+        if cached is None or cached[0] != version:
+            return None
+        return cached[1], cached[2]
+
+    def put(
+        self,
+        roadmap_id: Hashable,
+        version: Hashable,
+        entries: Entries,
+        tally: SummaryTally | None = None,
+    ) -> None:
+        if self.max_roadmaps <= 0:
+            return
+        self._entries[roadmap_id] = (version, entries, tally)
+        self._entries.move_to_end(roadmap_id)
+        while len(self._entries) > self.max_roadmaps:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_cache: ItemPathCache | None = None
+
+
+def get_item_path_cache() -> ItemPathCache:
+    """Return the process-wide cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = ItemPathCache(get_settings().item_path_cache_size)
+    return _cache
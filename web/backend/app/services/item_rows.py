@@ -0,0 +1,284 @@
+"""Row-per-item storage of roadmap items alongside the JSONB document.
+
+roadmap_data stays the document that generation and exports work on;
+roadmap_items mirrors its items one row each, so reads that need a few
+items, or items in one status, can use an index instead of loading and
+walking the whole document.
+
+Rows are kept in step in two ways. Whenever roadmap_data is assigned
+through the ORM (generation saves, new records), an after_flush hook
+rewrites the roadmap's rows from the document. Item endpoints, which
+write roadmap_data by path (see roadmap_patch), rewrite only the rows
+of the items they touched.
+"""
+
+import uuid
+from collections import defaultdict
+from collections.abc import Collection, Iterable
+from typing import Any
+
+from sqlalchemy import JSON, delete, event, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, attributes
+
+from arcane.core.items import RoadmapIndex
+
+from ..models.roadmap import RoadmapRecord
+from ..models.roadmap_item import RoadmapItem
+from .item_paths import ItemPaths
+from .roadmap_items import CHILDREN_KEY, COLLECTION_KEY
+
+# Item types from the top of the hierarchy down
+ITEM_TYPES = tuple(COLLECTION_KEY)
+
+
+def item_row(
+    roadmap_id: uuid.UUID, index: RoadmapIndex | ItemPaths, item_id: str, version: int = 1
+) -> dict[str, Any]:
+    """Column values for one indexed item, changed at the given roadmap version."""
+    item, item_type, parent_id, position, _ = index.entry(item_id)
+    children_key = CHILDREN_KEY[item_type]
+    hours = item.get("estimated_hours")
+    return {
+        "roadmap_id": roadmap_id,
+        "id": item_id,
+        "parent_id": parent_id,
+        "type": item_type,
+        "position": position,
+        "status": item.get("status") or "not_started",
+        "priority": item.get("priority"),
+        "estimated_hours": hours if isinstance(hours, (int, float)) else None,
+        "payload": {k: v for k, v in item.items() if k != children_key},
+        "version": version,
+    }
+
+
+def flatten_items(
+    roadmap_id: uuid.UUID, data: dict | None, version: int = 1
+) -> list[dict[str, Any]]:
+    """Column values for every item of a roadmap document."""
+    if not data:
+        return []
+    index = RoadmapIndex(data)
+    return [item_row(roadmap_id, index, item_id, version) for item_id in index]
+
+
+def assemble_items(
+    rows: Iterable[tuple[str, str | None, str, dict]],
+    parent_id: str | None = None,
+    fields: Collection[str] | None = None,
+    leaf_type: str | None = None,
+) -> list[dict]:
+    """Rebuild the nested child list of parent_id from (id, parent_id, type, payload) rows.
+
+    Rows must come in position order; one pass attaches each item to its
+    parent's child list, whichever of the two comes first.
+
+    Args:
+        fields: Item fields to keep (plus id and child lists); None keeps all.
+        leaf_type: Items of this type are left without their child list.
+    """
+    children: defaultdict[str | None, list[dict]] = defaultdict(list)
+    for item_id, item_parent_id, item_type, payload in rows:
+        if fields is None:
+            node = dict(payload)
+        else:
+            node = {k: v for k, v in payload.items() if k in fields or k == "id"}
+        children_key = CHILDREN_KEY[item_type]
+        if children_key is not None and item_type != leaf_type:
+            node[children_key] = children[item_id]
+        children[item_parent_id].append(node)
+    return children[parent_id]
+
+
+def assemble_milestones(rows: Iterable[tuple[str, str | None, str, dict]]) -> list[dict]:
+    """Rebuild the nested milestone list from (id, parent_id, type, payload) rows."""
+    return assemble_items(rows)
+
+
+async def write_item_rows(
+    db: AsyncSession,
+    roadmap_id: uuid.UUID,
+    index: RoadmapIndex | ItemPaths,
+    item_ids: Iterable[str],
+    removed_ids: Iterable[str] = (),
+    version: int = 1,
+) -> None:
+    """Rewrite the rows of changed items and drop those of removed ones.
+
+    Args:
+        index: Index over the roadmap document as it now stands.
+        item_ids: Items added or changed (fields, status or position).
+        removed_ids: Items no longer in the document.
+        version: The roadmap version that made the changes.
+    """
+    changed = [i for i in dict.fromkeys(item_ids) if i in index]
+    stale = set(changed) | set(removed_ids)
+    if not stale:
+        return
+    await db.execute(
+        delete(RoadmapItem).where(
+            RoadmapItem.roadmap_id == roadmap_id, RoadmapItem.id.in_(stale)
+        )
+    )
+    if changed:
+        await db.execute(
+            insert(RoadmapItem), [item_row(roadmap_id, index, i, version) for i in changed]
+        )
+
+
+async def load_roadmap_data(
+    db: AsyncSession,
+    roadmap_id: uuid.UUID,
+    fields: Collection[str] | None = None,
+    depth: int | None = None,
+) -> dict | None:
+    """Reassemble a roadmap's data from its top-level fields and item rows.
+
+    Only the document's top level (usage, project name, ...) is read
+    from roadmap_data; the milestones come from roadmap_items.
+
+    Args:
+        fields: Item fields to return (id is always included); None for all.
+        depth: Item levels to return, 1 for milestones only; None for all.
+    """
+    column = RoadmapRecord.roadmap_data
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        top_level = column.op("-", return_type=JSONB)("milestones")
+    elif dialect == "sqlite":
+        top_level = func.json_remove(column, "$.milestones", type_=JSON)
+    else:
+        top_level = column
+    data = await db.scalar(select(top_level).where(RoadmapRecord.id == roadmap_id))
+    if data is None:
+        return None
+    query = (
+        select(RoadmapItem.id, RoadmapItem.parent_id, RoadmapItem.type, RoadmapItem.payload)
+        .where(RoadmapItem.roadmap_id == roadmap_id)
+        .order_by(RoadmapItem.position)
+    )
+    leaf_type = None
+    if depth is not None and depth < len(ITEM_TYPES):
+        query = query.where(RoadmapItem.type.in_(ITEM_TYPES[:depth]))
+        leaf_type = ITEM_TYPES[depth - 1]
+    result = await db.execute(query)
+    data["milestones"] = assemble_items(result.all(), fields=fields, leaf_type=leaf_type)
+    return data
+
+
+async def load_item_subtree(
+    db: AsyncSession,
+    roadmap_id: uuid.UUID,
+    item_id: str,
+    fields: Collection[str] | None = None,
+    depth: int | None = None,
+) -> tuple[str, dict] | None:
+    """Return (item_type, item) with its descendants, or None if not found.
+
+    The subtree is read in one recursive query over the parent index,
+    without touching roadmap_data.
+
+    Args:
+        fields: Item fields to return (id is always included); None for all.
+        depth: Levels below the item to include, 0 for the item alone;
+            None for all.
+    """
+    items = RoadmapItem.__table__
+    subtree = (
+        select(
+            items.c.id, items.c.parent_id, items.c.type, items.c.payload,
+            items.c.position, literal(0).label("level"),
+        )
+        .where(items.c.roadmap_id == roadmap_id, items.c.id == item_id)
+        .cte("subtree", recursive=True)
+    )
+    child = aliased(items)
+    step = select(
+        child.c.id, child.c.parent_id, child.c.type, child.c.payload,
+        child.c.position, subtree.c.level + 1,
+    ).join(
+        subtree, (child.c.roadmap_id == roadmap_id) & (child.c.parent_id == subtree.c.id)
+    )
+    if depth is not None:
+        step = step.where(subtree.c.level < depth)
+    subtree = subtree.union_all(step)
+    result = await db.execute(
+        select(subtree.c.id, subtree.c.parent_id, subtree.c.type, subtree.c.payload)
+        .order_by(subtree.c.level, subtree.c.position)
+    )
+    rows = result.all()
+    if not rows:
+        return None
+    _, parent_id, item_type, _ = rows[0]
+    leaf_level = ITEM_TYPES.index(item_type) + (depth if depth is not None else len(ITEM_TYPES))
+    leaf_type = ITEM_TYPES[leaf_level] if leaf_level < len(ITEM_TYPES) else None
+    [item] = assemble_items(rows, parent_id, fields=fields, leaf_type=leaf_type)
+    return item_type, item
+
+
+async def list_item_rows(
+    db: AsyncSession,
+    roadmap_id: uuid.UUID,
+    status: str | None = None,
+    item_type: str | None = None,
+    parent_id: str | None = None,
+) -> list[RoadmapItem]:
+    """Items of a roadmap, optionally filtered, ordered by parent and position."""
+    query = select(RoadmapItem).where(RoadmapItem.roadmap_id == roadmap_id)
+    if status is not None:
+        query = query.where(RoadmapItem.status == status)
+    if item_type is not None:
+        query = query.where(RoadmapItem.type == item_type)
+    if parent_id is not None:
+        query = query.where(
+            RoadmapItem.parent_id.is_(None) if parent_id == "root"
+            else RoadmapItem.parent_id == parent_id
+        )
+    result = await db.execute(query.order_by(RoadmapItem.parent_id, RoadmapItem.position))
+    return list(result.scalars().all())
+
+
+async def items_changed_since(
+    db: AsyncSession,
+    roadmap_id: uuid.UUID,
+    version: int,
+    item_ids: Collection[str] | None = None,
+) -> list[RoadmapItem]:
+    """Rows written after the given roadmap version, parents before children.
+
+    Pass item_ids to look only at those items.
+    """
+    query = select(RoadmapItem).where(
+        RoadmapItem.roadmap_id == roadmap_id, RoadmapItem.version > version
+    )
+    if item_ids is not None:
+        if not item_ids:
+            return []
+        query = query.where(RoadmapItem.id.in_(item_ids))
+    rows = (await db.execute(query.order_by(RoadmapItem.position))).scalars().all()
+    return sorted(rows, key=lambda row: ITEM_TYPES.index(row.type))
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_item_rows(session: Session, flush_context) -> None:
+    """Rewrite item rows of roadmaps whose roadmap_data was assigned."""
+    connection = session.connection()
+    table = RoadmapItem.__table__
+    for record in session.deleted:
+        if isinstance(record, RoadmapRecord):
+            connection.execute(delete(table).where(table.c.roadmap_id == record.id))
+    for record in (*session.new, *session.dirty):
+        if not isinstance(record, RoadmapRecord):
+            continue
+        history = attributes.get_history(
+            record, "roadmap_data", passive=attributes.PASSIVE_NO_INITIALIZE
+        )
+        if not history.has_changes():
+            continue
+        if record not in session.new:
+            connection.execute(delete(table).where(table.c.roadmap_id == record.id))
+        rows = flatten_items(record.id, record.roadmap_data, record.version)
+        if rows:
+            connection.execute(insert(table), rows)
@@ -0,0 +1,30 @@
+"""In-process generation metrics for the Prometheus /metrics endpoint.
+
+Each generation job, regeneration job and AI edit uses its own AI
+client. When a job ends, its client's telemetry is merged into the
+process-wide report here, so /metrics covers every job this worker ran.
+"""
+
+from arcane.core.clients import BaseAIClient, GenerationTelemetry
+
+_telemetry = GenerationTelemetry()
+
+
+def record_client(client: BaseAIClient) -> None:
+    """Add a finished job's client telemetry to the process totals."""
+    _telemetry.merge(client.telemetry)
+
+
+def telemetry() -> GenerationTelemetry:
+    """Return the process-wide telemetry report."""
+    return _telemetry
+
+
+def render_prometheus() -> str:
+    """Render the process totals in the Prometheus text format."""
+    return _telemetry.to_prometheus()
+
+
+def reset() -> None:
+    """Clear the process totals (used by tests)."""
+    _telemetry.reset()
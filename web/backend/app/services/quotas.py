@@ -0,0 +1,106 @@
+"""Per-user generation quotas.
+
+A user's usage is the sum of their UsageRecord ledger, which every
+generation job (partial and failed runs included), regeneration and AI
+edit adds to. Rows are never removed, so deleting a roadmap doesn't
+give its usage back. Tokens are priced with the model that used them;
+usage backfilled from roadmaps doesn't record one, so it is priced with
+the configured model.
+
+Each generation job runs under a GenerationBudget holding what is left
+of the user's quotas, plus the per-job time limit. When the budget is
+reached the job stops with a partial roadmap that a later job resumes.
+"""
+
+import uuid
+from dataclasses import dataclass
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from arcane.core.clients import UsageStats
+from arcane.core.generators import GenerationBudget
+from arcane.core.utils import model_pricing
+
+from ..config import Settings
+from ..models.usage_record import UsageRecord
+
+
+@dataclass
+class UserUsage:
+    """Tokens and cost a user has used so far."""
+
+    input_tokens: int
+    output_tokens: int
+    cost_usd: float
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+async def get_user_usage(db: AsyncSession, user_id: uuid.UUID, model: str) -> UserUsage:
+    """Sum a user's usage ledger in one query, pricing each model's tokens."""
+    result = await db.execute(
+        select(
+            UsageRecord.model,
+            func.sum(UsageRecord.input_tokens),
+            func.sum(UsageRecord.output_tokens),
+        )
+        .where(UsageRecord.user_id == user_id)
+        .group_by(UsageRecord.model)
+    )
+    usage = UserUsage(input_tokens=0, output_tokens=0, cost_usd=0.0)
+    for used_by, input_tokens, output_tokens in result:
+        pricing = model_pricing(used_by or model)
+        usage.input_tokens += int(input_tokens)
+        usage.output_tokens += int(output_tokens)
+        usage.cost_usd += (
+            input_tokens * pricing["input"] + output_tokens * pricing["output"]
+        ) / 1_000_000
+    return usage
+
+
+def record_usage(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    kind: str,
+    model: str,
+    usage: UsageStats,
+    roadmap_id: uuid.UUID | None = None,
+) -> None:
+    """Charge what a job or edit ("generation", "ai_edit", ...) used to the user."""
+    if usage.total_tokens:
+        db.add(
+            UsageRecord(
+                user_id=user_id,
+                roadmap_id=roadmap_id,
+                kind=kind,
+                model=model,
+                input_tokens=usage.input_tokens,
+                output_tokens=usage.output_tokens,
+            )
+        )
+
+
+def generation_budget(settings: Settings, usage: UserUsage) -> GenerationBudget | None:
+    """The budget for a user's next job, or None if nothing is limited.
+
+    Raises:
+        HTTPException: 429 if a quota is already used up.
+    """
+    max_tokens = max_cost = None
+    if settings.user_quota_tokens:
+        max_tokens = settings.user_quota_tokens - usage.total_tokens
+    if settings.user_quota_usd:
+        max_cost = settings.user_quota_usd - usage.cost_usd
+    if (max_tokens is not None and max_tokens <= 0) or (max_cost is not None and max_cost <= 0):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Generation quota used up",
+        )
+    max_seconds = settings.generation_max_seconds or None
+    if max_tokens is None and max_cost is None and max_seconds is None:
+        return None
+    return GenerationBudget(max_seconds=max_seconds, max_tokens=max_tokens, max_cost_usd=max_cost)
@@ -1,7 +1,13 @@
-"""JSONB roadmap item traversal and mutation helpers."""
+"""JSONB roadmap item traversal and mutation helpers.
+
+One-off lookups walk the tree and stop at the match; callers doing
+several lookups on the same data can build one RoadmapIndex and pass it
+along, or pass ItemPaths cached for the roadmap's version (see item_paths).
+"""
 
 import copy
 import uuid
+from collections.abc import Iterable
 from typing import Any
 
 from fastapi import HTTPException, status
@@ -9,11 +15,13 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from arcane.core.items import RoadmapIndex
 from arcane.core.utils.ids import generate_id
 
 from ..models.project import Project
 from ..models.roadmap import RoadmapRecord
 from ..models.user import User
+from .item_paths import ItemPaths
 
 # Maps item type to the key holding its children
 CHILDREN_KEY = {
@@ -53,12 +61,14 @@ async def get_project_for_user(
 
 
 async def get_roadmap_for_user(
-    db: AsyncSession, roadmap_id: uuid.UUID, user: User
+    db: AsyncSession, roadmap_id: uuid.UUID, user: User, *options: Any
 ) -> RoadmapRecord:
+    """Load a roadmap the user owns; options (e.g. defer()) apply to the query."""
     result = await db.execute(
         select(RoadmapRecord)
         .join(Project)
         .where(RoadmapRecord.id == roadmap_id, Project.user_id == user.id)
+        .options(*options)
     )
     roadmap = result.scalar_one_or_none()
     if roadmap is None:
@@ -72,34 +82,49 @@ def ensure_roadmap_data(roadmap: RoadmapRecord) -> dict:
     return copy.deepcopy(roadmap.roadmap_data)
 
 
-def save_roadmap_data(roadmap: RoadmapRecord, data: dict) -> None:
-    """Deep-copy and reassign so SQLAlchemy detects the JSONB change."""
-    roadmap.roadmap_data = copy.deepcopy(data)
-
-
-def find_item_by_id(
-    data: dict, item_id: str
-) -> tuple[dict, list, int, str] | None:
-    """Find an item anywhere in the hierarchy.
+def _walk_to(data: dict, item_id: str) -> list[tuple[dict, list, int, str]] | None:
+    """Walk the hierarchy until item_id and return the path down to it.
 
-    Returns (item, parent_list, index_in_parent, item_type) or None.
+    Each step is (item, parent_list, index_in_parent, item_type), from the
+    milestone down to the item itself. Returns None if item_id is not found.
     """
     milestones = data.get("milestones", [])
     for mi, ms in enumerate(milestones):
+        path = [(ms, milestones, mi, "milestone")]
         if ms.get("id") == item_id:
-            return ms, milestones, mi, "milestone"
+            return path
         for ei, ep in enumerate(ms.get("epics", [])):
+            path[1:] = [(ep, ms["epics"], ei, "epic")]
             if ep.get("id") == item_id:
-                return ep, ms["epics"], ei, "epic"
+                return path
             for si, st in enumerate(ep.get("stories", [])):
+                path[2:] = [(st, ep["stories"], si, "story")]
                 if st.get("id") == item_id:
-                    return st, ep["stories"], si, "story"
+                    return path
                 for ti, tk in enumerate(st.get("tasks", [])):
                     if tk.get("id") == item_id:
-                        return tk, st["tasks"], ti, "task"
+                        return [*path, (tk, st["tasks"], ti, "task")]
     return None
 
 
+def find_item_by_id(
+    data: dict, item_id: str, index: RoadmapIndex | ItemPaths | None = None
+) -> tuple[dict, list, int, str] | None:
+    """Find an item anywhere in the hierarchy.
+
+    Pass an index built over data to reuse it across several lookups.
+
+    Returns (item, parent_list, index_in_parent, item_type) or None.
+    """
+    if index is None:
+        path = _walk_to(data, item_id)
+        return path[-1] if path else None
+    if item_id not in index:
+        return None
+    entry = index.entry(item_id)
+    return entry.item, index.container(item_id), entry.position, entry.item_type
+
+
 def count_descendants(item: dict, item_type: str) -> int:
     """Count all nested children of an item."""
     children_key = CHILDREN_KEY.get(item_type)
@@ -116,34 +141,36 @@ def count_descendants(item: dict, item_type: str) -> int:
     return count
 
 
-def apply_item_update(item: dict, updates: dict[str, Any]) -> dict:
-    """Apply partial updates to an item dict, returning the modified item."""
-    for key, value in updates.items():
-        item[key] = value
-    return item
-
-
-def create_child_item(parent_id: str, item_type: str, item_data: dict, data: dict) -> dict:
+def create_child_item(
+    parent_id: str,
+    item_type: str,
+    item_data: dict,
+    data: dict,
+    index: RoadmapIndex | ItemPaths | None = None,
+) -> dict:
     """Create a new child item under the given parent.
 
+    Pass the index built over data to keep it current.
+
     Returns the created item dict.
     Raises HTTPException on invalid parent or type mismatch.
     """
+    if index is None:
+        index = RoadmapIndex(data)
     if parent_id == "root":
         if item_type != "milestone":
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Only milestones can be added at root level",
             )
-        collection = data.setdefault("milestones", [])
+        parent_key = None
     else:
-        result = find_item_by_id(data, parent_id)
-        if result is None:
+        if parent_id not in index:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Parent item {parent_id} not found",
             )
-        parent_item, _, _, parent_type = result
+        parent_type = index.entry(parent_id).item_type
         expected_child_type = CHILD_TYPE.get(parent_type)
         if expected_child_type is None:
             raise HTTPException(
@@ -155,19 +182,23 @@ def create_child_item(parent_id: str, item_type: str, item_data: dict, data: dic
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Expected child type '{expected_child_type}' for parent type '{parent_type}', got '{item_type}'",
             )
-        children_key = CHILDREN_KEY[parent_type]
-        collection = parent_item.setdefault(children_key, [])
+        parent_key = parent_id
 
     new_item = {"id": generate_id(item_type), **item_data}
     # Ensure child collection keys exist for non-task items
     children_key = CHILDREN_KEY.get(item_type)
     if children_key and children_key not in new_item:
         new_item[children_key] = []
-    collection.append(new_item)
+    try:
+        index.add(parent_key, new_item)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     return new_item
 
 
-def find_parent_chain(data: dict, item_id: str) -> dict | None:
+def find_parent_chain(
+    data: dict, item_id: str, index: RoadmapIndex | ItemPaths | None = None
+) -> dict | None:
     """Return ancestor context for an item, formatted for generator parent_context.
 
     Returns {} for milestones, {"milestone": {...}} for epics,
@@ -184,26 +215,17 @@ def find_parent_chain(data: dict, item_id: str) -> dict | None:
             entry["goal"] = item.get("goal", "")
         return entry
 
-    for ms in data.get("milestones", []):
-        if ms.get("id") == item_id:
-            return {}
-        for ep in ms.get("epics", []):
-            if ep.get("id") == item_id:
-                return {"milestone": _ancestor_entry(ms, "milestone")}
-            for st in ep.get("stories", []):
-                if st.get("id") == item_id:
-                    return {
-                        "milestone": _ancestor_entry(ms, "milestone"),
-                        "epic": _ancestor_entry(ep, "epic"),
-                    }
-                for tk in st.get("tasks", []):
-                    if tk.get("id") == item_id:
-                        return {
-                            "milestone": _ancestor_entry(ms, "milestone"),
-                            "epic": _ancestor_entry(ep, "epic"),
-                            "story": _ancestor_entry(st, "story"),
-                        }
-    return None
+    if index is None:
+        path = _walk_to(data, item_id)
+        if path is None:
+            return None
+        return {t: _ancestor_entry(item, t) for item, _, _, t in path[:-1]}
+    if item_id not in index:
+        return None
+    return {
+        a.item_type: _ancestor_entry(a.item, a.item_type)
+        for a in index.ancestors(item_id)
+    }
 
 
 def compute_parent_status(children: list[dict]) -> str:
@@ -220,101 +242,89 @@ def compute_parent_status(children: list[dict]) -> str:
     return "in_progress"
 
 
-def cascade_status_update(data: dict, item_id: str) -> list[dict]:
+def cascade_status_update(
+    data: dict, item_id: str, index: RoadmapIndex | ItemPaths | None = None
+) -> list[dict]:
     """After a status change on item_id, recompute all ancestor statuses.
 
     Returns list of {id, status} for each changed ancestor.
     """
+    if index is not None:
+        return cascade_status_updates(data, [item_id], index)
     changed: list[dict] = []
-
-    for ms in data.get("milestones", []):
-        for ep in ms.get("epics", []):
-            for st in ep.get("stories", []):
-                for tk in st.get("tasks", []):
-                    if tk.get("id") == item_id:
-                        # Walk up: story -> epic -> milestone
-                        return _recompute_ancestors(data, ms, ep, st)
-                if st.get("id") == item_id:
-                    return _recompute_ancestors(data, ms, ep)
-            if ep.get("id") == item_id:
-                return _recompute_ancestors(data, ms)
-        if ms.get("id") == item_id:
-            # Milestone has no parent to update
-            return []
+    # Walk up: story -> epic -> milestone
+    for item, _, _, item_type in reversed((_walk_to(data, item_id) or [])[:-1]):
+        new_status = compute_parent_status(item.get(CHILDREN_KEY[item_type], []))
+        if item.get("status") != new_status:
+            item["status"] = new_status
+            changed.append({"id": item["id"], "status": new_status})
     return changed
 
 
-def _recompute_ancestors(
-    data: dict,
-    ms: dict,
-    ep: dict | None = None,
-    st: dict | None = None,
+def cascade_status_updates(
+    data: dict, item_ids: Iterable[str], index: RoadmapIndex | ItemPaths | None = None
 ) -> list[dict]:
-    """Recompute status for story, epic, milestone ancestors as needed."""
-    changed: list[dict] = []
+    """After status changes on several items, recompute their ancestors' statuses.
+
+    Each ancestor is recomputed once, deepest first, however many of
+    the items sit below it.
 
-    if st is not None:
-        # Recompute story status from tasks
-        new_status = compute_parent_status(st.get("tasks", []))
-        if st.get("status") != new_status:
-            st["status"] = new_status
-            changed.append({"id": st["id"], "status": new_status})
-
-    if ep is not None:
-        # Recompute epic status from stories
-        new_status = compute_parent_status(ep.get("stories", []))
-        if ep.get("status") != new_status:
-            ep["status"] = new_status
-            changed.append({"id": ep["id"], "status": new_status})
-
-    # Recompute milestone status from epics
-    new_status = compute_parent_status(ms.get("epics", []))
-    if ms.get("status") != new_status:
-        ms["status"] = new_status
-        changed.append({"id": ms["id"], "status": new_status})
+    Returns list of {id, status} for each changed ancestor.
+    """
+    if index is None:
+        index = RoadmapIndex(data)
+    ancestors = {}
+    for item_id in item_ids:
+        if item_id in index:
+            for entry in index.ancestors(item_id):
+                ancestors[entry.item["id"]] = entry
 
+    changed: list[dict] = []
+    for entry in sorted(ancestors.values(), key=lambda e: e.depth, reverse=True):
+        item = entry.item
+        new_status = compute_parent_status(item.get(CHILDREN_KEY[entry.item_type], []))
+        if item.get("status") != new_status:
+            item["status"] = new_status
+            changed.append({"id": item["id"], "status": new_status})
     return changed
 
 
-def reorder_children(parent_id: str, item_ids: list[str], data: dict) -> None:
+def reorder_children(
+    parent_id: str,
+    item_ids: list[str],
+    data: dict,
+    index: RoadmapIndex | ItemPaths | None = None,
+) -> list[dict]:
     """Reorder children of a parent to match the given ID order.
 
+    Pass the index built over data to keep it current.
+
+    Returns the reordered child list.
     Raises HTTPException if IDs don't match existing children.
     """
+    if index is None:
+        index = RoadmapIndex(data)
     if parent_id == "root":
-        collection = data.get("milestones", [])
+        parent_key = None
     else:
-        result = find_item_by_id(data, parent_id)
-        if result is None:
+        if parent_id not in index:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Parent item {parent_id} not found",
             )
-        parent_item, _, _, parent_type = result
-        children_key = CHILDREN_KEY.get(parent_type)
-        if children_key is None:
+        parent_type = index.entry(parent_id).item_type
+        if CHILDREN_KEY.get(parent_type) is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Item type '{parent_type}' has no children to reorder",
             )
-        collection = parent_item.get(children_key, [])
+        parent_key = parent_id
 
-    existing_ids = {item["id"] for item in collection}
-    requested_ids = set(item_ids)
-
-    if existing_ids != requested_ids:
+    try:
+        index.reorder(parent_key, item_ids)
+    except ValueError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Provided item IDs do not match existing children",
-        )
-
-    id_to_item = {item["id"]: item for item in collection}
-    reordered = [id_to_item[item_id] for item_id in item_ids]
-
-    # Replace in-place
-    if parent_id == "root":
-        data["milestones"] = reordered
-    else:
-        result = find_item_by_id(data, parent_id)
-        parent_item, _, _, parent_type = result
-        parent_item[CHILDREN_KEY[parent_type]] = reordered
+        ) from None
+    return index.children(parent_key)
@@ -0,0 +1,392 @@
+"""Path-level writes of roadmap item edits.
+
+Item endpoints used to deep-copy roadmap_data, edit the copy and assign
+it back, so SQLAlchemy rewrote the whole document for a one-field
+change. A RoadmapPatch edits the loaded document in place instead and
+records each change as a write at a path such as
+``milestones/0/epics/2/status``. flush() turns those into one UPDATE:
+nested ``jsonb_set`` / ``#-`` on PostgreSQL and ``json_set`` /
+``json_remove`` on SQLite, so the statement carries only the changed
+values whatever the size of the roadmap. Other dialects, roadmaps
+without data yet and patches with more than MAX_PATH_WRITES changes
+(e.g. a large batch) fall back to writing the whole document. The
+roadmap_items rows of the touched items are rewritten alongside, and
+the summary columns go out in the same UPDATE, moved by the items the
+patch changed when the cache had the previous version's summary tally.
+
+Paths come from the patch's ItemPaths index (cached per roadmap version,
+see item_paths), which the mutation helpers in roadmap_items keep
+current, so every recorded path is relative to the document as left by
+the changes before it.
+
+The UPDATE only applies at the version the roadmap was loaded at and
+bumps it. apply_edit() retries an edit that lost the race against the
+latest version, and rebases edits made against an older version (If-Match)
+when the items they target haven't changed since.
+"""
+
+import json
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import datetime, timezone
+from typing import Any, TypeVar
+
+from sqlalchemy import Text, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified, set_committed_value
+
+from ..models.roadmap import RoadmapRecord
+from ..models.user import User
+from .item_paths import ItemPaths, get_item_path_cache
+from .item_rows import items_changed_since, write_item_rows
+from .roadmap_items import (
+    CHILD_TYPE,
+    CHILDREN_KEY,
+    COLLECTION_KEY,
+    cascade_status_updates,
+    create_child_item,
+    get_roadmap_for_user,
+    reorder_children,
+)
+from .roadmap_responses import version_conflict
+from .roadmap_summary import SummaryTally
+
+# A path into roadmap_data: object keys and list positions
+Path = tuple[str | int, ...]
+
+T = TypeVar("T")
+
+# Tries at an item edit before giving up on a roadmap that keeps changing
+MAX_EDIT_ATTEMPTS = 5
+
+# Past this many path writes, sending the document is cheaper than the
+# statement applying them
+MAX_PATH_WRITES = 200
+
+# SQLite's parser overflows on a few dozen nested function calls
+SQLITE_MAX_NESTING = 24
+
+
+class VersionConflict(Exception):
+    """A roadmap write lost the race against another write."""
+
+    def __init__(self, roadmap_id: uuid.UUID):
+        super().__init__(f"Roadmap {roadmap_id} was written concurrently")
+        self.roadmap_id = roadmap_id
+
+
+class RoadmapPatch:
+    """Edits to one roadmap's items, written back as path updates.
+
+    ``data`` is the record's own roadmap_data (or a new empty document),
+    edited in place; ``index`` comes from the item path cache when this
+    version of the roadmap was edited before, and is built otherwise.
+    So does ``tally``, the summary totals, which stays None until the
+    first flush when it isn't cached.
+    """
+
+    def __init__(self, roadmap: RoadmapRecord):
+        self.roadmap = roadmap
+        self._whole = roadmap.roadmap_data is None
+        self.data: dict = {"milestones": []} if self._whole else roadmap.roadmap_data
+        cached = None
+        if not self._whole and roadmap.version is not None:
+            cached = get_item_path_cache().take(roadmap.id, roadmap.version)
+        entries, self.tally = cached or (None, None)
+        self.index = ItemPaths(self.data, entries)
+        # (path, value) sets, or (path, None) with remove=True
+        self._ops: list[tuple[Path, Any, bool]] = []
+        # Items whose roadmap_items row must be rewritten or dropped
+        self._touched: list[str] = []
+        self._removed: list[str] = []
+        # Items whose concurrent change would conflict with these edits
+        self.targets: set[str] = set()
+        # Items whose own fields or child list changed ("root" for the
+        # milestone list); kept across flushes for the version snapshot
+        self.changed: set[str] = set()
+
+    def item_path(self, item_id: str) -> Path:
+        """Path of an item, e.g. ("milestones", 0, "epics", 2)."""
+        path: list[str | int] = []
+        for entry in (*self.index.ancestors(item_id), self.index.entry(item_id)):
+            path += [COLLECTION_KEY[entry.item_type], entry.position]
+        return tuple(path)
+
+    def _set(self, path: Path, value: Any) -> None:
+        self._ops.append((path, value, False))
+
+    def _remove(self, path: Path) -> None:
+        self._ops.append((path, None, True))
+
+    def _count(self, item: dict, item_type: str, sign: int = 1) -> None:
+        """Add an item's subtree to the tally, or take it away with sign=-1."""
+        if self.tally is not None:
+            for node, node_type in _subtree(item, item_type):
+                self.tally.count(node_type, node, sign)
+
+    # --- Edits ---
+
+    def update(self, item_id: str, fields: dict[str, Any]) -> dict:
+        """Set fields on an item; returns the item."""
+        entry = self.index.entry(item_id)
+        if self.tally is not None:
+            self.tally.count(entry.item_type, entry.item, -1)
+        item = self.index.update(item_id, **fields)
+        if self.tally is not None:
+            self.tally.count(entry.item_type, item)
+        path = self.item_path(item_id)
+        for key, value in fields.items():
+            self._set((*path, key), value)
+        self._touched.append(item_id)
+        self.targets.add(item_id)
+        self.changed.add(item_id)
+        return item
+
+    def cascade_status(self, item_id: str) -> list[dict]:
+        """Recompute ancestor statuses after item_id's status changed.
+
+        Returns list of {id, status} for each changed ancestor.
+        """
+        return self.cascade_statuses([item_id])
+
+    def cascade_statuses(self, item_ids: list[str]) -> list[dict]:
+        """Recompute ancestor statuses once after several status changes."""
+        old_status = {}
+        if self.tally is not None:
+            for item_id in item_ids:
+                if item_id in self.index:
+                    for entry in self.index.ancestors(item_id):
+                        old_status[entry.item["id"]] = entry.item.get("status")
+        changed = cascade_status_updates(self.data, item_ids, self.index)
+        for change in changed:
+            if self.tally is not None:
+                entry = self.index.entry(change["id"])
+                self.tally.count(entry.item_type, {"status": old_status[change["id"]]}, -1)
+                self.tally.count(entry.item_type, entry.item)
+            self._set((*self.item_path(change["id"]), "status"), change["status"])
+            self._touched.append(change["id"])
+            self.changed.add(change["id"])
+        return changed
+
+    def add_child(self, parent_id: str, item_type: str, item_data: dict) -> dict:
+        """Append a new item under parent_id ("root" for milestones)."""
+        new_item = create_child_item(parent_id, item_type, item_data, self.data, self.index)
+        path = self.item_path(new_item["id"])
+        if path[-1] == 0:
+            # The parent may not have had the child list at all
+            self._set(path[:-1], [new_item])
+        else:
+            self._set(path, new_item)
+        subtree = _subtree_ids(new_item, item_type)
+        self._touched += subtree
+        self.changed.update(subtree)
+        self.changed.add(parent_id)
+        self._count(new_item, item_type)
+        return new_item
+
+    def remove(self, item_id: str) -> dict:
+        """Remove an item and its subtree; returns the removed item."""
+        path = self.item_path(item_id)
+        entry = self.index.entry(item_id)
+        item = self.index.remove(item_id)
+        self._remove(path)
+        subtree = _subtree_ids(item, entry.item_type)
+        self._removed += subtree
+        self._count(item, entry.item_type, -1)
+        self.targets.update(subtree)
+        self.changed.add(entry.parent_id or "root")
+        # Later siblings moved up one place
+        siblings = self.index.children(entry.parent_id)[entry.position:]
+        self._touched += [sibling["id"] for sibling in siblings]
+        return item
+
+    def reorder(self, parent_id: str, item_ids: list[str]) -> None:
+        """Reorder the children of parent_id ("root" for milestones).
+
+        JSON arrays can't be permuted in place, so the child list is
+        written whole (still only that list, not the document).
+        """
+        children = reorder_children(parent_id, item_ids, self.data, self.index)
+        if parent_id == "root":
+            path: Path = ("milestones",)
+        else:
+            entry = self.index.entry(parent_id)
+            path = (*self.item_path(parent_id), CHILDREN_KEY[entry.item_type])
+        self._set(path, children)
+        self._touched += [child["id"] for child in children]
+        self.targets.update(child["id"] for child in children)
+        self.changed.add(parent_id)
+
+    # --- Writing ---
+
+    async def flush(self, db: AsyncSession) -> None:
+        """Write the recorded edits to the database.
+
+        The write only applies if the roadmap is still at the version it
+        was loaded at.
+
+        Raises:
+            VersionConflict: If another write got there first; nothing
+                was written.
+        """
+        roadmap = self.roadmap
+        if self._whole:
+            # Rows are written by the item_rows flush hook; the ORM checks the version
+            roadmap.roadmap_data = self.data
+            await db.flush()
+            self._whole = False
+            self._clear()
+            return
+        if not self._ops:
+            return
+
+        dialect = db.get_bind().dialect.name
+        if len(self._ops) > MAX_PATH_WRITES:
+            value = self.data
+        elif dialect == "postgresql":
+            value = _postgresql_expression(self._ops)
+        elif dialect == "sqlite":
+            runs = _runs(self._ops)
+            value = _sqlite_expression(runs) if len(runs) <= SQLITE_MAX_NESTING else self.data
+        else:
+            flag_modified(roadmap, "roadmap_data")
+            await db.flush()
+            self._clear()
+            return
+
+        now = datetime.now(timezone.utc)
+        version = roadmap.version + 1
+        if self.tally is None:
+            self.tally = SummaryTally.of(self.data)
+        summary = self.tally.values()
+        result = await db.execute(
+            update(RoadmapRecord)
+            .where(RoadmapRecord.id == roadmap.id, RoadmapRecord.version == roadmap.version)
+            .values(roadmap_data=value, updated_at=now, version=version, **summary)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise VersionConflict(roadmap.id)
+        # The in-memory document already matches; don't let the ORM write it again
+        set_committed_value(roadmap, "updated_at", now)
+        set_committed_value(roadmap, "version", version)
+        for key, summary_value in summary.items():
+            set_committed_value(roadmap, key, summary_value)
+        await write_item_rows(
+            db, roadmap.id, self.index, self._touched, self._removed, version
+        )
+        get_item_path_cache().put(roadmap.id, version, self.index.entries, self.tally)
+        self._clear()
+
+    def _clear(self) -> None:
+        self._ops.clear()
+        self._touched.clear()
+        self._removed.clear()
+
+
+async def apply_edit(
+    db: AsyncSession,
+    roadmap_id: uuid.UUID,
+    user: User,
+    edit: Callable[[RoadmapPatch], T],
+    expected_version: int | None = None,
+) -> tuple[RoadmapPatch, T]:
+    """Apply edit to the current version of a roadmap and write it.
+
+    If another write lands between loading the roadmap and writing it,
+    the roadmap is reloaded and edit applied again, so concurrent edits
+    never overwrite each other and no lock is held across requests.
+    With expected_version (from If-Match), the edit is rebased onto the
+    current version unless one of the items it targets has changed
+    since expected_version.
+
+    Returns:
+        The flushed patch and edit's return value.
+
+    Raises:
+        HTTPException: 409 on a conflicting change, or if the roadmap
+            kept changing under the edit.
+    """
+    roadmap = None
+    for _ in range(MAX_EDIT_ATTEMPTS):
+        if roadmap is not None:
+            db.expire(roadmap)
+        roadmap = await get_roadmap_for_user(db, roadmap_id, user)
+        if expected_version is not None and expected_version > roadmap.version:
+            raise version_conflict(roadmap.version)
+        patch = RoadmapPatch(roadmap)
+        result = edit(patch)
+        if (
+            expected_version is not None
+            and expected_version < roadmap.version
+            and await items_changed_since(db, roadmap.id, expected_version, patch.targets)
+        ):
+            raise version_conflict(roadmap.version)
+        try:
+            await patch.flush(db)
+        except VersionConflict:
+            continue
+        return patch, result
+    current = await db.scalar(
+        select(RoadmapRecord.version).where(RoadmapRecord.id == roadmap_id)
+    )
+    raise version_conflict(current)
+
+
+def _subtree(item: dict, item_type: str) -> Iterator[tuple[dict, str]]:
+    """An item and everything below it, with their types."""
+    stack = [(item, item_type)]
+    while stack:
+        node, node_type = stack.pop()
+        yield node, node_type
+        children_key = CHILDREN_KEY[node_type]
+        if children_key is not None:
+            child_type = CHILD_TYPE[node_type]
+            stack.extend((child, child_type) for child in node.get(children_key) or [])
+
+
+def _subtree_ids(item: dict, item_type: str) -> list[str]:
+    return [node["id"] for node, _ in _subtree(item, item_type)]
+
+
+def _postgresql_expression(ops: list[tuple[Path, Any, bool]]):
+    value = RoadmapRecord.roadmap_data
+    for path, new_value, remove in ops:
+        pg_path = literal([str(p) for p in path], ARRAY(Text))
+        if remove:
+            value = value.op("#-", return_type=JSONB)(pg_path)
+        else:
+            value = func.jsonb_set(value, pg_path, literal(new_value, JSONB), True, type_=JSONB)
+    return value
+
+
+def _sqlite_path(path: Path) -> str:
+    parts = ["$"]
+    for p in path:
+        parts.append(f"[{p}]" if isinstance(p, int) else f'."{p}"')
+    return "".join(parts)
+
+
+def _runs(ops: list[tuple[Path, Any, bool]]) -> list[tuple[bool, list]]:
+    """Group consecutive sets and consecutive removes."""
+    runs: list[tuple[bool, list]] = []
+    for path, new_value, remove in ops:
+        if not runs or runs[-1][0] != remove:
+            runs.append((remove, []))
+        runs[-1][1].append((path, new_value))
+    return runs
+
+
+def _sqlite_expression(runs: list[tuple[bool, list]]):
+    # json_set and json_remove take any number of paths, applied in order
+    value = RoadmapRecord.roadmap_data
+    for remove, ops in runs:
+        if remove:
+            value = func.json_remove(value, *(_sqlite_path(path) for path, _ in ops))
+        else:
+            args = []
+            for path, new_value in ops:
+                args += [_sqlite_path(path), func.json(json.dumps(new_value))]
+            value = func.json_set(value, *args)
+    return value
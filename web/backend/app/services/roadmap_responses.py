@@ -0,0 +1,198 @@
+"""Serialized GET /roadmaps/{id} responses, cached per roadmap version.
+
+The frontend polls roadmap detail, and building it means reassembling
+every item and serializing the whole document. Responses carry an ETag
+derived from the roadmap's version, so a client holding the current
+copy gets a bodyless 304. Otherwise, the JSON bytes (and their gzipped
+form) are kept in an in-process LRU keyed by roadmap ID, version and
+projection (fields/depth), and are rebuilt only after the roadmap is
+written.
+"""
+
+import gzip
+import hashlib
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from fastapi import HTTPException, Response, status
+
+from ..config import get_settings
+
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 1024
+
+
+def etag_for(version: int, variant: str = "") -> str:
+    """ETag of one variant (e.g. a field projection) of a roadmap version."""
+    tag = str(version)
+    if variant:
+        tag += "-" + hashlib.sha1(variant.encode()).hexdigest()[:8]
+    # Weak: the identity and gzip encodings of a version share it
+    return f'W/"{tag}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values.
+
+    gzip;q=0 refuses it; without a gzip entry, a "*" entry decides.
+    """
+    weights: dict[str, float] = {}
+    for entry in (accept_encoding or "").split(","):
+        coding, _, params = entry.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip().lower()] = weight
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in weights:
+            return weights[coding] > 0
+    return False
+
+
+def if_match_version(if_match: str | None) -> int | None:
+    """Roadmap version named by an If-Match header, or None for any version.
+
+    Takes a bare version number or any ETag from a roadmap read.
+    """
+    if not if_match or if_match.strip() == "*":
+        return None
+    tag = if_match.strip().removeprefix("W/").strip('"').split("-")[0]
+    if not tag.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="If-Match must be a roadmap version or ETag",
+        )
+    return int(tag)
+
+
+def version_conflict(version: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Roadmap was changed by another edit (now at version {version})",
+        headers={"ETag": etag_for(version)},
+    )
+
+
+class SerializedResponse:
+    """One version's JSON body, plus its gzip encoding when compressible."""
+
+    __slots__ = ("body", "gzipped")
+
+    def __init__(self, body: bytes, compress: bool = True):
+        self.body = body
+        self.gzipped = (
+            gzip.compress(body, compresslevel=6)
+            if compress and len(body) >= GZIP_MIN_BYTES
+            else None
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.gzipped or b"")
+
+    def response(self, etag: str, accept_encoding: str | None) -> Response:
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "private, no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        body = self.body
+        if self.gzipped is not None and accepts_gzip(accept_encoding):
+            body = self.gzipped
+            headers["Content-Encoding"] = "gzip"
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+    )
+
+
+class RoadmapResponseCache:
+    """LRU of serialized responses, one version per roadmap, bounded in bytes.
+
+    Each roadmap's entry holds the variants (full document, field
+    projections) served for its current version.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._responses: OrderedDict[
+            Hashable, tuple[Hashable, dict[str, SerializedResponse]]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def get(
+        self, roadmap_id: Hashable, version: Hashable, variant: str = ""
+    ) -> SerializedResponse | None:
+        """Return the cached response for this version and variant, if any."""
+        cached = self._responses.get(roadmap_id)
+        if cached is None or cached[0] != version or variant not in cached[1]:
+            return None
+        self._responses.move_to_end(roadmap_id)
+        return cached[1][variant]
+
+    def put(
+        self,
+        roadmap_id: Hashable,
+        version: Hashable,
+        response: SerializedResponse,
+        variant: str = "",
+    ) -> None:
+        if response.size > self.max_bytes:
+            return
+        cached = self._responses.get(roadmap_id)
+        if cached is None or cached[0] != version:
+            self.discard(roadmap_id)
+            cached = self._responses[roadmap_id] = (version, {})
+        variants = cached[1]
+        if variant in variants:
+            self.size -= variants[variant].size
+        variants[variant] = response
+        self.size += response.size
+        self._responses.move_to_end(roadmap_id)
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self._responses.popitem(last=False)
+            self.size -= sum(r.size for r in evicted.values())
+
+    def discard(self, roadmap_id: Hashable) -> None:
+        cached = self._responses.pop(roadmap_id, None)
+        if cached is not None:
+            self.size -= sum(r.size for r in cached[1].values())
+
+    def clear(self) -> None:
+        self._responses.clear()
+        self.size = 0
+
+
+_cache: RoadmapResponseCache | None = None
+
+
+def get_roadmap_response_cache() -> RoadmapResponseCache:
+    """Return the process-wide cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = RoadmapResponseCache(get_settings().roadmap_response_cache_mb * 1024 * 1024)
+    return _cache
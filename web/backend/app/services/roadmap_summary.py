@@ -0,0 +1,124 @@
+"""Summary columns stored on each roadmap row.
+
+Listing roadmaps used to load every roadmap_data document and summarize
+it in Python. The figures the lists show (item counts, hours, completion)
+are now kept in columns of the roadmaps table, updated on every write
+of roadmap_data: by a before_flush hook when the document is assigned
+through the ORM, and by RoadmapPatch when items are edited by path.
+List queries load SUMMARY_COLUMNS only.
+
+The columns are rounded, so they can't be moved by the items an edit
+changes. A SummaryTally holds the exact totals behind them; RoadmapPatch
+keeps one in the item path cache next to the index entries and adjusts
+it item by item, so the document is only summarized whole when its
+index has to be built too.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, attributes
+
+from arcane.core.items import Status
+from arcane.core.items.index import CHILD_TYPE, CHILDREN_KEY
+from arcane.core.planning import summarize
+
+from ..models.roadmap import RoadmapRecord
+
+# What RoadmapSummary needs; pass to load_only()
+SUMMARY_COLUMNS = (
+    RoadmapRecord.id,
+    RoadmapRecord.name,
+    RoadmapRecord.status,
+    RoadmapRecord.created_at,
+    RoadmapRecord.updated_at,
+    RoadmapRecord.item_counts,
+    RoadmapRecord.completion_percent,
+    RoadmapRecord.hours_completed,
+    RoadmapRecord.hours_total,
+)
+
+
+# Item type -> its key in item_counts
+COUNT_KEY = {child: CHILDREN_KEY[parent] for parent, child in CHILD_TYPE.items()}
+
+
+@dataclass
+class SummaryTally:
+    """Exact totals behind a roadmap's summary columns.
+
+    Attributes:
+        item_counts: Items per type, keyed like RoadmapSummary.item_counts.
+        completed_items: Completed items of any type.
+        hours_total: Sum of task estimates.
+        hours_completed: Sum of completed task estimates.
+    """
+
+    item_counts: dict[str, int]
+    completed_items: int
+    hours_total: float
+    hours_completed: float
+
+    @classmethod
+    def of(cls, data: dict) -> "SummaryTally":
+        """Tally a whole ``{"milestones": [...]}`` document."""
+        summary = summarize(data)
+        return cls(
+            item_counts=summary.item_counts,
+            completed_items=sum(summary.completed_counts.values()),
+            hours_total=summary.hours_total,
+            hours_completed=summary.hours_completed,
+        )
+
+    def count(self, item_type: str, item: dict, sign: int = 1) -> None:
+        """Add an item's share of the totals, or take it away with sign=-1.
+
+        Counts the item alone, not its children.
+        """
+        completed = item.get("status") == Status.COMPLETED
+        self.item_counts[COUNT_KEY[item_type]] += sign
+        self.completed_items += sign * completed
+        if item_type == "task":
+            hours = sign * float(item.get("estimated_hours") or 0)
+            self.hours_total += hours
+            self.hours_completed += hours * completed
+
+    def values(self) -> dict[str, Any]:
+        """Summary column values, rounded as summarize() rounds them."""
+        items = sum(self.item_counts.values())
+        return {
+            "item_counts": dict(self.item_counts),
+            "completion_percent": (
+                round(self.completed_items / items * 100, 1) if items > 0 else 0.0
+            ),
+            # Sums moved up and down by edits can land a hair under a whole hour
+            "hours_completed": int(round(self.hours_completed, 6)),
+            "hours_total": int(round(self.hours_total, 6)),
+        }
+
+
+def summary_values(data: dict | None) -> dict[str, Any]:
+    """Summary column values for a roadmap document."""
+    if not data:
+        return {
+            "item_counts": None,
+            "completion_percent": None,
+            "hours_completed": None,
+            "hours_total": None,
+        }
+    return SummaryTally.of(data).values()
+
+
+@event.listens_for(Session, "before_flush")
+def _update_summaries(session: Session, flush_context, instances) -> None:
+    """Recompute the summary of roadmaps whose roadmap_data was assigned."""
+    for record in (*session.new, *session.dirty):
+        if not isinstance(record, RoadmapRecord):
+            continue
+        history = attributes.get_history(
+            record, "roadmap_data", passive=attributes.PASSIVE_NO_INITIALIZE
+        )
+        if history.has_changes():
+            for key, value in summary_values(record.roadmap_data).items():
+                setattr(record, key, value)
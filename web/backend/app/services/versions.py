@@ -0,0 +1,312 @@
+"""Roadmap version history for the web backend.
+
+Snapshots use arcane-core's content-addressed object format: every item
+is an object keyed by the hash of its fields and its children's hashes,
+so unchanged subtrees are shared between snapshots. Objects and
+snapshots are rows of the roadmap_version_objects and roadmap_snapshots
+tables, so every worker sees the same history, and each snapshot is
+keyed by the roadmap version it records.
+
+A snapshot is recorded once the write it records has committed. After
+an item edit, only the items the RoadmapPatch changed and their
+ancestors are hashed again; every other subtree keeps the hash it has
+in the previous version's snapshot, read from the objects along the
+changed paths. When there is no snapshot of the previous version, or
+the write wasn't a patch (generation saves), the whole tree is hashed.
+
+Reads load objects a tree level at a time into an in-memory VersionStore
+and let it rebuild or diff them; diffs only load the subtrees that
+differ.
+"""
+
+import json
+import logging
+import uuid
+from collections.abc import Iterable
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from arcane.core.storage import Change, MemoryObjectBackend, VersionStore, encode_object
+
+from ..models.roadmap import RoadmapRecord
+from ..models.roadmap_snapshot import RoadmapSnapshot, RoadmapVersionObject
+from .roadmap_patch import RoadmapPatch
+
+logger = logging.getLogger(__name__)
+
+# Item type -> (key of its child list, type of its children), "roadmap" for the root
+CHILDREN = {
+    "roadmap": ("milestones", "milestone"),
+    "milestone": ("epics", "epic"),
+    "epic": ("stories", "story"),
+    "story": ("tasks", "task"),
+    "task": (None, None),
+}
+
+# Object hashes per SELECT ... IN query
+LOAD_CHUNK = 500
+
+
+async def record_version(
+    db: AsyncSession,
+    roadmap: RoadmapRecord,
+    message: str,
+    patch: RoadmapPatch | None = None,
+) -> RoadmapSnapshot | None:
+    """Record and commit a snapshot of a roadmap at its current version.
+
+    Call once the write has committed. The snapshot is written in a
+    session of its own on db's engine, and history is best effort: a
+    snapshot that fails to record is logged, and db and the write are
+    left as they were.
+
+    Args:
+        db: Any session on the roadmap's database.
+        roadmap: The roadmap record (name and context are kept too).
+        message: Short description of the change.
+        patch: The patch that made the write, so only what it changed
+            is hashed again; None hashes roadmap.roadmap_data whole.
+
+    Returns:
+        The snapshot of this version, or None if the roadmap has no data
+        yet or recording failed.
+    """
+    data = patch.data if patch is not None else roadmap.roadmap_data
+    if not data:
+        return None
+    try:
+        async with AsyncSession(db.bind, expire_on_commit=False) as session:
+            return await _record(session, roadmap, message, data, patch)
+    except SQLAlchemyError:
+        logger.exception(
+            "Could not record version %s of roadmap %s", roadmap.version, roadmap.id
+        )
+        return None
+
+
+async def _record(
+    db: AsyncSession,
+    roadmap: RoadmapRecord,
+    message: str,
+    data: dict,
+    patch: RoadmapPatch | None,
+) -> RoadmapSnapshot:
+    latest = await find_snapshot(db, roadmap.id)
+    if latest is not None and latest.version == roadmap.version:
+        return latest
+
+    changed = None
+    old_objects: dict[str, dict] = {}
+    if patch is not None and latest is not None and latest.version == roadmap.version - 1:
+        changed = _changed_paths(patch)
+        try:
+            old_objects = await _objects_along(db, roadmap.id, latest.root, changed)
+        except KeyError:
+            changed = None
+
+    root_item = {
+        "project_name": roadmap.name,
+        "context": roadmap.context,
+        "milestones": data.get("milestones", []),
+    }
+    new_objects: dict[str, bytes] = {}
+    root = _hash_tree("roadmap", root_item, "root", changed, old_objects, new_objects)
+    if latest is not None and latest.root == root:
+        return latest
+
+    if new_objects:
+        await db.execute(
+            _insert_new(db, RoadmapVersionObject),
+            [
+                {"roadmap_id": roadmap.id, "hash": key, "data": encoded.decode()}
+                for key, encoded in new_objects.items()
+            ],
+        )
+    snapshot = RoadmapSnapshot(
+        roadmap_id=roadmap.id,
+        version=roadmap.version,
+        root=root,
+        message=message,
+        total_items=roadmap.item_counts or {},
+        total_hours=roadmap.hours_total or 0,
+    )
+    db.add(snapshot)
+    await db.commit()
+    return snapshot
+
+
+def _changed_paths(patch: RoadmapPatch) -> set[str]:
+    """The patch's changed items and their ancestors, plus "root"."""
+    ids = {"root"}
+    for item_id in patch.changed:
+        if item_id in patch.index:
+            ids.add(item_id)
+            ids.update(entry.item["id"] for entry in patch.index.ancestors(item_id))
+    return ids
+
+
+async def _objects_along(
+    db: AsyncSession, roadmap_id: uuid.UUID, root: str, changed: set[str]
+) -> dict[str, dict]:
+    """Objects of the changed items that have children, by item ID, from a snapshot.
+
+    Raises:
+        KeyError: If an object is missing.
+    """
+    found: dict[str, dict] = {}
+    level = {"root": root}
+    item_type = "roadmap"
+    while level:
+        objects = await _load_objects(db, roadmap_id, level.values())
+        child_type = CHILDREN[item_type][1]
+        leaves = CHILDREN[child_type][0] is None
+        next_level = {}
+        for item_id, key in level.items():
+            obj = found[item_id] = json.loads(objects[key])
+            if not leaves:
+                next_level.update(
+                    (child_id, child_key)
+                    for child_id, child_key in obj["children"]
+                    if child_id in changed
+                )
+        level, item_type = next_level, child_type
+    return found
+
+
+def _hash_tree(
+    item_type: str,
+    item: dict,
+    item_id: str,
+    changed: set[str] | None,
+    old_objects: dict[str, dict],
+    new_objects: dict[str, bytes],
+) -> str:
+    """Hash an item's subtree, reusing the old hashes of unchanged children.
+
+    Objects hashed here are added to new_objects. With changed None,
+    nothing is reused.
+    """
+    children = []
+    children_key, child_type = CHILDREN[item_type]
+    if children_key is not None:
+        old = old_objects.get(item_id)
+        old_hashes = dict(old["children"]) if old is not None else {}
+        for child in item.get(children_key) or []:
+            child_id = child["id"]
+            if changed is not None and child_id not in changed and child_id in old_hashes:
+                children.append([child_id, old_hashes[child_id]])
+            else:
+                key = _hash_tree(child_type, child, child_id, changed, old_objects, new_objects)
+                children.append([child_id, key])
+    key, encoded = encode_object(item_type, item, children)
+    new_objects[key] = encoded
+    return key
+
+
+def _insert_new(db: AsyncSession, model):
+    """INSERT that skips rows whose primary key already exists."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing()
+    if dialect == "sqlite":
+        return sqlite.insert(model).on_conflict_do_nothing()
+    return insert(model)
+
+
+# --- Reading ---
+
+
+async def list_snapshots(db: AsyncSession, roadmap_id: uuid.UUID) -> list[RoadmapSnapshot]:
+    """All snapshots of a roadmap, newest first."""
+    result = await db.execute(
+        select(RoadmapSnapshot)
+        .where(RoadmapSnapshot.roadmap_id == roadmap_id)
+        .order_by(RoadmapSnapshot.version.desc())
+    )
+    return list(result.scalars())
+
+
+async def find_snapshot(
+    db: AsyncSession,
+    roadmap_id: uuid.UUID,
+    version: int | None = None,
+    before: int | None = None,
+) -> RoadmapSnapshot | None:
+    """The snapshot of a version, else the latest one (before a version, if given)."""
+    query = select(RoadmapSnapshot).where(RoadmapSnapshot.roadmap_id == roadmap_id)
+    if version is not None:
+        return await db.scalar(query.where(RoadmapSnapshot.version == version))
+    if before is not None:
+        query = query.where(RoadmapSnapshot.version < before)
+    return await db.scalar(query.order_by(RoadmapSnapshot.version.desc()).limit(1))
+
+
+async def checkout_data(db: AsyncSession, roadmap_id: uuid.UUID, root: str) -> dict:
+    """Rebuild the roadmap document a snapshot's root hash points to."""
+    store = VersionStore(MemoryObjectBackend())
+    await _fetch_subtrees(db, roadmap_id, [root], store)
+    return store.checkout_data(root)
+
+
+async def diff_roots(
+    db: AsyncSession, roadmap_id: uuid.UUID, old_root: str, new_root: str
+) -> list[Change]:
+    """List the changes between two snapshots' root hashes."""
+    store = VersionStore(MemoryObjectBackend())
+    pairs = [(old_root, new_root)] if old_root != new_root else []
+    while pairs:
+        objects = await _fetch(db, roadmap_id, {key for pair in pairs for key in pair}, store)
+        next_pairs = []
+        whole = []
+        for old_key, new_key in pairs:
+            old_children = dict(objects[old_key]["children"])
+            new_children = dict(objects[new_key]["children"])
+            for child_id, new_child in new_children.items():
+                old_child = old_children.get(child_id)
+                if old_child is None:
+                    whole.append(new_child)
+                elif old_child != new_child:
+                    next_pairs.append((old_child, new_child))
+            whole += [key for child_id, key in old_children.items() if child_id not in new_children]
+        # Added and removed items are reported with their whole subtree
+        await _fetch_subtrees(db, roadmap_id, whole, store)
+        pairs = next_pairs
+    return store.diff_roots(old_root, new_root)
+
+
+async def _fetch_subtrees(
+    db: AsyncSession, roadmap_id: uuid.UUID, keys: list[str], store: VersionStore
+) -> None:
+    while keys:
+        objects = await _fetch(db, roadmap_id, keys, store)
+        keys = [child for obj in objects.values() for _, child in obj["children"]]
+
+
+async def _fetch(
+    db: AsyncSession, roadmap_id: uuid.UUID, keys: Iterable[str], store: VersionStore
+) -> dict[str, dict]:
+    """Load objects into store; returns them decoded, by hash."""
+    objects = {}
+    for key, data in (await _load_objects(db, roadmap_id, keys)).items():
+        store.backend.put(key, data.encode())
+        objects[key] = json.loads(data)
+    return objects
+
+
+async def _load_objects(
+    db: AsyncSession, roadmap_id: uuid.UUID, keys: Iterable[str]
+) -> dict[str, str]:
+    keys = list(dict.fromkeys(keys))
+    found: dict[str, str] = {}
+    for start in range(0, len(keys), LOAD_CHUNK):
+        result = await db.execute(
+            select(RoadmapVersionObject.hash, RoadmapVersionObject.data).where(
+                RoadmapVersionObject.roadmap_id == roadmap_id,
+                RoadmapVersionObject.hash.in_(keys[start:start + LOAD_CHUNK]),
+            )
+        )
+        found.update(result.all())
+    return found
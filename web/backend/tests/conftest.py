@@ -1,10 +1,14 @@
+import uuid
+
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.database import get_db
 from app.main import app
 from app.models import Base
+from app.models.roadmap import RoadmapRecord
 from app.models.user import User
 from app.services.auth import hash_password
 
@@ -66,3 +70,94 @@ async def auth_headers(client: AsyncClient) -> dict[str, str]:
     })
     token = resp.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
+
+
+def big_roadmap(milestones: int = 4, tasks_per_story: int = 25) -> dict:
+    """A roadmap of a few hundred KB: 4 x 3 epics x 4 stories x 25 tasks."""
+    return {
+        "milestones": [
+            {
+                "id": f"m{m}",
+                "name": f"Milestone {m}",
+                "status": "not_started",
+                "epics": [
+                    {
+                        "id": f"m{m}e{e}",
+                        "name": f"Epic {e}",
+                        "status": "not_started",
+                        "stories": [
+                            {
+                                "id": f"m{m}e{e}s{s}",
+                                "name": f"Story {s}",
+                                "status": "not_started",
+                                "tasks": [
+                                    {
+                                        "id": f"m{m}e{e}s{s}t{t}",
+                                        "name": f"Task {t}",
+                                        "description": "x" * 200,
+                                        "status": "not_started",
+                                    }
+                                    for t in range(tasks_per_story)
+                                ],
+                            }
+                            for s in range(4)
+                        ],
+                    }
+                    for e in range(3)
+                ],
+            }
+            for m in range(milestones)
+        ],
+    }
+
+
+@pytest.fixture
+async def seeded(client: AsyncClient, auth_headers):
+    """A roadmap whose data is written straight to the database."""
+    resp = await client.post("/projects/", json={"name": "Patch"}, headers=auth_headers)
+    project_id = uuid.UUID(resp.json()["id"])
+    async with async_session_test() as session:
+        roadmap = RoadmapRecord(
+            project_id=project_id,
+            name="Big",
+            context={"vision": "test"},
+            roadmap_data=big_roadmap(),
+        )
+        session.add(roadmap)
+        await session.commit()
+        return roadmap.id, auth_headers
+
+
+async def stored_data(roadmap_id: uuid.UUID) -> dict:
+    async with async_session_test() as session:
+        return await session.scalar(
+            select(RoadmapRecord.roadmap_data).where(RoadmapRecord.id == roadmap_id)
+        )
+
+
+@pytest.fixture
+def captured():
+    """Parameters of every UPDATE on roadmaps, as sent to the database."""
+    updates = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE roadmaps"):
+            updates.append(parameters)
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", capture)
+    yield updates
+    event.remove(engine_test.sync_engine, "before_cursor_execute", capture)
+
+
+@pytest.fixture
+def selects():
+    """Every SELECT sent to the database."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine_test.sync_engine, "before_cursor_execute", capture)
@@ -12,6 +12,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import Settings, get_settings
 from app.main import app
 from app.models.roadmap import RoadmapRecord
+from app.models.usage_record import UsageRecord
+from arcane.core.clients import UsageStats
 
 pytestmark = pytest.mark.asyncio
 
@@ -156,7 +158,7 @@ def _mock_run_ai_edit(item, item_type, command, context_dict, parent_context, an
     edited = dict(item)
     edited["name"] = f"[Edited] {item['name']}"
     edited["description"] = f"AI edited: {command}"
-    return edited
+    return edited, UsageStats(api_calls=1, input_tokens=1200, output_tokens=300)
 
 
 # --- Tests ---
@@ -282,3 +284,39 @@ class TestAiEdit:
         assert resp.status_code == 200
         data = resp.json()
         assert data["item_type"] == "story"
+
+    async def test_ai_edit_charges_usage(
+        self, client: AsyncClient, roadmap_with_items, db_session: AsyncSession
+    ):
+        rm, headers = roadmap_with_items
+        with patch("app.routers.roadmaps.run_ai_edit", side_effect=_mock_run_ai_edit):
+            await client.post(
+                f"/roadmaps/{rm['id']}/items/ep-1/ai-edit",
+                json={"command": "Rename this"},
+                headers=headers,
+            )
+        records = (await db_session.execute(select(UsageRecord))).scalars().all()
+        assert [(r.kind, r.input_tokens, r.output_tokens) for r in records] == [
+            ("ai_edit", 1200, 300)
+        ]
+        assert records[0].roadmap_id == uuid.UUID(rm["id"])
+
+    async def test_ai_edit_refused_once_quota_used_up(
+        self, client: AsyncClient, roadmap_with_items
+    ):
+        rm, headers = roadmap_with_items
+        app.dependency_overrides[get_settings] = _fake_settings(user_quota_tokens=1000)
+        with patch("app.routers.roadmaps.run_ai_edit", side_effect=_mock_run_ai_edit) as run:
+            first = await client.post(
+                f"/roadmaps/{rm['id']}/items/ep-1/ai-edit",
+                json={"command": "Rename this"},
+                headers=headers,
+            )
+            second = await client.post(
+                f"/roadmaps/{rm['id']}/items/ep-1/ai-edit",
+                json={"command": "Rename this again"},
+                headers=headers,
+            )
+        assert first.status_code == 200
+        assert second.status_code == 429
+        assert run.call_count == 1
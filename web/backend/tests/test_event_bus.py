@@ -0,0 +1,265 @@
+"""Tests for the event bus: subscriber queues, backends and NOTIFY payloads."""
+
+import asyncio
+import contextlib
+
+import pytest
+from httpx import AsyncClient
+
+from app.config import Settings
+from app.services import event_bus
+from app.services.event_bus import (
+    MAX_PAYLOAD,
+    PostgresBackend,
+    Reassembler,
+    Subscription,
+    encode,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_subscribers():
+    event_bus._subscribers.clear()
+    yield
+    event_bus._subscribers.clear()
+
+
+def big_event() -> dict:
+    return {
+        "event": "complete",
+        "data": {"report": ["détail " * 40 for _ in range(100)]},
+    }
+
+
+def item(n: int) -> dict:
+    return {"event": "item_created", "data": {"type": "task", "name": f"T{n}", "parent": "S"}}
+
+
+def progress(tasks: int) -> dict:
+    return {"event": "progress", "data": {"tasks": tasks}}
+
+
+def drain(queue: Subscription) -> list[dict]:
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+class TestSubscription:
+    def test_keeping_up_sees_every_event(self):
+        queue = Subscription(max_events=4)
+        for n in range(10):
+            queue.put_nowait(item(n))
+            assert queue.get_nowait() == item(n)
+        assert queue.stats()["delivered"] == 10
+        assert queue.coalesced == queue.dropped == 0
+
+    def test_latest_progress_replaces_pending(self):
+        queue = Subscription(batch_seconds=0)
+        queue.put_nowait(progress(1))
+        queue.put_nowait(item(0))
+        queue.put_nowait(progress(2))
+        assert drain(queue) == [item(0), progress(2)]
+        assert queue.coalesced == 1
+
+    def test_items_batched_within_window(self):
+        queue = Subscription(batch_seconds=60)
+        for n in range(3):
+            queue.put_nowait(item(n))
+        queue.put_nowait(progress(3))
+        queue.put_nowait(item(3))
+        events = drain(queue)
+        assert [e["event"] for e in events] == ["items_created", "progress", "item_created"]
+        assert events[0]["data"]["items"] == [item(n)["data"] for n in range(3)]
+        assert queue.stats()["delivered"] == 5
+
+        queue = Subscription(batch_seconds=0)
+        queue.put_nowait(item(0))
+        queue.put_nowait(item(1))
+        assert [e["event"] for e in drain(queue)] == ["item_created", "item_created"]
+
+    def test_bounded_but_terminal_events_kept(self):
+        queue = Subscription(max_events=5, batch_seconds=0)
+        queue.put_nowait({"event": "budget_exceeded", "data": {}})
+        for n in range(20):
+            queue.put_nowait(item(n))
+        queue.put_nowait({"event": "complete", "data": {}})
+        stats = queue.stats()
+        assert stats["pending"] == 5
+        assert stats["dropped"] == 17
+        events = drain(queue)
+        assert events[0]["event"] == "budget_exceeded"
+        assert events[1:4] == [item(17), item(18), item(19)]
+        assert events[-1]["event"] == "complete"
+
+    def test_batches_count_toward_bound(self):
+        queue = Subscription(max_events=10, batch_seconds=60)
+        for n in range(25):
+            queue.put_nowait(item(n))
+        assert queue.stats()["pending"] <= 10
+        assert queue.dropped + queue.stats()["pending"] == 25
+
+    async def test_get_waits_for_events(self):
+        queue = Subscription()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+        queue.put_nowait(progress(1))
+        assert await asyncio.wait_for(getter, 1) == progress(1)
+
+    async def test_stream_ends_on_terminal_event(self):
+        queue = Subscription()
+        for event in (progress(1), {"event": "complete", "data": {}}, progress(2)):
+            queue.put_nowait(event)
+
+        async def running():
+            return None
+
+        events = [e async for e in event_bus.events(queue, running)]
+        assert [e["event"] for e in events] == ["progress", "complete"]
+
+    async def test_stream_finds_terminal_event_it_missed(self):
+        checks = []
+
+        async def finished():
+            checks.append(True)
+            return {"event": "error", "data": {}} if len(checks) == 2 else None
+
+        events = [e async for e in event_bus.events(Subscription(), finished, idle_seconds=0.01)]
+        assert events == [{"event": "error", "data": {}}]
+        assert len(checks) == 2
+
+    async def test_lag_metrics(self, client: AsyncClient):
+        queue = event_bus.subscribe("job-1")
+        queue.max_events = 3
+        for n in range(5):
+            event_bus.publish("job-1", progress(n))
+            event_bus.publish("job-1", {"event": "export_step", "data": {"n": n}})
+        await asyncio.sleep(0.01)
+        [stats] = event_bus.subscriber_stats()["job-1"]
+        assert stats["pending"] == 3
+        assert stats["dropped"] == 3
+        assert stats["coalesced"] == 4
+        assert stats["lag_seconds"] > 0
+
+        resp = await client.get("/metrics")
+        assert "arcane_sse_subscribers 1" in resp.text
+        assert "arcane_sse_pending_events_max 3" in resp.text
+        event_bus.unsubscribe("job-1", queue)
+        assert "arcane_sse_subscribers 0" in event_bus.render_prometheus()
+
+
+class TestEncoding:
+    def test_small_event_is_one_payload(self):
+        event = {"event": "progress", "data": {"tasks": 3}}
+        payloads = encode("w1", "w1-0", "job-1", event)
+        assert len(payloads) == 1
+        assert Reassembler().feed(payloads[0]) == {"o": "w1", "j": "job-1", "e": event}
+
+    def test_large_event_is_chunked(self):
+        payloads = encode("w1", "w1-0", "job-1", big_event())
+        assert len(payloads) > 1
+        assert all(len(p.encode()) < 8000 for p in payloads)
+        assert all(len(p) <= MAX_PAYLOAD for p in payloads)
+
+        reassembler = Reassembler()
+        assert [reassembler.feed(p) for p in payloads[:-1]] == [None] * (len(payloads) - 1)
+        assert reassembler.feed(payloads[-1])["e"] == big_event()
+
+    def test_interleaved_messages(self):
+        first = encode("w1", "w1-0", "job-1", big_event())
+        second = encode("w2", "w2-0", "job-2", big_event())
+        reassembler = Reassembler()
+        done = [m for pair in zip(first, second, strict=True) for m in map(reassembler.feed, pair) if m]
+        assert [m["j"] for m in done] == ["job-1", "job-2"]
+
+    def test_incomplete_messages_are_bounded(self):
+        reassembler = Reassembler()
+        for n in range(Reassembler.MAX_PENDING + 10):
+            reassembler.feed(f"m{n}:0:2:{{")
+        assert len(reassembler._pending) == Reassembler.MAX_PENDING
+
+
+class TestPostgresBackend:
+    def test_delivers_other_workers_events(self):
+        backend = PostgresBackend("postgresql://unused", "events")
+        queue = event_bus.subscribe("job-1")
+        event = {"event": "progress", "data": {}}
+        for payload in encode("other", "other-0", "job-1", event):
+            backend.receive(payload)
+        # Its own events were delivered locally when published
+        for payload in encode(backend.origin, f"{backend.origin}-0", "job-1", event):
+            backend.receive(payload)
+        backend.receive("not a payload")
+        assert queue.qsize() == 1
+        assert queue.get_nowait() == event
+
+    def test_publish_delivers_locally_and_sends(self, monkeypatch):
+        backend = PostgresBackend("postgresql://unused", "events")
+        monkeypatch.setattr(event_bus, "_backend", backend)
+        queue = event_bus.subscribe("job-1")
+        event_bus.publish("job-1", {"event": "progress", "data": {}})
+        event_bus.publish("job-2", big_event())
+        assert queue.qsize() == 1
+        assert backend._outbox.qsize() == 2
+        assert len(backend._outbox.get_nowait()) == 1
+        assert len(backend._outbox.get_nowait()) > 1
+
+    async def test_send_closes_failed_connection(self, monkeypatch):
+        class Connection:
+            def __init__(self, fail):
+                self.fail = fail
+                self.closed = False
+                self.sent = []
+
+            def is_closed(self):
+                return self.closed
+
+            def transaction(self):
+                return contextlib.nullcontext()
+
+            async def execute(self, *args):
+                if self.fail:
+                    raise event_bus.asyncpg.PostgresError("connection broke")
+                self.sent.append(args[-1])
+
+            async def close(self):
+                self.closed = True
+                raise OSError("already gone")
+
+        connections = [Connection(fail=True), Connection(fail=False)]
+        opened = iter(connections)
+
+        async def connect(_dsn):
+            return next(opened)
+
+        monkeypatch.setattr(event_bus.asyncpg, "connect", connect)
+        backend = PostgresBackend("postgresql://unused", "events")
+        sender = asyncio.create_task(backend._send())
+        backend._outbox.put_nowait(["first"])
+        backend._outbox.put_nowait(["second"])
+        await backend._outbox.join()
+        sender.cancel()
+        assert connections[0].closed
+        assert connections[1].sent == ["second"]
+
+
+class TestBackendSelection:
+    def test_auto_follows_database(self):
+        assert event_bus.backend_name(Settings(database_url="sqlite+aiosqlite://")) == "memory"
+        assert event_bus.backend_name(
+            Settings(database_url="postgresql+asyncpg://u:p@db/arcane")
+        ) == "postgres"
+        assert event_bus.backend_name(
+            Settings(database_url="postgresql+asyncpg://u:p@db/arcane", event_bus_backend="memory")
+        ) == "memory"
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            event_bus.backend_name(Settings(event_bus_backend="redis"))
+
+    async def test_memory_backend_starts_nothing(self):
+        await event_bus.start(Settings(database_url="sqlite+aiosqlite://"))
+        assert event_bus._backend is None
+        await event_bus.stop()
@@ -14,9 +14,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import Settings, get_settings
 from app.main import app
 from app.models.generation_job import GenerationJob
+from app.models.project import Project
 from app.models.roadmap import RoadmapRecord
+from app.models.usage_record import UsageRecord
 from app.services import event_bus
-from app.services.generation import WebStorageAdapter
+from app.services.generation import WebStorageAdapter, run_regeneration
+from app.services.quotas import get_user_usage, record_usage
+from arcane.core.clients import UsageStats
+from arcane.core.generators import EtaSnapshot
+from tests.conftest import async_session_test
 
 pytestmark = pytest.mark.asyncio
 
@@ -202,6 +208,98 @@ class TestStartGeneration:
         assert resp.status_code == 401
 
 
+async def _charge(db_session: AsyncSession, rm: dict, tokens: int) -> uuid.UUID:
+    """Charge tokens to the roadmap owner's ledger; returns the owner's ID."""
+    record = await db_session.get(RoadmapRecord, uuid.UUID(rm["id"]))
+    project = await db_session.get(Project, record.project_id)
+    usage = UsageStats(input_tokens=tokens // 2, output_tokens=tokens - tokens // 2)
+    record_usage(db_session, project.user_id, "generation", Settings().model, usage, record.id)
+    await db_session.commit()
+    return project.user_id
+
+
+class TestGenerationQuotas:
+    async def _set_roadmap(self, db_session, rm, status="draft", milestones=(), tokens=0):
+        record = await db_session.get(RoadmapRecord, uuid.UUID(rm["id"]))
+        record.status = status
+        record.roadmap_data = {"milestones": list(milestones)}
+        await db_session.commit()
+        await _charge(db_session, rm, tokens)
+
+    async def _start(self, client, rm, headers, **settings):
+        app.dependency_overrides[get_settings] = _fake_settings(**settings)
+        with patch(
+            "app.routers.generation.run_generation", side_effect=_noop_run_generation
+        ) as run:
+            resp = await client.post(f"/roadmaps/{rm['id']}/generate", headers=headers)
+        return resp, run
+
+    async def test_unlimited_by_default(self, client: AsyncClient, roadmap_with_context):
+        rm, headers = roadmap_with_context
+        resp, run = await self._start(client, rm, headers)
+        assert resp.status_code == 202
+        assert run.call_args.kwargs["budget"] is None
+        assert run.call_args.kwargs["resume"] is False
+
+    async def test_budget_is_what_is_left_of_quota(
+        self, client: AsyncClient, roadmap_with_context, db_session: AsyncSession
+    ):
+        rm, headers = roadmap_with_context
+        await self._set_roadmap(db_session, rm, tokens=3000)
+        resp, run = await self._start(
+            client, rm, headers, user_quota_tokens=10_000, generation_max_seconds=600
+        )
+        assert resp.status_code == 202
+        budget = run.call_args.kwargs["budget"]
+        assert budget.max_tokens == 7000
+        assert budget.max_seconds == 600
+        assert budget.max_cost_usd is None
+
+    async def test_used_up_quota_returns_429(
+        self, client: AsyncClient, roadmap_with_context, db_session: AsyncSession
+    ):
+        rm, headers = roadmap_with_context
+        # $3 / $15 per million tokens on sonnet: 200k tokens cost $1.80
+        await self._set_roadmap(db_session, rm, tokens=200_000)
+        resp, run = await self._start(client, rm, headers, user_quota_usd=1.5)
+        assert resp.status_code == 429
+        assert "quota" in resp.json()["detail"].lower()
+        run.assert_not_called()
+
+    async def test_deleting_roadmap_keeps_usage(
+        self, client: AsyncClient, roadmap_with_context, db_session: AsyncSession
+    ):
+        rm, headers = roadmap_with_context
+        user_id = await _charge(db_session, rm, 200_000)
+        resp = await client.delete(f"/roadmaps/{rm['id']}", headers=headers)
+        assert resp.status_code == 204
+        usage = await get_user_usage(db_session, user_id, Settings().model)
+        assert usage.total_tokens == 200_000
+
+    async def test_roadmap_document_usage_not_counted(
+        self, client: AsyncClient, roadmap_with_context, db_session: AsyncSession
+    ):
+        rm, headers = roadmap_with_context
+        # The document's own usage is reporting; only the ledger counts
+        record = await db_session.get(RoadmapRecord, uuid.UUID(rm["id"]))
+        record.roadmap_data = {
+            "milestones": [],
+            "usage": {"input_tokens": 100_000, "output_tokens": 100_000},
+        }
+        await db_session.commit()
+        resp, run = await self._start(client, rm, headers, user_quota_usd=1.5)
+        assert resp.status_code == 202
+
+    async def test_partial_roadmap_is_resumed(
+        self, client: AsyncClient, roadmap_with_context, db_session: AsyncSession
+    ):
+        rm, headers = roadmap_with_context
+        await self._set_roadmap(db_session, rm, status="partial", milestones=[{"name": "M1"}])
+        resp, run = await self._start(client, rm, headers)
+        assert resp.status_code == 202
+        assert run.call_args.kwargs["resume"] is True
+
+
 # --- Get Generation Job Tests ---
 
 
@@ -518,6 +616,29 @@ class TestAdapterEventEmission:
         progress_event = next(e for e in events if e["event"] == "progress")
         assert progress_event["data"]["milestones"] == 1
         assert progress_event["data"]["phase"] == "epics"
+        assert "eta" not in progress_event["data"]
+
+        # Once the orchestrator reports an ETA, progress carries it
+        adapter.set_eta(
+            EtaSnapshot(
+                completed_calls=2,
+                remaining_calls=8,
+                eta_seconds=40.0,
+                calls_per_minute=6.0,
+                tokens_per_second=30.0,
+                cost_to_complete_usd=0.5,
+            )
+        )
+        await adapter.save_roadmap(MockRoadmap())
+        events = []
+        while not queue.empty():
+            events.append(queue.get_nowait())
+        progress_event = next(e for e in events if e["event"] == "progress")
+        assert progress_event["data"]["eta"]["remaining_calls"] == 8
+        assert progress_event["data"]["eta"]["eta_seconds"] == 40.0
+
+        await db_session.refresh(job)
+        assert job.progress["eta"]["cost_to_complete_usd"] == 0.5
 
 
 # --- Regenerate Endpoint Tests ---
@@ -686,3 +807,55 @@ class TestRegenerateEndpoint:
             headers=other_headers,
         )
         assert resp.status_code == 404
+
+    async def test_regenerate_refused_once_quota_used_up(
+        self, client: AsyncClient, roadmap_with_generated_items, db_session: AsyncSession
+    ):
+        rm, headers = roadmap_with_generated_items
+        await _charge(db_session, rm, 20_000)
+        app.dependency_overrides[get_settings] = _fake_settings(user_quota_tokens=10_000)
+        with patch(
+            "app.routers.generation.run_regeneration", side_effect=_noop_run_regeneration
+        ) as run:
+            resp = await client.post(
+                f"/roadmaps/{rm['id']}/items/ep-1/regenerate",
+                headers=headers,
+            )
+        assert resp.status_code == 429
+        run.assert_not_called()
+
+    async def test_regeneration_charges_usage_even_if_it_fails(
+        self, roadmap_with_generated_items, db_session: AsyncSession
+    ):
+        rm, _ = roadmap_with_generated_items
+        record = await db_session.get(RoadmapRecord, uuid.UUID(rm["id"]))
+        project = await db_session.get(Project, record.project_id)
+        job = GenerationJob(roadmap_id=record.id, status="pending")
+        db_session.add(job)
+        await db_session.commit()
+
+        class SpentClient:
+            """Has used tokens, then fails the next call."""
+
+            usage = UsageStats(api_calls=2, input_tokens=900, output_tokens=100)
+
+        with (
+            patch("app.services.generation.create_client", return_value=SpentClient()),
+            patch("app.services.generation.metrics.record_client"),
+        ):
+            await run_regeneration(
+                session_factory=async_session_test,
+                roadmap_record_id=rm["id"],
+                job_id=str(job.id),
+                user_id=str(project.user_id),
+                item_id="ep-1",
+                anthropic_api_key="sk-fake-test-key",
+                model="sonnet",
+            )
+
+        await db_session.refresh(job)
+        assert job.status == "failed"
+        records = (await db_session.execute(select(UsageRecord))).scalars().all()
+        assert [(r.kind, r.model, r.input_tokens, r.output_tokens) for r in records] == [
+            ("regeneration", "sonnet", 900, 100)
+        ]
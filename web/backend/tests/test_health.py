@@ -14,3 +14,29 @@ async def test_health_response_fields(client):
     assert data["status"] == "healthy"
     assert data["database"] == "healthy"
     assert data["version"] == "0.1.0"
+
+
+@pytest.mark.asyncio
+async def test_metrics_prometheus_format(client):
+    from types import SimpleNamespace
+
+    from arcane.core.clients import GenerationTelemetry
+    from app.services import metrics
+
+    job = SimpleNamespace(telemetry=GenerationTelemetry())
+    with job.telemetry.track_call("epic") as call:
+        call.add_tokens(100, 400)
+    job.telemetry.record_generation("epic", 3.0, attempts=2)
+
+    metrics.reset()
+    metrics.record_client(job)
+    try:
+        resp = await client.get("/metrics")
+    finally:
+        metrics.reset()
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert 'arcane_generation_calls_total{level="epic"} 1' in resp.text
+    assert 'arcane_generation_output_tokens_total{level="epic"} 400' in resp.text
+    assert 'arcane_generation_retries_total{level="epic"} 1' in resp.text
@@ -0,0 +1,135 @@
+"""Tests for batched item operations."""
+
+from httpx import AsyncClient
+
+from app.services.roadmap_items import cascade_status_updates
+from app.services.roadmap_patch import MAX_PATH_WRITES
+from tests.conftest import big_roadmap, stored_data
+
+from .test_roadmap_concurrency import stored_version
+
+
+def test_cascade_once_per_ancestor():
+    data = big_roadmap(milestones=1, tasks_per_story=2)
+    story = data["milestones"][0]["epics"][0]["stories"][0]
+    for task in story["tasks"]:
+        task["status"] = "completed"
+    changed = cascade_status_updates(data, ["m0e0s0t0", "m0e0s0t1", "m0e1s0t0"])
+    assert changed == [
+        {"id": "m0e0s0", "status": "completed"},
+        {"id": "m0e0", "status": "in_progress"},
+        {"id": "m0", "status": "in_progress"},
+    ]
+
+
+class TestBatchEndpoint:
+    async def test_mixed_operations_in_one_write(self, client: AsyncClient, seeded, captured):
+        roadmap_id, headers = seeded
+        operations = [
+            {"op": "update", "item_id": f"m0e0s0t{t}", "fields": {"status": "completed"}}
+            for t in range(25)
+        ]
+        operations += [
+            {"op": "update", "item_id": "m1", "fields": {"name": "Renamed"}},
+            {
+                "op": "create",
+                "parent_id": "m0e0",
+                "item_type": "story",
+                "data": {"id": "new-story", "name": "New"},
+            },
+            {"op": "create", "parent_id": "new-story", "item_type": "task", "data": {"name": "T"}},
+            {"op": "update", "item_id": "new-story", "fields": {"priority": "high"}},
+            {"op": "delete", "item_id": "m2"},
+            {"op": "reorder", "parent_id": "root", "item_ids": ["m3", "m1", "m0"]},
+        ]
+        resp = await client.post(
+            f"/roadmaps/{roadmap_id}/items:batch",
+            json={"operations": operations},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert len(captured) == 1
+        assert resp.headers["etag"] == f'W/"{await stored_version(roadmap_id)}"'
+
+        body = resp.json()
+        results = body["results"]
+        assert [r["op"] for r in results[25:]] == [
+            "update", "create", "create", "update", "delete", "reorder",
+        ]
+        assert results[0]["data"]["status"] == "completed"
+        assert results[28]["data"]["priority"] == "high"
+        assert results[29]["children_deleted"] == 3 + 12 + 12 * 25
+        assert results[30]["item_type"] == "root"
+        # One cascade for the 25 task updates
+        assert body["cascaded"] == [
+            {"id": "m0e0s0", "status": "completed"},
+            {"id": "m0e0", "status": "in_progress"},
+            {"id": "m0", "status": "in_progress"},
+        ]
+
+        data = await stored_data(roadmap_id)
+        assert [m["id"] for m in data["milestones"]] == ["m3", "m1", "m0"]
+        assert data["milestones"][1]["name"] == "Renamed"
+        stories = data["milestones"][2]["epics"][0]["stories"]
+        assert stories[0]["status"] == "completed"
+        assert stories[-1]["id"] == "new-story"
+        assert stories[-1]["tasks"][0]["id"] == results[27]["item_id"]
+
+        # Item rows were kept in step
+        resp = await client.get(f"/roadmaps/{roadmap_id}", headers=headers)
+        assert resp.json()["roadmap_data"] == data
+
+    async def test_failed_operation_applies_nothing(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        resp = await client.post(
+            f"/roadmaps/{roadmap_id}/items:batch",
+            json={"operations": [
+                {"op": "update", "item_id": "m0", "fields": {"name": "Renamed"}},
+                {"op": "delete", "item_id": "m1"},
+                {"op": "delete", "item_id": "m1"},
+            ]},
+            headers=headers,
+        )
+        assert resp.status_code == 404
+        assert resp.json()["detail"] == "Operation 2: Item not found"
+        assert await stored_data(roadmap_id) == big_roadmap()
+        assert await stored_version(roadmap_id) == 1
+
+    async def test_rejects_malformed_batches(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        for operations in ([], [{"op": "move", "item_id": "m0"}], [{"op": "delete"}]):
+            resp = await client.post(
+                f"/roadmaps/{roadmap_id}/items:batch",
+                json={"operations": operations},
+                headers=headers,
+            )
+            assert resp.status_code == 422
+
+    async def test_large_batch_writes_document_once(
+        self, client: AsyncClient, seeded, captured
+    ):
+        roadmap_id, headers = seeded
+        expected = big_roadmap()
+        operations = []
+        for milestone in expected["milestones"][:2]:
+            for epic in milestone["epics"]:
+                for story in epic["stories"]:
+                    for task in story["tasks"]:
+                        task["status"] = "completed"
+                        operations.append(
+                            {"op": "update", "item_id": task["id"], "fields": {"status": "completed"}}
+                        )
+                    story["status"] = "completed"
+                epic["status"] = "completed"
+            milestone["status"] = "completed"
+        assert len(operations) > MAX_PATH_WRITES
+
+        resp = await client.post(
+            f"/roadmaps/{roadmap_id}/items:batch",
+            json={"operations": operations},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert len(captured) == 1
+        assert len(resp.json()["cascaded"]) == 2 + 2 * 3 + 2 * 3 * 4
+        assert await stored_data(roadmap_id) == expected
@@ -0,0 +1,211 @@
+"""Tests for the item path index cached between item edits."""
+
+import copy
+
+import pytest
+from httpx import AsyncClient
+
+from arcane.core.items import RoadmapIndex
+from app.models.roadmap import RoadmapRecord
+from app.services import item_paths, roadmap_items
+from app.services.item_paths import ItemPathCache, ItemPaths, get_item_path_cache
+from app.services.roadmap_items import (
+    cascade_status_update,
+    find_item_by_id,
+    find_parent_chain,
+)
+from app.services.roadmap_summary import SummaryTally
+from tests.conftest import async_session_test, big_roadmap, stored_data
+
+
+
+def assert_matches_fresh_index(paths: ItemPaths) -> None:
+    fresh = RoadmapIndex(paths.root)
+    assert set(paths) == set(fresh)
+    for item_id in fresh:
+        assert paths.entry(item_id) == fresh.entry(item_id)
+        assert paths.path(item_id) == fresh.path(item_id)
+
+
+class TestItemPaths:
+    def test_lookups_match_roadmap_index(self):
+        data = big_roadmap(milestones=2, tasks_per_story=3)
+        paths = ItemPaths(data)
+        index = RoadmapIndex(data)
+        assert len(paths) == len(index)
+        assert paths.get("m1e2s3t1") is index.get("m1e2s3t1")
+        assert paths.get("missing") is None
+        assert paths.ancestors("m1e2s3t1") == index.ancestors("m1e2s3t1")
+        assert paths.container("m1e2s3t1") is index.container("m1e2s3t1")
+        assert paths.children() is data["milestones"]
+
+    def test_entries_carry_over_to_a_copy(self):
+        data = big_roadmap(milestones=2, tasks_per_story=3)
+        entries = ItemPaths(data).entries
+        other = copy.deepcopy(data)
+        paths = ItemPaths(other, entries)
+        assert paths.get("m0e1s2t0") is other["milestones"][0]["epics"][1]["stories"][2]["tasks"][0]
+
+    def test_structural_edits_stay_consistent(self):
+        paths = ItemPaths(big_roadmap(milestones=3, tasks_per_story=3))
+        paths.add("m0e0", {"id": "new", "tasks": [{"id": "new-t0"}, {"id": "new-t1"}]})
+        paths.add(None, {"id": "m-new"})
+        paths.remove("m1")
+        paths.remove("m0e1s2t0")
+        paths.reorder("m0e0", ["new", "m0e0s3", "m0e0s2", "m0e0s1", "m0e0s0"])
+        paths.update("m2e0s0t0", status="completed")
+        assert paths.get("m2e0s0t0")["status"] == "completed"
+        assert_matches_fresh_index(paths)
+
+    def test_invalid_edits(self):
+        paths = ItemPaths(big_roadmap(milestones=1, tasks_per_story=1))
+        with pytest.raises(ValueError):
+            paths.add("m0e0s0t0", {"id": "child"})
+        with pytest.raises(ValueError):
+            paths.add("m0e0", {"id": "m0e0s0"})
+        with pytest.raises(ValueError):
+            paths.reorder("m0e0", ["m0e0s0"])
+        with pytest.raises(KeyError):
+            paths.entry("missing")
+
+
+class TestLookupsWithoutIndex:
+    """One-off lookups walk to the item instead of indexing the whole roadmap."""
+
+    @pytest.fixture(autouse=True)
+    def no_index_builds(self, monkeypatch):
+        def fail(_data):
+            raise AssertionError("built a RoadmapIndex for a one-off lookup")
+
+        monkeypatch.setattr(roadmap_items, "RoadmapIndex", fail)
+
+    @pytest.mark.parametrize("item_id", ["m0", "m1e2", "m1e2s3", "m1e2s3t1", "missing"])
+    def test_match_index(self, item_id):
+        data = big_roadmap(milestones=2, tasks_per_story=3)
+        index = RoadmapIndex(data)
+        assert find_item_by_id(data, item_id) == find_item_by_id(data, item_id, index)
+        assert find_parent_chain(data, item_id) == find_parent_chain(data, item_id, index)
+
+    @pytest.mark.parametrize("item_id", ["m0", "m1e2", "m1e2s3", "m1e2s3t1", "missing"])
+    def test_cascade_matches_index(self, item_id):
+        walked = big_roadmap(milestones=2, tasks_per_story=3)
+        indexed = copy.deepcopy(walked)
+        for data in (walked, indexed):
+            found = find_item_by_id(data, item_id)
+            if found:
+                found[0]["status"] = "completed"
+        assert cascade_status_update(walked, item_id) == cascade_status_update(
+            indexed, item_id, RoadmapIndex(indexed)
+        )
+        assert walked == indexed
+
+
+class TestItemPathCache:
+    def test_take_needs_matching_version(self):
+        cache = ItemPathCache()
+        cache.put("r1", 1, {"a": ("milestone", None, 0, 0)})
+        assert cache.take("r1", 2) is None
+        # A miss still drops the stale entries
+        assert len(cache) == 0
+        tally = SummaryTally({"milestones": 1}, 0, 0.0, 0.0)
+        cache.put("r1", 2, {"a": ("milestone", None, 0, 0)}, tally)
+        assert cache.take("r1", 2) == ({"a": ("milestone", None, 0, 0)}, tally)
+        assert cache.take("r1", 2) is None
+
+    def test_least_recently_used_evicted(self):
+        cache = ItemPathCache(max_roadmaps=2)
+        cache.put("r1", 1, {})
+        cache.put("r2", 1, {})
+        cache.put("r1", 2, {})
+        cache.put("r3", 1, {})
+        assert cache.take("r2", 1) is None
+        assert cache.take("r1", 2) == ({}, None)
+        assert cache.take("r3", 1) == ({}, None)
+
+    def test_disabled(self):
+        cache = ItemPathCache(max_roadmaps=0)
+        cache.put("r1", 1, {})
+        assert len(cache) == 0
+
+
+class TestEndpointsReuseIndex:
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        get_item_path_cache().clear()
+        yield
+        get_item_path_cache().clear()
+
+    async def test_second_edit_skips_index_build(
+        self, client: AsyncClient, seeded, monkeypatch
+    ):
+        roadmap_id, headers = seeded
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"status": "completed"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+
+        def no_rebuild(_root):
+            raise AssertionError("index rebuilt on a cached version")
+
+        monkeypatch.setattr(item_paths, "RoadmapIndex", no_rebuild)
+        resp = await client.post(
+            f"/roadmaps/{roadmap_id}/items/m0e0/children",
+            json={"item_type": "story", "data": {"name": "New"}},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+        resp = await client.delete(f"/roadmaps/{roadmap_id}/items/m1", headers=headers)
+        assert resp.status_code == 200
+        resp = await client.put(
+            f"/roadmaps/{roadmap_id}/items/reorder",
+            json={"parent_id": "root", "item_ids": ["m3", "m2", "m0"]},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m2e1s3t24",
+            json={"status": "in_progress"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+
+        data = await stored_data(roadmap_id)
+        assert [m["id"] for m in data["milestones"]] == ["m3", "m2", "m0"]
+        assert data["milestones"][1]["epics"][1]["status"] == "in_progress"
+        monkeypatch.undo()
+        _, cached, tally = get_item_path_cache()._entries[roadmap_id]
+        assert_matches_fresh_index(ItemPaths(data, cached))
+        assert tally == SummaryTally.of(data)
+
+    async def test_outside_write_invalidates(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"status": "completed"},
+            headers=headers,
+        )
+        # Any other write bumps the version, so the cached paths no longer apply
+        async with async_session_test() as session:
+            record = await session.get(RoadmapRecord, roadmap_id)
+            record.roadmap_data = big_roadmap(milestones=1, tasks_per_story=1)
+            await session.commit()
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"status": "in_progress"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e1s0t0",
+            json={"status": "in_progress"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m1e0s0t0",
+            json={"status": "in_progress"},
+            headers=headers,
+        )
+        assert resp.status_code == 404
@@ -0,0 +1,206 @@
+"""Tests for the roadmap_items table kept alongside roadmap_data."""
+
+import uuid
+
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.models.roadmap import RoadmapRecord
+from app.models.roadmap_item import RoadmapItem
+from app.services.item_rows import assemble_milestones, flatten_items, load_roadmap_data
+from tests.conftest import async_session_test, big_roadmap, stored_data
+
+
+
+async def assembled_data(roadmap_id: uuid.UUID) -> dict:
+    async with async_session_test() as session:
+        return await load_roadmap_data(session, roadmap_id)
+
+
+async def row_count(roadmap_id: uuid.UUID) -> int:
+    async with async_session_test() as session:
+        return await session.scalar(
+            select(func.count()).where(RoadmapItem.roadmap_id == roadmap_id)
+        )
+
+
+class TestFlatten:
+    def test_round_trip(self):
+        data = big_roadmap(milestones=2, tasks_per_story=3)
+        rows = flatten_items(uuid.uuid4(), data)
+        assert len(rows) == 2 + 6 + 24 + 72
+        task = next(r for r in rows if r["id"] == "m1e2s3t2")
+        assert (task["parent_id"], task["type"], task["position"]) == ("m1e2s3", "task", 2)
+        assert "tasks" not in next(r for r in rows if r["id"] == "m1e2s3")["payload"]
+
+        # Any row order works as long as siblings come in position order
+        rows.sort(key=lambda r: (r["position"], r["type"] != "task"))
+        milestones = assemble_milestones(
+            (r["id"], r["parent_id"], r["type"], r["payload"]) for r in rows
+        )
+        assert milestones == data["milestones"]
+
+
+class TestRowsFollowWrites:
+    async def test_orm_writes_replace_rows(self, seeded):
+        roadmap_id, _ = seeded
+        assert await row_count(roadmap_id) == 4 + 12 + 48 + 1200
+        assert await assembled_data(roadmap_id) == big_roadmap()
+
+        smaller = {"usage": {"input_tokens": 10}, **big_roadmap(milestones=1, tasks_per_story=1)}
+        async with async_session_test() as session:
+            record = await session.get(RoadmapRecord, roadmap_id)
+            record.roadmap_data = smaller
+            await session.commit()
+        assert await row_count(roadmap_id) == 1 + 3 + 12 + 12
+        assert await assembled_data(roadmap_id) == smaller
+
+    async def test_item_edits_update_rows(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"status": "completed", "estimated_hours": 5},
+            headers=headers,
+        )
+        resp = await client.post(
+            f"/roadmaps/{roadmap_id}/items/m0e0/children",
+            json={"item_type": "story", "data": {"name": "New", "tasks": [{"id": "extra"}]}},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+        await client.put(
+            f"/roadmaps/{roadmap_id}/items/reorder",
+            json={"parent_id": "m1e1", "item_ids": ["m1e1s3", "m1e1s2", "m1e1s1", "m1e1s0"]},
+            headers=headers,
+        )
+        await client.delete(f"/roadmaps/{roadmap_id}/items/m2e0", headers=headers)
+
+        assert await assembled_data(roadmap_id) == await stored_data(roadmap_id)
+        assert await row_count(roadmap_id) == 4 + 12 + 48 + 1200 + 2 - (1 + 4 + 100)
+
+    async def test_deleting_roadmap_drops_rows(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        resp = await client.delete(f"/roadmaps/{roadmap_id}", headers=headers)
+        assert resp.status_code == 204
+        assert await row_count(roadmap_id) == 0
+
+
+class TestEndpoints:
+    async def test_get_roadmap_reassembles_items(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        resp = await client.get(f"/roadmaps/{roadmap_id}", headers=headers)
+        assert resp.status_code == 200
+        assert resp.json()["roadmap_data"] == big_roadmap()
+
+    async def test_get_roadmap_without_data(self, client: AsyncClient, auth_headers):
+        resp = await client.post("/projects/", json={"name": "Empty"}, headers=auth_headers)
+        resp = await client.post(
+            f"/projects/{resp.json()['id']}/roadmaps",
+            json={"name": "Empty roadmap"},
+            headers=auth_headers,
+        )
+        resp = await client.get(f"/roadmaps/{resp.json()['id']}", headers=auth_headers)
+        assert resp.status_code == 200
+        assert resp.json()["roadmap_data"] is None
+
+    async def test_list_items_filters(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m3e2s1t4",
+            json={"status": "blocked"},
+            headers=headers,
+        )
+        resp = await client.get(
+            f"/roadmaps/{roadmap_id}/items", params={"status": "blocked"}, headers=headers
+        )
+        assert resp.status_code == 200
+        # The task and the ancestors its status cascaded to
+        assert sorted(r["item_id"] for r in resp.json()) == ["m3", "m3e2", "m3e2s1", "m3e2s1t4"]
+
+        resp = await client.get(
+            f"/roadmaps/{roadmap_id}/items", params={"parent_id": "root"}, headers=headers
+        )
+        assert [r["item_id"] for r in resp.json()] == ["m0", "m1", "m2", "m3"]
+        assert "epics" not in resp.json()[0]["data"]
+
+        resp = await client.get(
+            f"/roadmaps/{roadmap_id}/items",
+            params={"parent_id": "m0e0s0", "item_type": "task"},
+            headers=headers,
+        )
+        assert [r["position"] for r in resp.json()] == list(range(25))
+
+
+class TestProjection:
+    async def test_fields_and_depth(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        full = await client.get(f"/roadmaps/{roadmap_id}", headers=headers)
+        resp = await client.get(
+            f"/roadmaps/{roadmap_id}",
+            params={"fields": "name,status", "depth": 3},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != full.headers["etag"]
+        data = resp.json()["roadmap_data"]
+        milestone = data["milestones"][1]
+        assert set(milestone) == {"id", "name", "status", "epics"}
+        story = milestone["epics"][2]["stories"][3]
+        assert story == {"id": "m1e2s3", "name": "Story 3", "status": "not_started"}
+        assert len(resp.content) * 5 < len(full.content)
+
+        resp = await client.get(
+            f"/roadmaps/{roadmap_id}", params={"depth": 1}, headers=headers
+        )
+        milestones = resp.json()["roadmap_data"]["milestones"]
+        assert [m["id"] for m in milestones] == ["m0", "m1", "m2", "m3"]
+        assert "epics" not in milestones[0]
+
+    async def test_projection_rejects_bad_params(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        for params in ({"fields": "name,"}, {"depth": 0}, {"depth": 5}):
+            resp = await client.get(f"/roadmaps/{roadmap_id}", params=params, headers=headers)
+            assert resp.status_code == 422
+
+    async def test_subtree(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        resp = await client.get(f"/roadmaps/{roadmap_id}/items/m2e1", headers=headers)
+        assert resp.status_code == 200
+        assert resp.json()["item_type"] == "epic"
+        assert resp.json()["data"] == big_roadmap()["milestones"][2]["epics"][1]
+
+        resp = await client.get(
+            f"/roadmaps/{roadmap_id}/items/m2e1",
+            params={"depth": 1, "fields": "name"},
+            headers=headers,
+        )
+        assert resp.json()["data"] == {
+            "id": "m2e1",
+            "name": "Epic 1",
+            "stories": [{"id": f"m2e1s{i}", "name": f"Story {i}"} for i in range(4)],
+        }
+
+        resp = await client.get(
+            f"/roadmaps/{roadmap_id}/items/m2e1s0t3", params={"depth": 0}, headers=headers
+        )
+        assert resp.json()["data"]["id"] == "m2e1s0t3"
+
+    async def test_subtree_conditional_get(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        url = f"/roadmaps/{roadmap_id}/items/m0e0"
+        etag = (await client.get(url, headers=headers)).headers["etag"]
+        resp = await client.get(url, headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 304
+        await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"status": "completed"},
+            headers=headers,
+        )
+        resp = await client.get(url, headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["data"]["status"] == "in_progress"
+
+    async def test_subtree_not_found(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        resp = await client.get(f"/roadmaps/{roadmap_id}/items/missing", headers=headers)
+        assert resp.status_code == 404
@@ -0,0 +1,223 @@
+"""Tests for roadmap versions, If-Match and concurrent writes."""
+
+import copy
+
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from app.models.roadmap import RoadmapRecord
+from app.models.roadmap_item import RoadmapItem
+from app.services.generation import RoadmapWriter
+from app.services.roadmap_patch import RoadmapPatch, VersionConflict
+from app.services.roadmap_responses import etag_for, if_match_version
+from tests.conftest import async_session_test, big_roadmap, stored_data
+
+
+
+async def stored_version(roadmap_id) -> int:
+    async with async_session_test() as session:
+        return await session.scalar(
+            select(RoadmapRecord.version).where(RoadmapRecord.id == roadmap_id)
+        )
+
+
+async def bump_version(roadmap_id) -> None:
+    """A write from somewhere else that touches no items."""
+    async with async_session_test() as session:
+        await session.execute(
+            update(RoadmapRecord)
+            .where(RoadmapRecord.id == roadmap_id)
+            .values(version=RoadmapRecord.version + 1)
+        )
+        await session.commit()
+
+
+class TestIfMatch:
+    def test_parses_versions_and_etags(self):
+        assert if_match_version(None) is None
+        assert if_match_version("*") is None
+        assert if_match_version("7") == 7
+        assert if_match_version('W/"7"') == 7
+        assert if_match_version(etag_for(7, "fields=name")) == 7
+
+    def test_rejects_other_values(self):
+        with pytest.raises(HTTPException) as exc:
+            if_match_version('"abc"')
+        assert exc.value.status_code == 400
+
+
+class TestVersions:
+    async def test_every_write_bumps_version(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        assert await stored_version(roadmap_id) == 1
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"status": "completed"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] == etag_for(2)
+        resp = await client.get(f"/roadmaps/{roadmap_id}", headers=headers)
+        assert resp.json()["version"] == 2
+        assert resp.headers["etag"] == etag_for(2)
+
+        async with async_session_test() as session:
+            rows = {
+                row.id: row.version
+                for row in (await session.execute(
+                    select(RoadmapItem).where(RoadmapItem.roadmap_id == roadmap_id)
+                )).scalars()
+            }
+        # Only the task and the parents whose status cascaded
+        assert {i for i, v in rows.items() if v == 2} == {"m0e0s0t0", "m0e0s0", "m0e0", "m0"}
+
+    async def test_whole_document_write_stamps_rows(self, seeded):
+        roadmap_id, _ = seeded
+        async with async_session_test() as session:
+            record = await session.get(RoadmapRecord, roadmap_id)
+            record.roadmap_data = big_roadmap(milestones=1, tasks_per_story=1)
+            await session.commit()
+        async with async_session_test() as session:
+            versions = set(
+                (await session.execute(
+                    select(RoadmapItem.version).where(RoadmapItem.roadmap_id == roadmap_id)
+                )).scalars()
+            )
+        assert versions == {2}
+
+    async def test_flush_detects_concurrent_write(self, seeded):
+        roadmap_id, _ = seeded
+        async with async_session_test() as session:
+            roadmap = await session.get(RoadmapRecord, roadmap_id)
+            patch = RoadmapPatch(roadmap)
+            patch.update("m0e0s0t0", {"name": "Renamed"})
+            await bump_version(roadmap_id)
+            with pytest.raises(VersionConflict):
+                await patch.flush(session)
+            await session.rollback()
+        data = await stored_data(roadmap_id)
+        assert data["milestones"][0]["epics"][0]["stories"][0]["tasks"][0]["name"] == "Task 0"
+
+
+class TestConcurrentEdits:
+    async def test_stale_if_match_on_other_item_is_rebased(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        etag = (await client.get(f"/roadmaps/{roadmap_id}", headers=headers)).headers["etag"]
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"status": "completed"},
+            headers={**headers, "If-Match": etag},
+        )
+        assert resp.status_code == 200
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t1",
+            json={"name": "Other"},
+            headers={**headers, "If-Match": etag},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] == etag_for(3)
+
+        task = (await stored_data(roadmap_id))["milestones"][0]["epics"][0]["stories"][0]["tasks"]
+        assert task[0]["status"] == "completed"
+        assert task[1]["name"] == "Other"
+
+    async def test_stale_if_match_on_same_item_conflicts(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        etag = (await client.get(f"/roadmaps/{roadmap_id}", headers=headers)).headers["etag"]
+        await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"name": "First"},
+            headers={**headers, "If-Match": etag},
+        )
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"name": "Second"},
+            headers={**headers, "If-Match": etag},
+        )
+        assert resp.status_code == 409
+        assert "another edit" in resp.json()["detail"]
+        assert resp.headers["etag"] == etag_for(2)
+
+        # Deleting an ancestor of the changed item conflicts too
+        resp = await client.delete(
+            f"/roadmaps/{roadmap_id}/items/m0e0", headers={**headers, "If-Match": etag}
+        )
+        assert resp.status_code == 409
+        resp = await client.delete(
+            f"/roadmaps/{roadmap_id}/items/m0e0",
+            headers={**headers, "If-Match": resp.headers["etag"]},
+        )
+        assert resp.status_code == 200
+
+    async def test_future_if_match_conflicts(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"name": "Renamed"},
+            headers={**headers, "If-Match": etag_for(5)},
+        )
+        assert resp.status_code == 409
+
+    async def test_edit_retried_after_lost_race(
+        self, client: AsyncClient, seeded, monkeypatch
+    ):
+        roadmap_id, headers = seeded
+        flush = RoadmapPatch.flush
+        raced = []
+
+        async def racing_flush(self, db):
+            if not raced:
+                raced.append(True)
+                await bump_version(roadmap_id)
+            await flush(self, db)
+
+        monkeypatch.setattr(RoadmapPatch, "flush", racing_flush)
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"name": "Renamed"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] == etag_for(3)
+        data = await stored_data(roadmap_id)
+        assert data["milestones"][0]["epics"][0]["stories"][0]["tasks"][0]["name"] == "Renamed"
+
+
+class TestRoadmapWriter:
+    async def test_keeps_edits_made_while_generating(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        async with async_session_test() as session:
+            record = await session.get(RoadmapRecord, roadmap_id)
+            generated = copy.deepcopy(record.roadmap_data)
+            writer = RoadmapWriter(async_session_test, roadmap_id)
+            writer.start(record.version, copy.deepcopy(generated))
+
+        await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"name": "Edited"},
+            headers=headers,
+        )
+        await client.delete(f"/roadmaps/{roadmap_id}/items/m1", headers=headers)
+        resp = await client.post(
+            f"/roadmaps/{roadmap_id}/items/m0e0/children",
+            json={"item_type": "story", "data": {"name": "Added"}},
+            headers=headers,
+        )
+        added_id = resp.json()["item_id"]
+
+        generated["milestones"].append({"id": "m9", "name": "Generated", "epics": []})
+        await writer.save(generated)
+        generated["milestones"][-1]["epics"].append({"id": "m9e0", "name": "More", "stories": []})
+        document = await writer.save(generated)
+
+        data = await stored_data(roadmap_id)
+        assert data == document
+        milestones = {m["id"]: m for m in data["milestones"]}
+        assert "m1" not in milestones
+        assert milestones["m9"]["epics"][0]["id"] == "m9e0"
+        stories = milestones["m0"]["epics"][0]["stories"]
+        assert stories[0]["tasks"][0]["name"] == "Edited"
+        assert stories[-1]["id"] == added_id
+        assert await stored_version(roadmap_id) == writer.version == 6
@@ -0,0 +1,126 @@
+"""Tests for path-level roadmap item writes."""
+
+import uuid
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.roadmap import RoadmapRecord
+from app.services.roadmap_patch import RoadmapPatch, _postgresql_expression, _sqlite_path
+from tests.conftest import big_roadmap, stored_data
+
+
+class TestPaths:
+    def test_item_path_follows_positions(self):
+        roadmap = RoadmapRecord(roadmap_data=big_roadmap(milestones=2, tasks_per_story=2))
+        patch = RoadmapPatch(roadmap)
+        assert patch.item_path("m1e2s0t1") == (
+            "milestones", 1, "epics", 2, "stories", 0, "tasks", 1,
+        )
+        assert _sqlite_path(("milestones", 1, "status")) == '$."milestones"[1]."status"'
+
+    def test_postgresql_statement_uses_jsonb_set(self):
+        ops = [
+            (("milestones", 0, "epics", 1, "status"), "completed", False),
+            (("milestones", 0, "epics", 0), None, True),
+        ]
+        sql = str(_postgresql_expression(ops).compile(dialect=postgresql.dialect()))
+        assert "jsonb_set(roadmaps.roadmap_data" in sql
+        assert "#-" in sql
+
+    def test_edits_share_the_loaded_document(self):
+        data = big_roadmap(milestones=1, tasks_per_story=1)
+        roadmap = RoadmapRecord(roadmap_data=data)
+        patch = RoadmapPatch(roadmap)
+        patch.update("m0e0s0t0", {"status": "completed"})
+        assert patch.data is data
+        assert data["milestones"][0]["epics"][0]["stories"][0]["tasks"][0]["status"] == "completed"
+
+
+class TestEndpointWrites:
+    async def test_status_update_writes_only_changed_paths(self, client, seeded, captured):
+        roadmap_id, headers = seeded
+        resp = await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m2e1s3t7",
+            json={"status": "completed"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert {c["id"] for c in resp.json()["cascaded"]} == {"m2e1s3", "m2e1", "m2"}
+
+        # One UPDATE with four small paths, not the ~300 KB document
+        assert len(captured) == 1
+        assert sum(len(str(p)) for p in captured[0]) < 1000
+
+        expected = big_roadmap()
+        milestone = expected["milestones"][2]
+        story = milestone["epics"][1]["stories"][3]
+        story["tasks"][7]["status"] = "completed"
+        for item in (story, milestone["epics"][1], milestone):
+            item["status"] = "in_progress"
+        assert await stored_data(roadmap_id) == expected
+
+    async def test_add_reorder_delete_match_document(self, client, seeded):
+        roadmap_id, headers = seeded
+        resp = await client.post(
+            f"/roadmaps/{roadmap_id}/items/m1e0/children",
+            json={"item_type": "story", "data": {"name": "New story"}},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+        new_id = resp.json()["item_id"]
+        resp = await client.post(
+            f"/roadmaps/{roadmap_id}/items/{new_id}/children",
+            json={"item_type": "task", "data": {"name": "First task"}},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+        task_id = resp.json()["item_id"]
+
+        resp = await client.put(
+            f"/roadmaps/{roadmap_id}/items/reorder",
+            json={"parent_id": "root", "item_ids": ["m3", "m0", "m1", "m2"]},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        resp = await client.delete(f"/roadmaps/{roadmap_id}/items/m1e0s0", headers=headers)
+        assert resp.status_code == 200
+
+        expected = big_roadmap()
+        stories = expected["milestones"][1]["epics"][0]["stories"]
+        stories.append({
+            "id": new_id,
+            "name": "New story",
+            "tasks": [{"id": task_id, "name": "First task"}],
+        })
+        del stories[0]
+        milestones = expected["milestones"]
+        expected["milestones"] = [milestones[3], *milestones[:3]]
+        assert await stored_data(roadmap_id) == expected
+
+    async def test_first_item_writes_whole_document(self, client, auth_headers):
+        resp = await client.post("/projects/", json={"name": "Empty"}, headers=auth_headers)
+        resp = await client.post(
+            f"/projects/{resp.json()['id']}/roadmaps",
+            json={"name": "Empty roadmap"},
+            headers=auth_headers,
+        )
+        roadmap_id = resp.json()["id"]
+        resp = await client.post(
+            f"/roadmaps/{roadmap_id}/items/root/children",
+            json={"item_type": "milestone", "data": {"name": "M1"}},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        data = await stored_data(uuid.UUID(roadmap_id))
+        assert [m["name"] for m in data["milestones"]] == ["M1"]
+
+    async def test_failed_edit_writes_nothing(self, client, seeded, captured):
+        roadmap_id, headers = seeded
+        resp = await client.put(
+            f"/roadmaps/{roadmap_id}/items/reorder",
+            json={"parent_id": "m0", "item_ids": ["m0e0"]},
+            headers=headers,
+        )
+        assert resp.status_code == 400
+        assert captured == []
+        assert await stored_data(roadmap_id) == big_roadmap()
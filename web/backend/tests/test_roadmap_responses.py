@@ -0,0 +1,142 @@
+"""Tests for conditional GETs and the serialized roadmap response cache."""
+
+import pytest
+from httpx import AsyncClient
+
+from app.services.roadmap_responses import (
+    RoadmapResponseCache,
+    SerializedResponse,
+    accepts_gzip,
+    etag_matches,
+    get_roadmap_response_cache,
+)
+from tests.conftest import big_roadmap
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    get_roadmap_response_cache().clear()
+    yield
+    get_roadmap_response_cache().clear()
+
+
+class TestEtags:
+    def test_matching(self):
+        assert etag_matches('W/"abc"', 'W/"abc"')
+        assert etag_matches('"abc"', 'W/"abc"')
+        assert etag_matches('"x", W/"abc"', 'W/"abc"')
+        assert etag_matches("*", 'W/"abc"')
+        assert not etag_matches('W/"abd"', 'W/"abc"')
+        assert not etag_matches(None, 'W/"abc"')
+
+
+class TestAcceptEncoding:
+    def test_q_values(self):
+        assert accepts_gzip("gzip")
+        assert accepts_gzip("br, GZIP;q=0.5")
+        assert accepts_gzip("deflate, *")
+        assert not accepts_gzip("gzip;q=0")
+        assert not accepts_gzip("gzip; q=0.000, identity")
+        assert not accepts_gzip("*;q=0")
+        assert not accepts_gzip("gzip;q=0, *")
+        assert not accepts_gzip("identity")
+        assert not accepts_gzip(None)
+
+
+class TestResponseCache:
+    def test_evicts_least_recently_used_by_size(self):
+        cache = RoadmapResponseCache(max_bytes=250)
+        cache.put("r1", 1, SerializedResponse(b"a" * 100))
+        cache.put("r2", 1, SerializedResponse(b"b" * 100))
+        assert cache.get("r1", 1) is not None
+        cache.put("r3", 1, SerializedResponse(b"c" * 100))
+        assert cache.get("r2", 1) is None
+        assert cache.get("r1", 1).body == b"a" * 100
+        assert cache.size == 200
+
+    def test_new_version_replaces_old(self):
+        cache = RoadmapResponseCache(max_bytes=1000)
+        cache.put("r1", 1, SerializedResponse(b"old"))
+        cache.put("r1", 2, SerializedResponse(b"new"))
+        assert cache.get("r1", 1) is None
+        assert cache.get("r1", 2).body == b"new"
+        assert (len(cache), cache.size) == (1, 3)
+
+    def test_too_large_not_cached(self):
+        cache = RoadmapResponseCache(max_bytes=0)
+        cache.put("r1", 1, SerializedResponse(b"{}"))
+        assert len(cache) == 0
+
+    def test_gzip_only_when_worthwhile(self):
+        assert SerializedResponse(b"{}").gzipped is None
+        assert SerializedResponse(b"[" + b"1," * 1000 + b"1]").gzipped is not None
+        assert SerializedResponse(b"1" * 2000, compress=False).gzipped is None
+
+
+class TestConditionalGet:
+    async def test_not_modified_until_written(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        resp = await client.get(f"/roadmaps/{roadmap_id}", headers=headers)
+        assert resp.status_code == 200
+        etag = resp.headers["etag"]
+        assert resp.json()["roadmap_data"] == big_roadmap()
+
+        resp = await client.get(
+            f"/roadmaps/{roadmap_id}", headers={**headers, "If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+        await client.patch(
+            f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+            json={"status": "completed"},
+            headers=headers,
+        )
+        resp = await client.get(
+            f"/roadmaps/{roadmap_id}", headers={**headers, "If-None-Match": etag}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        milestone = resp.json()["roadmap_data"]["milestones"][0]
+        assert milestone["epics"][0]["stories"][0]["tasks"][0]["status"] == "completed"
+        assert milestone["status"] == "in_progress"
+
+    async def test_repeat_reads_served_from_cache(self, client: AsyncClient, seeded, selects):
+        roadmap_id, headers = seeded
+        first = await client.get(f"/roadmaps/{roadmap_id}", headers=headers)
+        selects.clear()
+        second = await client.get(f"/roadmaps/{roadmap_id}", headers=headers)
+        assert second.content == first.content
+        # Only the ownership check; no items reassembled
+        assert selects
+        assert not [s for s in selects if "roadmap_items" in s]
+
+    async def test_gzip_on_request(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        plain = await client.get(
+            f"/roadmaps/{roadmap_id}", headers={**headers, "Accept-Encoding": "identity"}
+        )
+        assert "content-encoding" not in plain.headers
+        zipped = await client.get(
+            f"/roadmaps/{roadmap_id}", headers={**headers, "Accept-Encoding": "gzip"}
+        )
+        assert zipped.headers["content-encoding"] == "gzip"
+        assert int(zipped.headers["content-length"]) < len(plain.content) / 5
+        assert zipped.json() == plain.json()
+        refused = await client.get(
+            f"/roadmaps/{roadmap_id}", headers={**headers, "Accept-Encoding": "gzip;q=0"}
+        )
+        assert "content-encoding" not in refused.headers
+        assert refused.content == plain.content
+
+    async def test_other_users_still_rejected(self, client: AsyncClient, seeded):
+        roadmap_id, headers = seeded
+        await client.get(f"/roadmaps/{roadmap_id}", headers=headers)
+        resp = await client.post(
+            "/auth/register",
+            json={"email": "other@example.com", "password": "securepassword"},
+        )
+        other = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+        resp = await client.get(f"/roadmaps/{roadmap_id}", headers=other)
+        assert resp.status_code == 404
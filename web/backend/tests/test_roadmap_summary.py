@@ -0,0 +1,101 @@
+"""Tests for the summary columns stored on roadmaps."""
+
+import pytest
+from httpx import AsyncClient
+
+from app.models.roadmap import RoadmapRecord
+from app.services import roadmap_summary
+from app.services.roadmap_summary import summary_values
+from tests.conftest import async_session_test, stored_data
+
+
+async def project_roadmaps(client: AsyncClient, roadmap_id, headers) -> list[dict]:
+    async with async_session_test() as session:
+        project_id = (await session.get(RoadmapRecord, roadmap_id)).project_id
+    resp = await client.get(f"/projects/{project_id}/roadmaps", headers=headers)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+async def test_summary_written_with_document(client: AsyncClient, seeded):
+    roadmap_id, headers = seeded
+    [summary] = await project_roadmaps(client, roadmap_id, headers)
+    assert summary["item_counts"] == {"milestones": 4, "epics": 12, "stories": 48, "tasks": 1200}
+    assert summary["completion_percent"] == 0.0
+    assert summary["hours_total"] == 0
+
+
+async def test_item_edits_refresh_summary(client: AsyncClient, seeded):
+    roadmap_id, headers = seeded
+    await client.patch(
+        f"/roadmaps/{roadmap_id}/items/m0e0s0t0",
+        json={"status": "completed", "estimated_hours": 6},
+        headers=headers,
+    )
+    await client.patch(
+        f"/roadmaps/{roadmap_id}/items/m0e0s0t1",
+        json={"estimated_hours": 2},
+        headers=headers,
+    )
+    await client.delete(f"/roadmaps/{roadmap_id}/items/m3", headers=headers)
+
+    [summary] = await project_roadmaps(client, roadmap_id, headers)
+    assert summary["item_counts"] == {"milestones": 3, "epics": 9, "stories": 36, "tasks": 900}
+    assert summary["hours_total"] == 8
+    assert summary["hours_completed"] == 6
+    # One completed task out of 948 items
+    assert summary["completion_percent"] == pytest.approx(100 / 948, abs=0.1)
+
+
+async def test_lists_never_load_roadmap_data(client: AsyncClient, seeded, selects):
+    roadmap_id, headers = seeded
+    await project_roadmaps(client, roadmap_id, headers)
+    async with async_session_test() as session:
+        project_id = (await session.get(RoadmapRecord, roadmap_id)).project_id
+    selects.clear()
+
+    resp = await client.get(f"/projects/{project_id}", headers=headers)
+    assert resp.json()["roadmaps"][0]["item_counts"]["tasks"] == 1200
+    await client.get(f"/projects/{project_id}/roadmaps", headers=headers)
+    assert selects
+    assert not [s for s in selects if "roadmap_data" in s]
+
+
+
+async def test_warm_edits_move_summary_without_summarizing(client: AsyncClient, seeded, monkeypatch):
+    roadmap_id, headers = seeded
+    url = f"/roadmaps/{roadmap_id}/items"
+    resp = await client.patch(f"{url}/m0e0s0t0", json={"estimated_hours": 2}, headers=headers)
+    assert resp.status_code == 200
+
+    calls = []
+    real = roadmap_summary.summarize
+    monkeypatch.setattr(roadmap_summary, "summarize", lambda data: calls.append(data) or real(data))
+    edits = [
+        client.patch(
+            f"{url}/m0e0s0t1", json={"status": "completed", "estimated_hours": 3}, headers=headers
+        ),
+        client.post(
+            f"{url}/m1e0/children",
+            json={"item_type": "story", "data": {"id": "new", "name": "New", "tasks": [
+                {"id": "new-t", "name": "T", "estimated_hours": 0.1},
+                {"id": "new-u", "name": "U", "estimated_hours": 0.2, "status": "completed"},
+            ]}},
+            headers=headers,
+        ),
+        # Completes the new story too
+        client.patch(f"{url}/new-t", json={"status": "completed"}, headers=headers),
+        client.delete(f"{url}/m2e1", headers=headers),
+        client.patch(f"{url}/new-t", json={"status": "in_progress"}, headers=headers),
+        client.patch(f"{url}/m0e0s0t0", json={"status": "completed"}, headers=headers),
+    ]
+    for edit in edits:
+        assert (await edit).status_code in (200, 201)
+    assert calls == []
+
+    [summary] = await project_roadmaps(client, roadmap_id, headers)
+    expected = summary_values(await stored_data(roadmap_id))
+    assert {key: summary[key] for key in expected} == expected
+    assert summary["item_counts"]["stories"] == 45
+    assert summary["hours_total"] == 5
+    assert summary["hours_completed"] == 5
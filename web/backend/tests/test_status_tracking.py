@@ -311,6 +311,105 @@ async def test_stats_hours_tracking(
     stats = resp.json()
     assert stats["hours_completed"] == 4
     assert stats["completion_percent"] == pytest.approx(33.3, abs=0.1)
+    assert stats["hours_by_status"]["completed"] == 4
+    assert stats["hours_by_status"]["not_started"] == 8
+
+
+async def test_stats_critical_path(
+    client: AsyncClient, roadmap_with_hierarchy
+):
+    h = roadmap_with_hierarchy
+    headers = h["headers"]
+    rm_id = h["roadmap_id"]
+
+    # Independent tasks: the longest one is the critical path
+    resp = await client.get(f"/roadmaps/{rm_id}/stats", headers=headers)
+    stats = resp.json()
+    assert stats["critical_path_hours"] == 8
+    assert stats["critical_path"] == [h["task2_id"]]
+    assert stats["dependency_problems"] == []
+
+    await client.patch(
+        f"/roadmaps/{rm_id}/items/{h['task2_id']}",
+        json={"prerequisites": [h["task1_id"], "missing-task"]},
+        headers=headers,
+    )
+    resp = await client.get(f"/roadmaps/{rm_id}/stats", headers=headers)
+    stats = resp.json()
+    assert stats["critical_path_hours"] == 12
+    assert stats["critical_path"] == [h["task1_id"], h["task2_id"]]
+    assert stats["dependency_problems"] == [
+        f"{h['task2_id']} requires unknown item missing-task"
+    ]
+
+
+async def test_forecast_endpoint(
+    client: AsyncClient, roadmap_with_hierarchy
+):
+    h = roadmap_with_hierarchy
+    resp = await client.get(
+        f"/roadmaps/{h['roadmap_id']}/forecast",
+        params={"simulations": 500, "team_size": 1, "start": "2026-11-02", "seed": 1},
+        headers=h["headers"],
+    )
+    assert resp.status_code == 200
+    forecast = resp.json()
+    assert forecast["team_size"] == 1
+    assert [m["id"] for m in forecast["milestones"]] == [h["milestone_id"]]
+    hours = forecast["completion"]["hours"]
+    # 12 estimated hours for one developer, with right-skewed uncertainty
+    assert 8 < float(hours["50"]) <= float(hours["80"]) <= float(hours["95"]) < 30
+    assert forecast["completion"]["dates"]["50"] >= "2026-11-03"
+    assert forecast["deadline"] is None
+
+
+async def test_forecast_rejects_prerequisite_cycle(
+    client: AsyncClient, roadmap_with_hierarchy
+):
+    h = roadmap_with_hierarchy
+    headers = h["headers"]
+    rm_id = h["roadmap_id"]
+    for task_id, other in (("task1_id", "task2_id"), ("task2_id", "task1_id")):
+        await client.patch(
+            f"/roadmaps/{rm_id}/items/{h[task_id]}",
+            json={"prerequisites": [h[other]]},
+            headers=headers,
+        )
+    resp = await client.get(
+        f"/roadmaps/{rm_id}/forecast", params={"simulations": 100}, headers=headers
+    )
+    assert resp.status_code == 400
+    assert "Prerequisite cycle" in resp.json()["detail"]
+
+
+async def test_cost_estimate_endpoint(
+    client: AsyncClient, roadmap_with_hierarchy
+):
+    h = roadmap_with_hierarchy
+    headers = h["headers"]
+
+    # The hierarchy is fully generated, so nothing is left to pay for
+    resp = await client.get(f"/roadmaps/{h['roadmap_id']}/cost-estimate", headers=headers)
+    assert resp.status_code == 200
+    estimate = resp.json()
+    assert estimate["api_calls"] == 0
+    assert estimate["estimated_cost_usd"] == 0
+
+    # An empty roadmap gets the default estimate; the hierarchy has no
+    # recorded usage, so it can't calibrate it
+    rm_resp = await client.post(
+        f"/projects/{h['project_id']}/roadmaps", json={"name": "Empty"}, headers=headers
+    )
+    resp = await client.get(
+        f"/roadmaps/{rm_resp.json()['id']}/cost-estimate",
+        params={"model": "haiku"},
+        headers=headers,
+    )
+    estimate = resp.json()
+    assert estimate["api_calls"] == 40
+    assert estimate["estimated_cost_usd"] > 0
+    assert estimate["samples"] == 0
+    assert estimate["low_cost_usd"] is None
 
 
 async def test_stats_overdue_detection(
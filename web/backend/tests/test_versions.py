@@ -0,0 +1,188 @@
+"""Tests for roadmap version history endpoints."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+
+from app.models.roadmap_snapshot import RoadmapVersionObject
+from app.services import versions
+from arcane.core.storage import MemoryObjectBackend, VersionStore
+from tests.conftest import async_session_test, stored_data
+
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def headers(client: AsyncClient):
+    resp = await client.post("/auth/register", json={
+        "email": "versionuser@example.com",
+        "password": "securepassword",
+    })
+    assert resp.status_code == 201
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+@pytest.fixture
+async def roadmap(client: AsyncClient, headers):
+    proj_resp = await client.post("/projects/", json={"name": "Versions"}, headers=headers)
+    rm_resp = await client.post(
+        f"/projects/{proj_resp.json()['id']}/roadmaps",
+        json={"name": "Versioned Roadmap", "context": {"vision": "test"}},
+        headers=headers,
+    )
+    rm_id = rm_resp.json()["id"]
+
+    ms_resp = await client.post(
+        f"/roadmaps/{rm_id}/items/root/children",
+        json={"item_type": "milestone", "data": {
+            "name": "M1", "description": "Milestone 1", "priority": "high", "goal": "G1",
+        }},
+        headers=headers,
+    )
+    ms_id = ms_resp.json()["item_id"]
+
+    ep_resp = await client.post(
+        f"/roadmaps/{rm_id}/items/{ms_id}/children",
+        json={"item_type": "epic", "data": {
+            "name": "E1", "description": "Epic 1", "priority": "medium", "goal": "EG1",
+        }},
+        headers=headers,
+    )
+    return {"id": rm_id, "milestone_id": ms_id, "epic_id": ep_resp.json()["item_id"]}
+
+
+async def test_item_writes_record_versions(client: AsyncClient, headers, roadmap):
+    resp = await client.get(f"/roadmaps/{roadmap['id']}/versions", headers=headers)
+    assert resp.status_code == 200
+    versions = resp.json()
+    # Snapshots are keyed by roadmap version; the empty roadmap (1) has none
+    assert [v["version"] for v in versions] == [3, 2]
+    assert versions[0]["message"].startswith("Add epic")
+    assert versions[0]["total_items"]["epics"] == 1
+
+
+async def test_diff_reports_modified_fields(client: AsyncClient, headers, roadmap):
+    await client.patch(
+        f"/roadmaps/{roadmap['id']}/items/{roadmap['epic_id']}",
+        json={"name": "Renamed epic"},
+        headers=headers,
+    )
+
+    resp = await client.get(f"/roadmaps/{roadmap['id']}/versions/diff", headers=headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["from_version"] == 3
+    assert body["to_version"] == 4
+    assert body["changes"] == [{
+        "kind": "modified",
+        "item_type": "epic",
+        "item_id": roadmap["epic_id"],
+        "name": "Renamed epic",
+        "fields": ["name"],
+    }]
+
+
+async def test_diff_across_versions(client: AsyncClient, headers, roadmap):
+    await client.delete(
+        f"/roadmaps/{roadmap['id']}/items/{roadmap['epic_id']}", headers=headers
+    )
+
+    resp = await client.get(
+        f"/roadmaps/{roadmap['id']}/versions/diff",
+        params={"from_version": 2, "to_version": 4},
+        headers=headers,
+    )
+    assert resp.json()["changes"] == []
+
+
+async def test_get_version_returns_old_data(client: AsyncClient, headers, roadmap):
+    await client.delete(
+        f"/roadmaps/{roadmap['id']}/items/{roadmap['epic_id']}", headers=headers
+    )
+
+    resp = await client.get(f"/roadmaps/{roadmap['id']}/versions/3", headers=headers)
+    assert resp.status_code == 200
+    milestones = resp.json()["roadmap_data"]["milestones"]
+    assert milestones[0]["epics"][0]["id"] == roadmap["epic_id"]
+
+
+async def test_unknown_version_404(client: AsyncClient, headers, roadmap):
+    resp = await client.get(f"/roadmaps/{roadmap['id']}/versions/99", headers=headers)
+    assert resp.status_code == 404
+
+
+async def object_count(roadmap_id) -> int:
+    async with async_session_test() as session:
+        return await session.scalar(
+            select(func.count()).where(RoadmapVersionObject.roadmap_id == roadmap_id)
+        )
+
+
+def full_root(data: dict) -> str:
+    """Root hash of data when every item is hashed afresh."""
+    store = VersionStore(MemoryObjectBackend())
+    meta = {"project_name": "Big", "context": {"vision": "test"}}
+    return store.commit_data("big", meta, data["milestones"]).root
+
+
+async def test_edits_rehash_only_changed_paths(client: AsyncClient, seeded):
+    roadmap_id, headers = seeded
+    url = f"/roadmaps/{roadmap_id}/items"
+    # No snapshot of the seeded version, so the first one hashes everything
+    await client.patch(f"{url}/m0e0s0t0", json={"name": "First"}, headers=headers)
+    objects = await object_count(roadmap_id)
+
+    await client.patch(f"{url}/m1e2s3t4", json={"name": "Second"}, headers=headers)
+    # The task, its story, epic and milestone, and the root
+    assert await object_count(roadmap_id) == objects + 5
+
+    await client.delete(f"{url}/m2e0", headers=headers)
+    await client.post(
+        f"{url}/m3e1/children",
+        json={"item_type": "story", "data": {"id": "new", "name": "New", "tasks": [{"id": "new-t", "name": "T"}]}},
+        headers=headers,
+    )
+    await client.put(
+        f"{url}/reorder", json={"parent_id": "root", "item_ids": ["m3", "m0", "m1", "m2"]},
+        headers=headers,
+    )
+    await client.patch(f"{url}/m0e0s0t1", json={"status": "completed"}, headers=headers)
+
+    data = await stored_data(roadmap_id)
+    versions = (await client.get(f"/roadmaps/{roadmap_id}/versions", headers=headers)).json()
+    assert [v["version"] for v in versions] == [7, 6, 5, 4, 3, 2]
+    assert versions[0]["root"] == full_root(data)
+    assert versions[0]["total_items"] == {"milestones": 4, "epics": 11, "stories": 45, "tasks": 1101}
+
+    resp = await client.get(f"/roadmaps/{roadmap_id}/versions/7", headers=headers)
+    assert resp.json()["roadmap_data"]["milestones"] == data["milestones"]
+    resp = await client.get(
+        f"/roadmaps/{roadmap_id}/versions/diff",
+        params={"from_version": 3, "to_version": 4},
+        headers=headers,
+    )
+    changes = resp.json()["changes"]
+    assert changes[0] == {
+        "kind": "removed", "item_type": "epic", "item_id": "m2e0", "name": "Epic 0", "fields": [],
+    }
+    assert len(changes) == 1 + 4 + 4 * 25
+
+
+async def test_failed_snapshot_keeps_edit(client: AsyncClient, seeded, monkeypatch):
+    roadmap_id, headers = seeded
+
+    failing = AsyncMock(side_effect=OperationalError("INSERT", {}, Exception("disk full")))
+    monkeypatch.setattr(versions, "_record", failing)
+    resp = await client.patch(
+        f"/roadmaps/{roadmap_id}/items/m0e0s0t0", json={"name": "Kept"}, headers=headers
+    )
+    assert resp.status_code == 200
+    assert resp.headers["etag"] == 'W/"2"'
+    data = await stored_data(roadmap_id)
+    assert data["milestones"][0]["epics"][0]["stories"][0]["tasks"][0]["name"] == "Kept"
+    resp = await client.get(f"/roadmaps/{roadmap_id}/versions", headers=headers)
+    assert resp.json() == []
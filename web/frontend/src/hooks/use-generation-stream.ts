@@ -81,6 +81,10 @@ export function useGenerationStream(jobId: string | null) {
               case "item_created":
                 setItems((prev) => [...prev, event.data]);
                 break;
+              case "items_created":
+                // Sent instead when items were created faster than we read them
+                setItems((prev) => [...prev, ...event.data.items]);
+                break;
               case "complete":
                 setProgress((prev) =>
                   prev ? { ...prev, phase: "complete" } : prev
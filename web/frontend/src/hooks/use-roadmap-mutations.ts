@@ -7,6 +7,8 @@ import type {
   ItemUpdate,
   ItemCreateRequest,
   ReorderRequest,
+  BatchOperation,
+  BatchResponse,
   ItemResponse,
   DeleteResponse,
   GenerationJobResponse,
@@ -89,6 +91,23 @@ export function useReorderItems(roadmapId: string) {
   });
 }
 
+export function useBatchItems(roadmapId: string) {
+  const queryClient = useQueryClient();
+  return useMutation({
+    mutationFn: (operations: BatchOperation[]) =>
+      apiClient<BatchResponse>(`/roadmaps/${roadmapId}/items:batch`, {
+        method: "POST",
+        body: { operations },
+      }),
+    onSuccess: () => {
+      queryClient.invalidateQueries({ queryKey: ["roadmaps", roadmapId] });
+    },
+    onError: (error: Error) => {
+      toast.error("Failed to update items", { description: error.message });
+    },
+  });
+}
+
 export function useRegenerateItem(roadmapId: string) {
   return useMutation({
     mutationFn: (itemId: string) =>
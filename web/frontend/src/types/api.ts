@@ -72,6 +72,7 @@ export interface RoadmapDetail {
   status: "draft" | "generating" | "completed";
   context: Record<string, unknown> | null;
   roadmap_data: Record<string, unknown> | null;
+  version: number;
   created_at: string;
   updated_at: string;
 }
@@ -125,6 +126,25 @@ export interface DeleteResponse {
   children_deleted: number;
 }
 
+export type BatchOperation =
+  | { op: "update"; item_id: string; fields: ItemUpdate }
+  | ({ op: "create"; parent_id: string } & ItemCreateRequest)
+  | { op: "delete"; item_id: string }
+  | ({ op: "reorder" } & ReorderRequest);
+
+export interface BatchResult {
+  op: BatchOperation["op"];
+  item_id: string;
+  item_type: string;
+  data: Record<string, unknown> | null;
+  children_deleted: number | null;
+}
+
+export interface BatchResponse {
+  results: BatchResult[];
+  cascaded: { id: string; status: string }[];
+}
+
 // AI Edit
 export interface AiEditResponse {
   item_id: string;
@@ -154,6 +174,13 @@ export interface RoadmapStats {
   hours_completed: number;
   completion_percent: number;
   milestones: MilestoneStats[];
+  hours_by_status: Record<string, number>;
+  hours_by_priority: Record<string, number>;
+  hours_by_label: Record<string, number>;
+  overdue_tasks: string[];
+  critical_path_hours: number;
+  critical_path: string[];
+  dependency_problems: string[];
 }
 
 // Credentials
@@ -28,8 +28,20 @@ export interface ErrorData {
   message: string;
 }
 
+export interface BudgetExceededData {
+  reason: string;
+  elapsed_seconds: number;
+  tokens: number;
+  cost_usd: number;
+  pending: { milestones: number; epics: number; stories: number };
+  remaining_calls: number;
+  cost_to_complete_usd: number;
+}
+
 export type GenerationEvent =
   | { event: "progress"; data: ProgressData }
   | { event: "item_created"; data: ItemCreatedData }
+  | { event: "items_created"; data: { items: ItemCreatedData[] } }
+  | { event: "budget_exceeded"; data: BudgetExceededData }
   | { event: "complete"; data: CompleteData }
   | { event: "error"; data: ErrorData };